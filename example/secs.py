@@ -1,11 +1,22 @@
-import socket
+import io
+import array
+import sys
+import concurrent.futures
+import asyncio
 import re
+import importlib
+import selectors
+import collections
 import threading
-import inspect
+import heapq
+import time
+import socket
+import select
 import datetime
-import importlib
-import os
 import struct
+import inspect
+import os
+import functools
 
 
 class Secs2BodyParseError(Exception):
@@ -22,11 +33,17 @@ class Secs2BodyBytesParseError(Secs2BodyParseError):
 
 class AbstractSecs2Body:
 
+    __slots__ = (
+        '_type',
+        '__cache_sml', '__cache_repr', '__cache_bytes', '__cache_byte_size'
+    )
+
     _BYTES_LEN_3 = 2**16
     _BYTES_LEN_2 = 2**8
     _SML_TAB = '  '
     _SML_VALUESEPARATOR = ' '
     _SML_LINESEPARATOR = os.linesep
+    _SML_WRITE_CHUNK = 1024
 
     def __init__(self, item_type, value):
         self._type = item_type
@@ -34,6 +51,7 @@ class AbstractSecs2Body:
         self.__cache_sml = None
         self.__cache_repr = None
         self.__cache_bytes = None
+        self.__cache_byte_size = None
 
     def __str__(self):
         return self.to_sml()
@@ -141,6 +159,27 @@ class AbstractSecs2Body:
             self.__cache_sml = self._create_to_sml()
         return self.__cache_sml
 
+    def write_sml(self, stream, max_depth=None, max_items=None):
+        """Write SML to stream.
+
+        Written piece by piece, without building whole SML string.
+
+        Args:
+            stream (io.TextIOBase): text stream, or object has write(str).
+            max_depth (int): 'L' nested deeper than max_depth are written as '<L [n] ... >'.
+                Defaults to None, no limit.
+            max_items (int): write first max_items of values and 'L' items, and '...'.
+                Defaults to None, no limit.
+
+        Returns:
+            None: None
+
+        Examples:
+            write_sml(sys.stdout, max_items=100)
+            <U4 [50000] 0 1 2 ... 99 ... >
+        """
+        self._write_sml(stream, '', max_depth, max_items)
+
     def to_bytes(self):
         """bytes getter.
 
@@ -151,6 +190,66 @@ class AbstractSecs2Body:
             self.__cache_bytes = self._create_to_bytes()
         return self.__cache_bytes
 
+    def byte_size(self):
+        """bytes length getter.
+
+        Computed from item lengths, without encoding values.
+
+        Returns:
+            int: length of to_bytes()
+        """
+        if self.__cache_byte_size is None:
+            if self.__cache_bytes is None:
+                self.__cache_byte_size = self._create_byte_size()
+            else:
+                self.__cache_byte_size = len(self.__cache_bytes)
+        return self.__cache_byte_size
+
+    def write_into(self, buffer, offset=0):
+        """Write bytes into buffer.
+
+        Args:
+            buffer (bytearray or memoryview): writable buffer, require byte_size() bytes from offset.
+            offset (int): write position. Defaults to 0.
+
+        Returns:
+            int: position next to written bytes.
+        """
+        if self.__cache_bytes is None:
+            return self._write_into(buffer, offset)
+        else:
+            end = offset + len(self.__cache_bytes)
+            buffer[offset:end] = self.__cache_bytes
+            return end
+
+    def to_numpy(self):
+        """numpy.ndarray getter.
+
+        Supports 'B', 'BOOLEAN', 'I1'-'I8', 'U1'-'U8', 'F4', 'F8'.
+        Require NumPy.
+
+        Raises:
+            TypeError: if 'L' or 'A'.
+
+        Returns:
+            numpy.ndarray: values, native byte order.
+        """
+        np = importlib.import_module('numpy')
+
+        tt = self._type
+        if tt[0] == 'BOOLEAN':
+            return np.frombuffer(self._create_to_bytes_value(), dtype='u1') != 0
+        elif tt[2] > 0:
+            if tt[4] is None:
+                dt = np.dtype('>f' + str(tt[2]))
+            elif tt[4]:
+                dt = np.dtype('>i' + str(tt[2]))
+            else:
+                dt = np.dtype('>u' + str(tt[2]))
+            return np.frombuffer(self._create_to_bytes_value(), dtype=dt).astype(dt.newbyteorder('='))
+        else:
+            raise TypeError(tt[0] + " not support to_numpy")
+
     def _create_to_sml(self):
         l, v = self._create_to_sml_value()
         return '<' + self._type[0] + ' [' + str(l) + '] ' + str(v) + ' >'
@@ -158,6 +257,41 @@ class AbstractSecs2Body:
     def _create_to_sml_value(self):
         return 0, ''
 
+    def _write_sml(self, stream, level, max_depth, max_items):
+        stream.write(level + '<' + self._type[0] + ' [' + str(len(self)) + '] ')
+        self._write_sml_value(stream, max_items)
+        stream.write(' >')
+
+    def _write_sml_value(self, stream, max_items):
+        n = len(self)
+        m = n if max_items is None else min(n, max_items)
+        sep = self._SML_VALUESEPARATOR
+        for i in range(0, m, self._SML_WRITE_CHUNK):
+            if i > 0:
+                stream.write(sep)
+            stream.write(sep.join(self._sml_values(i, min(m, (i + self._SML_WRITE_CHUNK)))))
+        if m < n:
+            stream.write((sep + '...') if m > 0 else '...')
+
+    def _sml_values(self, start, stop):
+        return [str(x) for x in self._value[start:stop]]
+
+    def _write_sml_list(self, stream, level, max_depth, max_items):
+        n = len(self)
+        stream.write(level + '<L [' + str(n) + ']')
+        if n > 0 and max_depth is not None and max_depth < 1:
+            stream.write(' ... >')
+            return
+        deep_level = level + self._SML_TAB
+        deep_depth = None if max_depth is None else (max_depth - 1)
+        m = n if max_items is None else min(n, max_items)
+        for i in range(m):
+            stream.write(self._SML_LINESEPARATOR)
+            self[i]._write_sml(stream, deep_level, deep_depth, max_items)
+        if m < n:
+            stream.write(self._SML_LINESEPARATOR + deep_level + '...')
+        stream.write(self._SML_LINESEPARATOR + level + '>')
+
     def _create_to_bytes(self):
         bs_vv = self._create_to_bytes_value()
         v_len = len(bs_vv)
@@ -172,6 +306,39 @@ class AbstractSecs2Body:
     def _create_to_bytes_value(self):
         return self._value
 
+    def _create_byte_size(self):
+        v_len = self._value_byte_size()
+        return self._header_size(v_len) + v_len
+
+    def _value_byte_size(self):
+        return len(self._create_to_bytes_value())
+
+    def _header_size(self, v_len):
+        if v_len >= self._BYTES_LEN_3:
+            return 4
+        elif v_len >= self._BYTES_LEN_2:
+            return 3
+        else:
+            return 2
+
+    def _write_header_into(self, buffer, offset, v_len):
+        if v_len >= self._BYTES_LEN_3:
+            struct.pack_into('>BBH', buffer, offset, (self._type[1] | 0x03), (v_len >> 16) & 0xFF, v_len & 0xFFFF)
+            return offset + 4
+        elif v_len >= self._BYTES_LEN_2:
+            struct.pack_into('>BH', buffer, offset, (self._type[1] | 0x02), v_len)
+            return offset + 3
+        else:
+            struct.pack_into('>BB', buffer, offset, (self._type[1] | 0x01), v_len)
+            return offset + 2
+
+    def _write_into(self, buffer, offset):
+        bs = self._create_to_bytes_value()
+        pos = self._write_header_into(buffer, offset, len(bs))
+        end = pos + len(bs)
+        buffer[pos:end] = bs
+        return end
+
     @staticmethod
     def _tiof(value, item_size, is_signed):    # test_int_overflow return int_value
 
@@ -194,22 +361,72 @@ class AbstractSecs2Body:
             v_min = 0
 
         if v > v_max or v < v_min:
-            raise ValueError("value is from " + str(min) + " to " + str(max) + ", value is " + str(v))
+            raise ValueError("value is from " + str(v_min) + " to " + str(v_max) + ", value is " + str(v))
 
         return v
 
+    @staticmethod
+    def _tiofs(values, item_type):    # test_int_overflow of all values at once, return int_values tuple
+
+        try:
+            vv = tuple(map(int, values))
+        except ValueError:
+            vv = tuple([
+                (int(x[2:], 16) if (type(x) is str and x.upper().startswith("0X")) else int(x))
+                for x in values])
+
+        if vv:
+            v_min, v_max = Secs2BodyBuilder._INT_RANGES[item_type[0]]
+            x_min = min(vv)
+            x_max = max(vv)
+            if x_max > v_max or x_min < v_min:
+                v = x_max if x_max > v_max else x_min
+                raise ValueError("value is from " + str(v_min) + " to " + str(v_max) + ", value is " + str(v))
+
+        return vv
+
+    @staticmethod
+    def _int_range(item_type):  # return (min, max)
+        n = item_type[2] * 8
+        if item_type[4]:
+            x = 2**(n - 1)
+            return -x, (x - 1)
+        else:
+            return 0, (2**n - 1)
+
 
 class Secs2AsciiBody(AbstractSecs2Body):
 
+    __slots__ = ('_extended', '__value')
+
     def __init__(self, item_type, value):
         self._extended = os.getenv('SECS_EXTENDED')
 
-        if self._extended:
+        if self._extended or type(value) is memoryview:
             super(Secs2AsciiBody, self).__init__(item_type, value)  # Keep it as is
             return
 
         super(Secs2AsciiBody, self).__init__(item_type, str(value))
 
+    @property
+    def _value(self):
+        v = self.__value
+        if type(v) is memoryview:
+            # decode received view on first touch
+            try:
+                if self._extended and not all([c <= 128 for c in v]):
+                    v = bytes(v)
+                else:
+                    v = str(v, 'ascii')
+            except UnicodeDecodeError as e:
+                raise Secs2BodyBytesParseError(e)
+            self.__value = v
+        return v
+
+    @_value.setter
+    def _value(self, val):
+        self.__value = val
+
     def _create_to_sml_value(self):
         # ret = len(self._value), ('"' + self._value + '"')
         s = self._value
@@ -217,7 +434,20 @@ class Secs2AsciiBody(AbstractSecs2Body):
             s = ''.join(['%c' % c for c in s])
         return len(s), (f'"{s}"')
 
+    def _write_sml_value(self, stream, max_items):
+        s = self._value
+        suffix = ''
+        if max_items is not None and len(s) > max_items:
+            s = s[:max_items]
+            suffix = self._SML_VALUESEPARATOR + '...'
+        if self._extended:
+            s = ''.join(['%c' % c for c in s])
+        stream.write('"' + s + '"' + suffix)
+
     def _create_to_bytes_value(self):
+        if type(self.__value) is memoryview:
+            return self.__value
+
         if self._extended:
             s = self._value
             if type(s) is str:
@@ -229,12 +459,14 @@ class Secs2AsciiBody(AbstractSecs2Body):
         return self._value.encode(encoding='ascii')
 
     @staticmethod
-    def build(item_type, value):
+    def build(item_type, value, trusted=False):
         return Secs2AsciiBody(item_type, value)
 
 
 class Secs2BooleanBody(AbstractSecs2Body):
 
+    __slots__ = ('_value', )
+
     def __init__(self, item_type, value):
         tv = type(value)
         if tv is tuple or tv is list:
@@ -252,92 +484,240 @@ class Secs2BooleanBody(AbstractSecs2Body):
         vv = [("TRUE" if x else "FALSE") for x in self._value]
         return len(vv), self._SML_VALUESEPARATOR.join(vv)
 
+    def _sml_values(self, start, stop):
+        return [("TRUE" if x else "FALSE") for x in self._value[start:stop]]
+
     def _create_to_bytes_value(self):
         return bytes([(0xFF if v else 0x00) for v in self._value])
 
+    def _value_byte_size(self):
+        return len(self._value)
+
     @staticmethod
-    def build(item_type, value):
+    def build(item_type, value, trusted=False):
         return Secs2BooleanBody(item_type, value)
 
 
 class Secs2BinaryBody(AbstractSecs2Body):
 
-    def __init__(self, item_type, value):
+    __slots__ = ('__value', )
+
+    def __init__(self, item_type, value, trusted=False):
         tv = type(value)
-        if tv is bytes:
+        if tv is bytes or tv is memoryview:
             super(Secs2BinaryBody, self).__init__(item_type, value)
         elif tv is bytearray:
             super(Secs2BinaryBody, self).__init__(item_type, bytes(value))
         elif tv is tuple or tv is list:
             super(Secs2BinaryBody, self).__init__(
                 item_type,
-                bytes([self._tiof(x, item_type[2], item_type[4]) for x in value])
+                bytes(value if trusted else self._tiofs(value, item_type))
                 )
         else:
             super(Secs2BinaryBody, self).__init__(
                 item_type,
-                bytes([self._tiof(value, item_type[2], item_type[4])])
+                bytes(self._tiofs((value, ), item_type))
                 )
 
+    @property
+    def _value(self):
+        v = self.__value
+        if type(v) is memoryview:
+            # copy received view on first touch
+            v = self.__value = v.tobytes()
+        return v
+
+    @_value.setter
+    def _value(self, val):
+        self.__value = val
+
+    def __len__(self):
+        return len(self.__value)
+
     def _create_to_sml_value(self):
         vv = [('0x' + '{:02X}'.format(x)) for x in self._value]
         return len(vv), self._SML_VALUESEPARATOR.join(vv)
 
+    def _sml_values(self, start, stop):
+        return [('0x' + '{:02X}'.format(x)) for x in self._value[start:stop]]
+
+    def _create_to_bytes_value(self):
+        return self.__value
+
     @staticmethod
-    def build(item_type, value):
-        return Secs2BinaryBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2BinaryBody(item_type, value, trusted)
 
 
 class AbstractSecs2NumberBody(AbstractSecs2Body):
 
+    __slots__ = ('_value', )
+
+    _ARRAY_BYTESWAP = sys.byteorder == 'little'
+    _ARRAY_TYPECODES = dict()
+
     def __init__(self, item_type, value):
-        super(AbstractSecs2NumberBody, self).__init__(item_type, tuple(value))
+        if self._is_ndarray(value):
+            value = self._array_from_numpy(item_type, value)
+        if type(value) is array.array:
+            tc = self._array_typecode(item_type)
+            if value.typecode != tc:
+                try:
+                    value = array.array(tc, value)
+                except OverflowError as e:
+                    raise ValueError(e)
+            super(AbstractSecs2NumberBody, self).__init__(item_type, value)
+        else:
+            super(AbstractSecs2NumberBody, self).__init__(item_type, tuple(value))
+
+    @classmethod
+    def _array_typecode(cls, item_type):
+        """array.array typecode of same size and sign as item_type.
+
+        Returns:
+            str: typecode
+        """
+        tc = cls._ARRAY_TYPECODES.get(item_type[0])
+        if tc is None:
+            if item_type[4] is None:
+                cc = item_type[3]
+            elif item_type[4]:
+                cc = 'bhilq'
+            else:
+                cc = 'BHILQ'
+            tc = [c for c in cc if array.array(c).itemsize == item_type[2]][0]
+            cls._ARRAY_TYPECODES[item_type[0]] = tc
+        return tc
+
+    @classmethod
+    def _array_from_bytes(cls, item_type, bs):
+        """Decode big-endian bytes to array.array.
+
+        Args:
+            item_type (tuple): item type.
+            bs (bytes or memoryview): big-endian values.
+
+        Returns:
+            array.array: values
+        """
+        a = array.array(cls._array_typecode(item_type))
+        a.frombytes(bs)
+        if cls._ARRAY_BYTESWAP:
+            a.byteswap()
+        return a
+
+    @staticmethod
+    def _is_ndarray(value):
+        np = sys.modules.get('numpy')
+        return np is not None and isinstance(value, np.ndarray)
+
+    @classmethod
+    def _array_from_numpy(cls, item_type, value):
+        """Convert numpy.ndarray to array.array without per-element objects.
+
+        Raises:
+            ValueError: if integer value out of range, or not finite.
+
+        Returns:
+            array.array: values
+        """
+        np = sys.modules['numpy']
+        tc = cls._array_typecode(item_type)
+        if item_type[4] is not None and value.size > 0:
+            if value.dtype.kind in 'fc' and not np.isfinite(value).all():
+                raise ValueError("value is not finite")
+            v_min, v_max = Secs2BodyBuilder._INT_RANGES[item_type[0]]
+            if value.min() < v_min or value.max() > v_max:
+                raise ValueError("value is from " + str(v_min) + " to " + str(v_max))
+        a = array.array(tc)
+        a.frombytes(memoryview(np.ascontiguousarray(value, dtype=np.dtype(tc)).reshape(-1)).cast('B'))
+        return a
+
+    def to_numpy(self):
+        v = self._value
+        if type(v) is array.array:
+            np = importlib.import_module('numpy')
+            return np.frombuffer(v, dtype=np.dtype(v.typecode)).copy()
+        else:
+            return super(AbstractSecs2NumberBody, self).to_numpy()
 
     def _create_to_sml_value(self):
         vv = [str(x) for x in self._value]
         return len(vv), self._SML_VALUESEPARATOR.join(vv)
 
     def _create_to_bytes_value(self):
-        return b''.join([struct.pack(('>' + self._type[3]), x) for x in self._value])
+        v = self._value
+        if type(v) is array.array:
+            if self._ARRAY_BYTESWAP:
+                v = v[:]
+                v.byteswap()
+            return v.tobytes()
+        else:
+            return struct.pack(('>' + str(len(v)) + self._type[3]), *v)
+
+    def _value_byte_size(self):
+        return len(self._value) * self._type[2]
+
+    def _write_into(self, buffer, offset):
+        v = self._value
+        if type(v) is array.array:
+            return super(AbstractSecs2NumberBody, self)._write_into(buffer, offset)
+        else:
+            pos = self._write_header_into(buffer, offset, len(v) * self._type[2])
+            struct.pack_into(('>' + str(len(v)) + self._type[3]), buffer, pos, *v)
+            return pos + len(v) * self._type[2]
 
 
 class Secs2IntegerBody(AbstractSecs2NumberBody):
 
-    def __init__(self, item_type, value):
+    __slots__ = ()
+
+    def __init__(self, item_type, value, trusted=False):
         tv = type(value)
-        if tv is tuple or tv is list:
+        if tv is array.array or self._is_ndarray(value):
+            super(Secs2IntegerBody, self).__init__(item_type, value)
+        elif tv is tuple or tv is list:
             super(Secs2IntegerBody, self).__init__(
                 item_type,
-                [self._tiof(x, item_type[2], item_type[4]) for x in value]
+                value if trusted else self._tiofs(value, item_type)
                 )
         else:
             super(Secs2IntegerBody, self).__init__(
                 item_type,
-                [self._tiof(value, item_type[2], item_type[4])]
+                self._tiofs((value, ), item_type)
                 )
 
     @staticmethod
-    def build(item_type, value):
-        return Secs2IntegerBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2IntegerBody(item_type, value, trusted)
 
 
 class Secs2FloatBody(AbstractSecs2NumberBody):
 
-    def __init__(self, item_type, value):
+    __slots__ = ()
+
+    def __init__(self, item_type, value, trusted=False):
         tv = type(value)
-        if tv is tuple or tv is list:
-            super(Secs2FloatBody, self).__init__(item_type, [float(x) for x in value])
+        if tv is array.array or self._is_ndarray(value):
+            super(Secs2FloatBody, self).__init__(item_type, value)
+        elif tv is tuple or tv is list:
+            super(Secs2FloatBody, self).__init__(
+                item_type,
+                value if trusted else tuple(map(float, value))
+                )
         else:
-            super(Secs2FloatBody, self).__init__(item_type, [float(value)])
+            super(Secs2FloatBody, self).__init__(item_type, (float(value), ))
 
     @staticmethod
-    def build(item_type, value):
-        return Secs2FloatBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2FloatBody(item_type, value, trusted)
 
 
 class Secs2ListBody(AbstractSecs2Body):
 
-    def __init__(self, item_type, value):
+    __slots__ = ('_value', )
+
+    def __init__(self, item_type, value, trusted=False):
 
         tv = type(value)
         if tv is tuple or tv is list:
@@ -349,7 +729,7 @@ class Secs2ListBody(AbstractSecs2Body):
                 else:
                     tx = type(x)
                     if (tx is tuple or tx is list) and (len(x) == 2):
-                        vv.append(Secs2BodyBuilder.build(x[0], x[1]))
+                        vv.append(Secs2BodyBuilder.build(x[0], x[1], trusted))
                     else:
                         raise TypeError("L value require tuple or list, and length == 2")
 
@@ -359,35 +739,167 @@ class Secs2ListBody(AbstractSecs2Body):
             raise TypeError("L values require tuple or list")
 
     def _create_to_sml(self):
+        stream = io.StringIO()
+        self._write_sml_list(stream, '', None, None)
+        return stream.getvalue()
 
-        def _lsf(value, level=''):  # create_list_sml_string
-            deep_level = level + self._SML_TAB
-            vv = list()
-            vv.append(level + '<L [' + str(len(value)) + ']')
-            for x in value:
-                if x.type == 'L':
-                    vv.append(_lsf(x.value, deep_level))
-                else:
-                    vv.append(deep_level + x.to_sml())
-            vv.append(level + '>')
-            return self._SML_LINESEPARATOR.join(vv)
-
-        return _lsf(self._value)
+    def _write_sml(self, stream, level, max_depth, max_items):
+        self._write_sml_list(stream, level, max_depth, max_items)
 
     def _create_to_bytes(self):
+        buffer = bytearray(self.byte_size())
+        self._write_into(buffer, 0)
+        return bytes(buffer)
+
+    def _create_byte_size(self):
         v_len = len(self._value)
-        bs_len = struct.pack('>L', v_len)
-        bs_vv = b''.join([x.to_bytes() for x in self._value])
-        if v_len >= self._BYTES_LEN_3:
-            return struct.pack('>B', (self._type[1] | 0x03)) + bs_len[1:4] + bs_vv
-        elif v_len >= self._BYTES_LEN_2:
-            return struct.pack('>B', (self._type[1] | 0x02)) + bs_len[2:4] + bs_vv
-        else:
-            return struct.pack('>B', (self._type[1] | 0x01)) + bs_len[3:4] + bs_vv
+        return self._header_size(v_len) + sum([x.byte_size() for x in self._value])
+
+    def _write_into(self, buffer, offset):
+        pos = self._write_header_into(buffer, offset, len(self._value))
+        for x in self._value:
+            pos = x.write_into(buffer, pos)
+        return pos
 
     @staticmethod
-    def build(item_type, value):
-        return Secs2ListBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2ListBody(item_type, value, trusted)
+
+
+
+class Secs2LazyBody(AbstractSecs2Body):
+    """SECS-II body decoded on demand.
+
+    Backed by the received body bytes. Only item headers are read
+    until a value is accessed, and only the accessed subtree is decoded.
+    Parse errors are raised on access as Secs2BodyBytesParseError.
+    Trailing bytes after a non-empty list are detected when the list end is reached,
+    by to_bytes or decoding the list.
+    """
+
+    __slots__ = (
+        '__bs', '__pos', '__compact', '__start', '__v_len', '__end', '__bytes_end',
+        '__offsets', '__children', '__decoded'
+    )
+
+    def __init__(self, body_bytes, pos=0, compact=False, end=None):
+        # end: bytes end of root item, item must end at it
+        tt, start_index, v_len = Secs2BodyBuilder._item_header(body_bytes, pos)
+        super(Secs2LazyBody, self).__init__(tt, None)
+        self.__bs = body_bytes
+        self.__pos = pos
+        self.__compact = compact
+        self.__start = start_index
+        self.__v_len = v_len
+        self.__bytes_end = end
+        if tt[0] == 'L' and v_len > 0:
+            # checked when end is reached
+            self.__end = None
+        else:
+            self.__end = start_index + v_len
+            self.__check_bytes_end(self.__end)
+        self.__offsets = None
+        self.__children = None
+        self.__decoded = None
+
+    @property
+    def _value(self):
+        if self._type[0] == 'L':
+            return tuple([self.__child(i) for i in range(self.__v_len)])
+        else:
+            return self.__decode()._value
+
+    @_value.setter
+    def _value(self, val):
+        # value is always decoded from body bytes
+        pass
+
+    def __len__(self):
+        if self._type[0] == 'L':
+            return self.__v_len
+        else:
+            return len(self.__decode())
+
+    def __getitem__(self, item):
+        if self._type[0] == 'L' and type(item) is int:
+            i = item + self.__v_len if item < 0 else item
+            if i < 0 or i >= self.__v_len:
+                raise Secs2BodyParseError("list index out of range")
+            return self.__child(i)
+        else:
+            return super(Secs2LazyBody, self).__getitem__(item)
+
+    def __offset(self, index):  # offset index, extended up to index on demand
+        if self.__offsets is None:
+            self.__offsets = [self.__start]
+        while len(self.__offsets) <= index:
+            self.__offsets.append(Secs2BodyBuilder._skip_item(self.__bs, self.__offsets[-1]))
+        return self.__offsets[index]
+
+    def __child(self, index):
+        if self.__children is None:
+            self.__children = [None] * self.__v_len
+
+        v = self.__children[index]
+        if v is None:
+            v = Secs2LazyBody(self.__bs, self.__offset(index), self.__compact)
+            self.__children[index] = v
+        return v
+
+    def __end_index(self):
+        if self.__end is None:
+            end = Secs2BodyBuilder._skip_item(self.__bs, self.__offset(self.__v_len - 1))
+            self.__check_bytes_end(end)
+            self.__end = end
+        return self.__end
+
+    def __check_bytes_end(self, end):
+        if self.__bytes_end is not None and end != self.__bytes_end:
+            raise Secs2BodyBytesParseError(
+                "not reach bytes end, reach=" + str(end) + ", length=" + str(self.__bytes_end))
+
+    def __decode(self):
+        if self.__decoded is None:
+            bs = self.__bs
+            if type(bs) is not memoryview:
+                bs = memoryview(bs)
+            self.__decoded = Secs2BodyBuilder.from_body_bytes(
+                bs[self.__pos:self.__end_index()],
+                compact=self.__compact)
+        return self.__decoded
+
+    def _create_to_sml(self):
+        return self.__decode().to_sml()
+
+    def _write_sml(self, stream, level, max_depth, max_items):
+        if self._type[0] == 'L':
+            self._write_sml_list(stream, level, max_depth, max_items)
+        else:
+            self.__decode()._write_sml(stream, level, max_depth, max_items)
+
+    def _create_to_bytes_value(self):
+        bs = self.__bs
+        if type(bs) is not memoryview:
+            bs = memoryview(bs)
+        return bs[self.__start:self.__end_index()]
+
+    def _create_to_bytes(self):
+        bs = self.__bs
+        end = self.__end_index()
+        if type(bs) is bytes and self.__pos == 0 and end == len(bs):
+            return bs
+        return bytes(bs[self.__pos:end])
+
+    def _create_byte_size(self):
+        return self.__end_index() - self.__pos
+
+    def _write_into(self, buffer, offset):
+        bs = self.__bs
+        if type(bs) is not memoryview:
+            bs = memoryview(bs)
+        end = offset + self.byte_size()
+        buffer[offset:end] = bs[self.__pos:self.__end_index()]
+        return end
 
 
 class Secs2BodyBuilder:
@@ -409,9 +921,26 @@ class Secs2BodyBuilder:
         ('U4',      0xB0,  4, 'L',  False,  Secs2IntegerBody.build)
     )
 
+    _INT_RANGES = {i[0]: AbstractSecs2Body._int_range(i) for i in _ITEMS if i[4] is not None}
+
     @classmethod
-    def build(cls, item_type, value):
+    def build(cls, item_type, value, trusted=False):
+        """Build Secs2Body.
+
+        Args:
+            item_type (str or tuple): item type, 'L', 'B', 'U4', ...
+            value (Any): value.
+            trusted (bool): skip conversion and range check of
+                'B', 'I1'-'I8', 'U1'-'U8', 'F4', 'F8' list values. Defaults to False.
+                Require values already int (or float), and in range.
+
+        Raises:
+            TypeError: if item_type is not str or tuple.
+            ValueError: if value is out of range.
 
+        Returns:
+            AbstractSecs2Body: Secs2Body
+        """
         if item_type is None:
             raise TypeError("Not accept None")
 
@@ -424,125 +953,286 @@ class Secs2BodyBuilder:
         else:
             raise TypeError("Require str or tuple")
 
-        return ref_type[5](ref_type, value)
+        k = cls._intern_key(ref_type, value)
+        if k is not None:
+            return cls._interned(ref_type, k)
 
-    @classmethod
-    def get_item_type_from_sml(cls, sml_item_type):
-        str_upper = sml_item_type.upper()
-        for i in cls._ITEMS:
-            if i[0] == str_upper:
-                return i
-        raise ValueError("'" + sml_item_type + "' not found")
+        return ref_type[5](ref_type, value, trusted)
+
+    _INTERN_SCALARS = {
+        'B': (0, 0xFF),
+        'U1': (0, 0xFF),
+        'I1': (-0x80, 0x7F)
+    }
+    _INTERNED = dict()
 
     @classmethod
-    def from_body_bytes(cls, body_bytes):
+    def _intern_key(cls, item_type, value):
+        """Key of interned item, if value is empty or small scalar.
 
-        def _itr(b):    # get_item_type
-            x = b & 0xFC
-            for i in cls._ITEMS:
-                if i[1] == x:
-                    return i
-            raise ValueError('0x' + '{:02X}'.format(b) + " not found")
+        Small scalars are single 'B', 'U1', 'I1' and 'BOOLEAN' values.
 
-        def _xr(bs, pos):   # get (item_type, value_length, shift_position)
+        Returns:
+            tuple: (item-type-name, None if empty, otherwise value), None if not interned.
+        """
+        name = item_type[0]
+        tv = type(value)
 
-            b = bs[pos]
-            t = _itr(b)
-            len_bit = b & 0x3
+        if tv is tuple or tv is list:
+            if not value:
+                return None if name == 'A' else (name, None)
+            if len(value) != 1:
+                return None
+            value = value[0]
+            tv = type(value)
 
-            if len_bit == 3:
-                len_bs = (bs[pos+1] << 16) | (bs[pos+2] << 8) | bs[pos+3]
-            elif len_bit == 2:
-                len_bs = (bs[pos+1] << 8) | bs[pos+2]
-            else:
-                len_bs = bs[pos+1]
+        elif tv is bytes:
+            if name != 'B':
+                return None
+            if not value:
+                return (name, None)
+            if len(value) != 1:
+                return None
+            value = value[0]
+            tv = int
 
-            return t, len_bs, (len_bit + 1)
+        elif tv is str:
+            return (name, None) if (name == 'A' and not value) else None
 
-        def _f(bs, pos):
+        if name == 'BOOLEAN':
+            return (name, value) if tv is bool else None
 
-            r = _xr(bs, pos)
-            tt, v_len, b_len = _xr(bs, pos)
-            start_index = pos + b_len
-            end_index = pos + b_len + v_len
+        r = cls._INTERN_SCALARS.get(name)
+        if r is not None and tv is int and r[0] <= value <= r[1]:
+            return (name, value)
 
-            if tt[0] == 'L':
-                vv = list()
-                p = start_index
-                for _ in range(r[1]):
-                    v, p = _f(bs, p)
-                    vv.append(v)
-                return tt[5](tt, vv), p
+        return None
 
-            elif tt[0] == 'BOOLEAN':
-                vv = [(b != 0x00) for b in bs[start_index:end_index]]
-                return tt[5](tt, vv), end_index
+    @classmethod
+    def _interned(cls, item_type, key):
+        """Canonical shared instance of empty or small scalar item.
 
-            elif tt[0] == 'A':
-                if os.getenv('SECS_EXTENDED'):
-                    v = bs[start_index:end_index]
-                    v = v.decode(encoding='ascii') if all([c <= 128 for c in v]) else bytes([c for c in v])
-                    return tt[5](tt, v), end_index
+        Items are immutable, bytes and SML are built once on first use.
 
-                v = bs[start_index:end_index].decode(encoding='ascii')
-                return tt[5](tt, v), end_index
+        Returns:
+            AbstractSecs2Body: Secs2Body
+        """
+        v = cls._INTERNED.get(key)
+        if v is None:
+            if key[1] is None:
+                v = item_type[5](item_type, ('' if key[0] == 'A' else tuple()))
+            else:
+                v = item_type[5](item_type, (key[1], ))
+            v.to_bytes()
+            v.to_sml()
+            v = cls._INTERNED.setdefault(key, v)
+        return v
 
-            elif tt[0] == 'B':
-                vv = bs[start_index:end_index]
-                return tt[5](tt, vv), end_index
+    _SML_ITEMS = {i[0]: i for i in _ITEMS}
 
-            elif tt[0] in ('I1', 'I2', 'I4', 'I8', 'F8', 'F4', 'U1', 'U2', 'U4', 'U8'):
-                vv = list()
-                p = start_index
-                for _ in range(0, v_len, tt[2]):
-                    prev = p
-                    p += tt[2]
-                    v = struct.unpack(('>' + tt[3]), bs[prev:p])
-                    vv.append(v[0])
-                return tt[5](tt, vv), end_index
+    @classmethod
+    def get_item_type_from_sml(cls, sml_item_type):
+        try:
+            return cls._SML_ITEMS[sml_item_type.upper()]
+        except KeyError:
+            raise ValueError("'" + sml_item_type + "' not found")
 
+    _FORMAT_TABLE = tuple(map(
+        {(i[1] | n): (i, n) for i in _ITEMS for n in (1, 2, 3)}.get,
+        range(256)))
+
+    @classmethod
+    def _item_header(cls, bs, pos):  # return (item_type, value_start_position, value_length)
         try:
-            if len(body_bytes) == 0:
-                return None
+            b = bs[pos]
+            x = cls._FORMAT_TABLE[b]
+            if x is None:
+                raise Secs2BodyBytesParseError('0x' + '{:02X}'.format(b) + " not found")
 
-            lr, lp = _f(body_bytes, 0)
-            len_body = len(body_bytes)
+            tt, len_bit = x
 
-            if lp == len_body:
-                lr._cache_bytes = bytes(body_bytes)
-                return lr
+            if len_bit == 1:
+                v_len = bs[pos+1]
+            elif len_bit == 2:
+                v_len = (bs[pos+1] << 8) | bs[pos+2]
             else:
-                raise Secs2BodyBytesParseError("not reach bytes end, reach=" + str(lp) + ", length=" + str(len_body))
+                v_len = (bs[pos+1] << 16) | (bs[pos+2] << 8) | bs[pos+3]
+
+            return tt, (pos + len_bit + 1), v_len
 
-        except ValueError as e:
-            raise Secs2BodyBytesParseError(e)
-        except TypeError as e:
-            raise Secs2BodyBytesParseError(e)
         except IndexError as e:
             raise Secs2BodyBytesParseError(e)
 
+    @classmethod
+    def _skip_item(cls, bs, pos):  # return item end position
+        tt, p, v_len = cls._item_header(bs, pos)
+        if tt[0] == 'L':
+            for _ in range(v_len):
+                p = cls._skip_item(bs, p)
+            return p
+        else:
+            p += v_len
+            if p > len(bs):
+                raise Secs2BodyBytesParseError("not reach item end, end=" + str(p) + ", length=" + str(len(bs)))
+            return p
 
-class SmlParseError(Exception):
+    @classmethod
+    def from_body_bytes(cls, body_bytes, lazy=False, compact=False):
+        """Parse SECS-II body bytes.
 
-    def __init__(self, msg):
-        super(SmlParseError, self).__init__(msg)
+        If body_bytes is a memoryview, 'A' and 'B' items keep their payload
+        as a view of it and copy on first access to the value.
 
+        If lazy is True, return Secs2LazyBody, decoded on access.
 
-class Secs2BodySmlParseError(SmlParseError):
+        If compact is True, I1-I8, U1-U8, F4 and F8 values are array.array
+        instead of tuple.
 
-    def __init__(self, msg):
-        super(Secs2BodySmlParseError, self).__init__(msg)
+        Args:
+            body_bytes (bytes or memoryview): SECS-II body bytes.
+            lazy (bool): decode on access. Defaults to False.
+            compact (bool): decode numbers to array.array. Defaults to False.
 
+        Raises:
+            Secs2BodyBytesParseError: if parse failed.
 
-class SmlParser:
+        Returns:
+            AbstractSecs2Body: Secs2Body, None if body_bytes is empty.
+        """
+        if lazy:
+            return Secs2LazyBody(body_bytes, 0, compact, len(body_bytes)) if len(body_bytes) > 0 else None
+
+        table = cls._FORMAT_TABLE
+        interned = cls._INTERNED
+        scalars = cls._INTERN_SCALARS
+        extended = os.getenv('SECS_EXTENDED')
+        is_view = type(body_bytes) is memoryview
+
+        def _f(bs, pos, m):
+
+            b = bs[pos]
+            x = table[b]
+            if x is None:
+                raise ValueError('0x' + '{:02X}'.format(b) + " not found")
+
+            tt, len_bit = x
+
+            if len_bit == 1:
+                v_len = bs[pos+1]
+            elif len_bit == 2:
+                v_len = (bs[pos+1] << 8) | bs[pos+2]
+            else:
+                v_len = (bs[pos+1] << 16) | (bs[pos+2] << 8) | bs[pos+3]
+
+            start_index = pos + len_bit + 1
+            end_index = start_index + v_len
+
+            if v_len <= 1 and end_index <= m and not (compact and tt[4] is not None):
+                if v_len == 0:
+                    k = (tt[0], None)
+                elif tt[0] == 'BOOLEAN':
+                    k = (tt[0], bs[start_index] != 0x00)
+                elif tt[0] in scalars:
+                    k = bs[start_index]
+                    k = (tt[0], (k - 0x100 if (tt[0] == 'I1' and k > 0x7F) else k))
+                else:
+                    k = None
+                if k is not None:
+                    v = interned.get(k)
+                    if v is None:
+                        v = cls._interned(tt, k)
+                    return v, end_index
+
+            if tt[0] == 'L':
+                vv = list()
+                p = start_index
+                for _ in range(v_len):
+                    v, p = _f(bs, p, m)
+                    vv.append(v)
+                return tt[5](tt, vv), p
+
+            if end_index > m:
+                raise Secs2BodyBytesParseError("not reach item end, end=" + str(end_index) + ", length=" + str(m))
+
+            if tt[0] == 'BOOLEAN':
+                vv = [(b != 0x00) for b in bs[start_index:end_index]]
+                return tt[5](tt, vv), end_index
+
+            elif tt[0] == 'A':
+                v = bs[start_index:end_index]
+                if is_view:
+                    # validate now, decode on first access
+                    if not extended and max(v, default=0) > 0x7F:
+                        raise Secs2BodyBytesParseError("'A' has not ASCII bytes")
+                    return tt[5](tt, v), end_index
+                if extended:
+                    v = v.decode(encoding='ascii') if all([c <= 128 for c in v]) else bytes([c for c in v])
+                else:
+                    v = v.decode(encoding='ascii')
+                return tt[5](tt, v), end_index
+
+            elif tt[0] == 'B':
+                return tt[5](tt, bs[start_index:end_index]), end_index
+
+            else:
+                if v_len % tt[2] != 0:
+                    raise Secs2BodyBytesParseError(tt[0] + " length is not multiple of " + str(tt[2]))
+                if compact:
+                    vv = AbstractSecs2NumberBody._array_from_bytes(tt, memoryview(bs)[start_index:end_index])
+                else:
+                    vv = struct.unpack_from(('>' + str(v_len // tt[2]) + tt[3]), bs, start_index)
+                return tt[5](tt, vv, True), end_index
+
+        try:
+            len_body = len(body_bytes)
+
+            if len_body == 0:
+                return None
+
+            lr, lp = _f(body_bytes, 0, len_body)
+
+            if lp == len_body:
+                return lr
+            else:
+                raise Secs2BodyBytesParseError("not reach bytes end, reach=" + str(lp) + ", length=" + str(len_body))
+
+        except ValueError as e:
+            raise Secs2BodyBytesParseError(e)
+        except TypeError as e:
+            raise Secs2BodyBytesParseError(e)
+        except IndexError as e:
+            raise Secs2BodyBytesParseError(e)
+        except struct.error as e:
+            raise Secs2BodyBytesParseError(e)
+
+
+class SmlParseError(Exception):
+
+    def __init__(self, msg):
+        super(SmlParseError, self).__init__(msg)
+
+
+class Secs2BodySmlParseError(SmlParseError):
+
+    def __init__(self, msg):
+        super(Secs2BodySmlParseError, self).__init__(msg)
+
+
+class SmlParser:
 
     _SML_PATTERN = '[Ss]([0-9]{1,3})[Ff]([0-9]{1,3})\\s*([Ww]?)\\s*((<.*>)?)\\s*\\.$'
     _SML_PROG = re.compile(_SML_PATTERN)
 
+    _PARSE_CACHE_MAX_LENGTH = 1024
+
     @classmethod
     def parse(cls, sml_str):
         """parse from SML to Tuple
 
+        Results of SML up to 1024 characters are cached by SML string,
+        same SML returns same secs2body instance.
+        Secs2body is immutable, shared between callers.
+
         Args:
             sml_str (str): SML string.
 
@@ -558,6 +1248,18 @@ class SmlParser:
                 AbstractSecs2Body: secs2body or None
             )
         """
+        if len(sml_str) <= cls._PARSE_CACHE_MAX_LENGTH:
+            return cls._parse_cached(sml_str)
+        else:
+            return cls._parse(sml_str)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_cached(cls, sml_str):
+        return cls._parse(sml_str)
+
+    @classmethod
+    def _parse(cls, sml_str):
         s = sml_str.replace('\n', ' ').strip()
         if not s.endswith("."):
             raise SmlParseError("SML not endswith '.'")
@@ -575,125 +1277,111 @@ class SmlParser:
             cls._parse_body(body) if len(body) > 0 else None
         )
 
+    _SML_TOKEN_PATTERN = (
+        '[\\x00-\\x20]*(?:'
+        '(<)'                           # 1: item start bracket
+        '|(>)'                          # 2: item end bracket
+        '|(\\[[^\\]]*\\])'              # 3: size bracket
+        '|"([^"]*)"'                    # 4: ascii string
+        '|([^\\x00-\\x20\\[\\]"<>]+)'     # 5: word
+        '|(.)'                          # 6: not accept
+        ')'
+    )
+    _SML_TOKEN_PROG = re.compile(_SML_TOKEN_PATTERN, re.DOTALL)
+
     @classmethod
     def _parse_body(cls, sml_str):
 
-        def _is_ws(v):  # is_white_space
-            return (v.encode(encoding='ascii'))[0] <= 0x20
-
-        def _seek_next(s, from_pos, *args):
-            p = from_pos
-            if len(args) > 0:
-                while True:
-                    v = s[p]
-                    for a in args:
-                        if type(a) is str:
-                            if v == a:
-                                return v, p
-                        else:
-                            if a(v):
-                                return v, p
-                    p += 1
-            else:
-                while True:
-                    v = s[p]
-                    if _is_ws(v):
-                        p += 1
-                    else:
-                        return v, p
-
-        def _ssbkt(s, from_pos):    # seek size_start_bracket'[' position, return position, -1 if not exist
-            v, p = _seek_next(s, from_pos)
-            return p if v == '[' else -1
-
-        def _sebkt(s, from_pos):    # seek size_end_bracket']' position, return position
-            return (_seek_next(s, from_pos, ']'))[1]
-
-        def _isbkt(s, from_pos):    # seek item_start_bracket'<' position, return position, -1 if not exist
-            v, p = _seek_next(s, from_pos)
-            return p if v == '<' else -1
-
-        def _iebkt(s, from_pos):    # seek item_end_bracket'>' position, return position
-            return (_seek_next(s, from_pos, '>'))[1]
-
-        def _seek_item(s, from_pos):  # seek item_type, return (item_type, shifted_position)
-            p_start = (_seek_next(s, from_pos))[1]
-            p_end = (_seek_next(s, (p_start + 1), '[', '"', '<', '>', _is_ws))[1]
-            return Secs2BodyBuilder.get_item_type_from_sml(s[p_start:p_end]), p_end
-
-        def _f(s, from_pos):
+        def _f(tokens, i):
 
-            p = _isbkt(s, from_pos)
-
-            if p < 0:
+            if tokens[i][0] is None:
                 raise Secs2BodySmlParseError("Not start < bracket")
 
-            tt, p = _seek_item(s, (p + 1))
+            x = tokens[i + 1][4]
+            if x is None:
+                raise Secs2BodySmlParseError("Not found item type")
+
+            tt = Secs2BodyBuilder.get_item_type_from_sml(x)
 
-            r = _ssbkt(s, p)
-            if r >= 0:
-                p = _sebkt(s, (r + 1)) + 1
+            i += 2
+            if tokens[i][2] is not None:
+                i += 1
 
             if tt[0] == 'L':
                 vv = list()
                 while True:
-                    v, p = _seek_next(s, p)
-                    if v == '>':
-                        return tt[5](tt, vv), (p + 1)
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, vv), (i + 1)
 
-                    elif v == '<':
-                        r, p = _f(s, p)
+                    elif t[0] is not None:
+                        r, i = _f(tokens, i)
                         vv.append(r)
 
                     else:
                         raise Secs2BodySmlParseError("Not reach LIST end")
 
             elif tt[0] == 'BOOLEAN':
-                r = _iebkt(s, p)
                 vv = list()
-                for x in s[p:r].strip().split():
-                    ux = x.upper()
+                while True:
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, vv), (i + 1)
+
+                    if t[4] is None:
+                        raise Secs2BodySmlParseError("Not reach BOOLEAN end")
+
+                    ux = t[4].upper()
                     if ux == 'TRUE' or ux == 'T':
                         vv.append(True)
                     elif ux == 'FALSE' or ux == 'F':
                         vv.append(False)
                     else:
                         raise Secs2BodySmlParseError("Not accept, BOOLEAN require TRUE or FALSE")
-                return tt[5](tt, vv), (r + 1)
+                    i += 1
 
             elif tt[0] == 'A':
                 vv = list()
                 while True:
-                    v, p_start = _seek_next(s, p)
-                    if v == '>':
-                        return tt[5](tt, ''.join(vv)), (p_start + 1)
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, ''.join(vv)), (i + 1)
 
-                    elif v == '"':
-                        v, p_end = _seek_next(s, (p_start + 1), '"')
-                        vv.append(s[(p_start+1):p_end])
-                        p = p_end + 1
+                    elif t[3] is not None:
+                        vv.append(t[3])
 
-                    elif v == '0':
-                        if s[p_start + 1] not in ('X', 'x'):
+                    elif t[4] is not None:
+                        if not (t[4].startswith('0x') or t[4].startswith('0X')):
                             raise Secs2BodySmlParseError("Ascii not accept 0xNN")
-                        v, p = _seek_next(s, (p_start+2), '"', '>', _is_ws)
-                        vv.append(bytes([int(s[(p_start+2):p], 16)]).decode(encoding='ascii'))
+                        vv.append(bytes([int(t[4][2:], 16)]).decode(encoding='ascii'))
 
                     else:
                         raise Secs2BodySmlParseError("Ascii not reach end")
+                    i += 1
+
+            else:
+                vv = list()
+                while True:
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, vv), (i + 1)
+
+                    elif t[4] is not None:
+                        vv.append(t[4])
 
-            elif tt[0] in ('B', 'I1', 'I2', 'I4', 'I8', 'F4', 'F8', 'U1', 'U2', 'U4', 'U8'):
-                r = _iebkt(s, p)
-                return tt[5](tt, s[p:r].strip().split()), (r + 1)
+                    else:
+                        raise Secs2BodySmlParseError("Not reach " + tt[0] + " end")
+                    i += 1
 
         try:
             if sml_str is None:
                 raise Secs2BodySmlParseError("Not accept None")
 
             ss = str(sml_str).strip()
-            lr, lp = _f(ss, 0)
-            if len(ss[lp:]) > 0:
-                raise Secs2BodySmlParseError("Not reach end, end=" + str(lp) + ", length=" + str(len(ss)))
+            tokens = [m.groups() for m in cls._SML_TOKEN_PROG.finditer(ss)]
+            lr, lp = _f(tokens, 0)
+            if lp < len(tokens):
+                raise Secs2BodySmlParseError("Not reach end, end=" + str(lp) + ", tokens=" + str(len(tokens)))
             return lr
 
         except TypeError as e:
@@ -704,6 +1392,301 @@ class SmlParser:
             raise Secs2BodySmlParseError(str(e))
 
 
+class Secs2TemplateError(Exception):
+
+    def __init__(self, msg):
+        super(Secs2TemplateError, self).__init__(msg)
+
+
+class Secs2Placeholder:
+
+    def __init__(self, name):
+        self.__name = str(name)
+
+    def __repr__(self):
+        return '$' + self.__name
+
+    @property
+    def name(self):
+        pass
+
+    @name.getter
+    def name(self):
+        """Placeholder name getter.
+
+        Returns:
+            str: name
+        """
+        return self.__name
+
+
+class Secs2Template:
+    """Precompiled SECS-II body, constant items are encoded once.
+
+    Compile once, and render many times with placeholder values.
+
+    Examples:
+        tmpl = Secs2Template.compile('S6F11 W <L <U4 $dataid> <U4 1001> <L <A $text> > >.')
+        comm.send_template(tmpl, dataid=1, text="ON FIRE")
+
+        tmpl = Secs2Template.compile(
+            ('L', [
+                ('U4', Secs2Template.placeholder('dataid')),
+                ('U4', [1001])
+            ]))
+        comm.send(6, 11, True, tmpl.render(dataid=1))
+    """
+
+    _SML_PLACEHOLDER_PATTERN = (
+        '("[^"]*")'                                 # 1: ascii string, not replaced
+        '|<\\s*([A-Za-z0-9]+)\\s*(\\[[^\\]]*\\])?'  # 2: item type, 3: size bracket
+        '\\s*\\$([A-Za-z_][A-Za-z0-9_]*)\\s*>'      # 4: placeholder name
+    )
+    _SML_PLACEHOLDER_PROG = re.compile(_SML_PLACEHOLDER_PATTERN)
+    _SML_MESSAGE_PROG = re.compile(SmlParser._SML_PATTERN, re.DOTALL)
+    _SML_MARKER = '\x00'
+
+    def __init__(self, chunks, strm=None, func=None, wbit=False):
+        self.__chunks = tuple(chunks)
+        self.__names = frozenset([x[0] for x in self.__chunks if type(x) is not bytes])
+        self.__strm = strm
+        self.__func = func
+        self.__wbit = bool(wbit)
+
+    @property
+    def strm(self):
+        pass
+
+    @strm.getter
+    def strm(self):
+        """Stream-Number getter.
+
+        Returns:
+            int: Stream-Number, None if compiled from SECS-II body.
+        """
+        return self.__strm
+
+    @property
+    def func(self):
+        pass
+
+    @func.getter
+    def func(self):
+        """Function-Number getter.
+
+        Returns:
+            int: Function-Number, None if compiled from SECS-II body.
+        """
+        return self.__func
+
+    @property
+    def wbit(self):
+        pass
+
+    @wbit.getter
+    def wbit(self):
+        """W-Bit getter.
+
+        Returns:
+            bool: W-Bit
+        """
+        return self.__wbit
+
+    @property
+    def names(self):
+        pass
+
+    @names.getter
+    def names(self):
+        """Placeholder names getter.
+
+        Returns:
+            frozenset: names
+        """
+        return self.__names
+
+    def render(self, **values):
+        """Render SECS-II body.
+
+        Args:
+            **values: placeholder values, same as build value, or AbstractSecs2Body.
+
+        A placeholder used under several item types is built once per item type.
+
+        Raises:
+            Secs2TemplateError: if placeholder value missing or unknown.
+            TypeError: if value type not accepted, or AbstractSecs2Body of other item type.
+            ValueError: if value is out of range.
+
+        Returns:
+            AbstractSecs2Body: Secs2Body
+        """
+        for k in values:
+            if k not in self.__names:
+                raise Secs2TemplateError("'" + k + "' is not placeholder")
+
+        encoded = dict()
+        vv = list()
+        for x in self.__chunks:
+            if type(x) is bytes:
+                vv.append(x)
+            else:
+                name, tt = x
+                bs = encoded.get(x)
+                if bs is None:
+                    try:
+                        v = values[name]
+                    except KeyError:
+                        raise Secs2TemplateError("'" + name + "' value missing")
+                    if isinstance(v, AbstractSecs2Body):
+                        if v.type != tt[0]:
+                            raise TypeError("'" + name + "' require " + tt[0] + ", value is " + v.type)
+                    else:
+                        v = Secs2BodyBuilder.build(tt, v)
+                    bs = v.to_bytes()
+                    encoded[x] = bs
+                vv.append(bs)
+
+        bs = b''.join(vv)
+        if len(bs) == 0:
+            return None
+        return Secs2LazyBody(bs, end=len(bs))
+
+    @staticmethod
+    def placeholder(name):
+        """Placeholder for tuple-style compile.
+
+        Args:
+            name (str): name, render keyword.
+
+        Returns:
+            Secs2Placeholder: placeholder
+        """
+        return Secs2Placeholder(name)
+
+    @classmethod
+    def compile(cls, v):
+        """Compile template.
+
+        Args:
+            v (str or tuple or list): SML or SECS-II body SML, placeholder is '$name'
+                like '<U4 $name>' or '<L $name>'.
+                Or tuple-style SECS-II body, placeholder is Secs2Template.placeholder('name').
+
+        Raises:
+            Secs2TemplateError: if SML ascii string has NUL.
+            SmlParseError: if SML parse failed.
+            Secs2BodySmlParseError: if Secs2body parse failed.
+            TypeError: if tuple-style body is not accepted.
+            ValueError: if value is out of range or item-type not found.
+
+        Returns:
+            Secs2Template: template
+        """
+        if isinstance(v, str):
+            return cls._compile_sml(v)
+        else:
+            chunks = list()
+            cls._compile_value(v, None, chunks)
+            return Secs2Template(cls._join_chunks(chunks))
+
+    @classmethod
+    def _compile_sml(cls, sml_str):
+
+        markers = list()
+
+        def _mark(m):
+            if m.group(1) is not None:
+                if cls._SML_MARKER in m.group(1):
+                    raise Secs2TemplateError("ascii string not accept NUL")
+                return m.group(1)
+            markers.append((
+                m.group(4),
+                Secs2BodyBuilder.get_item_type_from_sml(m.group(2))
+            ))
+            return '<A "' + cls._SML_MARKER + str(len(markers) - 1) + '">'
+
+        # newlines are whitespace for the tokenizer, kept inside ascii strings
+        s = cls._SML_PLACEHOLDER_PROG.sub(_mark, sml_str.strip())
+
+        if s.startswith('<'):
+            strm, func, wbit = None, None, False
+            body = SmlParser._parse_body(s)
+        else:
+            x = cls._SML_MESSAGE_PROG.match(s)
+            if x is None:
+                raise SmlParseError("SML not match")
+            strm, func, wbit = int(x.group(1)), int(x.group(2)), len(x.group(3)) > 0
+            body = SmlParser._parse_body(x.group(4)) if len(x.group(4)) > 0 else None
+
+        chunks = list()
+        if body is not None:
+            cls._compile_value(body, markers, chunks)
+
+        return Secs2Template(cls._join_chunks(chunks), strm, func, wbit)
+
+    @classmethod
+    def _compile_value(cls, v, markers, chunks):
+
+        if isinstance(v, AbstractSecs2Body):
+
+            if v.type == 'L':
+                chunks.append(cls._header_bytes(v._type[1], len(v)))
+                for x in v:
+                    cls._compile_value(x, markers, chunks)
+
+            elif (markers is not None
+                  and v.type == 'A'
+                  and type(v.value) is str
+                  and v.value.startswith(cls._SML_MARKER)):
+                chunks.append(markers[int(v.value[1:])])
+
+            else:
+                chunks.append(v.to_bytes())
+
+        else:
+            tv = type(v)
+            if not ((tv is tuple or tv is list) and len(v) == 2):
+                raise TypeError("Secs2Template value require tuple or list, and length == 2")
+
+            tt = v[0]
+            if type(tt) is str:
+                tt = Secs2BodyBuilder.get_item_type_from_sml(tt)
+
+            if isinstance(v[1], Secs2Placeholder):
+                chunks.append((v[1].name, tt))
+
+            elif tt[0] == 'L':
+                tx = type(v[1])
+                if not (tx is tuple or tx is list):
+                    raise TypeError("L values require tuple or list")
+                chunks.append(cls._header_bytes(tt[1], len(v[1])))
+                for x in v[1]:
+                    cls._compile_value(x, markers, chunks)
+
+            else:
+                chunks.append(Secs2BodyBuilder.build(tt, v[1]).to_bytes())
+
+    @staticmethod
+    def _header_bytes(fmt_byte, v_len):
+        if v_len >= 2**16:
+            return bytes([(fmt_byte | 0x03), ((v_len >> 16) & 0xFF), ((v_len >> 8) & 0xFF), (v_len & 0xFF)])
+        elif v_len >= 2**8:
+            return bytes([(fmt_byte | 0x02), ((v_len >> 8) & 0xFF), (v_len & 0xFF)])
+        else:
+            return bytes([(fmt_byte | 0x01), v_len])
+
+    @staticmethod
+    def _join_chunks(chunks):   # join adjacent constant bytes
+        vv = list()
+        for x in chunks:
+            if type(x) is bytes and len(vv) > 0 and type(vv[-1]) is bytes:
+                vv[-1] = vv[-1] + x
+            else:
+                vv.append(x)
+        return vv
+
+
 class SecsMessageParseError(Exception):
 
     def __init__(self, msg):
@@ -714,6 +1697,11 @@ class SecsMessage:
 
     _STR_LINESEPARATOR = os.linesep
 
+    __slots__ = (
+        '__strm', '__func', '__wbit', '__secs2body',
+        '__cache_header10bytes_str'
+    )
+
     def __init__(self, strm, func, wbit, secs2body):
 
         if strm < 0 or strm > 127:
@@ -888,6 +1876,29 @@ class SecsMessage:
 
         return self.__cache_header10bytes_str
 
+    def write_sml(self, stream, max_depth=None, max_items=None):
+        """Write SML to stream.
+
+        Written piece by piece, without building whole SML string.
+
+        Args:
+            stream (io.TextIOBase): text stream, or object has write(str).
+            max_depth (int): 'L' nested deeper than max_depth are written as '<L [n] ... >'.
+                Defaults to None, no limit.
+            max_items (int): write first max_items of values and 'L' items, and '...'.
+                Defaults to None, no limit.
+
+        Returns:
+            None: None
+        """
+        stream.write('S' + str(self.strm) + 'F' + str(self.func))
+        if self.wbit:
+            stream.write(' W')
+        if self.secs2body is not None:
+            stream.write(self._STR_LINESEPARATOR)
+            self.secs2body.write_sml(stream, max_depth, max_items)
+        stream.write('.')
+
 
 class HsmsSsMessageParseError(SecsMessageParseError):
 
@@ -983,6 +1994,12 @@ class HsmsSsRejectReason:
 
 class HsmsSsMessage(SecsMessage):
 
+    __slots__ = (
+        '_system_bytes', '_control_type',
+        '_cache_msg_length', '_cache_str', '_cache_repr', '_cache_bytes',
+        '_cache_header10bytes'
+    )
+
     def __init__(self, strm, func, wbit, secs2body, system_bytes, control_type):
         super(HsmsSsMessage, self).__init__(strm, func, wbit, secs2body)
         self._system_bytes = system_bytes
@@ -991,6 +2008,7 @@ class HsmsSsMessage(SecsMessage):
         self._cache_str = None
         self._cache_repr = None
         self._cache_bytes = None
+        self._cache_header10bytes = None
 
     def __str__(self):
         if self._cache_str is None:
@@ -1031,7 +2049,7 @@ class HsmsSsMessage(SecsMessage):
         if self._cache_msg_length is None:
             i = len(self._header10bytes())
             if self.secs2body is not None:
-                i += len(self.secs2body.to_bytes())
+                i += self.secs2body.byte_size()
             self._cache_msg_length = i
 
         return self._cache_msg_length
@@ -1062,37 +2080,79 @@ class HsmsSsMessage(SecsMessage):
 
     def to_bytes(self):
         if self._cache_bytes is None:
-            msg_len = self._msg_length()
-            vv = [
-                bytes([
-                    (msg_len >> 24) & 0xFF,
-                    (msg_len >> 16) & 0xFF,
-                    (msg_len >> 8) & 0xFF,
-                    msg_len & 0xFF
-                ]),
-                self._header10bytes(),
-                b'' if self.secs2body is None else self.secs2body.to_bytes()
-            ]
-            self._cache_bytes = b''.join(vv)
+            self._cache_bytes = b''.join(self.to_buffers())
         return self._cache_bytes
 
-    @classmethod
-    def from_bytes(cls, bs):
+    def to_buffers(self):
+        """Message buffers getter, for scatter/gather sending.
 
-        h10bs = bs[4:14]
-        sys_bs = h10bs[6:10]
+        Returns:
+            tuple: (4-bytes length + 10-bytes header, body bytes),
+                concatenation is to_bytes().
+        """
+        if self._cache_bytes is not None:
+            return (self._cache_bytes, )
+        msg_len = self._msg_length()
+        return (
+            bytes([
+                (msg_len >> 24) & 0xFF,
+                (msg_len >> 16) & 0xFF,
+                (msg_len >> 8) & 0xFF,
+                msg_len & 0xFF
+            ]) + self._header10bytes(),
+            b'' if self.secs2body is None else self.secs2body.to_bytes()
+        )
 
-        ctrl_type = HsmsSsControlType.get(h10bs[4:6])
+    def write_into(self, buffer, offset=0):
+        """Write message bytes into buffer.
 
-        if ctrl_type == HsmsSsControlType.DATA:
+        Args:
+            buffer (bytearray or memoryview): writable buffer, require (4 + 10 + body) bytes from offset.
+            offset (int): write position. Defaults to 0.
 
-            dev_id = (h10bs[0] << 8) | h10bs[1]
-            strm = h10bs[2] & 0x7F
-            func = h10bs[3]
-            wbit = (h10bs[2] & 0x80) == 0x80
+        Returns:
+            int: position next to written bytes.
+        """
+        msg_len = self._msg_length()
+        buffer[offset:(offset + 4)] = msg_len.to_bytes(4, 'big')
+        buffer[(offset + 4):(offset + 14)] = self._header10bytes()
+        if self.secs2body is None:
+            return offset + 14
+        else:
+            return self.secs2body.write_into(buffer, (offset + 14))
+
+    @classmethod
+    def from_bytes(cls, bs, lazy=False, compact=False):
+        """Parse HSMS-SS message from received frame.
+
+        SECS-II body is parsed over a memoryview of bs,
+        'A' and 'B' item payloads are not copied until accessed.
+        bs is cached as to_bytes() only if bytes. A bytearray is owned by
+        the message, and must not be modified after.
+
+        Args:
+            bs (bytes or bytearray): message frame, 4-bytes length + 10-bytes header + body.
+            lazy (bool): decode SECS-II body on access. Defaults to False.
+            compact (bool): decode numbers to array.array. Defaults to False.
+
+        Returns:
+            HsmsSsMessage: message
+        """
+        mv = memoryview(bs)
+        h10bs = bytes(mv[4:14])
+        sys_bs = h10bs[6:10]
+
+        ctrl_type = HsmsSsControlType.get(h10bs[4:6])
+
+        if ctrl_type == HsmsSsControlType.DATA:
+
+            dev_id = (h10bs[0] << 8) | h10bs[1]
+            strm = h10bs[2] & 0x7F
+            func = h10bs[3]
+            wbit = (h10bs[2] & 0x80) == 0x80
 
             if len(bs) > 14:
-                s2b = Secs2BodyBuilder.from_body_bytes(bs[14:])
+                s2b = Secs2BodyBuilder.from_body_bytes(mv[14:], lazy, compact)
                 v = HsmsSsDataMessage(strm, func, wbit, s2b, sys_bs, dev_id)
             else:
                 v = HsmsSsDataMessage(strm, func, wbit, None, sys_bs, dev_id)
@@ -1100,10 +2160,9 @@ class HsmsSsMessage(SecsMessage):
         else:
 
             v = HsmsSsControlMessage(sys_bs, ctrl_type)
-            v._p_type = h10bs[2]
-            v._s_type = h10bs[3]
 
-        v._cache_bytes = bs
+        if type(bs) is bytes:
+            v._cache_bytes = bs
         v._cache_header10bytes = h10bs
 
         return v
@@ -1111,18 +2170,19 @@ class HsmsSsMessage(SecsMessage):
 
 class HsmsSsDataMessage(HsmsSsMessage):
 
+    __slots__ = ('__session_id', )
+
     def __init__(self, strm, func, wbit, secs2body, system_bytes, session_id):
         super(HsmsSsDataMessage, self).__init__(strm, func, wbit, secs2body, system_bytes, HsmsSsControlType.DATA)
         self.__session_id = session_id
-        self.__cache_header10bytes = None
 
     def _header10bytes(self):
-        if self.__cache_header10bytes is None:
+        if self._cache_header10bytes is None:
             b2 = self.strm
             if self.wbit:
                 b2 |= 0x80
 
-            self.__cache_header10bytes = bytes([
+            self._cache_header10bytes = bytes([
                 (self.session_id >> 8) & 0x7F,
                 self.session_id & 0xFF,
                 b2, self.func,
@@ -1131,7 +2191,7 @@ class HsmsSsDataMessage(HsmsSsMessage):
                 self._system_bytes[2], self._system_bytes[3]
                 ])
 
-        return self.__cache_header10bytes
+        return self._cache_header10bytes
 
     @property
     def session_id(self):
@@ -1147,9 +2207,10 @@ class HsmsSsDataMessage(HsmsSsMessage):
 
 class HsmsSsControlMessage(HsmsSsMessage):
 
+    __slots__ = ()
+
     def __init__(self, system_bytes, control_type):
         super(HsmsSsControlMessage, self).__init__(0, 0, False, None, system_bytes, control_type)
-        self.__cache_header10bytes = None
 
     CONTROL_DEVICE_ID = -1
 
@@ -1157,8 +2218,8 @@ class HsmsSsControlMessage(HsmsSsMessage):
         return self.CONTROL_DEVICE_ID
 
     def _header10bytes(self):
-        if self.__cache_header10bytes is None:
-            self.__cache_header10bytes = bytes([
+        if self._cache_header10bytes is None:
+            self._cache_header10bytes = bytes([
                 0xFF, 0xFF,
                 0x00, 0x00,
                 self._control_type[0], self._control_type[1],
@@ -1166,7 +2227,7 @@ class HsmsSsControlMessage(HsmsSsMessage):
                 self._system_bytes[2], self._system_bytes[3]
                 ])
 
-        return self.__cache_header10bytes
+        return self._cache_header10bytes
 
     @classmethod
     def build_select_request(cls, system_bytes):
@@ -1223,8 +2284,151 @@ class Secs1MessageParseError(SecsMessageParseError):
         super(Secs1MessageParseError, self).__init__(msg)
 
 
+class Secs1Framer:
+    """SECS-I block framing on bytes-like objects.
+
+    Sums and splits are computed on memoryview slices, without per-byte lists.
+    Block is length-byte + header-10-bytes + body (max 244 bytes) + checksum-2-bytes.
+    """
+
+    BLOCK_BODY_SIZE = 244
+    MAX_BLOCKS = 0x7FFF
+
+    @staticmethod
+    def checksum(data):
+        """Checksum of bytes.
+
+        Args:
+            data (bytes-like): header and body bytes.
+
+        Returns:
+            int: 16-bit sum
+        """
+        return sum(memoryview(data).cast('B')) & 0xFFFF
+
+    @classmethod
+    def check_block(cls, buf, size):
+        """Test block checksum.
+
+        Args:
+            buf (bytes-like): block bytes, from length-byte.
+            size (int): block size, length-byte value + 3.
+
+        Returns:
+            bool: True if checksum is valid.
+        """
+        mv = memoryview(buf).cast('B')
+        return cls.checksum(mv[1:(size - 2)]) == ((mv[size - 2] << 8) | mv[size - 1])
+
+    @classmethod
+    def count(cls, body_size):
+        """Count of blocks.
+
+        Args:
+            body_size (int): SECS-II body bytes length.
+
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+
+        Returns:
+            int: count of blocks, at least 1.
+        """
+        bs = cls.BLOCK_BODY_SIZE
+        count = max(1, (body_size + bs - 1) // bs)
+
+        if count > cls.MAX_BLOCKS:
+            raise Secs1MessageParseError("blocks overflow")
+
+        return count
+
+    @classmethod
+    def block(cls, header10bytes, body, index, count=None):
+        """Build one block.
+
+        Only the slice of the block is copied from body.
+
+        Args:
+            header10bytes (bytes): header-10-bytes, block-number bytes are replaced.
+            body (bytes-like): SECS-II body bytes.
+            index (int): block index, from 0.
+            count (int): count of blocks. Defaults to None, counted from body.
+
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+            IndexError: if index out of range.
+
+        Returns:
+            bytes: block bytes.
+        """
+        mv = memoryview(body).cast('B')
+        n = len(mv)
+        if count is None:
+            count = cls.count(n)
+
+        if index < 0 or index >= count:
+            raise IndexError("block index out of range")
+
+        bs = cls.BLOCK_BODY_SIZE
+        pos = index * bs
+        x = min(bs, n - pos)
+        num = index + 1
+
+        b4 = (num >> 8) & 0x7F
+        if num == count:
+            b4 |= 0x80
+        b5 = num & 0xFF
+
+        a = (sum(mv[pos:(pos + x)]) + sum(header10bytes)
+             - header10bytes[4] - header10bytes[5] + b4 + b5)
+
+        v = bytearray(x + 13)
+        v[0] = x + 10
+        v[1:11] = header10bytes
+        v[5] = b4
+        v[6] = b5
+        v[11:(11 + x)] = mv[pos:(pos + x)]
+        v[-2] = (a >> 8) & 0xFF
+        v[-1] = a & 0xFF
+        return bytes(v)
+
+    @classmethod
+    def split(cls, header10bytes, body):
+        """Split message to blocks.
+
+        Args:
+            header10bytes (bytes): header-10-bytes, block-number bytes are replaced.
+            body (bytes-like): SECS-II body bytes.
+
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+
+        Returns:
+            list: block bytes.
+        """
+        mv = memoryview(body).cast('B')
+        count = cls.count(len(mv))
+        return [cls.block(header10bytes, mv, i, count) for i in range(count)]
+
+    @staticmethod
+    def join(blocks):
+        """Join body bytes of blocks.
+
+        Args:
+            blocks (list or tuple): Secs1MessageBlock.
+
+        Returns:
+            bytes: SECS-II body bytes.
+        """
+        return b''.join([memoryview(x.to_bytes())[11:-2] for x in blocks])
+
+
 class Secs1Message(SecsMessage):
 
+    __slots__ = (
+        '_system_bytes', '__device_id', '__rbit',
+        '__cache_header10bytes', '__cache_str', '__cache_repr', '__cache_blocks'
+    )
+
     def __init__(self, strm, func, wbit, secs2body, system_bytes, device_id, rbit):
         super(Secs1Message, self).__init__(strm, func, wbit, secs2body)
         self._system_bytes = system_bytes
@@ -1299,77 +2503,67 @@ class Secs1Message(SecsMessage):
 
     def to_blocks(self):
 
-        def _bb(bs, from_pos):
-            m = len(bs)
-            x = m - from_pos
-            if x > 244:
-                return bs[from_pos:(from_pos + 244)], 244, False
-            else:
-                return bs[from_pos:m], x, True
-
-        def _hh(l_hh, num, l_ebit):
-            b4 = (num >> 8) & 0x7F
-            if l_ebit:
-                b4 |= 0x80
-            b5 = num & 0xFF
-            return bytes([
-                l_hh[0], l_hh[1], l_hh[2], l_hh[3],
-                b4, b5,
-                l_hh[6], l_hh[7], l_hh[8], l_hh[9]
-            ])
-
-        def _sum(l_hh, l_bb):
-            x = sum([i for i in l_hh]) + sum([i for i in l_bb])
-            return bytes([((x >> 8) & 0xFF), (x & 0xFF)])
-
         if self.__cache_blocks is None:
 
-            h10bs = self._header10bytes()
-            if self.secs2body is None:
-                body_bs = bytes()
-            else:
-                body_bs = self.secs2body.to_bytes()
+            self.__cache_blocks = tuple([
+                Secs1MessageBlock(x)
+                for x in Secs1Framer.split(self._header10bytes(), self.__body_view())])
 
-            blocks = []
-            pos = 0
-            block_num = 0
+        return self.__cache_blocks
 
-            while True:
-                block_num += 1
+    def __body_view(self):
+        if self.secs2body is None:
+            return memoryview(bytes())
+        else:
+            return memoryview(self.secs2body.to_bytes())
 
-                if block_num > 0x7FFF:
-                    raise Secs1MessageParseError("blocks overflow")
+    def block_count(self):
+        """Count of blocks.
 
-                bb, shift, ebit = _bb(body_bs, pos)
-                hh = _hh(h10bs, block_num, ebit)
-                ss = _sum(hh, bb)
+        Returns:
+            int: count of blocks, without building blocks.
+        """
+        if self.__cache_blocks is None:
+            return Secs1Framer.count(len(self.__body_view()))
+        else:
+            return len(self.__cache_blocks)
 
-                v = Secs1MessageBlock(bytes([shift + 10]) + hh + bb + ss)
-                blocks.append(v)
+    def get_block(self, index):
+        """Block getter.
 
-                if ebit:
-                    break
+        If blocks are not cached by to_blocks, block is built on demand
+        from memoryview of body, and not cached.
 
-                pos += shift
+        Args:
+            index (int): block index, from 0.
 
-            self.__cache_blocks = tuple(blocks)
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+            IndexError: if index out of range.
 
-        return self.__cache_blocks
+        Returns:
+            Secs1MessageBlock: block.
+        """
+        if self.__cache_blocks is None:
+            return Secs1MessageBlock(
+                Secs1Framer.block(self._header10bytes(), self.__body_view(), index))
+        else:
+            return self.__cache_blocks[index]
 
     @classmethod
-    def from_blocks(cls, blocks):
+    def from_blocks(cls, blocks, lazy=False, compact=False):
 
         if blocks is None or len(blocks) == 0:
             raise Secs1MessageParseError("No blocks")
 
-        bs = b''.join([(x.to_bytes())[11:-2] for x in blocks])
+        bs = Secs1Framer.join(blocks)
 
         try:
             v = Secs1Message(
                 blocks[0].strm,
                 blocks[0].func,
                 blocks[0].wbit,
-                Secs2BodyBuilder.from_body_bytes(bs) if bs else None,
+                Secs2BodyBuilder.from_body_bytes(memoryview(bs), lazy, compact) if bs else None,
                 blocks[0].get_system_bytes(),
                 blocks[0].device_id,
                 blocks[0].rbit
@@ -1383,6 +2577,8 @@ class Secs1Message(SecsMessage):
 
 class Secs1MessageBlock:
 
+    __slots__ = ('__bytes', '__cache_str', '__cache_repr')
+
     def __init__(self, block_bytes):
         self.__bytes = block_bytes
         self.__cache_str = None
@@ -1390,7 +2586,7 @@ class Secs1MessageBlock:
 
     def __str__(self):
         if self.__cache_str is None:
-            self._cache_str = (
+            self.__cache_str = (
                 '[' + '{:02X}'.format(self.__bytes[1])
                 + ' ' + '{:02X}'.format(self.__bytes[2])
                 + '|' + '{:02X}'.format(self.__bytes[3])
@@ -1403,7 +2599,7 @@ class Secs1MessageBlock:
                 + ' ' + '{:02X}'.format(self.__bytes[10])
                 + '] length: ' + str(self.__bytes[0])
                 )
-        return self._cache_str
+        return self.__cache_str
 
     def __repr__(self):
         if self.__cache_repr is None:
@@ -1573,182 +2769,617 @@ class SecsWaitReplyMessageError(SecsWithReferenceMessageError):
         super(SecsWaitReplyMessageError, self).__init__(msg, ref_msg)
 
 
-class AbstractQueuing:
+class SecsTimer:
+    """Deadline timer, one thread for many timeouts.
+
+    Callbacks are called on timer thread, keep them short.
+    Cancelled entries are removed lazily, and the heap is rebuilt
+    when they exceed half of it.
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+    __COMPACT_MIN = 64
 
     def __init__(self):
-        self.__terminated = False
-        self._vv = list()
-        self._v_cdt = threading.Condition()
+        self.__heap = list()
+        self.__seq = 0
+        self.__cancelled = 0
+        self.__cdt = threading.Condition()
+        self.__th = None
 
-    def __enter__(self):
-        return self
+    @classmethod
+    def get_shared(cls):
+        """Shared timer getter.
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.shutdown()
+        Returns:
+            SecsTimer: timer shared by communicators.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = SecsTimer()
+            return cls.__shared
 
-    def shutdown(self):
-        with self._v_cdt:
-            self.__terminated = True
-            self._v_cdt.notify_all()
+    def schedule(self, timeout, callback):
+        """Schedule callback.
 
-    def _is_terminated(self):
-        with self._v_cdt:
-            return self.__terminated
+        Args:
+            timeout (float): seconds.
+            callback (function): no arguments, called after timeout.
 
-    def await_termination(self, timeout=None):
-        with self._v_cdt:
-            return self._v_cdt.wait_for(self._is_terminated, timeout)
+        Returns:
+            list: entry, to cancel.
+        """
+        with self.__cdt:
+            self.__seq += 1
+            entry = [(time.monotonic() + timeout), self.__seq, callback]
+            heapq.heappush(self.__heap, entry)
+            if self.__th is None:
+                self.__th = threading.Thread(target=self.__run, daemon=True)
+                self.__th.start()
+            self.__cdt.notify()
+            return entry
+
+    def cancel(self, entry):
+        """Cancel scheduled callback.
 
-    def put(self, value):
-        with self._v_cdt:
-            if value is not None and not self._is_terminated():
-                self._vv.append(value)
-                self._v_cdt.notify_all()
+        Args:
+            entry (list): entry returned by schedule.
+        """
+        with self.__cdt:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self.__cancelled += 1
+            if self.__cancelled > self.__COMPACT_MIN and self.__cancelled * 2 > len(self.__heap):
+                self.__heap = [x for x in self.__heap if x[2] is not None]
+                heapq.heapify(self.__heap)
+                self.__cancelled = 0
 
-    def puts(self, values):
-        with self._v_cdt:
-            if values and not self._is_terminated():
-                self._vv.extend([v for v in values])
-                self._v_cdt.notify_all()
+    def __len__(self):
+        """Scheduled entries count, includes cancelled entries not removed yet.
 
-    def _poll_vv(self):
-        with self._v_cdt:
-            if self._vv:
-                return self._vv.pop(0)
-            else:
-                return None
+        Returns:
+            int: count
+        """
+        with self.__cdt:
+            return len(self.__heap)
 
+    def __run(self):
+        while True:
+            with self.__cdt:
+                while True:
+                    while self.__heap and self.__heap[0][2] is None:
+                        heapq.heappop(self.__heap)
+                        self.__cancelled -= 1
 
-class CallbackQueuing(AbstractQueuing):
+                    if not self.__heap:
+                        self.__cdt.wait()
+                        continue
 
-    def __init__(self, callback):
-        super(CallbackQueuing, self).__init__()
-        self._cb = callback
+                    d = self.__heap[0][0] - time.monotonic()
+                    if d <= 0.0:
+                        entry = heapq.heappop(self.__heap)
+                        cb = entry[2]
+                        entry[2] = None
+                        break
 
-        def _f():
-            with self._v_cdt:
-                while True:
-                    v = self._poll_vv()
-                    if v is None:
-                        self._v_cdt.wait()
+                    self.__cdt.wait(d)
 
-                        if self._is_terminated():
-                            self._cb(None)
-                            return
+            try:
+                cb()
+            except Exception:
+                pass
 
-                    else:
-                        self._cb(v)
 
-        threading.Thread(target=_f, daemon=True).start()
+class SecsReactor:
+    """Readiness loop, reads sockets and serial ports of many communicators on one thread.
 
+    Callbacks are called on reactor thread when readable, must read once and not block.
+    """
 
-class WaitingQueuing(AbstractQueuing):
+    __shared = None
+    __shared_lock = threading.Lock()
 
     def __init__(self):
-        super(WaitingQueuing, self).__init__()
+        self.__sel = selectors.DefaultSelector()
+        self.__ops = collections.deque()
+        self.__ops_lock = threading.Lock()
+        self.__wakeup_r, self.__wakeup_w = socket.socketpair()
+        self.__wakeup_r.setblocking(False)
+        self.__wakeup_w.setblocking(False)
+        self.__sel.register(self.__wakeup_r, selectors.EVENT_READ, None)
+        self.__th = threading.Thread(target=self.__run, name='secs-reactor', daemon=True)
+        self.__th.start()
 
-    def poll(self, timeout=None):
+    @classmethod
+    def get_shared(cls):
+        """Shared reactor getter.
 
-        with self._v_cdt:
+        Returns:
+            SecsReactor: reactor shared by communicators.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = SecsReactor()
+            return cls.__shared
 
-            if self._is_terminated():
-                return None
+    def register(self, fileobj, callback, error_callback=None):
+        """Register readable callback.
 
-            v = self._poll_vv()
-            if v is not None:
-                return v
+        If callback raises, file object is unregistered and
+        error_callback is called with the exception on reactor thread.
 
-            self._v_cdt.wait(timeout)
+        Args:
+            fileobj (socket.socket or object has fileno()): file object.
+            callback (function): no arguments, called when readable.
+            error_callback (function): 1 argument (exception), or None.
+        """
+        self.__call(self.__sel.register, fileobj, selectors.EVENT_READ, (callback, error_callback))
 
-            if self._is_terminated():
-                return None
+    def unregister(self, fileobj):
+        """Unregister file object, returns after removed from reactor.
 
-            return self._poll_vv()
+        Args:
+            fileobj (socket.socket or object has fileno()): file object.
+        """
+        self.__call(self.__unregister, fileobj)
 
-    def put_to_list(self, values, pos, size, timeout=None):
+    def __unregister(self, fileobj):
+        try:
+            self.__sel.unregister(fileobj)
+        except (KeyError, ValueError):
+            pass
 
-        def _f(vv, p, m):
-            vv_size = len(self._vv)
-            if vv_size > 0:
-                r = m - p
-                if vv_size > r:
-                    vv.extend(self._vv[0:r])
-                    del self._vv[0:r]
-                    return r
-                else:
-                    vv.extend(self._vv)
-                    self._vv.clear()
-                    return vv_size
-            else:
-                return -1
+    def __call(self, func, *args):
 
-        with self._v_cdt:
+        if threading.current_thread() is self.__th:
+            func(*args)
+            return
 
-            if self._is_terminated():
-                return -1
+        ev = threading.Event()
+        errs = list()
 
-            rr = _f(values, pos, size)
-            if rr > 0:
-                return rr
+        def _f():
+            try:
+                func(*args)
+            except Exception as e:
+                errs.append(e)
+            finally:
+                ev.set()
 
-            self._v_cdt.wait(timeout)
+        with self.__ops_lock:
+            self.__ops.append(_f)
 
-            if self._is_terminated():
-                return -1
+        try:
+            self.__wakeup_w.send(b'\x00')
+        except (BlockingIOError, InterruptedError):
+            pass
 
-            return _f(values, pos, size)
+        ev.wait()
 
+        if errs:
+            raise errs[0]
 
-class AbstractSecsCommunicator:
+    def __run(self):
+        while True:
+            for key, mask in self.__sel.select():
 
-    __DEFAULT_TIMEOUT_T1 = 1.0
-    __DEFAULT_TIMEOUT_T2 = 15.0
-    __DEFAULT_TIMEOUT_T3 = 45.0
-    __DEFAULT_TIMEOUT_T4 = 45.0
-    __DEFAULT_TIMEOUT_T5 = 10.0
-    __DEFAULT_TIMEOUT_T6 = 5.0
-    __DEFAULT_TIMEOUT_T7 = 10.0
-    __DEFAULT_TIMEOUT_T8 = 5.0
+                if key.data is None:
+                    try:
+                        while self.__wakeup_r.recv(4096):
+                            pass
+                    except (BlockingIOError, InterruptedError):
+                        pass
 
-    def __init__(self, device_id, is_equip, **kwargs):
+                    while True:
+                        with self.__ops_lock:
+                            if not self.__ops:
+                                break
+                            f = self.__ops.popleft()
+                        f()
+
+                elif self.__sel.get_map().get(key.fd) is key:
+                    callback, error_callback = key.data
+                    try:
+                        callback()
+                    except Exception as e:
+                        self.__unregister(key.fileobj)
+                        if error_callback is not None:
+                            try:
+                                error_callback(e)
+                            except Exception:
+                                pass
 
-        self.__gem = Gem(self)
 
-        self.device_id = device_id
-        self.is_equip = is_equip
+class QueuingFullError(SecsCommunicatorError):
 
-        self.name = kwargs.get('name', None)
-        self.timeout_t1 = kwargs.get('timeout_t1', self.__DEFAULT_TIMEOUT_T1)
-        self.timeout_t2 = kwargs.get('timeout_t2', self.__DEFAULT_TIMEOUT_T2)
-        self.timeout_t3 = kwargs.get('timeout_t3', self.__DEFAULT_TIMEOUT_T3)
-        self.timeout_t4 = kwargs.get('timeout_t4', self.__DEFAULT_TIMEOUT_T4)
-        self.timeout_t5 = kwargs.get('timeout_t5', self.__DEFAULT_TIMEOUT_T5)
-        self.timeout_t6 = kwargs.get('timeout_t6', self.__DEFAULT_TIMEOUT_T6)
-        self.timeout_t7 = kwargs.get('timeout_t7', self.__DEFAULT_TIMEOUT_T7)
-        self.timeout_t8 = kwargs.get('timeout_t8', self.__DEFAULT_TIMEOUT_T8)
+    def __init__(self, msg):
+        super(QueuingFullError, self).__init__(msg)
 
-        gem_mdln = kwargs.get('gem_mdln', None)
-        if gem_mdln is not None:
-            self.gem.mdln = gem_mdln
 
-        gem_softrev = kwargs.get('gem_softrev', None)
-        if gem_softrev is not None:
-            self.gem.softrev = gem_softrev
+class QueuingFullPolicy:
 
-        gem_clock_type = kwargs.get('gem_clock_type', None)
-        if gem_clock_type is not None:
-            self.gem.clock_type = gem_clock_type
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    RAISE = 'raise'
+
+    @classmethod
+    def get(cls, v):
+        for x in (cls.BLOCK, cls.DROP_OLDEST, cls.RAISE):
+            if x == v:
+                return x
+        raise ValueError("'" + str(v) + "' is not QueuingFullPolicy")
+
+
+class AbstractQueuing:
+
+    def __init__(self, maxsize=None, full_policy=QueuingFullPolicy.BLOCK, full_callback=None):
+        # full_callback: if not None, called with QueuingFullError instead of raising, value is dropped
+        self.__terminated = False
+        self.__maxsize = maxsize if maxsize is None else int(maxsize)
+        self.__full_policy = QueuingFullPolicy.get(full_policy)
+        self.__full_callback = full_callback
+        self._vv = collections.deque()
+        self._v_cdt = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def shutdown(self):
+        with self._v_cdt:
+            self.__terminated = True
+            self._v_cdt.notify_all()
+
+    def _is_terminated(self):
+        with self._v_cdt:
+            return self.__terminated
+
+    def await_termination(self, timeout=None):
+        with self._v_cdt:
+            return self._v_cdt.wait_for(self._is_terminated, timeout)
+
+    @property
+    def maxsize(self):
+        pass
+
+    @maxsize.getter
+    def maxsize(self):
+        """Queue max size getter.
+
+        Returns:
+            int: max size, None if unbounded.
+        """
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, val):
+        """Queue max size setter.
+
+        Queued values over new max size are kept.
+
+        Args:
+            val (int or None): max size, None if unbounded.
+        """
+        with self._v_cdt:
+            self.__maxsize = val if val is None else int(val)
+            self._v_cdt.notify_all()
+
+    @property
+    def full_policy(self):
+        pass
+
+    @full_policy.getter
+    def full_policy(self):
+        """Full policy getter.
+
+        Returns:
+            str: QueuingFullPolicy
+        """
+        return self.__full_policy
+
+    @full_policy.setter
+    def full_policy(self, val):
+        """Full policy setter.
+
+        Args:
+            val (str): QueuingFullPolicy
+        """
+        with self._v_cdt:
+            self.__full_policy = QueuingFullPolicy.get(val)
+            self._v_cdt.notify_all()
+
+    def qsize(self):
+        """Queued values count getter.
+
+        Returns:
+            int: count
+        """
+        with self._v_cdt:
+            return len(self._vv)
+
+    def put(self, value):
+        try:
+            with self._v_cdt:
+                if value is not None and not self._is_terminated():
+                    if self.__maxsize is not None and not self.__reserve(1):
+                        return
+                    self._vv.append(value)
+                    self._v_cdt.notify_all()
+
+        except QueuingFullError as e:
+            self.__put_full(e)
+
+    def puts(self, values):
+        try:
+            with self._v_cdt:
+                if values and not self._is_terminated():
+                    try:
+                        if self.__maxsize is None:
+                            self._vv.extend(values)
+                        else:
+                            for v in values:
+                                if not self.__reserve(1):
+                                    return
+                                self._vv.append(v)
+                    finally:
+                        self._v_cdt.notify_all()
+
+        except QueuingFullError as e:
+            self.__put_full(e)
+
+    def __put_full(self, e):
+        if self.__full_callback is None:
+            raise e
+        self.__full_callback(e)
+
+    def __reserve(self, n):   # apply full-policy, return False if terminated while blocking
+        if self.__maxsize is None or len(self._vv) + n <= self.__maxsize:
+            return True
+
+        if self.__full_policy == QueuingFullPolicy.DROP_OLDEST:
+            while self._vv and len(self._vv) + n > self.__maxsize:
+                self._vv.popleft()
+            return True
+
+        elif self.__full_policy == QueuingFullPolicy.RAISE:
+            raise QueuingFullError("Queue is full, maxsize=" + str(self.__maxsize))
+
+        else:
+            self._v_cdt.wait_for(
+                lambda: (self._is_terminated()
+                         or self.__full_policy != QueuingFullPolicy.BLOCK
+                         or self.__maxsize is None
+                         or len(self._vv) + n <= self.__maxsize))
+            if self._is_terminated():
+                return False
+            return self.__reserve(n)
+
+    def _poll_vv(self):
+        with self._v_cdt:
+            if self._vv:
+                v = self._vv.popleft()
+                if self.__maxsize is not None:
+                    self._v_cdt.notify_all()
+                return v
+            else:
+                return None
+
+
+class CallbackQueuing(AbstractQueuing):
+
+    def __init__(self, callback, maxsize=None, full_policy=QueuingFullPolicy.BLOCK, full_callback=None):
+        super(CallbackQueuing, self).__init__(maxsize, full_policy, full_callback)
+        self._cb = callback
+
+        def _f():
+            while True:
+                with self._v_cdt:
+                    v = self._poll_vv()
+                    while v is None:
+                        if self._is_terminated():
+                            break
+                        self._v_cdt.wait()
+                        v = self._poll_vv()
+
+                # callback outside of lock, put is not blocked while callback
+                if v is None:
+                    self._cb(None)
+                    return
+                else:
+                    self._cb(v)
+
+        threading.Thread(target=_f, daemon=True).start()
+
+
+class ExecutorQueuing(AbstractQueuing):
+    """Callback-Queuing dispatched on shared executor.
+
+    No thread per queuing. Callbacks of one queuing are called
+    in put order, one at a time, on executor threads.
+    """
+
+    __DRAIN_BATCH = 64
+
+    def __init__(self, callback, executor, maxsize=None, full_policy=QueuingFullPolicy.BLOCK, full_callback=None):
+        super(ExecutorQueuing, self).__init__(maxsize, full_policy, full_callback)
+        self._cb = callback
+        self.__executor = executor
+        self.__scheduled = False
+        self.__finished = False
+
+    def shutdown(self):
+        super(ExecutorQueuing, self).shutdown()
+        self.__schedule()
+
+    def put(self, value):
+        super(ExecutorQueuing, self).put(value)
+        self.__schedule()
+
+    def puts(self, values):
+        super(ExecutorQueuing, self).puts(values)
+        self.__schedule()
+
+    def __schedule(self):
+        with self._v_cdt:
+            if self.__scheduled or self.__finished:
+                return
+            if not self._vv and not self._is_terminated():
+                return
+            self.__scheduled = True
+
+        try:
+            self.__executor.submit(self.__drain)
+        except RuntimeError:
+            # executor already shutdown
+            with self._v_cdt:
+                self.__scheduled = False
+
+    def __drain(self):
+        try:
+            # drain a batch, and resubmit to share executor with other queuings
+            for _ in range(self.__DRAIN_BATCH):
+                with self._v_cdt:
+                    v = self._poll_vv()
+                    if v is None:
+                        if self.__finished or not self._is_terminated():
+                            return
+                        self.__finished = True
+
+                self._cb(v)
+
+                if v is None:
+                    return
+        finally:
+            with self._v_cdt:
+                self.__scheduled = False
+            self.__schedule()
+
+
+class WaitingQueuing(AbstractQueuing):
+
+    def __init__(self, maxsize=None, full_policy=QueuingFullPolicy.BLOCK):
+        super(WaitingQueuing, self).__init__(maxsize, full_policy)
+
+    def poll(self, timeout=None):
+
+        with self._v_cdt:
+
+            if self._is_terminated():
+                return None
+
+            v = self._poll_vv()
+            if v is not None:
+                return v
+
+            self._v_cdt.wait(timeout)
+
+            if self._is_terminated():
+                return None
+
+            return self._poll_vv()
+
+    def put_to_list(self, values, pos, size, timeout=None):
+
+        def _f(vv, p, m):
+            vv_size = len(self._vv)
+            if vv_size > 0:
+                r = m - p
+                if vv_size > r:
+                    vv.extend([self._vv.popleft() for _ in range(r)])
+                    self._v_cdt.notify_all()
+                    return r
+                else:
+                    vv.extend(self._vv)
+                    self._vv.clear()
+                    self._v_cdt.notify_all()
+                    return vv_size
+            else:
+                return -1
+
+        with self._v_cdt:
+
+            if self._is_terminated():
+                return -1
+
+            rr = _f(values, pos, size)
+            if rr > 0:
+                return rr
+
+            self._v_cdt.wait(timeout)
+
+            if self._is_terminated():
+                return -1
+
+            return _f(values, pos, size)
 
-        self._sys_num = 0
+
+class AbstractSecsCommunicator:
+
+    __DEFAULT_TIMEOUT_T1 = 1.0
+    __DEFAULT_TIMEOUT_T2 = 15.0
+    __DEFAULT_TIMEOUT_T3 = 45.0
+    __DEFAULT_TIMEOUT_T4 = 45.0
+    __DEFAULT_TIMEOUT_T5 = 10.0
+    __DEFAULT_TIMEOUT_T6 = 5.0
+    __DEFAULT_TIMEOUT_T7 = 10.0
+    __DEFAULT_TIMEOUT_T8 = 5.0
+
+    def __init__(self, device_id, is_equip, **kwargs):
+
+        self.__gem = Gem(self)
+
+        self.device_id = device_id
+        self.is_equip = is_equip
+
+        self.name = kwargs.get('name', None)
+        self.timeout_t1 = kwargs.get('timeout_t1', self.__DEFAULT_TIMEOUT_T1)
+        self.timeout_t2 = kwargs.get('timeout_t2', self.__DEFAULT_TIMEOUT_T2)
+        self.timeout_t3 = kwargs.get('timeout_t3', self.__DEFAULT_TIMEOUT_T3)
+        self.timeout_t4 = kwargs.get('timeout_t4', self.__DEFAULT_TIMEOUT_T4)
+        self.timeout_t5 = kwargs.get('timeout_t5', self.__DEFAULT_TIMEOUT_T5)
+        self.timeout_t6 = kwargs.get('timeout_t6', self.__DEFAULT_TIMEOUT_T6)
+        self.timeout_t7 = kwargs.get('timeout_t7', self.__DEFAULT_TIMEOUT_T7)
+        self.timeout_t8 = kwargs.get('timeout_t8', self.__DEFAULT_TIMEOUT_T8)
+
+        self.lazy_secs2body = kwargs.get('lazy_secs2body', False)
+        self.compact_secs2body = kwargs.get('compact_secs2body', False)
+
+        self.__dispatcher = kwargs.get('dispatcher', None)
+        self.__reactor = kwargs.get('reactor', None)
+        self.__callback_queuings = dict()
+        self.__set_queue_full_policy(
+            kwargs.get('queue_maxsize', None),
+            kwargs.get('queue_full_policy', QueuingFullPolicy.BLOCK))
+        self.__send_executor = None
+        self.__send_executor_lock = threading.Lock()
+
+        gem_mdln = kwargs.get('gem_mdln', None)
+        if gem_mdln is not None:
+            self.gem.mdln = gem_mdln
+
+        gem_softrev = kwargs.get('gem_softrev', None)
+        if gem_softrev is not None:
+            self.gem.softrev = gem_softrev
+
+        gem_clock_type = kwargs.get('gem_clock_type', None)
+        if gem_clock_type is not None:
+            self.gem.clock_type = gem_clock_type
+
+        self._sys_num = 0
 
         self.__communicating = False
         self.__comm_cdt = threading.Condition()
 
-        self.__recv_primary_msg_lstnrs = list()
-        self.__communicate_lstnrs = list()
-        self.__error_lstnrs = list()
-        self.__recv_all_msg_lstnrs = list()
-        self.__sended_msg_lstnrs = list()
+        self._lstnrs_lock = threading.Lock()
+        self.__recv_primary_msg_lstnrs = tuple()
+        self.__communicate_lstnrs = tuple()
+        self.__error_lstnrs = tuple()
+        self.__recv_all_msg_lstnrs = tuple()
+        self.__sended_msg_lstnrs = tuple()
 
         recv_pri_msg_lstnr = kwargs.get('recv_primary_msg', None)
         if recv_pri_msg_lstnr is not None:
@@ -2074,27 +3705,219 @@ class AbstractSecsCommunicator:
         """
         self.__timeout_t8 = self._try_gt_zero(val)
 
-    def open(self):
-        """Open communicator
-        """
-        self._open()
+    @property
+    def lazy_secs2body(self):
+        pass
 
-    def _open(self):
-        # prototype-pattern
-        raise NotImplementedError()
+    @lazy_secs2body.getter
+    def lazy_secs2body(self):
+        """Lazy-SECS-II-body-decode getter.
 
-    def close(self):
-        """Close communicator
+        Returns:
+            bool: True if received SECS-II body is decoded on access.
         """
-        self._close()
+        return self.__lazy_secs2body
 
-    def _close(self):
-        # prototype-pattern
-        raise NotImplementedError()
+    @lazy_secs2body.setter
+    def lazy_secs2body(self, val):
+        """Lazy-SECS-II-body-decode setter.
 
-    def open_and_wait_until_communicating(self, timeout=None):
+        Args:
+            val (bool): True if received SECS-II body is decoded on access.
+        """
+        self.__lazy_secs2body = bool(val)
 
-        if not self.is_open:
+    @property
+    def compact_secs2body(self):
+        pass
+
+    @compact_secs2body.getter
+    def compact_secs2body(self):
+        """Compact-SECS-II-body-decode getter.
+
+        Returns:
+            bool: True if received I1-I8, U1-U8, F4, F8 values are array.array.
+        """
+        return self.__compact_secs2body
+
+    @compact_secs2body.setter
+    def compact_secs2body(self, val):
+        """Compact-SECS-II-body-decode setter.
+
+        Args:
+            val (bool): True if received I1-I8, U1-U8, F4, F8 values are array.array.
+        """
+        self.__compact_secs2body = bool(val)
+
+    @property
+    def queue_maxsize(self):
+        pass
+
+    @queue_maxsize.getter
+    def queue_maxsize(self):
+        """Listener-Queue max size getter.
+
+        Returns:
+            int: max size, None if unbounded.
+        """
+        return self.__queue_maxsize
+
+    @queue_maxsize.setter
+    def queue_maxsize(self, val):
+        """Listener-Queue max size setter.
+
+        Applied to all listener queues.
+
+        Args:
+            val (int or None): max size, None if unbounded.
+
+        Raises:
+            ValueError: if value is not greater than 0,
+                or QueuingFullPolicy.BLOCK is not accepted.
+        """
+        self.__set_queue_full_policy(val, self.__queue_full_policy)
+
+    @property
+    def queue_full_policy(self):
+        pass
+
+    @queue_full_policy.getter
+    def queue_full_policy(self):
+        """Listener-Queue full policy getter.
+
+        Returns:
+            str: QueuingFullPolicy
+        """
+        return self.__queue_full_policy
+
+    @queue_full_policy.setter
+    def queue_full_policy(self, val):
+        """Listener-Queue full policy setter.
+
+        Applied to all listener queues.
+        If QueuingFullPolicy.RAISE, message not fit in queue is dropped,
+        and QueuingFullError is put to error listeners.
+
+        Args:
+            val (str): QueuingFullPolicy.BLOCK, QueuingFullPolicy.DROP_OLDEST or QueuingFullPolicy.RAISE
+
+        Raises:
+            ValueError: if value is not QueuingFullPolicy,
+                or QueuingFullPolicy.BLOCK is not accepted.
+        """
+        self.__set_queue_full_policy(self.__queue_maxsize, val)
+
+    def __set_queue_full_policy(self, maxsize, full_policy):
+        if maxsize is not None:
+            maxsize = int(maxsize)
+            if maxsize <= 0:
+                raise ValueError("queue_maxsize is greater than 0")
+        full_policy = QueuingFullPolicy.get(full_policy)
+
+        if (maxsize is not None
+                and full_policy == QueuingFullPolicy.BLOCK
+                and self._is_put_on_shared_thread()):
+            # blocking put stalls all connections on shared thread
+            raise ValueError("queue_full_policy BLOCK with queue_maxsize can not be used "
+                             "if messages are put on shared thread (reactor or asyncio loop)")
+
+        self.__queue_maxsize = maxsize
+        self.__queue_full_policy = full_policy
+
+        for q in self.__callback_queuings.values():
+            q.full_policy = full_policy
+            q.maxsize = maxsize
+
+    def _is_put_on_shared_thread(self):
+        # True if received messages are put to listener queues on thread shared with other connections
+        return self.__reactor is not None
+
+    @property
+    def dispatcher(self):
+        pass
+
+    @dispatcher.getter
+    def dispatcher(self):
+        """Listener-Dispatcher getter.
+
+        Set by 'dispatcher' keyword argument.
+        If None, each listener-queue has own thread.
+        If concurrent.futures.Executor, listeners are called on executor threads,
+        executor can be shared by many communicators.
+
+        Returns:
+            concurrent.futures.Executor: Dispatcher, or None.
+        """
+        return self.__dispatcher
+
+    @property
+    def reactor(self):
+        pass
+
+    @reactor.getter
+    def reactor(self):
+        """Reactor getter.
+
+        Set by 'reactor' keyword argument.
+        If None, each connection has own receiving thread.
+        If SecsReactor, connections are read on reactor thread,
+        reactor can be shared by many communicators.
+        With reactor, bounded queues (queue_maxsize) must not use
+        QueuingFullPolicy.BLOCK, ValueError is raised.
+
+        Returns:
+            SecsReactor: Reactor, or None.
+        """
+        return self.__reactor
+
+    def get_queue_sizes(self):
+        """Listener-Queue depths getter.
+
+        Returns:
+            dict: {name: queued count}, like {'recv_all_msg': 0, 'error': 0}
+        """
+        return {k: v.qsize() for k, v in self.__callback_queuings.items()}
+
+    def _build_callback_queuing(self, callback):
+        name = callback.__name__
+        if name.startswith('_put_'):
+            name = name[5:]
+        if name == 'error':
+            # error not fit in queue is dropped
+            full_callback = self.__drop_error
+        else:
+            full_callback = self._put_error
+        if self.__dispatcher is None:
+            q = CallbackQueuing(callback, self.queue_maxsize, self.queue_full_policy, full_callback)
+        else:
+            q = ExecutorQueuing(callback, self.__dispatcher, self.queue_maxsize, self.queue_full_policy, full_callback)
+        self.__callback_queuings[name] = q
+        return q
+
+    def __drop_error(self, e):
+        pass
+
+    def open(self):
+        """Open communicator
+        """
+        self._open()
+
+    def _open(self):
+        # prototype-pattern
+        raise NotImplementedError()
+
+    def close(self):
+        """Close communicator
+        """
+        self._close()
+
+    def _close(self):
+        # prototype-pattern
+        raise NotImplementedError()
+
+    def open_and_wait_until_communicating(self, timeout=None):
+
+        if not self.is_open:
             self._open()
 
         with self.__comm_cdt:
@@ -2135,6 +3958,9 @@ class AbstractSecsCommunicator:
             self.__closed = True
             with self.__comm_cdt:
                 self.__comm_cdt.notify_all()
+        with self.__send_executor_lock:
+            if self.__send_executor is not None:
+                self.__send_executor.shutdown(wait=False)
 
     def __enter__(self):
         return self
@@ -2143,7 +3969,8 @@ class AbstractSecsCommunicator:
         self._close()
 
     def __del__(self):
-        self._close()
+        if hasattr(self, '_open_close_rlock'):
+            self._close()
 
     def send(self, strm, func, wbit, secs2body=None):
         """Send primary message
@@ -2207,6 +4034,30 @@ class AbstractSecsCommunicator:
         strm, func, wbit, s2b = SmlParser.parse(sml_str)
         return self.send(strm, func, wbit, s2b)
 
+    def send_template(self, template, **values):
+        """Send primary message by template
+
+        Args:
+            template (Secs2Template): template compiled from SML.
+            **values: placeholder values.
+
+        Raises:
+            SecsCommunicatorError: if communicator not opened.
+            SecsSendMessageError: if send failed.
+            SecsWaitReplyError: if reply not received.
+            Secs2TemplateError: if template has no Stream-Number, or value missing.
+
+        Returns:
+            SecsMessage: Reply-Message if exist, otherwise None.
+
+        Examples:
+            tmpl = Secs2Template.compile('S6F11 W <L <U4 $dataid> <U4 1001> >.')
+            send_template(tmpl, dataid=1)
+        """
+        if template.strm is None:
+            raise Secs2TemplateError("Template has no Stream-Number and Function-Number")
+        return self.send(template.strm, template.func, template.wbit, template.render(**values))
+
     def reply(self, primary, strm, func, wbit, secs2body=None):
         """Send reply message
 
@@ -2256,6 +4107,141 @@ class AbstractSecsCommunicator:
             strm, func, wbit,
             self._create_secs2body(s2b))
 
+    def reply_template(self, primary, template, **values):
+        """Send reply message by template
+
+        Args:
+            primary (SecsMessage): Primary-Message
+            template (Secs2Template): template compiled from SML.
+            **values: placeholder values.
+
+        Raises:
+            SecsCommunicatorError: if communicator not opened.
+            SecsSendMessageError: if send failed.
+            Secs2TemplateError: if template has no Stream-Number, or value missing.
+
+        Returns:
+            None: None
+        """
+        if template.strm is None:
+            raise Secs2TemplateError("Template has no Stream-Number and Function-Number")
+        return self.reply(primary, template.strm, template.func, template.wbit, template.render(**values))
+
+    def send_async(self, strm, func, wbit, secs2body=None):
+        """Send primary message, without blocking.
+
+        Args:
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool): W-Bit.
+            secs2body (tuple or list or AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            concurrent.futures.Future: result is Reply-Message if exist, otherwise None.
+                exception is same as send.
+
+        Examples:
+            ff = [comm.send_async(1, 3, True, ('L', [])) for comm in comms]
+            replies = [f.result() for f in ff]
+        """
+        try:
+            s2b = self._create_secs2body(secs2body)
+        except Exception as e:
+            f = concurrent.futures.Future()
+            f.set_exception(e)
+            return f
+
+        return self._send_async(
+            strm, func, wbit,
+            s2b,
+            self._create_system_bytes(),
+            self.device_id)
+
+    def send_sml_async(self, sml_str):
+        """Send primary message by SML, without blocking.
+
+        Args:
+            sml_str (str): SML-string.
+
+        Raises:
+            Secs2BodySmlParseError: if Secs2body parse failed.
+            SmlParseError: if SML parse failed.
+
+        Returns:
+            concurrent.futures.Future: result is Reply-Message if exist, otherwise None.
+        """
+        strm, func, wbit, s2b = SmlParser.parse(sml_str)
+        return self.send_async(strm, func, wbit, s2b)
+
+    def reply_async(self, primary, strm, func, wbit, secs2body=None):
+        """Send reply message, without blocking.
+
+        Args:
+            primary (SecsMessage): Primary-Message.
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool: W-Bit.
+            secs2body (tuple or list or AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            concurrent.futures.Future: result is None.
+        """
+        try:
+            s2b = self._create_secs2body(secs2body)
+        except Exception as e:
+            f = concurrent.futures.Future()
+            f.set_exception(e)
+            return f
+
+        return self._send_async(
+            strm, func, wbit,
+            s2b,
+            primary.system_bytes,
+            self.device_id)
+
+    async def asend(self, strm, func, wbit, secs2body=None):
+        """Send primary message, awaitable.
+
+        Args:
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool): W-Bit.
+            secs2body (tuple or list or AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            SecsMessage: Reply-Message if exist, otherwise None.
+
+        Examples:
+            replies = await asyncio.gather(*[comm.asend(1, 3, True, ('L', [])) for comm in comms])
+        """
+        return await asyncio.wrap_future(self.send_async(strm, func, wbit, secs2body))
+
+    async def asend_sml(self, sml_str):
+        """Send primary message by SML, awaitable.
+
+        Args:
+            sml_str (str): SML-string.
+
+        Returns:
+            SecsMessage: Reply-Message if exist, otherwise None.
+        """
+        return await asyncio.wrap_future(self.send_sml_async(sml_str))
+
+    async def areply(self, primary, strm, func, wbit, secs2body=None):
+        """Send reply message, awaitable.
+
+        Args:
+            primary (SecsMessage): Primary-Message.
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool: W-Bit.
+            secs2body (tuple or list or AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            None: None
+        """
+        return await asyncio.wrap_future(self.reply_async(primary, strm, func, wbit, secs2body))
+
     def _create_system_bytes(self):
         self._sys_num = (self._sys_num + 1) & 0xFFFF
         n = self._sys_num
@@ -2273,6 +4259,8 @@ class AbstractSecsCommunicator:
             return None
         elif isinstance(v, AbstractSecs2Body):
             return v
+        elif isinstance(v, Secs2Template):
+            return v.render()
         else:
             tt = type(v)
             if (tt is list or tt is tuple) and len(v) == 2:
@@ -2301,11 +4289,45 @@ class AbstractSecsCommunicator:
         """
         raise NotImplementedError()
 
+    def _send_async(self, strm, func, wbit, secs2body, system_bytes, device_id):
+        # Blocking _send on sender-thread, override if protocol can wait reply without thread.
+        with self.__send_executor_lock:
+            if self.__send_executor is None:
+                if self.is_closed:
+                    f = concurrent.futures.Future()
+                    f.set_exception(SecsCommunicatorError("Communicator closed"))
+                    return f
+                self.__send_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix=(self.name or 'secs') + '-sender')
+            try:
+                return self.__send_executor.submit(
+                    self._send, strm, func, wbit, secs2body, system_bytes, device_id)
+            except RuntimeError:
+                f = concurrent.futures.Future()
+                f.set_exception(SecsCommunicatorError("Communicator closed"))
+                return f
+
     @staticmethod
     def _is_single_args_listener(listener):
         n = len(inspect.signature(listener).parameters)
         return n == 1
 
+    def _bind_listener(self, listener):   # return (listener, invoker), arity resolved once
+        if self._is_single_args_listener(listener):
+            return listener, listener
+        else:
+            return listener, (lambda v: listener(v, self))
+
+    def _added_listeners(self, lstnrs, listener):     # return copied tuple
+        return lstnrs + (self._bind_listener(listener), )
+
+    @staticmethod
+    def _removed_listeners(lstnrs, listener):   # return copied tuple
+        for i, x in enumerate(lstnrs):
+            if x[0] == listener:
+                return lstnrs[:i] + lstnrs[(i + 1):]
+        raise ValueError("listener not found")
+
     def add_recv_primary_msg_listener(self, listener):
         """Add receive-primary-message listener
 
@@ -2320,7 +4342,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_primary_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__recv_primary_msg_lstnrs = self._added_listeners(self.__recv_primary_msg_lstnrs, listener)
 
     def remove_recv_primary_msg_listener(self, listener):
         """Remove receive-primary-message-listener.
@@ -2331,15 +4354,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_primary_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__recv_primary_msg_lstnrs = self._removed_listeners(self.__recv_primary_msg_lstnrs, listener)
 
     def _put_recv_primary_msg(self, recv_msg):
         if recv_msg is not None:
             for ls in self.__recv_primary_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(recv_msg)
-                else:
-                    ls(recv_msg, self)
+                ls[1](recv_msg)
 
     def add_recv_all_msg_listener(self, listener):
         """Add receive-all-message listener
@@ -2357,7 +4378,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_all_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__recv_all_msg_lstnrs = self._added_listeners(self.__recv_all_msg_lstnrs, listener)
 
     def remove_recv_all_msg_listener(self, listener):
         """Remove receive-all-message-listener.
@@ -2368,15 +4390,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_all_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__recv_all_msg_lstnrs = self._removed_listeners(self.__recv_all_msg_lstnrs, listener)
 
     def _put_recv_all_msg(self, recv_msg):
         if recv_msg is not None:
             for ls in self.__recv_all_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(recv_msg)
-                else:
-                    ls(recv_msg, self)
+                ls[1](recv_msg)
 
     def add_sended_msg_listener(self, listener):
         """Add sended-message-listener.
@@ -2392,7 +4412,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__sended_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__sended_msg_lstnrs = self._added_listeners(self.__sended_msg_lstnrs, listener)
 
     def remove_sended_msg_listener(self, listener):
         """Remove sended-message-listener.
@@ -2403,15 +4424,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__sended_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__sended_msg_lstnrs = self._removed_listeners(self.__sended_msg_lstnrs, listener)
 
     def _put_sended_msg(self, sended_msg):
         if sended_msg is not None:
             for ls in self.__sended_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(sended_msg)
-                else:
-                    ls(sended_msg, self)
+                ls[1](sended_msg)
 
     def add_communicate_listener(self, listener):
         """Add communicate-state-change-listener.
@@ -2428,11 +4447,9 @@ class AbstractSecsCommunicator:
             None
         """
         with self.__comm_cdt:
-            self.__communicate_lstnrs.append(listener)
-            if self._is_single_args_listener(listener):
-                listener(self.__communicating)
-            else:
-                listener(self.__communicating, self)
+            with self._lstnrs_lock:
+                self.__communicate_lstnrs = self._added_listeners(self.__communicate_lstnrs, listener)
+            self.__communicate_lstnrs[-1][1](self.__communicating)
 
     def remove_communicate_listener(self, listener):
         """Remove communicate-state-change-listener.
@@ -2444,17 +4461,15 @@ class AbstractSecsCommunicator:
             None
         """
         with self.__comm_cdt:
-            self.__communicate_lstnrs.remove(listener)
+            with self._lstnrs_lock:
+                self.__communicate_lstnrs = self._removed_listeners(self.__communicate_lstnrs, listener)
 
     def _put_communicated(self, communicating):
         with self.__comm_cdt:
             if communicating != self.__communicating:
                 self.__communicating = communicating
                 for ls in self.__communicate_lstnrs:
-                    if self._is_single_args_listener(ls):
-                        ls(self.__communicating)
-                    else:
-                        ls(self.__communicating, self)
+                    ls[1](self.__communicating)
                 self.__comm_cdt.notify_all()
 
     @property
@@ -2484,7 +4499,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__error_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__error_lstnrs = self._added_listeners(self.__error_lstnrs, listener)
 
     def remove_error_listener(self, listener):
         """Remove error-listener.
@@ -2495,15 +4511,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__error_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__error_lstnrs = self._removed_listeners(self.__error_lstnrs, listener)
 
     def _put_error(self, e):
         if e is not None:
             for ls in self.__error_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(e)
-                else:
-                    ls(e, self)
+                ls[1](e)
 
 
 class HsmsSsCommunicatorError(SecsCommunicatorError):
@@ -2549,83 +4563,205 @@ class HsmsSsCommunicateState:
     SELECTED = 'selected'
 
 
-class SendReplyHsmsSsMessagePack:
+class HsmsSsReplyFuturePool:
+    """Pending reply table, System-Bytes to concurrent.futures.Future.
 
-    def __init__(self, msg):
-        self.__msg = msg
-        self.__reply_msg_cdt = threading.Condition()
-        self.__reply_msg = None
+    Timeouts are expired by shared SecsTimer, no thread waits per message.
+    Reply, timeout and shutdown take the entry out of the table under lock,
+    only the taker completes the future.
+    """
+
+    def __init__(self, timer):
+        self.__pool = dict()
+        self.__lock = threading.Lock()
+        self.__timer = timer
         self.__terminated = False
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
     def shutdown(self):
-        with self.__reply_msg_cdt:
+        with self.__lock:
             self.__terminated = True
-            self.__reply_msg_cdt.notify_all()
+            ff = [v[0] for v in self.__pool.values()]
+            self.__pool.clear()
+        for f in ff:
+            self._set_exception(f, HsmsSsCommunicatorError("HsmsSsConnection terminated"))
 
-    def __is_terminated(self):
-        with self.__reply_msg_cdt:
-            return self.__terminated
+    def entry(self, msg, timeout, timeout_error):
+        """Entry reply-waiting message.
 
-    def get_system_bytes(self):
-        return self.__msg.system_bytes
+        Args:
+            msg (HsmsSsMessage): message waits reply.
+            timeout (float): seconds.
+            timeout_error (function): return Exception set to future,
+                called on timeout only if reply not received.
 
-    def put_reply_msg(self, reply_msg):
-        with self.__reply_msg_cdt:
-            self.__reply_msg = reply_msg
-            self.__reply_msg_cdt.notify_all()
+        Returns:
+            concurrent.futures.Future: reply message future.
+                Exception is HsmsSsSendMessageError if System-Bytes is already waiting reply.
+        """
+        f = concurrent.futures.Future()
+        key = msg.system_bytes
 
-    def wait_reply_msg(self, timeout):
+        with self.__lock:
+            if self.__terminated:
+                f.set_exception(HsmsSsCommunicatorError("HsmsSsConnection terminated"))
+                return f
+            if key in self.__pool:
+                # pending entry is kept, its future completes by reply or timeout
+                f.set_exception(HsmsSsSendMessageError("System-Bytes already waiting reply", msg))
+                return f
+            self.__pool[key] = (f, msg)
 
-        with self.__reply_msg_cdt:
+        def _expired():
+            if self.__take(key, f) is not None:
+                self._set_exception(f, timeout_error())
 
-            if self.__is_terminated():
-                return None
+        entry = self.__timer.schedule(timeout, _expired)
 
-            if self.__reply_msg is not None:
-                return self.__reply_msg
+        def _done(x):
+            self.__timer.cancel(entry)
+            self.__take(key, x)
 
-            self.__reply_msg_cdt.wait(timeout)
+        f.add_done_callback(_done)
+        return f
 
-            return self.__reply_msg
+    def put_reply_msg(self, reply_msg):
+        with self.__lock:
+            v = self.__pool.pop(reply_msg.system_bytes, None)
 
+        if v is None:
+            return False
 
-class SendReplyHsmsSsMessagePackPool:
+        f, msg = v
+        if reply_msg.get_control_type() == HsmsSsControlType.REJECT_REQ:
+            self._set_exception(f, HsmsSsRejectMessageError("HsmsSs-Reject-Message", msg))
+        else:
+            self._set_result(f, reply_msg)
+        return True
 
-    def __init__(self):
-        self.__pool = dict()
-        self.__lock = threading.Lock()
+    def __take(self, key, f):    # return entry if f is still pending in pool
+        with self.__lock:
+            v = self.__pool.get(key)
+            if v is not None and v[0] is f:
+                del self.__pool[key]
+                return v
+            return None
 
-    def __enter__(self):
-        return self
+    @staticmethod
+    def _set_result(f, v):
+        try:
+            f.set_result(v)
+        except Exception:
+            # already done or cancelled
+            pass
 
-    def __exit__(self, exc_type, exc_value, traceback):
-        self.shutdown()
+    @staticmethod
+    def _set_exception(f, e):
+        try:
+            f.set_exception(e)
+        except Exception:
+            # already done or cancelled
+            pass
 
-    def shutdown(self):
-        with self.__lock:
-            for pack in self.__pool.values():
-                pack.shutdown()
 
-    def entry(self, pack):
-        with self.__lock:
-            self.__pool[pack.get_system_bytes()] = pack
+class HsmsSsFrameBuffer:
+    """Receive buffer, extracts length-prefixed HSMS-SS frames.
 
-    def remove(self, pack):
-        with self.__lock:
-            del self.__pool[pack.get_system_bytes()]
+    Received bytes are written by recv_into(get_buffer()) and buffer_updated(n).
+    Frames larger than the buffer are received into a frame-sized
+    bytearray, and returned without copy.
+    """
 
-    def put_reply_msg(self, reply_msg):
-        with self.__lock:
-            key = reply_msg.system_bytes
-            if key in self.__pool:
-                self.__pool[key].put_reply_msg(reply_msg)
-                return True
-            else:
-                return False
+    def __init__(self, size=65536):
+        self.__size = size
+        self.__buf = bytearray(size)
+        self.__r = 0
+        self.__w = 0
+
+    def get_buffer(self):
+        """Writable buffer getter.
+
+        Returns:
+            memoryview: free space of buffer.
+        """
+        n = self.__frame_size()
+        if n is not None and n > len(self.__buf):
+            # large frame, receive into frame-sized buffer
+            buf = bytearray(n)
+            m = self.__w - self.__r
+            buf[0:m] = self.__buf[self.__r:self.__w]
+            self.__buf = buf
+            self.__r = 0
+            self.__w = m
+
+        elif self.__w == len(self.__buf):
+            m = self.__w - self.__r
+            self.__buf[0:m] = self.__buf[self.__r:self.__w]
+            self.__r = 0
+            self.__w = m
+
+        return memoryview(self.__buf)[self.__w:]
+
+    def buffer_updated(self, nbytes):
+        """Notify received bytes length.
+
+        Args:
+            nbytes (int): bytes written into get_buffer().
+        """
+        self.__w += nbytes
+
+    def has_partial(self):
+        """Incomplete frame getter.
+
+        Returns:
+            bool: True if buffer has bytes of incomplete frame.
+        """
+        return self.__w > self.__r
+
+    def next_frame(self):
+        """Extract next frame.
+
+        Raises:
+            HsmsSsCommunicatorError: if message length < 10.
+
+        Returns:
+            bytes or bytearray: 4-bytes length + 10-bytes header + body, None if not completed.
+        """
+        n = self.__frame_size()
+        if n is None or (self.__w - self.__r) < n:
+            return None
+
+        if self.__r == 0 and n == len(self.__buf) and n > self.__size:
+            v = self.__buf
+            self.__buf = bytearray(self.__size)
+            self.__w = 0
+            return v
+
+        v = bytes(self.__buf[self.__r:(self.__r + n)])
+        self.__r += n
+        if self.__r == self.__w:
+            self.__r = 0
+            self.__w = 0
+        return v
+
+    def __frame_size(self):
+        if (self.__w - self.__r) < 4:
+            return None
+        n = int.from_bytes(self.__buf[self.__r:(self.__r + 4)], 'big')
+        if n < 10:
+            raise HsmsSsCommunicatorError("Receive message size < 10")
+        return n + 4
 
 
 class HsmsSsConnection:
 
+    __SEND_BATCH = 64
+
     def __init__(
             self, sock, comm,
             recv_primary_msg_put_callback,
@@ -2643,14 +4779,32 @@ class HsmsSsConnection:
         self.__terminated_cdt = threading.Condition()
         self.__terminated = False
 
-        self.__bbqq = WaitingQueuing()
+        self.__frame_buffer = HsmsSsFrameBuffer()
 
-        self.__send_reply_pool = SendReplyHsmsSsMessagePackPool()
+        self.__send_reply_pool = HsmsSsReplyFuturePool(SecsTimer.get_shared())
 
         self.__send_lock = threading.Lock()
 
-        threading.Thread(target=self.__receiving_socket_bytes, daemon=True).start()
-        threading.Thread(target=self.__reading_msg, daemon=True).start()
+        self.__send_coalescing = comm.send_coalescing
+        self.__send_queue = collections.deque()
+        self.__send_queue_cdt = threading.Condition()
+        self.__send_queue_closed = False
+
+        if self.__send_coalescing:
+            try:
+                self.__sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, AttributeError):
+                pass
+
+            threading.Thread(target=self.__writing_msg, daemon=True).start()
+
+        self.__reactor = comm.reactor
+        self.__t8_entry = None
+
+        if self.__reactor is None:
+            threading.Thread(target=self.__reading_msg, daemon=True).start()
+        else:
+            self.__reactor.register(self.__sock, self.__readable, self.__readable_error)
 
     def __enter__(self):
         return self
@@ -2665,11 +4819,19 @@ class HsmsSsConnection:
 
                 self.__terminated = True
 
-                self.__bbqq.shutdown()
                 self.__send_reply_pool.shutdown()
 
                 self.__terminated_cdt.notify_all()
 
+        with self.__send_queue_cdt:
+            self.__send_queue_closed = True
+            self.__send_queue_cdt.notify_all()
+
+        if self.__reactor is not None:
+            # every caller waits until unregistered, socket may be closed after return
+            self.__reactor.unregister(self.__sock)
+            self.__cancel_t8()
+
     def __is_terminated(self):
         with self.__terminated_cdt:
             return self.__terminated
@@ -2678,85 +4840,120 @@ class HsmsSsConnection:
         with self.__terminated_cdt:
             self.__terminated_cdt.wait_for(self.__is_terminated, timeout)
 
-    def __receiving_socket_bytes(self):
+    def __reading_msg(self):
         try:
+            fb = self.__frame_buffer
+
             while not self.__is_terminated():
-                bs = self.__sock.recv(4096)
-                if bs:
-                    self.__bbqq.puts(bs)
-                else:
-                    raise HsmsSsCommunicatorError("Terminate detect")
 
-        except HsmsSsCommunicatorError as e:
-            if not self.__is_terminated():
-                self.__put_error(e)
+                if fb.has_partial():
+                    r, w, x = select.select([self.__sock], [], [], self.__comm.timeout_t8)
+                    if not r:
+                        raise HsmsSsCommunicatorError("T8-Timeout")
+
+                self.__recv_once()
+
         except Exception as e:
-            if not self.__is_terminated():
-                self.__put_error(HsmsSsCommunicatorError(e))
+            self.__put_recv_error(e)
 
         finally:
             self.shutdown()
 
-    def __reading_msg(self):
+    def __readable(self):
+        # called on reactor thread, socket is readable
+        self.__cancel_t8()
         try:
-            while not self.__is_terminated():
+            self.__recv_once()
+        except Exception as e:
+            self.__put_recv_error(e)
+            self.shutdown()
+            return
 
-                heads = list()
-                pos = 0
-                size = 14
+        if self.__frame_buffer.has_partial():
+            self.__t8_entry = SecsTimer.get_shared().schedule(
+                self.__comm.timeout_t8,
+                self.__timeout_t8)
 
-                r = self.__bbqq.put_to_list(heads, pos, size)
-                if r < 0:
-                    return
+    def __readable_error(self, e):
+        # called on reactor thread, if __readable raised
+        self.__put_recv_error(e)
+        self.shutdown()
 
-                pos += r
+    def __timeout_t8(self):
+        self.__put_recv_error(HsmsSsCommunicatorError("T8-Timeout"))
+        self.shutdown()
 
-                while pos < size:
-                    r = self.__bbqq.put_to_list(
-                        heads, pos, size,
-                        self.__comm.timeout_t8)
+    def __cancel_t8(self):
+        entry = self.__t8_entry
+        if entry is not None:
+            self.__t8_entry = None
+            SecsTimer.get_shared().cancel(entry)
 
-                    if r < 0:
-                        raise HsmsSsCommunicatorError("T8-Timeout")
-                    else:
-                        pos += r
+    def __recv_once(self):
+        fb = self.__frame_buffer
 
-                bodys = list()
-                pos = 0
-                size = (heads[0] << 24
-                        | heads[1] << 16
-                        | heads[2] << 8
-                        | heads[3]) - 10
+        n = self.__sock.recv_into(fb.get_buffer())
+        if n == 0:
+            raise HsmsSsCommunicatorError("Terminate detect")
 
-                if size < 0:
-                    raise HsmsSsCommunicatorError("Receive message size < 10")
+        fb.buffer_updated(n)
 
-                while pos < size:
-                    r = self.__bbqq.put_to_list(
-                        bodys, pos, size,
-                        self.__comm.timeout_t8)
+        while True:
+            bs = fb.next_frame()
+            if bs is None:
+                break
 
-                    if r < 0:
-                        raise HsmsSsCommunicatorError("T8-Timeout")
-                    else:
-                        pos += r
+            msg = HsmsSsMessage.from_bytes(
+                bs,
+                self.__comm.lazy_secs2body,
+                self.__comm.compact_secs2body)
 
-                msg = HsmsSsMessage.from_bytes(bytes(heads) + bytes(bodys))
+            self.__put_recv_all_msg(msg)
 
-                self.__put_recv_all_msg(msg)
+            if not self.__send_reply_pool.put_reply_msg(msg):
+                self.__put_recv_primary_msg(msg, self)
 
-                if not self.__send_reply_pool.put_reply_msg(msg):
-                    self.__put_recv_primary_msg(msg, self)
+    def __put_recv_error(self, e):
+        if self.__is_terminated():
+            return
+        if isinstance(e, HsmsSsCommunicatorError):
+            self.__put_error(e)
+        elif isinstance(e, OSError):
+            self.__put_error(HsmsSsCommunicatorError(e))
+        else:
+            self.__put_error(e)
 
-        except Exception as e:
-            if not self.__is_terminated():
-                self.__put_error(e)
+    def __send_buffers(self, buffers):
+        if not hasattr(self.__sock, 'sendmsg'):
+            self.__sock.sendall(b''.join(buffers))
+            return
 
-        finally:
-            self.shutdown()
+        vv = [memoryview(x).cast('B') for x in buffers if len(x) > 0]
+        while vv:
+            n = self.__sock.sendmsg(vv)
+            while n > 0:
+                m = len(vv[0])
+                if n >= m:
+                    del vv[0]
+                    n -= m
+                else:
+                    vv[0] = vv[0][n:]
+                    n = 0
 
     def send(self, msg):
+        return self.send_async(msg).result()
 
+    def send_async(self, msg):
+        """Send message, without waiting reply.
+
+        Args:
+            msg (HsmsSsMessage): message.
+
+        Returns:
+            concurrent.futures.Future: Reply-Message if reply is required, otherwise None.
+                Exception is HsmsSsSendMessageError, HsmsSsTimeoutT3Error, HsmsSsTimeoutT6Error,
+                HsmsSsRejectMessageError or HsmsSsCommunicatorError.
+        """
         timeout_tx = -1.0
 
         ctrl_type = msg.get_control_type()
@@ -2770,56 +4967,92 @@ class HsmsSsConnection:
 
             timeout_tx = self.__comm.timeout_t6
 
-        def _send():
-            with self.__send_lock:
-                try:
-                    self.__sock.sendall(msg.to_bytes())
-                    self.__put_sended_msg(msg)
-                except Exception as e:
-                    raise HsmsSsSendMessageError(e, msg)
+        def _timeout_error():
+            if ctrl_type == HsmsSsControlType.DATA:
+                return HsmsSsTimeoutT3Error("HsmsSs-Timeout-T3", msg)
+            else:
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return HsmsSsTimeoutT6Error("HsmsSs-Timeout-T6", msg)
 
         if timeout_tx >= 0.0:
 
-            pack = SendReplyHsmsSsMessagePack(msg)
+            f = self.__send_reply_pool.entry(msg, timeout_tx, _timeout_error)
 
-            try:
-                self.__send_reply_pool.entry(pack)
+            if not f.done():
+                self.__write(msg, f, False)
 
-                _send()
+        else:
+            f = concurrent.futures.Future()
+            self.__write(msg, f, True)
 
-                rsp = pack.wait_reply_msg(timeout_tx)
+        return f
 
-                if rsp is None:
+    def __write(self, msg, f, complete):
+        # complete: set result None to f after sended
 
-                    if self.__is_terminated():
+        if self.__send_coalescing:
+            with self.__send_queue_cdt:
+                if not self.__send_queue_closed:
+                    self.__send_queue.append((msg, f, complete))
+                    self.__send_queue_cdt.notify()
+                    return
 
-                        raise HsmsSsCommunicatorError("HsmsSsConnection terminated")
+            HsmsSsReplyFuturePool._set_exception(
+                f, HsmsSsSendMessageError("Connection closed", msg))
+            return
 
-                    else:
+        try:
+            with self.__send_lock:
+                self.__send_buffers(msg.to_buffers())
+            self.__put_sended_msg(msg)
+        except Exception as e:
+            HsmsSsReplyFuturePool._set_exception(f, HsmsSsSendMessageError(e, msg))
+            return
 
-                        if ctrl_type == HsmsSsControlType.DATA:
+        if complete:
+            HsmsSsReplyFuturePool._set_result(f, None)
 
-                            raise HsmsSsTimeoutT3Error("HsmsSs-Timeout-T3", msg)
+    def __writing_msg(self):
+        # writer thread, pending messages are sent together, one sendmsg per batch
+        q = self.__send_queue
 
-                        else:
-                            self.shutdown()
-                            raise HsmsSsTimeoutT6Error("HsmsSs-Timeout-T6", msg)
+        while True:
+            with self.__send_queue_cdt:
+                while not q and not self.__send_queue_closed:
+                    self.__send_queue_cdt.wait()
 
-                else:
+                if self.__send_queue_closed:
+                    closed = list(q)
+                    q.clear()
+                    break
 
-                    if rsp.get_control_type() == HsmsSsControlType.REJECT_REQ:
+                batch = [q.popleft() for _ in range(min(len(q), self.__SEND_BATCH))]
 
-                        raise HsmsSsRejectMessageError("HsmsSs-Reject-Message", msg)
+            buffers = list()
+            sending = list()
+            for x in batch:
+                try:
+                    buffers.extend(x[0].to_buffers())
+                    sending.append(x)
+                except Exception as e:
+                    HsmsSsReplyFuturePool._set_exception(x[1], HsmsSsSendMessageError(e, x[0]))
 
-                    else:
-                        return rsp
+            try:
+                with self.__send_lock:
+                    self.__send_buffers(buffers)
+            except Exception as e:
+                for msg, f, complete in sending:
+                    HsmsSsReplyFuturePool._set_exception(f, HsmsSsSendMessageError(e, msg))
+                continue
 
-            finally:
-                self.__send_reply_pool.remove(pack)
+            for msg, f, complete in sending:
+                self.__put_sended_msg(msg)
+                if complete:
+                    HsmsSsReplyFuturePool._set_result(f, None)
 
-        else:
-            _send()
-            return None
+        for msg, f, complete in closed:
+            HsmsSsReplyFuturePool._set_exception(
+                f, HsmsSsSendMessageError("Connection closed", msg))
 
 
 class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
@@ -2832,11 +5065,13 @@ class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
 
         self._hsmsss_comm = HsmsSsCommunicateState.NOT_CONNECT
         self._hsmsss_comm_lock = threading.Lock()
-        self._hsmsss_comm_lstnrs = list()
+        self._hsmsss_comm_lstnrs = tuple()
+
+        self.__recv_all_msg_putter = self._build_callback_queuing(self._put_recv_all_msg)
+        self.__sended_msg_putter = self._build_callback_queuing(self._put_sended_msg)
+        self.__error_putter = self._build_callback_queuing(super()._put_error)
 
-        self.__recv_all_msg_putter = CallbackQueuing(self._put_recv_all_msg)
-        self.__sended_msg_putter = CallbackQueuing(self._put_sended_msg)
-        self.__error_putter = CallbackQueuing(super()._put_error)
+        self.send_coalescing = kwargs.get('send_coalescing', False)
 
         hsmsss_comm_lstnr = kwargs.get('hsmsss_communicate', None)
         if hsmsss_comm_lstnr is not None:
@@ -2893,6 +5128,33 @@ class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
         """
         return self.device_id
 
+    @property
+    def send_coalescing(self):
+        pass
+
+    @send_coalescing.setter
+    def send_coalescing(self, val):
+        """Send-Coalescing setter.
+
+        If True, TCP_NODELAY is set, and callers put messages to a queue.
+        Writer thread of each connection writes pending messages in one system call,
+        at most 64 messages per call.
+        Applied to next connection.
+
+        Args:
+            val (bool): Send-Coalescing
+        """
+        self.__send_coalescing = bool(val)
+
+    @send_coalescing.getter
+    def send_coalescing(self):
+        """Send-Coalescing getter.
+
+        Returns:
+            bool: True if send-coalescing.
+        """
+        return self.__send_coalescing
+
     def _put_error(self, e):
         self.__error_putter.put(e)
 
@@ -2925,6 +5187,15 @@ class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
             self.__sended_msg_putter.put,
             self.__error_putter.put)
 
+    def _build_hsmsss_asyncio_connection(self, loop, recv_primary_msg_callback):
+        return HsmsSsAsyncioConnection(
+            loop,
+            self,
+            recv_primary_msg_callback,
+            self.__recv_all_msg_putter.put,
+            self.__sended_msg_putter.put,
+            self.__error_putter.put)
+
     def _set_hsmsss_connection(self, conn, callback=None):
         with self._hsmsss_connection_lock:
             if self._hsmsss_connection is None:
@@ -2946,15 +5217,23 @@ class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
         return self.send_hsmsss_msg(
             HsmsSsDataMessage(strm, func, wbit, secs2body, system_bytes, device_id))
 
+    def _send_async(self, strm, func, wbit, secs2body, system_bytes, device_id):
+        return self.send_hsmsss_msg_async(
+            HsmsSsDataMessage(strm, func, wbit, secs2body, system_bytes, device_id))
+
     def send_hsmsss_msg(self, msg):
-        def _f():
-            with self._hsmsss_connection_lock:
-                if self._hsmsss_connection is None:
-                    raise HsmsSsSendMessageError("HsmsSsCommunicator not connected", msg)
-                else:
-                    return self._hsmsss_connection
+        return self.send_hsmsss_msg_async(msg).result()
 
-        return _f().send(msg)
+    def send_hsmsss_msg_async(self, msg):
+        with self._hsmsss_connection_lock:
+            conn = self._hsmsss_connection
+
+        if conn is None:
+            f = concurrent.futures.Future()
+            f.set_exception(HsmsSsSendMessageError("HsmsSsCommunicator not connected", msg))
+            return f
+
+        return conn.send_async(msg)
 
     def build_select_req(self):
         return HsmsSsControlMessage.build_select_request(
@@ -3025,8 +5304,9 @@ class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
             None
         """
         with self._hsmsss_comm_lock:
-            self._hsmsss_comm_lstnrs.append(listener)
-            listener(self._hsmsss_comm, self)
+            with self._lstnrs_lock:
+                self._hsmsss_comm_lstnrs = self._added_listeners(self._hsmsss_comm_lstnrs, listener)
+            self._hsmsss_comm_lstnrs[-1][1](self._hsmsss_comm)
 
     def remove_hsmsss_communicate_listener(self, listener):
         """Remove HSMS-SS-Communicate-state-change-listener.
@@ -3038,17 +5318,15 @@ class AbstractHsmsSsCommunicator(AbstractSecsCommunicator):
             None
         """
         with self._hsmsss_comm_lock:
-            self._hsmsss_comm_lstnrs.remove(listener)
+            with self._lstnrs_lock:
+                self._hsmsss_comm_lstnrs = self._removed_listeners(self._hsmsss_comm_lstnrs, listener)
 
     def _put_hsmsss_comm_state(self, state, callback=None):
         with self._hsmsss_comm_lock:
             if state != self._hsmsss_comm:
                 self._hsmsss_comm = state
                 for ls in self._hsmsss_comm_lstnrs:
-                    if self._is_single_args_listener(ls):
-                        ls(self._hsmsss_comm)
-                    else:
-                        ls(self._hsmsss_comm, self)
+                    ls[1](self._hsmsss_comm)
                 self._put_communicated(state == HsmsSsCommunicateState.SELECTED)
                 if callback is not None:
                     callback()
@@ -3085,7 +5363,7 @@ class HsmsSsActiveCommunicator(AbstractHsmsSsCommunicator):
 
         self.__ths = list()
 
-        self.__recv_primary_msg_putter = CallbackQueuing(self._put_recv_primary_msg)
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
 
     def _get_protocol(self):
         return self.__PROTOCOL
@@ -3301,16 +5579,70 @@ class HsmsSsPassiveCommunicator(AbstractHsmsSsCommunicator):
         self.__cdts = list()
         self.__ths = list()
 
-        self.__recv_primary_msg_putter = CallbackQueuing(self._put_recv_primary_msg)
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
 
         self.timeout_rebind = kwargs.get('timeout_rebind', self.__TIMEOUT_REBIND)
 
+        self.__server = kwargs.get('server', None)
+        self.peer_address = kwargs.get('peer_address', None)
+
     def _get_protocol(self):
         return self.__PROTOCOL
 
     def _get_ipaddress(self):
         return self.__ipaddr
 
+    @property
+    def server(self):
+        pass
+
+    @server.getter
+    def server(self):
+        """Shared server getter.
+
+        Set by 'server' keyword argument.
+        If None, communicator binds own port.
+
+        Returns:
+            HsmsSsPassiveServer: server, or None.
+        """
+        return self.__server
+
+    @property
+    def peer_address(self):
+        pass
+
+    @peer_address.setter
+    def peer_address(self, val):
+        """Peer-Address setter.
+
+        Used to route connections if shared server.
+
+        Args:
+            val (str or tuple): IP-Address, or (IP-Address, port). None accepts any peer.
+        """
+        if val is None or isinstance(val, str):
+            self.__peer_address = val
+        else:
+            self.__peer_address = tuple(val)
+
+    @peer_address.getter
+    def peer_address(self):
+        """Peer-Address getter.
+
+        Returns:
+            str or tuple: IP-Address, or (IP-Address, port). None if accepts any peer.
+        """
+        return self.__peer_address
+
+    def _is_peer(self, peer):
+        pa = self.__peer_address
+        if pa is None:
+            return False
+        if isinstance(pa, str):
+            return peer[0] == pa
+        return tuple(peer[0:2]) == pa
+
     @property
     def timeout_rebind(self):
         pass
@@ -3331,9 +5663,12 @@ class HsmsSsPassiveCommunicator(AbstractHsmsSsCommunicator):
             if self.is_open:
                 raise RuntimeError("Already opened")
 
-            th = threading.Thread(target=self.__loop, daemon=True)
-            self.__ths.append(th)
-            th.start()
+            if self.__server is None:
+                th = threading.Thread(target=self.__loop, daemon=True)
+                self.__ths.append(th)
+                th.start()
+            else:
+                self.__server._add_session(self)
 
             super()._open()
 
@@ -3421,6 +5756,10 @@ class HsmsSsPassiveCommunicator(AbstractHsmsSsCommunicator):
         finally:
             self.__cdts.remove(cdt)
 
+    def _accept_socket(self, sock):
+        # called by HsmsSsPassiveServer, blocking until connection closed
+        self.__accept_socket(sock)
+
     def __accept_socket(self, sock):
 
         qq = WaitingQueuing()
@@ -3518,129 +5857,1131 @@ class HsmsSsPassiveCommunicator(AbstractHsmsSsCommunicator):
                 elif (ctrl_type == HsmsSsControlType.SELECT_RSP
                       or ctrl_type == HsmsSsControlType.LINKTEST_RSP):
 
-                    conn.send(
-                        self.build_reject_req(
-                            recv_msg,
-                            HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+                    conn.send(
+                        self.build_reject_req(
+                            recv_msg,
+                            HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+
+                elif ctrl_type == HsmsSsControlType.REJECT_REQ:
+
+                    # Nothing
+                    pass
+
+                else:
+
+                    if HsmsSsControlType.has_s_type(recv_msg.get_s_type()):
+
+                        conn.send(
+                            self.build_reject_req(
+                                recv_msg,
+                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_P))
+
+                    else:
+
+                        conn.send(
+                            self.build_reject_req(
+                                recv_msg,
+                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+
+            except HsmsSsSendMessageError as e:
+                self._put_error(e)
+            except HsmsSsWaitReplyMessageError as e:
+                self._put_error(e)
+            except HsmsSsCommunicatorError as e:
+                self._put_error(e)
+
+        return False
+
+    def __receiving_msg(self, qq):
+
+        while not self.is_closed:
+
+            tt = qq.poll()
+
+            if tt is None:
+                return False
+
+            recv_msg = tt[0]
+            conn = tt[1]
+
+            ctrl_type = recv_msg.get_control_type()
+
+            try:
+                if ctrl_type == HsmsSsControlType.DATA:
+
+                    self.__recv_primary_msg_putter.put(recv_msg)
+
+                elif ctrl_type == HsmsSsControlType.LINKTEST_REQ:
+
+                    conn.send(self.build_linktest_rsp(recv_msg))
+
+                elif ctrl_type == HsmsSsControlType.SEPARATE_REQ:
+
+                    return False
+
+                elif ctrl_type == HsmsSsControlType.SELECT_REQ:
+
+                    conn.send(
+                        self.build_select_rsp(
+                            recv_msg,
+                            HsmsSsSelectStatus.ACTIVED))
+
+                elif (ctrl_type == HsmsSsControlType.SELECT_RSP
+                      or ctrl_type == HsmsSsControlType.LINKTEST_RSP):
+
+                    conn.send(
+                        self.build_reject_req(
+                            recv_msg,
+                            HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+
+                elif ctrl_type == HsmsSsControlType.REJECT_REQ:
+
+                    # Nothing
+                    pass
+
+                else:
+
+                    if HsmsSsControlType.has_s_type(recv_msg.get_s_type()):
+
+                        conn.send(
+                            self.build_reject_req(
+                                recv_msg,
+                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_P))
+
+                    else:
+
+                        conn.send(
+                            self.build_reject_req(
+                                recv_msg,
+                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+
+            except HsmsSsSendMessageError as e:
+                self._put_error(e)
+            except HsmsSsWaitReplyMessageError as e:
+                self._put_error(e)
+            except HsmsSsCommunicatorError as e:
+                self._put_error(e)
+
+        return False
+
+    def _close(self):
+
+        if self.is_closed:
+            return
+
+        super()._close()
+
+        self._set_closed()
+
+        if self.__server is not None:
+            self.__server._remove_session(self)
+
+        for cdt in self.__cdts:
+            with cdt:
+                cdt.notify_all()
+
+        for th in self.__ths:
+            if th.is_alive():
+                th.join(0.1)
+
+
+class HsmsSsPassiveServer:
+    """Listening port shared by many HsmsSsPassiveCommunicator sessions.
+
+    Accepted connection is routed to session,
+    by SESSION-ID of Select.req if not 0xFFFF, only to that session.
+    Otherwise by peer_address, next to any session without peer_address.
+    Session with peer_address never accepts connection from other peer.
+    Connection is closed if no session is free, after Select.rsp
+    NOT_READY (or ALREADY_USED if that session is connected) for Select.req.
+
+    Only listening port is shared. Each connection still has own threads,
+    same as HsmsSsPassiveCommunicator binding own port.
+
+    Examples:
+        server = HsmsSsPassiveServer('0.0.0.0', 5000)
+        host1 = server.create_session(session_id=1, is_equip=True, peer_address='10.0.0.5')
+        host2 = server.create_session(session_id=2, is_equip=True)
+        server.open()
+        host1.open()
+        host2.open()
+    """
+
+    __TIMEOUT_REBIND = 5.0
+    __TIMEOUT_T7 = 10.0
+    __HEADER_SIZE = 14
+
+    def __init__(self, ip_address, port, **kwargs):
+
+        self.__ipaddr = (ip_address, port)
+
+        self.timeout_rebind = kwargs.get('timeout_rebind', self.__TIMEOUT_REBIND)
+        self.timeout_t7 = kwargs.get('timeout_t7', self.__TIMEOUT_T7)
+        self.name = kwargs.get('name', None)
+
+        self.__sessions = tuple()
+        self.__claimed = set()
+        self.__sessions_lock = threading.Lock()
+
+        self.__server_sock = None
+        self.__cdt = threading.Condition()
+        self.__th = None
+        self.__opened = False
+        self.__closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def timeout_rebind(self):
+        pass
+
+    @timeout_rebind.setter
+    def timeout_rebind(self, val):
+        self.__timeout_rebind = AbstractSecsCommunicator._try_gt_zero(val)
+
+    @timeout_rebind.getter
+    def timeout_rebind(self):
+        return self.__timeout_rebind
+
+    @property
+    def timeout_t7(self):
+        pass
+
+    @timeout_t7.setter
+    def timeout_t7(self, val):
+        """Timeout-T7 setter, until Select.req is received for routing.
+
+        Args:
+            val (int or float): Timeout-T7 value.
+        """
+        self.__timeout_t7 = AbstractSecsCommunicator._try_gt_zero(val)
+
+    @timeout_t7.getter
+    def timeout_t7(self):
+        return self.__timeout_t7
+
+    @property
+    def is_closed(self):
+        pass
+
+    @is_closed.getter
+    def is_closed(self):
+        with self.__cdt:
+            return self.__closed
+
+    def create_session(self, session_id, is_equip, **kwargs):
+        """Create session on this server.
+
+        Args:
+            session_id (int): SESSION-ID.
+            is_equip (bool): True if Equipment.
+            **kwargs: same as HsmsSsPassiveCommunicator, and 'peer_address'.
+
+        Returns:
+            HsmsSsPassiveCommunicator: session, open to accept connection.
+        """
+        return HsmsSsPassiveCommunicator(
+            self.__ipaddr[0], self.__ipaddr[1],
+            session_id, is_equip,
+            server=self,
+            **kwargs)
+
+    def get_sessions(self):
+        """Opened sessions getter.
+
+        Returns:
+            tuple: HsmsSsPassiveCommunicator sessions.
+        """
+        return self.__sessions
+
+    def _add_session(self, comm):
+        with self.__sessions_lock:
+            self.__sessions = self.__sessions + (comm,)
+
+    def _remove_session(self, comm):
+        with self.__sessions_lock:
+            self.__sessions = tuple([x for x in self.__sessions if x is not comm])
+
+    def open(self):
+        """Open server
+        """
+        with self.__cdt:
+            if self.__closed:
+                raise RuntimeError("Already closed")
+            if self.__opened:
+                raise RuntimeError("Already opened")
+            self.__opened = True
+
+        self.__th = threading.Thread(target=self.__loop, daemon=True)
+        self.__th.start()
+
+    def close(self):
+        """Close server
+
+        Sessions are not closed.
+        """
+        with self.__cdt:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__cdt.notify_all()
+
+            sock = self.__server_sock
+
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+
+        if self.__th is not None and self.__th.is_alive():
+            self.__th.join(0.1)
+
+    def __put_error(self, e):
+        for comm in self.__sessions:
+            comm._put_error(e)
+
+    def __loop(self):
+        while not self.is_closed:
+            self.__open_server()
+            with self.__cdt:
+                if self.__closed:
+                    return
+                self.__cdt.wait(self.timeout_rebind)
+
+    def __open_server(self):
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+
+                # server closes unrouted connections, rebind while those are in TIME_WAIT
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                server.bind(self.__ipaddr)
+                server.listen()
+
+                with self.__cdt:
+                    if self.__closed:
+                        return
+                    self.__server_sock = server
+
+                try:
+                    while not self.is_closed:
+                        sock = (server.accept())[0]
+
+                        threading.Thread(
+                            target=self.__accept,
+                            args=(sock, ),
+                            daemon=True
+                            ).start()
+
+                finally:
+                    with self.__cdt:
+                        self.__server_sock = None
+
+        except Exception as e:
+            if not self.is_closed:
+                self.__put_error(HsmsSsCommunicatorError(e))
+
+    def __accept(self, sock):
+        with sock:
+            comm = None
+            try:
+                header = self.__peek_header(sock)
+                if header is None:
+                    return
+
+                comm = self.__claim_session(sock.getpeername(), header)
+                if comm is None:
+                    if (header[8], header[9]) == HsmsSsControlType.SELECT_REQ:
+                        self.__reject_select(sock, header)
+                    self.__put_error(HsmsSsCommunicatorError(
+                        "No free session for " + str(sock.getpeername())))
+                    return
+
+                comm._accept_socket(sock)
+
+            except Exception as e:
+                if not self.is_closed:
+                    if comm is None:
+                        self.__put_error(e)
+                    else:
+                        comm._put_error(e)
+
+            finally:
+                if comm is not None:
+                    with self.__sessions_lock:
+                        self.__claimed.discard(comm)
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except Exception:
+                    pass
+
+    def __peek_header(self, sock):
+        # blocking peek of length and header-10-bytes, without consuming.
+        # socket is shut down if not received until Timeout-T7.
+        lock = threading.Lock()
+        peeking = [True]
+
+        def _t7():
+            with lock:
+                if peeking[0]:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except Exception:
+                        pass
+
+        timer = SecsTimer.get_shared()
+        entry = timer.schedule(self.timeout_t7, _t7)
+
+        try:
+            bs = sock.recv(self.__HEADER_SIZE, socket.MSG_PEEK | socket.MSG_WAITALL)
+
+        except OSError:
+            return None
+
+        finally:
+            timer.cancel(entry)
+            with lock:
+                peeking[0] = False
+
+        if len(bs) < self.__HEADER_SIZE:
+            return None
+
+        return bs
+
+    def __claim_session(self, peer, header):
+
+        session_id = None
+        if (header[8], header[9]) == HsmsSsControlType.SELECT_REQ:
+            v = (header[4] << 8) | header[5]
+            if v != 0xFFFF:
+                session_id = v
+
+        with self.__sessions_lock:
+
+            # peer_address is checked on every routing path
+            free = [
+                x for x in self.__sessions
+                if x not in self.__claimed and (x.peer_address is None or x._is_peer(peer))]
+
+            comm = None
+
+            if session_id is not None:
+
+                # SESSION-ID of Select.req never falls back to other session
+                comm = next((x for x in free if x.session_id == session_id), None)
+
+            else:
+
+                comm = next((x for x in free if x._is_peer(peer)), None)
+
+                if comm is None:
+                    comm = next((x for x in free if x.peer_address is None), None)
+
+            if comm is not None:
+                self.__claimed.add(comm)
+
+            return comm
+
+    def __is_claimed(self, session_id):
+        with self.__sessions_lock:
+            return any(x.session_id == session_id for x in self.__claimed)
+
+    def __reject_select(self, sock, header):
+        session_id = (header[4] << 8) | header[5]
+        if self.__is_claimed(session_id):
+            status = HsmsSsSelectStatus.ALREADY_USED
+        else:
+            status = HsmsSsSelectStatus.NOT_READY
+
+        rsp = HsmsSsControlMessage.build_select_response(
+            HsmsSsMessage.from_bytes(header),
+            status)
+
+        sock.sendall(rsp.to_bytes())
+
+
+class HsmsSsAsyncioLoop:
+    """Event loop running on daemon thread, shared by asyncio communicators.
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Shared event loop getter.
+
+        Returns:
+            asyncio.AbstractEventLoop: loop, running on daemon thread.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name='hsmsss-asyncio-loop',
+                    daemon=True).start()
+                cls.__shared = loop
+            return cls.__shared
+
+
+class HsmsSsAsyncioConnection(asyncio.BufferedProtocol):
+    """HSMS-SS connection on event loop.
+
+    Same interface as HsmsSsConnection, frames are parsed in buffer_updated,
+    T8 is timer handle on loop. send and send_async are thread-safe.
+    """
+
+    def __init__(
+            self, loop, comm,
+            recv_primary_msg_put_callback,
+            recv_all_msg_put_callback,
+            sended_msg_put_callback,
+            error_put_callback):
+
+        self.__loop = loop
+        self.__comm = comm
+        self.__put_recv_primary_msg = recv_primary_msg_put_callback
+        self.__put_recv_all_msg = recv_all_msg_put_callback
+        self.__put_sended_msg = sended_msg_put_callback
+        self.__put_error = error_put_callback
+
+        self.__transport = None
+        self.__terminated = False
+        self.__closed = loop.create_future()
+        self.__t8_handle = None
+
+        self.__frame_buffer = HsmsSsFrameBuffer()
+
+        self.__send_reply_pool = HsmsSsReplyFuturePool(SecsTimer.get_shared())
+
+    def connection_made(self, transport):
+        self.__transport = transport
+
+    def get_buffer(self, sizehint):
+        return self.__frame_buffer.get_buffer()
+
+    def buffer_updated(self, nbytes):
+        fb = self.__frame_buffer
+        fb.buffer_updated(nbytes)
+
+        self.__cancel_t8()
+
+        try:
+            while True:
+                bs = fb.next_frame()
+                if bs is None:
+                    break
+
+                msg = HsmsSsMessage.from_bytes(
+                    bs,
+                    self.__comm.lazy_secs2body,
+                    self.__comm.compact_secs2body)
+
+                self.__put_recv_all_msg(msg)
+
+                if not self.__send_reply_pool.put_reply_msg(msg):
+                    self.__put_recv_primary_msg(msg, self)
+
+        except Exception as e:
+            if not self.__terminated:
+                self.__put_error(e)
+            self.__transport.abort()
+            return
+
+        if fb.has_partial():
+            self.__t8_handle = self.__loop.call_later(
+                self.__comm.timeout_t8,
+                self.__timeout_t8)
+
+    def eof_received(self):
+        if not self.__terminated:
+            self.__put_error(HsmsSsCommunicatorError("Terminate detect"))
+        return False
+
+    def connection_lost(self, exc):
+        self.__cancel_t8()
+        if exc is not None and not self.__terminated:
+            self.__put_error(HsmsSsCommunicatorError(exc))
+        self.__terminated = True
+        self.__send_reply_pool.shutdown()
+        if not self.__closed.done():
+            self.__closed.set_result(None)
+
+    def __timeout_t8(self):
+        self.__t8_handle = None
+        if not self.__terminated:
+            self.__put_error(HsmsSsCommunicatorError("T8-Timeout"))
+        self.__transport.abort()
+
+    def __cancel_t8(self):
+        if self.__t8_handle is not None:
+            self.__t8_handle.cancel()
+            self.__t8_handle = None
+
+    def __in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self.__loop
+        except RuntimeError:
+            return False
+
+    def __call_in_loop(self, callback, *args):
+        if self.__in_loop():
+            callback(*args)
+        else:
+            try:
+                self.__loop.call_soon_threadsafe(callback, *args)
+            except RuntimeError:
+                # loop closed
+                callback(*args)
+
+    def shutdown(self):
+        self.__call_in_loop(self.__shutdown)
+
+    def __shutdown(self):
+        if not self.__terminated:
+            self.__terminated = True
+            self.__send_reply_pool.shutdown()
+            if self.__transport is not None:
+                self.__transport.close()
+
+    async def wait_closed(self):
+        """Wait until connection lost.
+
+        Returns:
+            None: None
+        """
+        await asyncio.shield(self.__closed)
+
+    def send(self, msg):
+        if self.__in_loop():
+            raise HsmsSsCommunicatorError("Blocking send in event loop, use send_async or asend")
+        return self.send_async(msg).result()
+
+    def send_async(self, msg):
+        """Send message, without waiting reply.
+
+        Args:
+            msg (HsmsSsMessage): message.
+
+        Returns:
+            concurrent.futures.Future: Reply-Message if reply is required, otherwise None.
+                Exception is HsmsSsSendMessageError, HsmsSsTimeoutT3Error, HsmsSsTimeoutT6Error,
+                HsmsSsRejectMessageError or HsmsSsCommunicatorError.
+        """
+        timeout_tx = -1.0
+
+        ctrl_type = msg.get_control_type()
+
+        if ctrl_type == HsmsSsControlType.DATA:
+            if msg.wbit:
+                timeout_tx = self.__comm.timeout_t3
+
+        elif (ctrl_type == HsmsSsControlType.SELECT_REQ
+              or ctrl_type == HsmsSsControlType.LINKTEST_REQ):
+
+            timeout_tx = self.__comm.timeout_t6
+
+        def _timeout_error():
+            if ctrl_type == HsmsSsControlType.DATA:
+                return HsmsSsTimeoutT3Error("HsmsSs-Timeout-T3", msg)
+            else:
+                self.shutdown()
+                return HsmsSsTimeoutT6Error("HsmsSs-Timeout-T6", msg)
+
+        if timeout_tx >= 0.0:
+            f = self.__send_reply_pool.entry(msg, timeout_tx, _timeout_error)
+            if not f.done():
+                self.__call_in_loop(self.__write, msg, f, False)
+        else:
+            f = concurrent.futures.Future()
+            self.__call_in_loop(self.__write, msg, f, True)
+
+        return f
+
+    def __write(self, msg, f, complete):
+        try:
+            if self.__terminated or self.__transport is None or self.__transport.is_closing():
+                raise HsmsSsCommunicatorError("HsmsSsConnection terminated")
+            self.__transport.writelines(msg.to_buffers())
+            self.__put_sended_msg(msg)
+        except Exception as e:
+            HsmsSsReplyFuturePool._set_exception(f, HsmsSsSendMessageError(e, msg))
+            return
+        if complete:
+            HsmsSsReplyFuturePool._set_result(f, None)
+
+
+class AbstractHsmsSsAsyncioCommunicator(AbstractHsmsSsCommunicator):
+
+    def __init__(self, ip_address, port, session_id, is_equip, **kwargs):
+        super(AbstractHsmsSsAsyncioCommunicator, self).__init__(session_id, is_equip, **kwargs)
+
+        self.__ipaddr = (ip_address, port)
+        self.__loop = kwargs.get('loop', None)
+        self.__main = None
+
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
+
+    def _get_ipaddress(self):
+        return self.__ipaddr
+
+    @property
+    def loop(self):
+        pass
+
+    @loop.getter
+    def loop(self):
+        """Event loop getter.
+
+        Set by 'loop' keyword argument.
+        If None, HsmsSsAsyncioLoop.get_shared() is used.
+
+        Returns:
+            asyncio.AbstractEventLoop: loop
+        """
+        if self.__loop is None:
+            self.__loop = HsmsSsAsyncioLoop.get_shared()
+        return self.__loop
+
+    def _in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _is_put_on_shared_thread(self):
+        # received messages are put to listener queues on loop thread
+        return True
+
+    def _open(self):
+
+        with self._open_close_rlock:
+            if self.is_closed:
+                raise RuntimeError("Already closed")
+            if self.is_open:
+                raise RuntimeError("Already opened")
+
+            self.__main = asyncio.run_coroutine_threadsafe(self._main(), self.loop)
+
+            super()._open()
+
+            self._set_opened()
+
+    async def _main(self):
+        # prototype
+        raise NotImplementedError()
+
+    def _close(self):
+
+        if self.is_closed:
+            return
+
+        super()._close()
+
+        self._set_closed()
+
+        self.__recv_primary_msg_putter.shutdown()
+
+        if self.__main is not None:
+            self.__main.cancel()
+            if not self._in_loop():
+                concurrent.futures.wait([self.__main], 0.1)
+
+    def send_hsmsss_msg(self, msg):
+        if self._in_loop():
+            raise HsmsSsCommunicatorError("Blocking send in event loop, use send_async or asend")
+        return super().send_hsmsss_msg(msg)
+
+    def _put_recv_primary_msg_to_queue(self, recv_msg):
+        self.__recv_primary_msg_putter.put(recv_msg)
+
+    def _send_nowait(self, conn, msg):
+        conn.send_async(msg).add_done_callback(self.__put_send_error)
+
+    def __put_send_error(self, f):
+        e = f.exception()
+        if e is not None and not self.is_closed:
+            self._put_error(e)
+
+    def _reject_unsupported(self, conn, recv_msg):
+        if HsmsSsControlType.has_s_type(recv_msg.get_s_type()):
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    HsmsSsRejectReason.NOT_SUPPORT_TYPE_P))
+        else:
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+
+
+class HsmsSsAsyncioActiveCommunicator(AbstractHsmsSsAsyncioCommunicator):
+    """HSMS-SS-Active communicator on asyncio event loop.
+
+    No threads per connection, many communicators can share one loop.
+    Listeners are called same as HsmsSsActiveCommunicator.
+    After connect refused or connection closed, waits T5 before next connect,
+    open passive side first or set small timeout_t5 to connect sooner.
+    Blocking send can not be called on loop thread, use asend or send_async.
+    """
+
+    __PROTOCOL = 'HSMS-SS-ACTIVE-ASYNCIO'
+
+    def __init__(self, ip_address, port, session_id, is_equip, **kwargs):
+        super(HsmsSsAsyncioActiveCommunicator, self).__init__(ip_address, port, session_id, is_equip, **kwargs)
+
+    def _get_protocol(self):
+        return self.__PROTOCOL
+
+    async def _main(self):
+        while not self.is_closed:
+            await self.__connect()
+            if self.is_closed:
+                return
+            await asyncio.sleep(self.timeout_t5)
+
+    async def __connect(self):
+
+        ipaddr = self._get_ipaddress()
+
+        try:
+            transport, conn = await self.loop.create_connection(
+                lambda: self._build_hsmsss_asyncio_connection(self.loop, self.__receiving_msg),
+                ipaddr[0],
+                ipaddr[1])
+
+        except OSError as e:
+            if not self.is_closed:
+                self._put_error(HsmsSsCommunicatorError(e))
+            return
+
+        try:
+            self._put_hsmsss_comm_state_to_connected()
+
+            rsp = await asyncio.wrap_future(conn.send_async(self.build_select_req()))
+
+            if rsp is not None:
+
+                ss = rsp.get_select_status()
+
+                if (ss == HsmsSsSelectStatus.SUCCESS
+                        or ss == HsmsSsSelectStatus.ACTIVED):
+
+                    self._set_hsmsss_connection(
+                        conn,
+                        self._put_hsmsss_comm_state_to_selected)
+
+                    await conn.wait_closed()
+
+        except HsmsSsCommunicatorError as e:
+            if not self.is_closed:
+                self._put_error(e)
+        except HsmsSsSendMessageError as e:
+            if not self.is_closed:
+                self._put_error(e)
+        except HsmsSsWaitReplyMessageError as e:
+            if not self.is_closed:
+                self._put_error(e)
+
+        finally:
+            self._unset_hsmsss_connection(
+                self._put_hsmsss_comm_state_to_not_connected)
+
+            conn.shutdown()
+
+    def __receiving_msg(self, recv_msg, conn):
+
+        ctrl_type = recv_msg.get_control_type()
+
+        if ctrl_type == HsmsSsControlType.DATA:
+
+            if self.get_hsmsss_communicate_state() == HsmsSsCommunicateState.SELECTED:
+
+                self._put_recv_primary_msg_to_queue(recv_msg)
+
+            else:
+                self._send_nowait(
+                    conn,
+                    self.build_select_rsp(
+                        recv_msg,
+                        HsmsSsRejectReason.NOT_SELECTED))
+
+        elif ctrl_type == HsmsSsControlType.LINKTEST_REQ:
+
+            self._send_nowait(conn, self.build_linktest_rsp(recv_msg))
+
+        elif ctrl_type == HsmsSsControlType.SEPARATE_REQ:
+
+            conn.shutdown()
+
+        elif ctrl_type == HsmsSsControlType.SELECT_REQ:
+
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+
+        elif (ctrl_type == HsmsSsControlType.SELECT_RSP
+              or ctrl_type == HsmsSsControlType.LINKTEST_RSP):
+
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+
+        elif ctrl_type == HsmsSsControlType.REJECT_REQ:
+
+            # Nothing
+            pass
+
+        else:
+
+            self._reject_unsupported(conn, recv_msg)
+
+
+class HsmsSsAsyncioPassiveCommunicator(AbstractHsmsSsAsyncioCommunicator):
+    """HSMS-SS-Passive communicator on asyncio event loop.
+
+    No threads per connection, many communicators can share one loop.
+    Listeners are called same as HsmsSsPassiveCommunicator.
+    open returns after server is listening (or bind failed).
+    Blocking send can not be called on loop thread, use asend or send_async.
+    """
+
+    __PROTOCOL = 'HSMS-SS-PASSIVE-ASYNCIO'
+    __TIMEOUT_REBIND = 5.0
+
+    def __init__(self, ip_address, port, session_id, is_equip, **kwargs):
+        super(HsmsSsAsyncioPassiveCommunicator, self).__init__(ip_address, port, session_id, is_equip, **kwargs)
+
+        self.__conns = set()
+        self.__listening = None
+
+        self.timeout_rebind = kwargs.get('timeout_rebind', self.__TIMEOUT_REBIND)
+
+    def _get_protocol(self):
+        return self.__PROTOCOL
+
+    @property
+    def timeout_rebind(self):
+        pass
+
+    @timeout_rebind.setter
+    def timeout_rebind(self, val):
+        self.__timeout_rebind = self._try_gt_zero(val)
+
+    @timeout_rebind.getter
+    def timeout_rebind(self):
+        return self.__timeout_rebind
+
+    def _open(self):
+        self.__listening = concurrent.futures.Future()
+        super()._open()
+        if not self._in_loop():
+            concurrent.futures.wait([self.__listening], self.timeout_rebind)
+
+    def __put_listening(self):
+        if not self.__listening.done():
+            self.__listening.set_result(None)
+
+    async def _main(self):
+        try:
+            while not self.is_closed:
+                await self.__open_server()
+                if self.is_closed:
+                    return
+                await asyncio.sleep(self.timeout_rebind)
+        finally:
+            self.__put_listening()
+            for conn in tuple(self.__conns):
+                conn.shutdown()
+
+    async def __open_server(self):
+
+        ipaddr = self._get_ipaddress()
+
+        try:
+            server = await self.loop.create_server(
+                self.__accept,
+                ipaddr[0],
+                ipaddr[1])
+
+        except OSError as e:
+            self.__put_listening()
+            if not self.is_closed:
+                self._put_error(HsmsSsCommunicatorError(e))
+            return
+
+        self.__put_listening()
+
+        try:
+            await server.serve_forever()
+
+        except OSError as e:
+            if not self.is_closed:
+                self._put_error(HsmsSsCommunicatorError(e))
+
+        finally:
+            server.close()
+
+    def __accept(self):
+
+        selected = False
+        t7_handle = None
+
+        def _reset_t7(conn):
+            nonlocal t7_handle
+            if t7_handle is not None:
+                t7_handle.cancel()
+            t7_handle = None if selected else self.loop.call_later(self.timeout_t7, conn.shutdown)
+
+        def _recv(recv_msg, conn):
+            nonlocal selected
+            if selected:
+                self.__receiving_msg(recv_msg, conn)
+            else:
+                selected = self.__receiving_msg_until_selected(recv_msg, conn)
+                _reset_t7(conn)
+
+        async def _session(conn):
+            try:
+                await conn.wait_closed()
+            finally:
+                if t7_handle is not None:
+                    t7_handle.cancel()
+                self.__conns.discard(conn)
+                if selected:
+                    self._unset_hsmsss_connection(
+                        self._put_hsmsss_comm_state_to_not_connected)
+                elif (not self.__conns
+                      and self.get_hsmsss_communicate_state() == HsmsSsCommunicateState.CONNECTED):
+                    self._put_hsmsss_comm_state_to_not_connected()
 
-                elif ctrl_type == HsmsSsControlType.REJECT_REQ:
+        conn = self._build_hsmsss_asyncio_connection(self.loop, _recv)
 
-                    # Nothing
-                    pass
+        self.__conns.add(conn)
+        if self.get_hsmsss_communicate_state() == HsmsSsCommunicateState.NOT_CONNECT:
+            self._put_hsmsss_comm_state_to_connected()
+        _reset_t7(conn)
+        self.loop.create_task(_session(conn))
 
-                else:
+        return conn
 
-                    if HsmsSsControlType.has_s_type(recv_msg.get_s_type()):
+    def __receiving_msg_until_selected(self, recv_msg, conn):
 
-                        conn.send(
-                            self.build_reject_req(
-                                recv_msg,
-                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_P))
+        ctrl_type = recv_msg.get_control_type()
 
-                    else:
+        if ctrl_type == HsmsSsControlType.DATA:
 
-                        conn.send(
-                            self.build_reject_req(
-                                recv_msg,
-                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+            self._send_nowait(
+                conn,
+                self.build_select_rsp(
+                    recv_msg,
+                    HsmsSsRejectReason.NOT_SELECTED))
 
-            except HsmsSsSendMessageError as e:
-                self._put_error(e)
-            except HsmsSsWaitReplyMessageError as e:
-                self._put_error(e)
-            except HsmsSsCommunicatorError as e:
-                self._put_error(e)
+        elif ctrl_type == HsmsSsControlType.LINKTEST_REQ:
 
-        return False
+            self._send_nowait(conn, self.build_linktest_rsp(recv_msg))
 
-    def __receiving_msg(self, qq):
+        elif ctrl_type == HsmsSsControlType.SEPARATE_REQ:
 
-        while not self.is_closed:
+            conn.shutdown()
 
-            tt = qq.poll()
+        elif ctrl_type == HsmsSsControlType.SELECT_REQ:
 
-            if tt is None:
-                return False
+            r = self._set_hsmsss_connection(
+                conn,
+                self._put_hsmsss_comm_state_to_selected)
 
-            recv_msg = tt[0]
-            conn = tt[1]
+            if r:
 
-            ctrl_type = recv_msg.get_control_type()
+                self._send_nowait(
+                    conn,
+                    self.build_select_rsp(
+                        recv_msg,
+                        HsmsSsSelectStatus.SUCCESS))
 
-            try:
-                if ctrl_type == HsmsSsControlType.DATA:
+                return True
 
-                    self.__recv_primary_msg_putter.put(recv_msg)
+            else:
 
-                elif ctrl_type == HsmsSsControlType.LINKTEST_REQ:
+                self._send_nowait(
+                    conn,
+                    self.build_select_rsp(
+                        recv_msg,
+                        HsmsSsSelectStatus.ALREADY_USED))
 
-                    conn.send(self.build_linktest_rsp(recv_msg))
+        elif (ctrl_type == HsmsSsControlType.SELECT_RSP
+              or ctrl_type == HsmsSsControlType.LINKTEST_RSP):
 
-                elif ctrl_type == HsmsSsControlType.SEPARATE_REQ:
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
 
-                    return False
+        elif ctrl_type == HsmsSsControlType.REJECT_REQ:
 
-                elif ctrl_type == HsmsSsControlType.SELECT_REQ:
+            # Nothing
+            pass
 
-                    conn.send(
-                        self.build_select_rsp(
-                            recv_msg,
-                            HsmsSsSelectStatus.ACTIVED))
+        else:
 
-                elif (ctrl_type == HsmsSsControlType.SELECT_RSP
-                      or ctrl_type == HsmsSsControlType.LINKTEST_RSP):
+            self._reject_unsupported(conn, recv_msg)
 
-                    conn.send(
-                        self.build_reject_req(
-                            recv_msg,
-                            HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+        return False
 
-                elif ctrl_type == HsmsSsControlType.REJECT_REQ:
+    def __receiving_msg(self, recv_msg, conn):
 
-                    # Nothing
-                    pass
+        ctrl_type = recv_msg.get_control_type()
 
-                else:
+        if ctrl_type == HsmsSsControlType.DATA:
 
-                    if HsmsSsControlType.has_s_type(recv_msg.get_s_type()):
+            self._put_recv_primary_msg_to_queue(recv_msg)
 
-                        conn.send(
-                            self.build_reject_req(
-                                recv_msg,
-                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_P))
+        elif ctrl_type == HsmsSsControlType.LINKTEST_REQ:
 
-                    else:
+            self._send_nowait(conn, self.build_linktest_rsp(recv_msg))
 
-                        conn.send(
-                            self.build_reject_req(
-                                recv_msg,
-                                HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+        elif ctrl_type == HsmsSsControlType.SEPARATE_REQ:
 
-            except HsmsSsSendMessageError as e:
-                self._put_error(e)
-            except HsmsSsWaitReplyMessageError as e:
-                self._put_error(e)
-            except HsmsSsCommunicatorError as e:
-                self._put_error(e)
+            conn.shutdown()
 
-        return False
+        elif ctrl_type == HsmsSsControlType.SELECT_REQ:
 
-    def _close(self):
+            self._send_nowait(
+                conn,
+                self.build_select_rsp(
+                    recv_msg,
+                    HsmsSsSelectStatus.ACTIVED))
 
-        if self.is_closed:
-            return
+        elif (ctrl_type == HsmsSsControlType.SELECT_RSP
+              or ctrl_type == HsmsSsControlType.LINKTEST_RSP):
 
-        super()._close()
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
 
-        self._set_closed()
+        elif ctrl_type == HsmsSsControlType.REJECT_REQ:
 
-        for cdt in self.__cdts:
-            with cdt:
-                cdt.notify_all()
+            # Nothing
+            pass
 
-        for th in self.__ths:
-            if th.is_alive():
-                th.join(0.1)
+        else:
+
+            self._reject_unsupported(conn, recv_msg)
 
 
 class Secs1CommunicatorError(SecsCommunicatorError):
@@ -3677,10 +7018,61 @@ class MsgAndRecvBytesWaitingQueuing(WaitingQueuing):
 
     def __init__(self):
         super(MsgAndRecvBytesWaitingQueuing, self).__init__()
-        self.__msg_queue = list()
+        self.__msg_queue = collections.deque()
+        self.__recv_bytes = bytearray()
 
     def put_recv_bytes(self, bs):
-        self.puts(bs)
+        with self._v_cdt:
+            if bs and not self._is_terminated():
+                self.__recv_bytes.extend(bs)
+                self._v_cdt.notify_all()
+
+    def _poll_vv(self):
+        with self._v_cdt:
+            if self.__recv_bytes:
+                v = self.__recv_bytes[0]
+                del self.__recv_bytes[0]
+                return v
+            else:
+                return None
+
+    def read_into(self, buf, pos, size, timeout=None):
+        """Read received bytes into buffer.
+
+        Args:
+            buf (bytearray): buffer.
+            pos (int): start position of buf.
+            size (int): end position of buf.
+            timeout (float): seconds to wait, if no bytes.
+
+        Returns:
+            int: read bytes count, -1 if timeout or terminated.
+        """
+
+        def _f():
+            n = min(len(self.__recv_bytes), size - pos)
+            if n > 0:
+                buf[pos:(pos + n)] = self.__recv_bytes[0:n]
+                del self.__recv_bytes[0:n]
+                return n
+            else:
+                return -1
+
+        with self._v_cdt:
+
+            if self._is_terminated():
+                return -1
+
+            r = _f()
+            if r > 0:
+                return r
+
+            self._v_cdt.wait(timeout)
+
+            if self._is_terminated():
+                return -1
+
+            return _f()
 
     def entry_msg(self, msg):
         with self._v_cdt:
@@ -3696,7 +7088,7 @@ class MsgAndRecvBytesWaitingQueuing(WaitingQueuing):
                 return None, None
 
             if self.__msg_queue:
-                return self.__msg_queue.pop(0), None
+                return self.__msg_queue.popleft(), None
 
             v = self._poll_vv()
             if v is not None:
@@ -3708,133 +7100,177 @@ class MsgAndRecvBytesWaitingQueuing(WaitingQueuing):
                 return None, None
 
             if self.__msg_queue:
-                return self.__msg_queue.pop(0), None
+                return self.__msg_queue.popleft(), None
 
             return None, self._poll_vv()
 
     def recv_bytes_garbage(self, timeout):
 
         with self._v_cdt:
-            del self._vv[:]
+            while True:
+                del self.__recv_bytes[:]
 
-            if self._is_terminated():
-                return
+                if self._is_terminated():
+                    return
 
-            while True:
-                v = self.poll(timeout)
-                if v is None:
+                self._v_cdt.wait(timeout)
+
+                if not self.__recv_bytes:
                     return
 
 
 class SendSecs1MessagePack:
+    """Sending message and its reply, completed by future.
 
-    def __init__(self, msg):
+    Timeout-T3 is started after sended, restarted by each received block of reply.
+    Blocks are built on demand, only present block is held.
+    """
+
+    def __init__(self, msg, timeout_t3, sended_callback, timer):
         self.__msg = msg
         self.__present = 0
+        self.__block = None
+        self.__timeout_t3 = timeout_t3
+        self.__sended_callback = sended_callback
+        self.__timer = timer
+        self.__timer_entry = None
         self.__lock = threading.Lock()
-        self.__cdt = threading.Condition()
-        self.__sended = False
-        self.__except = None
-        self.__timer_resetted = True
-        self.__reply_msg = None
+        self.__future = concurrent.futures.Future()
+        self.__future.add_done_callback(self.__cancel_t3)
 
     def secs1msg(self):
         return self.__msg
 
+    def future(self):
+        """Future getter.
+
+        Returns:
+            concurrent.futures.Future: Reply-Message if W-Bit, otherwise None.
+        """
+        return self.__future
+
     def present_block(self):
-        return (self.__msg.to_blocks())[self.__present]
+        if self.__block is None:
+            self.__block = self.__msg.get_block(self.__present)
+        return self.__block
 
     def next_block(self):
         self.__present += 1
+        self.__block = None
 
     def reset_block(self):
         self.__present = 0
+        self.__block = None
 
     def ebit_block(self):
         return self.present_block().ebit
 
-    def wait_until_sended(self, timeout=None):
-        while True:
-            with self.__lock:
-                if self.__sended:
-                    return
-                elif self.__except is not None:
-                    raise self.__except
-
-            with self.__cdt:
-                self.__cdt.wait(timeout)
-
     def notify_sended(self):
-        with self.__lock:
-            self.__sended = True
-            with self.__cdt:
-                self.__cdt.notify_all()
+        self.__sended_callback(self.__msg)
+        if self.__msg.wbit and self.__timeout_t3 > 0.0:
+            self.__start_t3()
+        else:
+            self.__set_result(None)
 
     def notify_except(self, e):
-        with self.__lock:
-            self.__except = e
-            with self.__cdt:
-                self.__cdt.notify_all()
+        try:
+            self.__future.set_exception(e)
+        except Exception:
+            # already done
+            pass
 
-    def wait_until_reply(self, timeout):
+    def notify_reply_msg(self, msg):
+        self.__set_result(msg)
 
+    def notify_timer_reset(self):
         with self.__lock:
-            self.__timer_resetted = True
+            if self.__timer_entry is None:
+                return
+        self.__start_t3()
 
-        while True:
-            with self.__lock:
-                if self.__reply_msg is not None:
-                    return self.__reply_msg
-                elif self.__timer_resetted:
-                    self.__timer_resetted = False
-                else:
-                    return None
+    def is_waiting_reply(self):
+        """Reply-waiting getter.
 
-            with self.__cdt:
-                self.__cdt.wait(timeout)
+        Returns:
+            bool: True if sended with W-Bit, and reply not received yet.
+        """
+        with self.__lock:
+            return self.__timer_entry is not None and not self.__future.done()
 
-    def notify_reply_msg(self, msg):
+    def __set_result(self, v):
+        try:
+            self.__future.set_result(v)
+        except Exception:
+            # already done
+            pass
+
+    def __start_t3(self):
         with self.__lock:
-            self.__reply_msg = msg
-            with self.__cdt:
-                self.__cdt.notify_all()
+            if self.__future.done():
+                return
+            if self.__timer_entry is not None:
+                self.__timer.cancel(self.__timer_entry)
+            self.__timer_entry = self.__timer.schedule(self.__timeout_t3, self.__timeout_t3_expired)
 
-    def notify_timer_reset(self):
+    def __timeout_t3_expired(self):
+        self.notify_except(Secs1TimeoutT3Error('Timeout-T3', self.__msg))
+
+    def __cancel_t3(self, f):
         with self.__lock:
-            self.__timer_resetted = True
-            with self.__cdt:
-                self.__cdt.notify_all()
+            if self.__timer_entry is not None:
+                self.__timer.cancel(self.__timer_entry)
 
 
 class Secs1SendReplyPackPool:
+    """Sending packs indexed by System-Bytes, removed when completed.
+    """
 
     def __init__(self):
-        self.__packs = list()
+        self.__packs = dict()
         self.__lock = threading.Lock()
+        self.__terminated = False
 
     def append(self, pack):
+        key = pack.secs1msg().system_bytes
         with self.__lock:
-            self.__packs.append(pack)
+            if self.__terminated:
+                pack.notify_except(Secs1CommunicatorError("Communicator closed"))
+                return
+            self.__packs[key] = self.__packs.get(key, tuple()) + (pack,)
+
+        pack.future().add_done_callback(lambda f: self.__remove(key, pack))
+
+    def shutdown(self):
+        with self.__lock:
+            self.__terminated = True
+            pp = [p for v in self.__packs.values() for p in v]
+        for p in pp:
+            p.notify_except(Secs1CommunicatorError("Communicator closed"))
 
-    def remove(self, pack):
+    def __remove(self, key, pack):
         with self.__lock:
-            self.__packs.remove(pack)
+            pp = tuple([p for p in self.__packs.get(key, tuple()) if p is not pack])
+            if pp:
+                self.__packs[key] = pp
+            else:
+                self.__packs.pop(key, None)
 
     def __get_packs(self, system_bytes):
         with self.__lock:
-            return [p for p in self.__packs
-                    if p.secs1msg().system_bytes == system_bytes]
+            return self.__packs.get(system_bytes, tuple())
+
+    def receive(self, msg):
+        """Complete packs waiting reply by received message.
 
-    def sended(self, msg):
-        for p in self.__get_packs(msg.system_bytes):
-            p.notify_sended()
+        Packs not sended yet, or sended without W-Bit, are not completed.
 
-    def raise_except(self, msg, e):
-        for p in self.__get_packs(msg.system_bytes):
-            p.notify_except(e)
+        Args:
+            msg (Secs1Message): received message.
 
-    def receive(self, msg):
-        pp = self.__get_packs(msg.system_bytes)
+        Returns:
+            bool: True if reply of sended pack, otherwise message is primary.
+        """
+        pp = [p for p in self.__get_packs(msg.system_bytes) if p.is_waiting_reply()]
         if pp:
             for p in pp:
                 p.notify_reply_msg(msg)
@@ -3869,23 +7305,23 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         self.__send_reply_pack_pool = Secs1SendReplyPackPool()
         self.__recv_blocks = list()
 
-        self.__recv_primary_msg_putter = CallbackQueuing(self._put_recv_primary_msg)
-        self.__recv_all_msg_putter = CallbackQueuing(self._put_recv_all_msg)
-        self.__sended_msg_putter = CallbackQueuing(self._put_sended_msg)
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
+        self.__recv_all_msg_putter = self._build_callback_queuing(self._put_recv_all_msg)
+        self.__sended_msg_putter = self._build_callback_queuing(self._put_sended_msg)
 
-        self.__error_putter = CallbackQueuing(super()._put_error)
+        self.__error_putter = self._build_callback_queuing(super()._put_error)
 
-        self.__recv_block_lstnrs = list()
-        self.__recv_block_putter = CallbackQueuing(self._put_recv_block)
+        self.__recv_block_lstnrs = tuple()
+        self.__recv_block_putter = self._build_callback_queuing(self._put_recv_block)
 
-        self.__try_send_block_lstnrs = list()
-        self.__try_send_block_putter = CallbackQueuing(self._put_try_send_block)
+        self.__try_send_block_lstnrs = tuple()
+        self.__try_send_block_putter = self._build_callback_queuing(self._put_try_send_block)
 
-        self.__sended_block_lstnrs = list()
-        self.__sended_block_putter = CallbackQueuing(self._put_sended_block)
+        self.__sended_block_lstnrs = tuple()
+        self.__sended_block_putter = self._build_callback_queuing(self._put_sended_block)
 
-        self.__secs1_circuit_error_msg_lstnrs = list()
-        self.__secs1_circuit_error_msg_putter = CallbackQueuing(self._put_secs1_circuit_error_msg)
+        self.__secs1_circuit_error_msg_lstnrs = tuple()
+        self.__secs1_circuit_error_msg_putter = self._build_callback_queuing(self._put_secs1_circuit_error_msg)
 
         self.__circuit_th = None
 
@@ -3963,6 +7399,7 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
 
         self._set_closed()
 
+        self.__send_reply_pack_pool.shutdown()
         self.__recv_primary_msg_putter.shutdown()
         self.__recv_all_msg_putter.shutdown()
         self.__sended_msg_putter.shutdown()
@@ -3981,33 +7418,34 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         return self.send_secs1_msg(
             Secs1Message(strm, func, wbit, secs2body, system_bytes, device_id, self.is_equip))
 
-    def send_secs1_msg(self, msg):
-
-        pack = SendSecs1MessagePack(msg)
+    def _send_async(self, strm, func, wbit, secs2body, system_bytes, device_id):
+        return self.send_secs1_msg_async(
+            Secs1Message(strm, func, wbit, secs2body, system_bytes, device_id, self.is_equip))
 
+    def send_secs1_msg(self, msg):
         try:
-            self.__send_reply_pack_pool.append(pack)
-
-            self.__msg_and_bytes_queue.entry_msg(pack)
-
-            timeout_tx = self.timeout_t3 if msg.wbit else -1.0
+            return self.send_secs1_msg_async(msg).result()
+        except Secs1CommunicatorError:
+            # message without W-Bit is discarded at close,
+            # listener replying while closing is not failed
+            if msg.wbit or not self.is_closed:
+                raise
+            return None
 
-            pack.wait_until_sended()
+    def send_secs1_msg_async(self, msg):
 
-            self.__sended_msg_putter.put(pack.secs1msg())
+        pack = SendSecs1MessagePack(
+            msg,
+            self.timeout_t3,
+            self.__sended_msg_putter.put,
+            SecsTimer.get_shared())
 
-            if timeout_tx > 0.0:
+        self.__send_reply_pack_pool.append(pack)
 
-                r = pack.wait_until_reply(timeout_tx)
-                if r is None:
-                    raise Secs1TimeoutT3Error('Timeout-T3', pack.secs1msg())
-                else:
-                    return r
-            else:
-                return None
+        if not pack.future().done():
+            self.__msg_and_bytes_queue.entry_msg(pack)
 
-        finally:
-            self.__send_reply_pack_pool.remove(pack)
+        return pack.future()
 
     def _put_recv_bytes(self, bs):
         self.__msg_and_bytes_queue.put_recv_bytes(bs)
@@ -4033,7 +7471,8 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__recv_block_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__recv_block_lstnrs = self._added_listeners(self.__recv_block_lstnrs, listener)
 
     def remove_recv_block_listener(self, listener):
         """Remove receive-secs1-message-block-listener.
@@ -4044,15 +7483,13 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__recv_block_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__recv_block_lstnrs = self._removed_listeners(self.__recv_block_lstnrs, listener)
 
     def _put_recv_block(self, block):
         if block is not None:
             for ls in self.__recv_block_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(block)
-                else:
-                    ls(block, self)
+                ls[1](block)
 
     def add_try_send_block_listener(self, listener):
         """Add try-send-secs1-message-block-listener.
@@ -4068,7 +7505,8 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__try_send_block_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__try_send_block_lstnrs = self._added_listeners(self.__try_send_block_lstnrs, listener)
 
     def remove_try_send_block_listener(self, listener):
         """Remove try-send-secs1-message-block-listener.
@@ -4079,15 +7517,13 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__try_send_block_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__try_send_block_lstnrs = self._removed_listeners(self.__try_send_block_lstnrs, listener)
 
     def _put_try_send_block(self, block):
         if block is not None:
             for ls in self.__try_send_block_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(block)
-                else:
-                    ls(block, self)
+                ls[1](block)
 
     def add_sended_block_listener(self, listener):
         """Add sended-secs1-message-block-listener.
@@ -4103,7 +7539,8 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__sended_block_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__sended_block_lstnrs = self._added_listeners(self.__sended_block_lstnrs, listener)
 
     def remove_sended_block_listener(self, listener):
         """Remove sended-secs1-message-block-listener.
@@ -4114,15 +7551,13 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__sended_block_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__sended_block_lstnrs = self._removed_listeners(self.__sended_block_lstnrs, listener)
 
     def _put_sended_block(self, block):
         if block is not None:
             for ls in self.__sended_block_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(block)
-                else:
-                    ls(block, self)
+                ls[1](block)
 
     def add_secs1_circuit_error_msg_listener(self, listener):
         """Add SECS1-Circuit-error-msg-listener.
@@ -4138,7 +7573,8 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__secs1_circuit_error_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__secs1_circuit_error_msg_lstnrs = self._added_listeners(self.__secs1_circuit_error_msg_lstnrs, listener)
 
     def remove_secs1_circuit_error_msg_listener(self, listener):
         """Remove SECS1-Circuit-error-msg-listener.
@@ -4149,15 +7585,13 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__secs1_circuit_error_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__secs1_circuit_error_msg_lstnrs = self._removed_listeners(self.__secs1_circuit_error_msg_lstnrs, listener)
 
     def _put_secs1_circuit_error_msg(self, msg_obj):
         if msg_obj is not None:
             for ls in self.__secs1_circuit_error_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(msg_obj)
-                else:
-                    ls(msg_obj, self)
+                ls[1](msg_obj)
 
     def __circuit(self):
 
@@ -4299,9 +7733,9 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         try:
             self._send_bytes(self.__BYTES_EOT)
 
-            bb = list()
+            bb = bytearray(257)
 
-            r = self.__msg_and_bytes_queue.put_to_list(
+            r = self.__msg_and_bytes_queue.read_into(
                 bb, 0, 1,
                 self.timeout_t2)
 
@@ -4330,7 +7764,7 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
             m = bb_len + 3
 
             while pos < m:
-                r = self.__msg_and_bytes_queue.put_to_list(
+                r = self.__msg_and_bytes_queue.read_into(
                     bb, pos, m,
                     self.timeout_t1)
 
@@ -4346,7 +7780,7 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
 
                 pos += r
 
-            if self.__sum_check(bb):
+            if Secs1Framer.check_block(bb, m):
 
                 self._send_bytes(self.__BYTES_ACK)
 
@@ -4357,12 +7791,12 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
 
                 self.__secs1_circuit_error_msg_putter.put({
                     'msg': 'Sum-Check-Error',
-                    'bytes': bytes(bb)
+                    'bytes': bytes(bb[0:m])
                 })
 
                 return
 
-            block = Secs1MessageBlock(bytes(bb))
+            block = Secs1MessageBlock(bytes(bb[0:m]))
 
             self.__recv_block_putter.put(block)
 
@@ -4396,7 +7830,10 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
             if block.ebit:
 
                 try:
-                    msg = Secs1Message.from_blocks(self.__recv_blocks)
+                    msg = Secs1Message.from_blocks(
+                        self.__recv_blocks,
+                        self.lazy_secs2body,
+                        self.compact_secs2body)
 
                     if not self.__send_reply_pack_pool.receive(msg):
 
@@ -4437,12 +7874,6 @@ class AbstractSecs1Communicator(AbstractSecsCommunicator):
         except Secs1CommunicatorError as e:
             self._put_error(e)
 
-    @staticmethod
-    def __sum_check(bb):
-        a = sum(bb[1:-2]) & 0xFFFF
-        b = (bb[-2] << 8) | bb[-1]
-        return a == b
-
 
 class AbstractSecs1OnTcpIpCommunicator(AbstractSecs1Communicator):
 
@@ -4489,6 +7920,50 @@ class AbstractSecs1OnTcpIpCommunicator(AbstractSecs1Communicator):
             if not self.is_closed:
                 self._put_error(e)
 
+    def _start_reading(self, sock, cdt, ths):
+        # return reading thread, or None if read on reactor
+        if self.reactor is None:
+
+            def _f():
+                self._reading(sock)
+                with cdt:
+                    cdt.notify_all()
+
+            th = threading.Thread(target=_f, daemon=True)
+            th.start()
+            ths.append(th)
+            return th
+
+        def _readable():
+            try:
+                bs = sock.recv(4096)
+            except Exception as e:
+                if not self.is_closed:
+                    self._put_error(e)
+                bs = None
+
+            if bs:
+                self._put_recv_bytes(bs)
+            else:
+                self.reactor.unregister(sock)
+                with cdt:
+                    cdt.notify_all()
+
+        def _error(e):
+            if not self.is_closed:
+                self._put_error(e)
+            with cdt:
+                cdt.notify_all()
+
+        self.reactor.register(sock, _readable, _error)
+        return None
+
+    def _stop_reading(self, sock, th, ths):
+        if th is None:
+            self.reactor.unregister(sock)
+        else:
+            ths.remove(th)
+
 
 class Secs1OnTcpIpCommunicator(AbstractSecs1OnTcpIpCommunicator):
 
@@ -4559,22 +8034,15 @@ class Secs1OnTcpIpCommunicator(AbstractSecs1OnTcpIpCommunicator):
                                 try:
                                     sock.connect(self.__ipaddr)
 
-                                    def _f():
-                                        self._reading(sock)
-                                        with cdt:
-                                            cdt.notify_all()
-
-                                    th_r = threading.Thread(target=_f, daemon=True)
-                                    th_r.start()
+                                    th_r = self._start_reading(sock, cdt, self.__ths)
 
                                     try:
-                                        self.__ths.append(th_r)
                                         self._add_socket(sock)
 
                                         with cdt:
                                             cdt.wait()
                                     finally:
-                                        self.__ths.remove(th_r)
+                                        self._stop_reading(sock, th_r, self.__ths)
                                         self._remove_socket(sock)
 
                                 finally:
@@ -4737,16 +8205,9 @@ class Secs1OnTcpIpReceiverCommunicator(AbstractSecs1OnTcpIpCommunicator):
             try:
                 self.__cdts.append(cdt)
 
-                def _f():
-                    self._reading(sock)
-                    with cdt:
-                        cdt.notify_all()
-
-                th_r = threading.Thread(target=_f, daemon=True)
-                th_r.start()
+                th_r = self._start_reading(sock, cdt, self.__ths)
 
                 try:
-                    self.__ths.append(th_r)
                     self._add_socket(sock)
 
                     with cdt:
@@ -4754,7 +8215,7 @@ class Secs1OnTcpIpReceiverCommunicator(AbstractSecs1OnTcpIpCommunicator):
 
                 finally:
                     self._remove_socket(sock)
-                    self.__ths.remove(th_r)
+                    self._stop_reading(sock, th_r, self.__ths)
 
             finally:
                 self.__cdts.remove(cdt)
@@ -4867,6 +8328,44 @@ class Secs1OnPySerialCommunicator(AbstractSecs1Communicator):
         except Exception as e:
             self._put_error(e)
 
+    def __start_reading(self, ser, cdt):
+        # return reading thread, or None if read on reactor
+        if self.reactor is None or not hasattr(ser, 'fileno'):
+
+            def _f():
+                self._reading(ser)
+                with cdt:
+                    cdt.notify_all()
+
+            th = threading.Thread(target=_f, daemon=True)
+            th.start()
+            self.__ths.append(th)
+            return th
+
+        def _readable():
+            try:
+                bs = ser.read(ser.in_waiting or 1)
+            except Exception as e:
+                if not self.is_closed:
+                    self._put_error(e)
+                bs = None
+
+            if bs:
+                self._put_recv_bytes(bs)
+            else:
+                self.reactor.unregister(ser)
+                with cdt:
+                    cdt.notify_all()
+
+        def _error(e):
+            if not self.is_closed:
+                self._put_error(e)
+            with cdt:
+                cdt.notify_all()
+
+        self.reactor.register(ser, _readable, _error)
+        return None
+
     def _open(self):
         with self._open_close_rlock:
             if self.is_closed:
@@ -4896,16 +8395,9 @@ class Secs1OnPySerialCommunicator(AbstractSecs1Communicator):
                                 ser.port = self.__port
                                 ser.open()
 
-                                def _ff():
-                                    self._reading(ser)
-                                    with cdt:
-                                        cdt.notify_all()
-
-                                th_r = threading.Thread(target=_ff, daemon=True)
-                                th_r.start()
+                                th_r = self.__start_reading(ser, cdt)
 
                                 try:
-                                    self.__ths.append(th_r)
                                     self.__set_serial(ser)
 
                                     with cdt:
@@ -4913,7 +8405,10 @@ class Secs1OnPySerialCommunicator(AbstractSecs1Communicator):
 
                                 finally:
                                     self.__unset_serial()
-                                    self.__ths.remove(th_r)
+                                    if th_r is None:
+                                        self.reactor.unregister(ser)
+                                    else:
+                                        self.__ths.remove(th_r)
 
                             finally:
                                 try:
@@ -1,6 +1,26 @@
+import array
+import asyncio
+import concurrent.futures
+import importlib.util
+import io
+import os
+import socket
+import threading
+import time
 import unittest
 import secs
 
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+
+def _wait_until(f, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not f():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.01)
+    return True
+
 class Test(unittest.TestCase):
 
     def __build_passive(self):
@@ -445,6 +465,1039 @@ class Test(unittest.TestCase):
                 except Exception as e:
                     raise e
 
+    def test_secs2body_decode(self):
+
+        body = secs.Secs2BodyBuilder.build('L', [
+            ('B', [0x00, 0xFF]),
+            ('BOOLEAN', [True, False]),
+            ('A', 'ABC'),
+            ('I1', [-1]), ('I2', [-300]), ('I4', [-70000]), ('I8', [-2**40]),
+            ('U1', [255]), ('U2', [65535]), ('U4', [2**32 - 1]), ('U8', [2**64 - 1]),
+            ('F4', [1.5]), ('F8', [-0.25]),
+            ('L', [])
+        ])
+
+        bs = body.to_bytes()
+        v = secs.Secs2BodyBuilder.from_body_bytes(bs)
+        self.assertEqual(bs, v.to_bytes())
+        self.assertEqual(body.to_sml(), v.to_sml())
+        self.assertEqual((-2**40, ), v.get_value(6))
+        self.assertEqual((2**64 - 1, ), v.get_value(10))
+
+        # 3-bytes length
+        big = secs.Secs2BodyBuilder.build('U1', [1] * 70000)
+        self.assertEqual(70000, len(secs.Secs2BodyBuilder.from_body_bytes(big.to_bytes())))
+
+        for x in (b'\xFD\x01\x00', b'\xB1\x03\x00\x00\x00', b'\x41\x05AB', b'\x01\x02\x21\x01\x00'):
+            with self.assertRaises(secs.Secs2BodyBytesParseError):
+                secs.Secs2BodyBuilder.from_body_bytes(x)
+
+    def test_secs2body_view(self):
+
+        bs = bytearray(secs.Secs2BodyBuilder.build('L', [('A', 'ON FIRE'), ('B', [1, 2])]).to_bytes())
+        v = secs.Secs2BodyBuilder.from_body_bytes(memoryview(bs))
+        self.assertEqual('ON FIRE', v.get_value(0))
+        self.assertEqual(b'\x01\x02', v.get_value(1))
+
+        # values are detached from received buffer after access
+        bs[:] = bytes(len(bs))
+        self.assertEqual('ON FIRE', v.get_value(0))
+
+        with self.assertRaises(secs.Secs2BodyParseError):
+            secs.Secs2BodyBuilder.from_body_bytes(memoryview(b'\x41\x02A\xFF'))
+
+        with self.assertRaises(secs.Secs2BodyParseError):
+            secs.HsmsSsMessage.from_bytes(b'\x00\x00\x00\x0E\x00\x0A\x01\x01\x00\x00\x00\x00\x00\x01\x41\x02A\xFF')
+
+    def test_secs2body_lazy(self):
+
+        body = secs.Secs2BodyBuilder.build('L', [
+            ('U4', [1, 2, 3]),
+            ('L', [('A', 'X'), ('F8', [0.5])]),
+            ('B', [7])
+        ])
+        bs = body.to_bytes()
+
+        v = secs.Secs2BodyBuilder.from_body_bytes(bs, lazy=True)
+        self.assertIsInstance(v, secs.Secs2LazyBody)
+        self.assertEqual('L', v.type)
+        self.assertEqual(3, len(v))
+        self.assertEqual((0.5, ), v[1][1].value)
+        self.assertEqual(b'\x07', v.get_value(2))
+        self.assertEqual('X', v[-2][0].value)
+        self.assertIs(bs, v.to_bytes())
+        self.assertEqual(body.to_sml(), v.to_sml())
+        self.assertIsNone(secs.Secs2BodyBuilder.from_body_bytes(b'', lazy=True))
+
+        # errors are raised on access
+        bad = secs.Secs2BodyBuilder.from_body_bytes(b'\x01\x02\xB1\x04\x00\x00\x00\x01\xFD\x01\x00', lazy=True)
+        self.assertEqual((1, ), bad.get_value(0))
+        with self.assertRaises(secs.Secs2BodyBytesParseError):
+            bad.get_value(1)
+
+        with self.assertRaises(secs.Secs2BodyParseError):
+            v[3]
+
+        # trailing bytes are rejected, same as eager decoding
+        for bs in (b'\x65\x01\xD1\xE2', b'\x01\x00\x70'):
+            with self.assertRaises(secs.Secs2BodyBytesParseError):
+                secs.Secs2BodyBuilder.from_body_bytes(bs)
+            with self.assertRaises(secs.Secs2BodyBytesParseError):
+                secs.Secs2BodyBuilder.from_body_bytes(bs, lazy=True)
+
+        bs_trailing = body.to_bytes() + b'\x00'
+        trailing = secs.Secs2BodyBuilder.from_body_bytes(bs_trailing, lazy=True)
+        self.assertEqual(3, len(trailing))
+        with self.assertRaises(secs.Secs2BodyBytesParseError):
+            trailing.to_bytes()
+        with self.assertRaises(secs.Secs2BodyBytesParseError):
+            secs.Secs2BodyBuilder.from_body_bytes(bs_trailing, lazy=True).to_sml()
+
+    def test_secs2body_compact(self):
+
+        body = secs.Secs2BodyBuilder.build('L', [
+            ('I2', [-1, 2, -3]),
+            ('U8', [2**64 - 1]),
+            ('F4', [0.5, 1.5])
+        ])
+        bs = body.to_bytes()
+
+        v = secs.Secs2BodyBuilder.from_body_bytes(bs, compact=True)
+        self.assertIsInstance(v[0].value, array.array)
+        self.assertEqual([-1, 2, -3], list(v[0].value))
+        self.assertEqual([2**64 - 1], list(v[1].value))
+        self.assertEqual(bs, v.to_bytes())
+        self.assertEqual(body.to_sml(), v.to_sml())
+
+        a = secs.Secs2BodyBuilder.build('U2', array.array('H', [1, 65535]))
+        self.assertEqual(b'\xA9\x04\x00\x01\xFF\xFF', a.to_bytes())
+
+        # converted to item typecode, and range checked
+        self.assertEqual(b'\xA5\x01\x05', secs.Secs2BodyBuilder.build('U1', array.array('l', [5])).to_bytes())
+        with self.assertRaises(ValueError):
+            secs.Secs2BodyBuilder.build('U1', array.array('l', [256]))
+
+    @unittest.skipUnless(HAS_NUMPY, "requires numpy")
+    def test_secs2body_numpy(self):
+
+        import numpy as np
+
+        v = secs.Secs2BodyBuilder.build('I4', np.array([[-1, 2], [3, 4]], dtype=np.int64))
+        self.assertEqual((-1, 2, 3, 4), tuple(v.value))
+        self.assertEqual(b'\x71\x10' + b''.join(x.to_bytes(4, 'big', signed=True) for x in (-1, 2, 3, 4)), v.to_bytes())
+
+        with self.assertRaises(ValueError):
+            secs.Secs2BodyBuilder.build('U1', np.array([256]))
+        for x in (np.nan, np.inf, 1e30, -1.0):
+            with self.assertRaises(ValueError):
+                secs.Secs2BodyBuilder.build('U4', np.array([1.0, x]))
+        self.assertEqual((1, 2), tuple(secs.Secs2BodyBuilder.build('I2', np.array([1.0, 2.0])).value))
+
+        r = secs.Secs2BodyBuilder.from_body_bytes(v.to_bytes())
+        self.assertTrue(np.array_equal(np.array([-1, 2, 3, 4]), r.to_numpy()))
+        self.assertTrue(np.array_equal(
+            np.array([True, False]),
+            secs.Secs2BodyBuilder.build('BOOLEAN', [True, False]).to_numpy()))
+        self.assertEqual(np.float32, secs.Secs2BodyBuilder.build('F4', [0.5]).to_numpy().dtype)
+
+        with self.assertRaises(TypeError):
+            secs.Secs2BodyBuilder.build('A', 'X').to_numpy()
+
+    def test_secs2body_int_range(self):
+
+        B = secs.Secs2BodyBuilder
+        self.assertEqual((-128, 127), B.build('I1', [-128, 127]).value)
+        self.assertEqual((0, 2**64 - 1), B.build('U8', [0, 2**64 - 1]).value)
+        self.assertEqual((255, 16), B.build('U1', ['0xFF', '16']).value)
+        self.assertEqual(b'\x00\xFF', B.build('B', [0, 255]).value)
+
+        for t, v in (('I1', [0, 128]), ('I2', [-32769]), ('U4', [2**32]), ('U1', [-1]), ('B', [256]), ('U8', [-1])):
+            with self.assertRaises(ValueError):
+                B.build(t, v)
+
+        # trusted skips conversion and range check
+        self.assertEqual((1, 2), B.build('U2', (1, 2), trusted=True).value)
+
+    def test_secs2body_write_into(self):
+
+        body = secs.Secs2BodyBuilder.build('L', [
+            ('A', 'X' * 300),
+            ('U2', list(range(200))),
+            ('L', [('BOOLEAN', True), ('F4', [0.5])])
+        ])
+        bs = secs.Secs2BodyBuilder.from_body_bytes(body.to_bytes()).to_bytes()
+        self.assertEqual(len(bs), body.byte_size())
+
+        buf = bytearray(3 + body.byte_size())
+        self.assertEqual(len(buf), body.write_into(buf, 3))
+        self.assertEqual(bs, bytes(buf[3:]))
+
+        msg = secs.HsmsSsDataMessage(6, 11, True, body, b'\x00\x00\x00\x01', 10)
+        frame = b''.join(msg.to_buffers())
+        self.assertEqual(len(frame) - 4, int.from_bytes(frame[0:4], 'big'))
+        self.assertEqual(frame, msg.to_bytes())
+
+        buf = bytearray(len(frame))
+        self.assertEqual(len(frame), msg.write_into(buf))
+        self.assertEqual(frame, bytes(buf))
+
+    def test_secs2template(self):
+
+        tmpl = secs.Secs2Template.compile('S6F11 W <L <U4 $dataid> <U4 1001> <L <A $text> > >.')
+        self.assertEqual((6, 11, True), (tmpl.strm, tmpl.func, tmpl.wbit))
+        self.assertEqual(frozenset(['dataid', 'text']), tmpl.names)
+
+        v = tmpl.render(dataid=[1], text='ON FIRE')
+        self.assertEqual(
+            secs.Secs2BodyBuilder.build('L', [
+                ('U4', [1]), ('U4', [1001]), ('L', [('A', 'ON FIRE')])
+            ]).to_bytes(),
+            v.to_bytes())
+        self.assertEqual('ON FIRE', v[2][0].value)
+
+        # same name under two item types
+        v = secs.Secs2Template.compile('<L <U4 $x> <U1 $x>>').render(x=[200])
+        self.assertEqual(('U4', 'U1'), (v[0].type, v[1].type))
+        v = secs.Secs2Template.compile('<L <U1 $x> <U4 $x>>').render(x=[1])
+        self.assertEqual(('U1', 'U4'), (v[0].type, v[1].type))
+        with self.assertRaises(ValueError):
+            secs.Secs2Template.compile('<L <U4 $x> <U1 $x>>').render(x=[300])
+
+        # placeholder syntax inside ascii string is a constant
+        tmpl = secs.Secs2Template.compile('<L <A "<U4 $y>"> <U2 $z>>')
+        self.assertEqual(frozenset(['z']), tmpl.names)
+        self.assertEqual('<U4 $y>', tmpl.render(z=[2])[0].value)
+
+        # newlines inside ascii string are kept, outside are whitespace
+        sml = '<L\n  <A "LINE1\nLINE2">\n  <U2 $z>\n>'
+        v = secs.Secs2Template.compile(sml).render(z=[2])
+        self.assertEqual('LINE1\nLINE2', v[0].value)
+        self.assertEqual(
+            secs.SmlParser._parse_body(sml.replace('$z', '2')).to_bytes(),
+            v.to_bytes())
+        tmpl = secs.Secs2Template.compile('S1F3 W\n<L\n <A "A\nB">\n <U4 $x>\n>.')
+        self.assertEqual((1, 3, True), (tmpl.strm, tmpl.func, tmpl.wbit))
+        self.assertEqual('A\nB', tmpl.render(x=[1])[0].value)
+
+        # prebuilt body must match item type
+        tmpl = secs.Secs2Template.compile(('L', [('U4', secs.Secs2Template.placeholder('a'))]))
+        self.assertEqual((5, ), tmpl.render(a=secs.Secs2BodyBuilder.build('U4', [5]))[0].value)
+        with self.assertRaises(TypeError):
+            tmpl.render(a=secs.Secs2BodyBuilder.build('U2', [5]))
+
+        with self.assertRaises(secs.Secs2TemplateError):
+            tmpl.render()
+        with self.assertRaises(secs.Secs2TemplateError):
+            tmpl.render(a=[1], b=[2])
+
+    def test_sml_parser(self):
+
+        strm, func, wbit, body = secs.SmlParser.parse(
+            'S6F11 W\n<L [3]\n  <U4 1>\n  <A "ON <FIRE> 0x20" 0x41>\n  <BOOLEAN TRUE F>\n>.')
+        self.assertEqual((6, 11, True), (strm, func, wbit))
+        self.assertEqual('ON <FIRE> 0x20A', body[1].value)
+        self.assertEqual((True, False), body[2].value)
+
+        self.assertEqual((1, 1, True, None), secs.SmlParser.parse('S1F1 W.'))
+
+        # short SML is cached and shared, long SML is not
+        short = 'S5F2 <B 0x0>.'
+        self.assertIs(secs.SmlParser.parse(short)[3], secs.SmlParser.parse(short)[3])
+        long = 'S6F1 <L ' + ' '.join(['<U4 ' + str(i) + '>' for i in range(300)]) + '>.'
+        a = secs.SmlParser.parse(long)[3]
+        b = secs.SmlParser.parse(long)[3]
+        self.assertIsNot(a, b)
+        self.assertEqual(a.to_bytes(), b.to_bytes())
+
+        for x in ('S1F1 W', 'S1F1 <L <U4 1>.', 'S1F1 <U9 1>.', 'S1F1 <U1 X>.', 'S1F1 <A 1>.'):
+            with self.assertRaises(secs.SmlParseError):
+                secs.SmlParser.parse(x)
+
+    def test_write_sml(self):
+
+        body = secs.Secs2BodyBuilder.build('L', [
+            ('U4', list(range(5))),
+            ('L', [('L', [('A', 'X')])]),
+            ('B', [1, 2, 3])
+        ])
+
+        def _sml(v, max_depth=None, max_items=None):
+            stream = io.StringIO()
+            v.write_sml(stream, max_depth, max_items)
+            return stream.getvalue().replace(os.linesep, '\n')
+
+        self.assertEqual(body.to_sml().replace(os.linesep, '\n'), _sml(body))
+        self.assertEqual(
+            '<L [3]\n  <U4 [5] 0 1 2 3 4 >\n  <L [1] ... >\n  <B [3] 0x01 0x02 0x03 >\n>',
+            _sml(body, max_depth=1))
+        self.assertEqual(
+            '<L [3]\n  <U4 [5] 0 1 ... >\n  <L [1]\n    <L [1]\n      <A [1] "X" >\n    >\n  >\n  ...\n>',
+            _sml(body, max_items=2))
+
+        msg = secs.HsmsSsDataMessage(6, 11, True, body, b'\x00\x00\x00\x01', 10)
+        self.assertEqual('S6F11 W\n<L [3]\n  <U4 [5] 0 ... >\n  ...\n>.', _sml(msg, max_items=1))
+
+    def test_hsmsss_frame_buffer(self):
+
+        msgs = [
+            secs.HsmsSsDataMessage(1, 1, True, None, b'\x00\x00\x00\x01', 10),
+            secs.HsmsSsDataMessage(6, 11, False, secs.Secs2BodyBuilder.build('B', bytes(100000)), b'\x00\x00\x00\x02', 10),
+            secs.HsmsSsControlMessage.build_linktest_request(b'\x00\x00\x00\x03')
+        ]
+        stream = b''.join([m.to_bytes() for m in msgs])
+
+        fb = secs.HsmsSsFrameBuffer(1024)
+        frames = list()
+        pos = 0
+        while pos < len(stream):
+            buf = fb.get_buffer()
+            n = min(len(buf), 700, len(stream) - pos)
+            buf[0:n] = stream[pos:(pos + n)]
+            fb.buffer_updated(n)
+            pos += n
+            while True:
+                f = fb.next_frame()
+                if f is None:
+                    break
+                frames.append(f)
+
+        self.assertFalse(fb.has_partial())
+        self.assertEqual([m.to_bytes() for m in msgs], [bytes(f) for f in frames])
+
+        r = [secs.HsmsSsMessage.from_bytes(f) for f in frames]
+        self.assertEqual(secs.HsmsSsControlType.LINKTEST_REQ, r[2].get_control_type())
+        self.assertEqual(100000, len(r[1].secs2body.value))
+
+        # mutable large frame is not cached as to_bytes()
+        self.assertIs(bytearray, type(frames[1]))
+        self.assertIs(bytes, type(r[1].to_bytes()))
+        frames[1][-1] = 0xFF
+        self.assertEqual(msgs[1].to_bytes(), r[1].to_bytes())
+
+        with self.assertRaises(secs.HsmsSsCommunicatorError):
+            fb = secs.HsmsSsFrameBuffer()
+            fb.get_buffer()[0:4] = b'\x00\x00\x00\x09'
+            fb.buffer_updated(4)
+            fb.next_frame()
+
+    def test_queuing_full_policy(self):
+
+        q = secs.WaitingQueuing(2, secs.QueuingFullPolicy.DROP_OLDEST)
+        q.puts([1, 2, 3])
+        q.put(4)
+        self.assertEqual(2, q.qsize())
+        self.assertEqual([3, 4], [q.poll(0.1), q.poll(0.1)])
+
+        q = secs.WaitingQueuing(1, secs.QueuingFullPolicy.RAISE)
+        q.put(1)
+        with self.assertRaises(secs.QueuingFullError):
+            q.put(2)
+        self.assertEqual(1, q.qsize())
+
+        with self.assertRaises(ValueError):
+            secs.WaitingQueuing(1, 'unknown')
+
+        q = secs.WaitingQueuing(1, secs.QueuingFullPolicy.BLOCK)
+        q.put(1)
+        th = threading.Thread(target=lambda: q.put(2), daemon=True)
+        th.start()
+        th.join(0.2)
+        self.assertTrue(th.is_alive())
+        self.assertEqual(1, q.poll(0.1))
+        th.join(1.0)
+        self.assertFalse(th.is_alive())
+        self.assertEqual(2, q.poll(0.1))
+
+        # blocking put returns on shutdown
+        q.put(3)
+        th = threading.Thread(target=lambda: q.put(4), daemon=True)
+        th.start()
+        q.shutdown()
+        th.join(1.0)
+        self.assertFalse(th.is_alive())
+
+        # blocked put returns when max size is raised
+        q = secs.WaitingQueuing(1, secs.QueuingFullPolicy.BLOCK)
+        q.put(1)
+        th = threading.Thread(target=lambda: q.put(2), daemon=True)
+        th.start()
+        th.join(0.1)
+        q.maxsize = 2
+        th.join(1.0)
+        self.assertFalse(th.is_alive())
+        self.assertEqual(2, q.qsize())
+
+        # full listener queue drops message and reports error, connection is kept
+        passive = secs.HsmsSsPassiveCommunicator(
+            ip_address='127.0.0.1', port=5021, session_id=10, is_equip=True,
+            name='equip-full-queue')
+        active = secs.HsmsSsActiveCommunicator(
+            ip_address='127.0.0.1', port=5021, session_id=10, is_equip=False,
+            timeout_t5=0.5, name='host-full-queue')
+
+        # applied to queues already built
+        passive.queue_full_policy = secs.QueuingFullPolicy.RAISE
+        passive.queue_maxsize = 1
+
+        gate = threading.Event()
+        got = []
+        errs = []
+
+        def _recv_pasv(primary):
+            gate.wait(5.0)
+            got.append(primary)
+
+        passive.add_recv_primary_msg_listener(_recv_pasv)
+        passive.add_error_listener(lambda e: errs.append(e))
+
+        with passive:
+            passive.open()
+
+            with active:
+                active.open_and_wait_until_communicating(5.0)
+
+                for _ in range(10):
+                    active.send(1, 1, False)
+
+                self.assertTrue(_wait_until(
+                    lambda: any(isinstance(e, secs.QueuingFullError) for e in errs)))
+                gate.set()
+
+                self.assertTrue(_wait_until(lambda: len(got) >= 2))
+                self.assertLess(len(got), 10)
+                self.assertTrue(passive.is_communicating)
+
+                n = len(got)
+                active.send(1, 1, False)
+                self.assertTrue(_wait_until(lambda: len(got) == n + 1))
+
+    def test_executor_queuing(self):
+
+        executor = concurrent.futures.ThreadPoolExecutor(4)
+        results = {'a': [], 'b': []}
+        running = {'a': 0, 'b': 0}
+        overlapped = list()
+        finished = {'a': threading.Event(), 'b': threading.Event()}
+
+        def _cb(key):
+            def _f(v):
+                running[key] += 1
+                if running[key] > 1:
+                    overlapped.append(key)
+                if v is None:
+                    finished[key].set()
+                else:
+                    results[key].append(v)
+                running[key] -= 1
+            return _f
+
+        qa = secs.ExecutorQueuing(_cb('a'), executor)
+        qb = secs.ExecutorQueuing(_cb('b'), executor)
+        try:
+            for i in range(500):
+                qa.put(i)
+                qb.puts([i, i + 1000])
+
+            qa.shutdown()
+            qb.shutdown()
+            self.assertTrue(finished['a'].wait(5.0))
+            self.assertTrue(finished['b'].wait(5.0))
+
+            self.assertEqual(list(range(500)), results['a'])
+            self.assertEqual([x for i in range(500) for x in (i, i + 1000)], results['b'])
+            self.assertEqual([], overlapped)
+        finally:
+            executor.shutdown()
+
+    def test_listener_arity(self):
+
+        comm = secs.HsmsSsPassiveCommunicator(
+            ip_address='127.0.0.1', port=5014, session_id=10, is_equip=True)
+        recv = list()
+
+        def _one(e):
+            recv.append(('one', e))
+
+        def _two(e, c):
+            recv.append(('two', e, c))
+
+        comm.add_error_listener(_one)
+        comm.add_error_listener(_two)
+        comm.add_communicate_listener(lambda v: recv.append(('comm', v)))
+
+        e1 = secs.SecsCommunicatorError('e1')
+        comm._put_error(e1)
+        self.assertTrue(_wait_until(lambda: len(recv) == 3))
+        self.assertIn(('one', e1), recv)
+        self.assertIn(('two', e1, comm), recv)
+        self.assertIn(('comm', False), recv)
+
+        comm.remove_error_listener(_one)
+        with self.assertRaises(ValueError):
+            comm.remove_error_listener(_one)
+
+        e2 = secs.SecsCommunicatorError('e2')
+        comm._put_error(e2)
+        self.assertTrue(_wait_until(lambda: len(recv) == 4))
+        self.assertEqual(('two', e2, comm), recv[-1])
+
+    def test_secs_timer(self):
+
+        timer = secs.SecsTimer()
+        fired = list()
+        done = threading.Event()
+
+        timer.schedule(0.15, lambda: (fired.append(3), done.set()))
+        timer.schedule(0.05, lambda: fired.append(1))
+        timer.schedule(0.10, lambda: fired.append(2))
+        x = timer.schedule(0.07, lambda: fired.append('cancelled'))
+        timer.cancel(x)
+        timer.cancel(x)
+
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual([1, 2, 3], fired)
+
+        # cancelled entries do not accumulate
+        entries = [timer.schedule(60.0, lambda: None) for _ in range(1000)]
+        for e in entries:
+            timer.cancel(e)
+        self.assertLess(len(timer), 100)
+
+    def test_hsmsss_reply_future_pool(self):
+
+        timer = secs.SecsTimer()
+        pool = secs.HsmsSsReplyFuturePool(timer)
+        errors = list()
+
+        def _timeout_error():
+            errors.append(1)
+            return secs.HsmsSsTimeoutT3Error('Timeout-T3', None)
+
+        def _msg(n, f=1):
+            return secs.HsmsSsDataMessage(1, f, f == 1, None, n.to_bytes(4, 'big'), 10)
+
+        # reply before timeout, timeout error is never built
+        f = pool.entry(_msg(1), 0.1, _timeout_error)
+        self.assertTrue(pool.put_reply_msg(_msg(1, 2)))
+        self.assertEqual(2, f.result(1.0).func)
+        time.sleep(0.2)
+        self.assertEqual([], errors)
+
+        # timeout, and late reply is not accepted
+        f = pool.entry(_msg(2), 0.05, _timeout_error)
+        with self.assertRaises(secs.HsmsSsTimeoutT3Error):
+            f.result(1.0)
+        self.assertEqual([1], errors)
+        self.assertFalse(pool.put_reply_msg(_msg(2, 2)))
+
+        # reject
+        f = pool.entry(_msg(3), 1.0, _timeout_error)
+        pool.put_reply_msg(secs.HsmsSsControlMessage.build_reject_request(
+            _msg(3), secs.HsmsSsRejectReason.NOT_SELECTED))
+        with self.assertRaises(secs.HsmsSsRejectMessageError):
+            f.result(1.0)
+
+        # duplicate System-Bytes is rejected, pending entry still completes
+        f = pool.entry(_msg(6), 0.1, _timeout_error)
+        dup = pool.entry(_msg(6), 0.1, _timeout_error)
+        with self.assertRaises(secs.HsmsSsSendMessageError):
+            dup.result(0)
+        with self.assertRaises(secs.HsmsSsTimeoutT3Error):
+            f.result(1.0)
+        self.assertEqual([1, 1], errors)
+
+        f = pool.entry(_msg(4), 1.0, _timeout_error)
+        pool.shutdown()
+        with self.assertRaises(secs.HsmsSsCommunicatorError):
+            f.result(1.0)
+        self.assertTrue(pool.entry(_msg(5), 1.0, _timeout_error).exception(0))
+        self.assertEqual([1, 1], errors)
+
+    def test_hsmsss_send_async(self):
+
+        passive = secs.HsmsSsPassiveCommunicator(
+            ip_address='127.0.0.1', port=5016, session_id=10, is_equip=True,
+            timeout_t3=5.0, name='equip-passive-comm')
+        active = secs.HsmsSsActiveCommunicator(
+            ip_address='127.0.0.1', port=5016, session_id=10, is_equip=False,
+            timeout_t3=5.0, timeout_t5=0.5, name='host-active-comm')
+
+        def _recv_pasv(primary, comm):
+            if primary.strm == 1 and primary.func == 1:
+                comm.reply_async(primary, 1, 2, False, ('A', 'ASYNC')).result()
+            elif primary.strm == 2 and primary.func == 25:
+                comm.reply(primary, 2, 26, False, primary.secs2body)
+
+        passive.add_recv_primary_msg_listener(_recv_pasv)
+
+        with passive:
+            passive.open()
+
+            with active:
+                active.open_and_wait_until_communicating(5.0)
+
+                ff = [active.send_async(1, 1, True) for _ in range(20)]
+                self.assertEqual(['ASYNC'] * 20, [f.result(5.0).secs2body.value for f in ff])
+
+                self.assertIsNone(active.send_async(1, 1, False).result(5.0))
+                self.assertEqual(
+                    (1, 2, 3),
+                    active.send_sml_async('S2F25 W <U1 1 2 3>.').result(5.0).secs2body.value)
+
+                async def _main():
+                    r1 = await active.asend(1, 1, True)
+                    r2 = await active.asend_sml('S2F25 W <B 0x7>.')
+                    return r1, r2
+
+                r1, r2 = asyncio.run(_main())
+                self.assertEqual('ASYNC', r1.secs2body.value)
+                self.assertEqual(b'\x07', r2.secs2body.value)
+
+            f = active.send_async(1, 1, True)
+            with self.assertRaises(secs.SecsCommunicatorError):
+                f.result(5.0)
+
+    def test_hsmsss_asyncio(self):
+
+        # blocking put on shared loop thread is not accepted
+        with self.assertRaises(ValueError):
+            secs.HsmsSsAsyncioPassiveCommunicator(
+                ip_address='127.0.0.1', port=5017, session_id=10, is_equip=True,
+                queue_maxsize=10)
+
+        passive = secs.HsmsSsAsyncioPassiveCommunicator(
+            ip_address='127.0.0.1', port=5017, session_id=10, is_equip=True,
+            timeout_t3=5.0, name='equip-asyncio-passive')
+        active = secs.HsmsSsAsyncioActiveCommunicator(
+            ip_address='127.0.0.1', port=5017, session_id=10, is_equip=False,
+            timeout_t3=5.0, timeout_t5=0.5, name='host-asyncio-active')
+
+        pasv_states = []
+        passive.add_hsmsss_communicate_listener(lambda state: pasv_states.append(state))
+
+        def _recv_pasv(primary, comm):
+            if primary.strm == 1 and primary.func == 1:
+                comm.reply(primary, 1, 2, False, ('L', [('A', 'MDLN'), ('A', 'REV')]))
+
+        passive.add_recv_primary_msg_listener(_recv_pasv)
+
+        with passive:
+            passive.open()
+
+            with active:
+                t = time.monotonic()
+                active.open_and_wait_until_communicating(5.0)
+                self.assertLess(time.monotonic() - t, 2.0)
+
+                reply = active.send(1, 1, True)
+                self.assertEqual(['MDLN', 'REV'], [v.value for v in reply.secs2body.value])
+
+                self.assertEqual(
+                    [secs.HsmsSsCommunicateState.NOT_CONNECT,
+                     secs.HsmsSsCommunicateState.CONNECTED,
+                     secs.HsmsSsCommunicateState.SELECTED],
+                    pasv_states)
+
+            self.assertTrue(_wait_until(
+                lambda: pasv_states[-1] == secs.HsmsSsCommunicateState.NOT_CONNECT))
+
+    def test_secs_reactor(self):
+
+        reactor = secs.SecsReactor()
+
+        with self.assertRaises(ValueError):
+            secs.HsmsSsActiveCommunicator(
+                ip_address='127.0.0.1', port=5018, session_id=10, is_equip=False,
+                reactor=reactor, queue_maxsize=10)
+
+        calls = []
+        errs = []
+
+        def _readable():
+            calls.append(1)
+            raise RuntimeError('readable')
+
+        a, b = socket.socketpair()
+        with a, b:
+            reactor.register(a, _readable, errs.append)
+            b.send(b'\x00')
+            self.assertTrue(_wait_until(lambda: len(errs) == 1))
+            self.assertIsInstance(errs[0], RuntimeError)
+            b.send(b'\x00')
+            time.sleep(0.1)
+            self.assertEqual(1, len(calls))
+
+        passive = secs.HsmsSsPassiveCommunicator(
+            ip_address='127.0.0.1', port=5018, session_id=10, is_equip=True,
+            timeout_t3=5.0, reactor=reactor, queue_maxsize=10,
+            queue_full_policy=secs.QueuingFullPolicy.DROP_OLDEST,
+            name='equip-reactor-passive')
+        active = secs.HsmsSsActiveCommunicator(
+            ip_address='127.0.0.1', port=5018, session_id=10, is_equip=False,
+            timeout_t3=5.0, timeout_t5=0.5, reactor=reactor, queue_maxsize=10,
+            queue_full_policy=secs.QueuingFullPolicy.RAISE,
+            name='host-reactor-active')
+
+        def _recv_pasv(primary, comm):
+            if primary.strm == 1 and primary.func == 1:
+                comm.reply(primary, 1, 2, False, ('A', 'REACTOR'))
+
+        passive.add_recv_primary_msg_listener(_recv_pasv)
+
+        with passive:
+            passive.open()
+
+            with active:
+                active.open_and_wait_until_communicating(5.0)
+                self.assertEqual(
+                    ['REACTOR'] * 5,
+                    [active.send(1, 1, True).secs2body.value for _ in range(5)])
+
+    def test_hsmsss_passive_server(self):
+
+        server = secs.HsmsSsPassiveServer('127.0.0.1', 5019, timeout_t7=1.0)
+
+        other = server.create_session(
+            session_id=1, is_equip=True, peer_address='10.255.255.1', name='other')
+        local = server.create_session(
+            session_id=3, is_equip=True, peer_address='127.0.0.1', name='local')
+        anyone = server.create_session(
+            session_id=2, is_equip=True, name='anyone')
+
+        def _recv(primary, comm):
+            comm.reply(primary, 1, 2, False, ('A', comm.name))
+
+        for comm in (other, local, anyone):
+            comm.add_recv_primary_msg_listener(_recv)
+
+        def _active(session_id):
+            return secs.HsmsSsActiveCommunicator(
+                ip_address='127.0.0.1', port=5019, session_id=session_id, is_equip=False,
+                timeout_t3=5.0, timeout_t5=0.5)
+
+        def _connect():
+            # server binds on own thread, retry until listening
+            socks = []
+
+            def _f():
+                try:
+                    socks.append(socket.create_connection(('127.0.0.1', 5019)))
+                    return True
+                except ConnectionRefusedError:
+                    return False
+
+            self.assertTrue(_wait_until(_f))
+            return socks[0]
+
+        def _select(session_id):
+            # raw Select.req, returns Select.rsp status, and b'' after
+            with _connect() as sock:
+                sock.settimeout(5.0)
+                sock.sendall(bytes([
+                    0, 0, 0, 10,
+                    (session_id >> 8) & 0xFF, session_id & 0xFF,
+                    0, 0, 0, 1, 0, 0, 0, 1]))
+                bs = b''
+                while len(bs) < 14:
+                    r = sock.recv(14 - len(bs))
+                    self.assertNotEqual(b'', r)
+                    bs += r
+                self.assertEqual(b'', sock.recv(14))
+                self.assertEqual(bytes([0, 0, 0, 10, 0xFF, 0xFF, 0, 0, 2, 0, 0, 0, 1]), bs[:7] + bs[8:])
+                return bs[7]
+
+        with server, other, local, anyone:
+            server.open()
+            other.open()
+            local.open()
+            anyone.open()
+
+            # Select.req SESSION-ID 1 does not bypass peer_address of 'other',
+            # and is not routed to 'anyone'
+            self.assertEqual(secs.HsmsSsSelectStatus.NOT_READY, _select(1))
+            self.assertEqual(secs.HsmsSsSelectStatus.NOT_READY, _select(99))
+
+            # partial header is closed by Timeout-T7
+            with _connect() as sock:
+                sock.settimeout(5.0)
+                sock.sendall(bytes([0, 0, 0, 10, 0, 1]))
+                t = time.monotonic()
+                self.assertEqual(b'', sock.recv(14))
+                self.assertGreater(time.monotonic() - t, 0.5)
+
+            with _active(3) as a3, _active(1) as a1:
+                a3.open_and_wait_until_communicating(5.0)
+                self.assertEqual('local', a3.send(1, 1, True).secs2body.value)
+
+                a1.open_and_wait_until_communicating(5.0)
+                self.assertEqual('anyone', a1.send(1, 1, True).secs2body.value)
+
+                self.assertEqual(secs.HsmsSsSelectStatus.ALREADY_USED, _select(2))
+
+                self.assertFalse(other.is_communicating)
+
+    def test_hsmsss_send_coalescing(self):
+
+        passive = secs.HsmsSsPassiveCommunicator(
+            ip_address='127.0.0.1', port=5020, session_id=10, is_equip=True,
+            timeout_t3=5.0, send_coalescing=True, name='equip-coalescing')
+        active = secs.HsmsSsActiveCommunicator(
+            ip_address='127.0.0.1', port=5020, session_id=10, is_equip=False,
+            timeout_t3=5.0, timeout_t5=0.5, send_coalescing=True, name='host-coalescing')
+
+        def _recv_pasv(primary, comm):
+            comm.reply_async(primary, 2, 26, False, primary.secs2body)
+
+        passive.add_recv_primary_msg_listener(_recv_pasv)
+
+        sended = []
+        active.add_sended_msg_listener(
+            lambda msg: sended.append(msg) if (msg.strm, msg.func) == (2, 25) else None)
+
+        with passive:
+            passive.open()
+
+            with active:
+                active.open_and_wait_until_communicating(5.0)
+
+                def _f(n):
+                    ff = [active.send_async(2, 25, True, ('U4', [n, i])) for i in range(50)]
+                    return [f.result(5.0).secs2body.value for f in ff]
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as ex:
+                    rr = list(ex.map(_f, range(8)))
+
+                for n, r in enumerate(rr):
+                    self.assertEqual([(n, i) for i in range(50)], r)
+
+                self.assertTrue(_wait_until(lambda: len(sended) == 400))
+                self.assertEqual(400, len(set(msg.system_bytes for msg in sended)))
+
+    def test_secs1_send_reply_pack_pool(self):
+
+        timer = secs.SecsTimer()
+        pool = secs.Secs1SendReplyPackPool()
+        sended = []
+
+        def _pack(wbit, system_bytes, timeout_t3=5.0):
+            msg = secs.Secs1Message(1, 1, wbit, None, system_bytes, 10, False)
+            return secs.SendSecs1MessagePack(msg, timeout_t3, sended.append, timer)
+
+        def _reply(system_bytes):
+            return secs.Secs1Message(
+                1, 2, False, secs.Secs2BodyBuilder.build('A', 'R'), system_bytes, 10, True)
+
+        p1 = _pack(True, b'\x00\x00\x00\x01')
+        pool.append(p1)
+        p1.notify_sended()
+        self.assertEqual([p1.secs1msg()], sended)
+        self.assertFalse(p1.future().done())
+
+        self.assertFalse(pool.receive(_reply(b'\x00\x00\x00\x09')))
+        r = _reply(b'\x00\x00\x00\x01')
+        self.assertTrue(pool.receive(r))
+        self.assertIs(r, p1.future().result(1.0))
+        # completed pack is removed
+        self.assertFalse(pool.receive(r))
+
+        p2 = _pack(False, b'\x00\x00\x00\x02')
+        pool.append(p2)
+        p2.notify_sended()
+        self.assertIsNone(p2.future().result(1.0))
+
+        # only sended packs with W-Bit take reply
+        p6 = _pack(True, b'\x00\x00\x00\x06')
+        p7 = _pack(False, b'\x00\x00\x00\x06')
+        pool.append(p6)
+        pool.append(p7)
+        self.assertFalse(pool.receive(_reply(b'\x00\x00\x00\x06')))
+        self.assertFalse(p6.future().done())
+        self.assertFalse(p7.future().done())
+        p6.notify_sended()
+        r = _reply(b'\x00\x00\x00\x06')
+        self.assertTrue(pool.receive(r))
+        self.assertIs(r, p6.future().result(1.0))
+        self.assertFalse(p7.future().done())
+        p7.notify_sended()
+        self.assertIsNone(p7.future().result(1.0))
+
+        # T3 restarted by each received block of reply
+        p3 = _pack(True, b'\x00\x00\x00\x03', 0.3)
+        pool.append(p3)
+        p3.notify_sended()
+        block = _reply(b'\x00\x00\x00\x03').get_block(0)
+        for _ in range(4):
+            time.sleep(0.1)
+            pool.timer_reset(block)
+        self.assertFalse(p3.future().done())
+        with self.assertRaises(secs.Secs1TimeoutT3Error):
+            p3.future().result(2.0)
+
+        p4 = _pack(True, b'\x00\x00\x00\x04')
+        pool.append(p4)
+        pool.shutdown()
+        with self.assertRaises(secs.Secs1CommunicatorError):
+            p4.future().result(1.0)
+
+        p5 = _pack(True, b'\x00\x00\x00\x05')
+        pool.append(p5)
+        with self.assertRaises(secs.Secs1CommunicatorError):
+            p5.future().result(0.0)
+
+        # reply on closed communicator is discarded, not raised into listener
+        comm = self.__build_equip_master()
+        comm.close()
+        primary = secs.Secs1Message(1, 1, True, None, b'\x00\x00\x00\x08', 10, False)
+        self.assertIsNone(comm.reply(primary, 1, 2, False))
+        with self.assertRaises(secs.Secs1CommunicatorError):
+            comm.send(1, 1, True)
+        with self.assertRaises(secs.Secs1CommunicatorError):
+            comm.reply_async(primary, 1, 2, False).result(1.0)
+
+    def test_secs1_framer(self):
+
+        F = secs.Secs1Framer
+
+        self.assertEqual(0x0102, F.checksum(b'\x01\x02\xFF'))
+        self.assertEqual((0xFF * 300) & 0xFFFF, F.checksum(bytearray([0xFF]) * 300))
+
+        self.assertEqual(1, F.count(0))
+        self.assertEqual(1, F.count(244))
+        self.assertEqual(2, F.count(245))
+        self.assertEqual(0x7FFF, F.count(244 * 0x7FFF))
+        with self.assertRaises(secs.Secs1MessageParseError):
+            F.count(244 * 0x7FFF + 1)
+
+        header = bytes([0x80, 0x0A, 0x81, 0x01, 0xFF, 0xFF, 0x00, 0x00, 0x00, 0x07])
+        body = bytes(range(256)) * 2 + bytes(88)
+
+        blocks = F.split(header, body)
+        self.assertEqual([257, 257, 125], [len(b) for b in blocks])
+        self.assertEqual([(0x00, 0x01), (0x00, 0x02), (0x80, 0x03)], [(b[5], b[6]) for b in blocks])
+        for i, b in enumerate(blocks):
+            self.assertTrue(F.check_block(b, b[0] + 3))
+            self.assertEqual(b, F.block(header, body, i))
+            self.assertEqual(b[1:5] + b[7:11], header[0:4] + header[6:10])
+
+        self.assertEqual(body, F.join([secs.Secs1MessageBlock(b) for b in blocks]))
+
+        broken = bytearray(blocks[1])
+        broken[100] ^= 0x01
+        self.assertFalse(F.check_block(broken, broken[0] + 3))
+
+        with self.assertRaises(IndexError):
+            F.block(header, body, 3)
+
+        empty = F.split(header, b'')
+        self.assertEqual(1, len(empty))
+        self.assertEqual(13, len(empty[0]))
+        self.assertEqual((0x80, 0x01), (empty[0][5], empty[0][6]))
+        self.assertTrue(F.check_block(empty[0], 13))
+
+    def test_secs1_message_get_block(self):
+
+        def _msg():
+            return secs.Secs1Message(
+                6, 11, True, secs.Secs2BodyBuilder.build('U4', list(range(150))),
+                b'\x00\x01\x02\x03', 10, False)
+
+        expected = [b.to_bytes() for b in _msg().to_blocks()]
+        self.assertEqual(3, len(expected))
+
+        msg = _msg()
+        self.assertEqual(3, msg.block_count())
+        self.assertEqual(expected, [msg.get_block(i).to_bytes() for i in range(msg.block_count())])
+        self.assertEqual([False, False, True], [msg.get_block(i).ebit for i in range(3)])
+        with self.assertRaises(IndexError):
+            msg.get_block(3)
+
+        r = secs.Secs1Message.from_blocks([msg.get_block(i) for i in range(3)])
+        self.assertEqual(tuple(range(150)), r.secs2body.value)
+
+        header_only = secs.Secs1Message(1, 1, True, None, b'\x00\x00\x00\x01', 10, False)
+        self.assertEqual(1, header_only.block_count())
+        self.assertEqual(header_only.to_blocks()[0].to_bytes(), header_only.get_block(0).to_bytes())
+
+        # pack holds present block only
+        pack = secs.SendSecs1MessagePack(_msg(), 5.0, lambda m: None, secs.SecsTimer.get_shared())
+        vv = []
+        while True:
+            vv.append(pack.present_block().to_bytes())
+            if pack.ebit_block():
+                break
+            pack.next_block()
+        self.assertEqual(expected, vv)
+        pack.reset_block()
+        self.assertEqual(expected[0], pack.present_block().to_bytes())
+
+    def test_slots(self):
+
+        body = secs.Secs2BodyBuilder.build('L', [
+            ('A', 'MDLN'), ('B', [1, 2]), ('BOOLEAN', True),
+            ('U4', [1, 2]), ('I2', -1), ('F8', 1.5), ('L', [])])
+        items = [body] + list(body.value)
+        lazy = secs.Secs2BodyBuilder.from_body_bytes(body.to_bytes(), lazy=True)
+
+        data = secs.HsmsSsDataMessage(1, 13, True, body, b'\x00\x00\x00\x01', 10)
+        ctrl = secs.HsmsSsControlMessage.build_select_request(b'\x00\x00\x00\x02')
+        secs1 = secs.Secs1Message(1, 13, True, body, b'\x00\x00\x00\x03', 10, False)
+
+        for x in items + [lazy, data, ctrl, secs1, secs1.get_block(0)]:
+            self.assertFalse(hasattr(x, '__dict__'), type(x).__name__)
+            with self.assertRaises(AttributeError):
+                x.foo = 1
+
+        # API unchanged
+        self.assertEqual(body.to_bytes(), lazy.to_bytes())
+        self.assertEqual(body.value[0].value, lazy.value[0].value)
+        self.assertEqual(10, data.session_id)
+        self.assertEqual(data.to_bytes(), secs.HsmsSsMessage.from_bytes(data.to_bytes()).to_bytes())
+
+        # select status and reject reason are on the wire
+        for status in (secs.HsmsSsSelectStatus.SUCCESS, secs.HsmsSsSelectStatus.ALREADY_USED):
+            rsp = secs.HsmsSsControlMessage.build_select_response(ctrl, status)
+            r = secs.HsmsSsMessage.from_bytes(rsp.to_bytes())
+            self.assertEqual(secs.HsmsSsControlType.SELECT_RSP, r.get_control_type())
+            self.assertEqual(status, r.get_select_status())
+            self.assertEqual(ctrl.system_bytes, r.system_bytes)
+
+        rej = secs.HsmsSsControlMessage.build_reject_request(
+            data, secs.HsmsSsRejectReason.NOT_SELECTED)
+        r = secs.HsmsSsMessage.from_bytes(rej.to_bytes())
+        self.assertEqual(secs.HsmsSsControlType.REJECT_REQ, r.get_control_type())
+        self.assertEqual(secs.HsmsSsRejectReason.NOT_SELECTED, r.get_reject_reason())
+        self.assertEqual(data.system_bytes, r.system_bytes)
+
+    def test_secs2body_interning(self):
+
+        B = secs.Secs2BodyBuilder
+
+        self.assertIs(B.build('U1', 5), B.build('U1', [5]))
+        self.assertIs(B.build('B', b'\x07'), B.build('B', [7]))
+        self.assertIs(B.build('I1', -1), B.build('I1', (-1, )))
+        self.assertIs(B.build('BOOLEAN', True), B.build('BOOLEAN', [True]))
+        self.assertIs(B.build('L', []), B.build('L', tuple()))
+        self.assertIs(B.build('A', ''), B.build('A', ''))
+        self.assertIsNot(B.build('U4', 5), B.build('U4', 5))
+        self.assertIsNot(B.build('U1', [1, 2]), B.build('U1', [1, 2]))
+
+        for t, v in (('U1', 5), ('B', 7), ('I1', -1), ('BOOLEAN', True), ('L', []), ('A', '')):
+            tt = B.get_item_type_from_sml(t)
+            plain = tt[5](tt, v if t in ('L', 'A') else (v, ))
+            self.assertEqual(plain.to_bytes(), B.build(t, v).to_bytes())
+            self.assertEqual(plain.to_sml(), B.build(t, v).to_sml())
+            self.assertIs(B.build(t, v), B.from_body_bytes(plain.to_bytes()))
+
+        with self.assertRaises(ValueError):
+            B.build('U1', 256)
+        with self.assertRaises(ValueError):
+            B.build('I1', -129)
+
+        bs = B.build('U1', 5).to_bytes()
+        compact = B.from_body_bytes(bs, compact=True)
+        self.assertIsNot(B.build('U1', 5), compact)
+        self.assertEqual(5, compact.value[0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1044,6 +1044,49 @@ class Secs1Message(SecsMessage):
 
         return self.__cache_blocks
 
+    def block_count(self):
+        if self.__cache_blocks is None:
+            if self.secs2body is None:
+                return 1
+            m = len(self.secs2body.to_bytes())
+            return max(1, (m + 243) // 244)
+        else:
+            return len(self.__cache_blocks)
+
+    def get_block(self, index):
+
+        if self.__cache_blocks is not None:
+            return self.__cache_blocks[index]
+
+        count = self.block_count()
+        if count > 0x7FFF:
+            raise Secs1MessageParseError("blocks overflow")
+
+        if index < 0 or index >= count:
+            raise IndexError("block index out of range")
+
+        h10bs = self._header10bytes()
+        if self.secs2body is None:
+            bb = bytes()
+        else:
+            pos = index * 244
+            bb = bytes(memoryview(self.secs2body.to_bytes())[pos:(pos + 244)])
+
+        num = index + 1
+        b4 = (num >> 8) & 0x7F
+        if num == count:
+            b4 |= 0x80
+        b5 = num & 0xFF
+        hh = bytes([
+            h10bs[0], h10bs[1], h10bs[2], h10bs[3],
+            b4, b5,
+            h10bs[6], h10bs[7], h10bs[8], h10bs[9]
+        ])
+        x = sum(hh) + sum(bb)
+
+        return Secs1MessageBlock(
+            bytes([len(bb) + 10]) + hh + bb + bytes([((x >> 8) & 0xFF), (x & 0xFF)]))
+
     @classmethod
     def from_blocks(cls, blocks):
 
@@ -2283,6 +2326,7 @@ class SendSecs1MessagePack:
     def __init__(self, msg):
         self.__msg = msg
         self.__present = 0
+        self.__block = None
         self.__lock = threading.Lock()
         self.__cdt = threading.Condition()
         self.__sended = False
@@ -2294,13 +2338,17 @@ class SendSecs1MessagePack:
         return self.__msg
 
     def present_block(self):
-        return (self.__msg.to_blocks())[self.__present]
+        if self.__block is None:
+            self.__block = self.__msg.get_block(self.__present)
+        return self.__block
 
     def next_block(self):
         self.__present += 1
+        self.__block = None
 
     def reset_block(self):
         self.__present = 0
+        self.__block = None
 
     def ebit_block(self):
         return self.present_block().ebit
@@ -5,6 +5,8 @@ To get HSMS-SS-PASSIVE-communicator, HsmsSsPassiveCommunicator()
 
 To get HSMS-SS-ACTIVE-communicator, HsmsSsActiveCommunicator()
 
+To get HSMS-SS-PASSIVE/ACTIVE-communicator on asyncio, HsmsSsAsyncioPassiveCommunicator(), HsmsSsAsyncioActiveCommunicator()
+
 To get SECS-I-on-PySerial-communicator, Secs1OnPySerialCommunicator()
 
 To get SECS-I-on-TCP/IP-communicator, Secs1OnTcpIpCommunicator()
@@ -14,11 +16,13 @@ To get SECS-I-on-TCP/IP-Receiver-communicator, Secs1OnTcpIpReceiverCommunicator(
 """
 
 from secs.secs2body import Secs2BodyParseError, Secs2BodyBytesParseError
-from secs.secs2body import AbstractSecs2Body, Secs2BodyBuilder
+from secs.secs2body import AbstractSecs2Body, Secs2LazyBody, Secs2BodyBuilder
 
 from secs.smlparser import SmlParseError, Secs2BodySmlParseError
 from secs.smlparser import SmlParser
 
+from secs.secs2template import Secs2TemplateError, Secs2Placeholder, Secs2Template
+
 from secs.secsmessage import *
 
 from secs.hsmsssmessage import *
@@ -29,10 +33,13 @@ from secs.secscommunicator import *
 
 from secs.hsmssscommunicator import *
 
-from secs.hsmssspassivecommunicator import HsmsSsPassiveCommunicator
+from secs.hsmssspassivecommunicator import HsmsSsPassiveCommunicator, HsmsSsPassiveServer
 
 from secs.hsmsssactivecommunicator import HsmsSsActiveCommunicator
 
+from secs.hsmsssasynciocommunicator import HsmsSsAsyncioLoop, HsmsSsAsyncioConnection
+from secs.hsmsssasynciocommunicator import HsmsSsAsyncioActiveCommunicator, HsmsSsAsyncioPassiveCommunicator
+
 from secs.secs1communicator import *
 
 from secs.secs1ontcpipcommunicator import Secs1OnTcpIpCommunicator, Secs1OnTcpIpReceiverCommunicator
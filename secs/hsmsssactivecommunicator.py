@@ -19,7 +19,7 @@ class HsmsSsActiveCommunicator(secs.AbstractHsmsSsCommunicator):
 
         self.__ths = list()
 
-        self.__recv_primary_msg_putter = secs.CallbackQueuing(self._put_recv_primary_msg)
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
 
     def _get_protocol(self):
         return self.__PROTOCOL
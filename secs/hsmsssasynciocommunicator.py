@@ -0,0 +1,684 @@
+import asyncio
+import threading
+import concurrent.futures
+import secs
+
+
+class HsmsSsAsyncioLoop:
+    """Event loop running on daemon thread, shared by asyncio communicators.
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    @classmethod
+    def get_shared(cls):
+        """Shared event loop getter.
+
+        Returns:
+            asyncio.AbstractEventLoop: loop, running on daemon thread.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name='hsmsss-asyncio-loop',
+                    daemon=True).start()
+                cls.__shared = loop
+            return cls.__shared
+
+
+class HsmsSsAsyncioConnection(asyncio.BufferedProtocol):
+    """HSMS-SS connection on event loop.
+
+    Same interface as HsmsSsConnection, frames are parsed in buffer_updated,
+    T8 is timer handle on loop. send and send_async are thread-safe.
+    """
+
+    def __init__(
+            self, loop, comm,
+            recv_primary_msg_put_callback,
+            recv_all_msg_put_callback,
+            sended_msg_put_callback,
+            error_put_callback):
+
+        self.__loop = loop
+        self.__comm = comm
+        self.__put_recv_primary_msg = recv_primary_msg_put_callback
+        self.__put_recv_all_msg = recv_all_msg_put_callback
+        self.__put_sended_msg = sended_msg_put_callback
+        self.__put_error = error_put_callback
+
+        self.__transport = None
+        self.__terminated = False
+        self.__closed = loop.create_future()
+        self.__t8_handle = None
+
+        self.__frame_buffer = secs.HsmsSsFrameBuffer()
+
+        self.__send_reply_pool = secs.HsmsSsReplyFuturePool(secs.SecsTimer.get_shared())
+
+    def connection_made(self, transport):
+        self.__transport = transport
+
+    def get_buffer(self, sizehint):
+        return self.__frame_buffer.get_buffer()
+
+    def buffer_updated(self, nbytes):
+        fb = self.__frame_buffer
+        fb.buffer_updated(nbytes)
+
+        self.__cancel_t8()
+
+        try:
+            while True:
+                bs = fb.next_frame()
+                if bs is None:
+                    break
+
+                msg = secs.HsmsSsMessage.from_bytes(
+                    bs,
+                    self.__comm.lazy_secs2body,
+                    self.__comm.compact_secs2body)
+
+                self.__put_recv_all_msg(msg)
+
+                if not self.__send_reply_pool.put_reply_msg(msg):
+                    self.__put_recv_primary_msg(msg, self)
+
+        except Exception as e:
+            if not self.__terminated:
+                self.__put_error(e)
+            self.__transport.abort()
+            return
+
+        if fb.has_partial():
+            self.__t8_handle = self.__loop.call_later(
+                self.__comm.timeout_t8,
+                self.__timeout_t8)
+
+    def eof_received(self):
+        if not self.__terminated:
+            self.__put_error(secs.HsmsSsCommunicatorError("Terminate detect"))
+        return False
+
+    def connection_lost(self, exc):
+        self.__cancel_t8()
+        if exc is not None and not self.__terminated:
+            self.__put_error(secs.HsmsSsCommunicatorError(exc))
+        self.__terminated = True
+        self.__send_reply_pool.shutdown()
+        if not self.__closed.done():
+            self.__closed.set_result(None)
+
+    def __timeout_t8(self):
+        self.__t8_handle = None
+        if not self.__terminated:
+            self.__put_error(secs.HsmsSsCommunicatorError("T8-Timeout"))
+        self.__transport.abort()
+
+    def __cancel_t8(self):
+        if self.__t8_handle is not None:
+            self.__t8_handle.cancel()
+            self.__t8_handle = None
+
+    def __in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self.__loop
+        except RuntimeError:
+            return False
+
+    def __call_in_loop(self, callback, *args):
+        if self.__in_loop():
+            callback(*args)
+        else:
+            try:
+                self.__loop.call_soon_threadsafe(callback, *args)
+            except RuntimeError:
+                # loop closed
+                callback(*args)
+
+    def shutdown(self):
+        self.__call_in_loop(self.__shutdown)
+
+    def __shutdown(self):
+        if not self.__terminated:
+            self.__terminated = True
+            self.__send_reply_pool.shutdown()
+            if self.__transport is not None:
+                self.__transport.close()
+
+    async def wait_closed(self):
+        """Wait until connection lost.
+
+        Returns:
+            None: None
+        """
+        await asyncio.shield(self.__closed)
+
+    def send(self, msg):
+        if self.__in_loop():
+            raise secs.HsmsSsCommunicatorError("Blocking send in event loop, use send_async or asend")
+        return self.send_async(msg).result()
+
+    def send_async(self, msg):
+        """Send message, without waiting reply.
+
+        Args:
+            msg (secs.HsmsSsMessage): message.
+
+        Returns:
+            concurrent.futures.Future: Reply-Message if reply is required, otherwise None.
+                Exception is HsmsSsSendMessageError, HsmsSsTimeoutT3Error, HsmsSsTimeoutT6Error,
+                HsmsSsRejectMessageError or HsmsSsCommunicatorError.
+        """
+        timeout_tx = -1.0
+
+        ctrl_type = msg.get_control_type()
+
+        if ctrl_type == secs.HsmsSsControlType.DATA:
+            if msg.wbit:
+                timeout_tx = self.__comm.timeout_t3
+
+        elif (ctrl_type == secs.HsmsSsControlType.SELECT_REQ
+              or ctrl_type == secs.HsmsSsControlType.LINKTEST_REQ):
+
+            timeout_tx = self.__comm.timeout_t6
+
+        def _timeout_error():
+            if ctrl_type == secs.HsmsSsControlType.DATA:
+                return secs.HsmsSsTimeoutT3Error("HsmsSs-Timeout-T3", msg)
+            else:
+                self.shutdown()
+                return secs.HsmsSsTimeoutT6Error("HsmsSs-Timeout-T6", msg)
+
+        if timeout_tx >= 0.0:
+            f = self.__send_reply_pool.entry(msg, timeout_tx, _timeout_error)
+            if not f.done():
+                self.__call_in_loop(self.__write, msg, f, False)
+        else:
+            f = concurrent.futures.Future()
+            self.__call_in_loop(self.__write, msg, f, True)
+
+        return f
+
+    def __write(self, msg, f, complete):
+        try:
+            if self.__terminated or self.__transport is None or self.__transport.is_closing():
+                raise secs.HsmsSsCommunicatorError("HsmsSsConnection terminated")
+            self.__transport.writelines(msg.to_buffers())
+            self.__put_sended_msg(msg)
+        except Exception as e:
+            secs.HsmsSsReplyFuturePool._set_exception(f, secs.HsmsSsSendMessageError(e, msg))
+            return
+        if complete:
+            secs.HsmsSsReplyFuturePool._set_result(f, None)
+
+
+class AbstractHsmsSsAsyncioCommunicator(secs.AbstractHsmsSsCommunicator):
+
+    def __init__(self, ip_address, port, session_id, is_equip, **kwargs):
+        super(AbstractHsmsSsAsyncioCommunicator, self).__init__(session_id, is_equip, **kwargs)
+
+        self.__ipaddr = (ip_address, port)
+        self.__loop = kwargs.get('loop', None)
+        self.__main = None
+
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
+
+    def _get_ipaddress(self):
+        return self.__ipaddr
+
+    @property
+    def loop(self):
+        pass
+
+    @loop.getter
+    def loop(self):
+        """Event loop getter.
+
+        Set by 'loop' keyword argument.
+        If None, HsmsSsAsyncioLoop.get_shared() is used.
+
+        Returns:
+            asyncio.AbstractEventLoop: loop
+        """
+        if self.__loop is None:
+            self.__loop = HsmsSsAsyncioLoop.get_shared()
+        return self.__loop
+
+    def _in_loop(self):
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    def _is_put_on_shared_thread(self):
+        # received messages are put to listener queues on loop thread
+        return True
+
+    def _open(self):
+
+        with self._open_close_rlock:
+            if self.is_closed:
+                raise RuntimeError("Already closed")
+            if self.is_open:
+                raise RuntimeError("Already opened")
+
+            self.__main = asyncio.run_coroutine_threadsafe(self._main(), self.loop)
+
+            super()._open()
+
+            self._set_opened()
+
+    async def _main(self):
+        # prototype
+        raise NotImplementedError()
+
+    def _close(self):
+
+        if self.is_closed:
+            return
+
+        super()._close()
+
+        self._set_closed()
+
+        self.__recv_primary_msg_putter.shutdown()
+
+        if self.__main is not None:
+            self.__main.cancel()
+            if not self._in_loop():
+                concurrent.futures.wait([self.__main], 0.1)
+
+    def send_hsmsss_msg(self, msg):
+        if self._in_loop():
+            raise secs.HsmsSsCommunicatorError("Blocking send in event loop, use send_async or asend")
+        return super().send_hsmsss_msg(msg)
+
+    def _put_recv_primary_msg_to_queue(self, recv_msg):
+        self.__recv_primary_msg_putter.put(recv_msg)
+
+    def _send_nowait(self, conn, msg):
+        conn.send_async(msg).add_done_callback(self.__put_send_error)
+
+    def __put_send_error(self, f):
+        e = f.exception()
+        if e is not None and not self.is_closed:
+            self._put_error(e)
+
+    def _reject_unsupported(self, conn, recv_msg):
+        if secs.HsmsSsControlType.has_s_type(recv_msg.get_s_type()):
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.NOT_SUPPORT_TYPE_P))
+        else:
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+
+
+class HsmsSsAsyncioActiveCommunicator(AbstractHsmsSsAsyncioCommunicator):
+    """HSMS-SS-Active communicator on asyncio event loop.
+
+    No threads per connection, many communicators can share one loop.
+    Listeners are called same as HsmsSsActiveCommunicator.
+    After connect refused or connection closed, waits T5 before next connect,
+    open passive side first or set small timeout_t5 to connect sooner.
+    Blocking send can not be called on loop thread, use asend or send_async.
+    """
+
+    __PROTOCOL = 'HSMS-SS-ACTIVE-ASYNCIO'
+
+    def __init__(self, ip_address, port, session_id, is_equip, **kwargs):
+        super(HsmsSsAsyncioActiveCommunicator, self).__init__(ip_address, port, session_id, is_equip, **kwargs)
+
+    def _get_protocol(self):
+        return self.__PROTOCOL
+
+    async def _main(self):
+        while not self.is_closed:
+            await self.__connect()
+            if self.is_closed:
+                return
+            await asyncio.sleep(self.timeout_t5)
+
+    async def __connect(self):
+
+        ipaddr = self._get_ipaddress()
+
+        try:
+            transport, conn = await self.loop.create_connection(
+                lambda: self._build_hsmsss_asyncio_connection(self.loop, self.__receiving_msg),
+                ipaddr[0],
+                ipaddr[1])
+
+        except OSError as e:
+            if not self.is_closed:
+                self._put_error(secs.HsmsSsCommunicatorError(e))
+            return
+
+        try:
+            self._put_hsmsss_comm_state_to_connected()
+
+            rsp = await asyncio.wrap_future(conn.send_async(self.build_select_req()))
+
+            if rsp is not None:
+
+                ss = rsp.get_select_status()
+
+                if (ss == secs.HsmsSsSelectStatus.SUCCESS
+                        or ss == secs.HsmsSsSelectStatus.ACTIVED):
+
+                    self._set_hsmsss_connection(
+                        conn,
+                        self._put_hsmsss_comm_state_to_selected)
+
+                    await conn.wait_closed()
+
+        except secs.HsmsSsCommunicatorError as e:
+            if not self.is_closed:
+                self._put_error(e)
+        except secs.HsmsSsSendMessageError as e:
+            if not self.is_closed:
+                self._put_error(e)
+        except secs.HsmsSsWaitReplyMessageError as e:
+            if not self.is_closed:
+                self._put_error(e)
+
+        finally:
+            self._unset_hsmsss_connection(
+                self._put_hsmsss_comm_state_to_not_connected)
+
+            conn.shutdown()
+
+    def __receiving_msg(self, recv_msg, conn):
+
+        ctrl_type = recv_msg.get_control_type()
+
+        if ctrl_type == secs.HsmsSsControlType.DATA:
+
+            if self.get_hsmsss_communicate_state() == secs.HsmsSsCommunicateState.SELECTED:
+
+                self._put_recv_primary_msg_to_queue(recv_msg)
+
+            else:
+                self._send_nowait(
+                    conn,
+                    self.build_select_rsp(
+                        recv_msg,
+                        secs.HsmsSsRejectReason.NOT_SELECTED))
+
+        elif ctrl_type == secs.HsmsSsControlType.LINKTEST_REQ:
+
+            self._send_nowait(conn, self.build_linktest_rsp(recv_msg))
+
+        elif ctrl_type == secs.HsmsSsControlType.SEPARATE_REQ:
+
+            conn.shutdown()
+
+        elif ctrl_type == secs.HsmsSsControlType.SELECT_REQ:
+
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.NOT_SUPPORT_TYPE_S))
+
+        elif (ctrl_type == secs.HsmsSsControlType.SELECT_RSP
+              or ctrl_type == secs.HsmsSsControlType.LINKTEST_RSP):
+
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+
+        elif ctrl_type == secs.HsmsSsControlType.REJECT_REQ:
+
+            # Nothing
+            pass
+
+        else:
+
+            self._reject_unsupported(conn, recv_msg)
+
+
+class HsmsSsAsyncioPassiveCommunicator(AbstractHsmsSsAsyncioCommunicator):
+    """HSMS-SS-Passive communicator on asyncio event loop.
+
+    No threads per connection, many communicators can share one loop.
+    Listeners are called same as HsmsSsPassiveCommunicator.
+    open returns after server is listening (or bind failed).
+    Blocking send can not be called on loop thread, use asend or send_async.
+    """
+
+    __PROTOCOL = 'HSMS-SS-PASSIVE-ASYNCIO'
+    __TIMEOUT_REBIND = 5.0
+
+    def __init__(self, ip_address, port, session_id, is_equip, **kwargs):
+        super(HsmsSsAsyncioPassiveCommunicator, self).__init__(ip_address, port, session_id, is_equip, **kwargs)
+
+        self.__conns = set()
+        self.__listening = None
+
+        self.timeout_rebind = kwargs.get('timeout_rebind', self.__TIMEOUT_REBIND)
+
+    def _get_protocol(self):
+        return self.__PROTOCOL
+
+    @property
+    def timeout_rebind(self):
+        pass
+
+    @timeout_rebind.setter
+    def timeout_rebind(self, val):
+        self.__timeout_rebind = self._try_gt_zero(val)
+
+    @timeout_rebind.getter
+    def timeout_rebind(self):
+        return self.__timeout_rebind
+
+    def _open(self):
+        self.__listening = concurrent.futures.Future()
+        super()._open()
+        if not self._in_loop():
+            concurrent.futures.wait([self.__listening], self.timeout_rebind)
+
+    def __put_listening(self):
+        if not self.__listening.done():
+            self.__listening.set_result(None)
+
+    async def _main(self):
+        try:
+            while not self.is_closed:
+                await self.__open_server()
+                if self.is_closed:
+                    return
+                await asyncio.sleep(self.timeout_rebind)
+        finally:
+            self.__put_listening()
+            for conn in tuple(self.__conns):
+                conn.shutdown()
+
+    async def __open_server(self):
+
+        ipaddr = self._get_ipaddress()
+
+        try:
+            server = await self.loop.create_server(
+                self.__accept,
+                ipaddr[0],
+                ipaddr[1])
+
+        except OSError as e:
+            self.__put_listening()
+            if not self.is_closed:
+                self._put_error(secs.HsmsSsCommunicatorError(e))
+            return
+
+        self.__put_listening()
+
+        try:
+            await server.serve_forever()
+
+        except OSError as e:
+            if not self.is_closed:
+                self._put_error(secs.HsmsSsCommunicatorError(e))
+
+        finally:
+            server.close()
+
+    def __accept(self):
+
+        selected = False
+        t7_handle = None
+
+        def _reset_t7(conn):
+            nonlocal t7_handle
+            if t7_handle is not None:
+                t7_handle.cancel()
+            t7_handle = None if selected else self.loop.call_later(self.timeout_t7, conn.shutdown)
+
+        def _recv(recv_msg, conn):
+            nonlocal selected
+            if selected:
+                self.__receiving_msg(recv_msg, conn)
+            else:
+                selected = self.__receiving_msg_until_selected(recv_msg, conn)
+                _reset_t7(conn)
+
+        async def _session(conn):
+            try:
+                await conn.wait_closed()
+            finally:
+                if t7_handle is not None:
+                    t7_handle.cancel()
+                self.__conns.discard(conn)
+                if selected:
+                    self._unset_hsmsss_connection(
+                        self._put_hsmsss_comm_state_to_not_connected)
+                elif (not self.__conns
+                      and self.get_hsmsss_communicate_state() == secs.HsmsSsCommunicateState.CONNECTED):
+                    self._put_hsmsss_comm_state_to_not_connected()
+
+        conn = self._build_hsmsss_asyncio_connection(self.loop, _recv)
+
+        self.__conns.add(conn)
+        if self.get_hsmsss_communicate_state() == secs.HsmsSsCommunicateState.NOT_CONNECT:
+            self._put_hsmsss_comm_state_to_connected()
+        _reset_t7(conn)
+        self.loop.create_task(_session(conn))
+
+        return conn
+
+    def __receiving_msg_until_selected(self, recv_msg, conn):
+
+        ctrl_type = recv_msg.get_control_type()
+
+        if ctrl_type == secs.HsmsSsControlType.DATA:
+
+            self._send_nowait(
+                conn,
+                self.build_select_rsp(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.NOT_SELECTED))
+
+        elif ctrl_type == secs.HsmsSsControlType.LINKTEST_REQ:
+
+            self._send_nowait(conn, self.build_linktest_rsp(recv_msg))
+
+        elif ctrl_type == secs.HsmsSsControlType.SEPARATE_REQ:
+
+            conn.shutdown()
+
+        elif ctrl_type == secs.HsmsSsControlType.SELECT_REQ:
+
+            r = self._set_hsmsss_connection(
+                conn,
+                self._put_hsmsss_comm_state_to_selected)
+
+            if r:
+
+                self._send_nowait(
+                    conn,
+                    self.build_select_rsp(
+                        recv_msg,
+                        secs.HsmsSsSelectStatus.SUCCESS))
+
+                return True
+
+            else:
+
+                self._send_nowait(
+                    conn,
+                    self.build_select_rsp(
+                        recv_msg,
+                        secs.HsmsSsSelectStatus.ALREADY_USED))
+
+        elif (ctrl_type == secs.HsmsSsControlType.SELECT_RSP
+              or ctrl_type == secs.HsmsSsControlType.LINKTEST_RSP):
+
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+
+        elif ctrl_type == secs.HsmsSsControlType.REJECT_REQ:
+
+            # Nothing
+            pass
+
+        else:
+
+            self._reject_unsupported(conn, recv_msg)
+
+        return False
+
+    def __receiving_msg(self, recv_msg, conn):
+
+        ctrl_type = recv_msg.get_control_type()
+
+        if ctrl_type == secs.HsmsSsControlType.DATA:
+
+            self._put_recv_primary_msg_to_queue(recv_msg)
+
+        elif ctrl_type == secs.HsmsSsControlType.LINKTEST_REQ:
+
+            self._send_nowait(conn, self.build_linktest_rsp(recv_msg))
+
+        elif ctrl_type == secs.HsmsSsControlType.SEPARATE_REQ:
+
+            conn.shutdown()
+
+        elif ctrl_type == secs.HsmsSsControlType.SELECT_REQ:
+
+            self._send_nowait(
+                conn,
+                self.build_select_rsp(
+                    recv_msg,
+                    secs.HsmsSsSelectStatus.ACTIVED))
+
+        elif (ctrl_type == secs.HsmsSsControlType.SELECT_RSP
+              or ctrl_type == secs.HsmsSsControlType.LINKTEST_RSP):
+
+            self._send_nowait(
+                conn,
+                self.build_reject_req(
+                    recv_msg,
+                    secs.HsmsSsRejectReason.TRANSACTION_NOT_OPEN))
+
+        elif ctrl_type == secs.HsmsSsControlType.REJECT_REQ:
+
+            # Nothing
+            pass
+
+        else:
+
+            self._reject_unsupported(conn, recv_msg)
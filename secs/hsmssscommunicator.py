@@ -1,4 +1,8 @@
 import threading
+import select
+import socket
+import collections
+import concurrent.futures
 import secs
 
 
@@ -45,51 +49,19 @@ class HsmsSsCommunicateState:
     SELECTED = 'selected'
 
 
-class SendReplyHsmsSsMessagePack:
+class HsmsSsReplyFuturePool:
+    """Pending reply table, System-Bytes to concurrent.futures.Future.
 
-    def __init__(self, msg):
-        self.__msg = msg
-        self.__reply_msg_cdt = threading.Condition()
-        self.__reply_msg = None
-        self.__terminated = False
-
-    def shutdown(self):
-        with self.__reply_msg_cdt:
-            self.__terminated = True
-            self.__reply_msg_cdt.notify_all()
-
-    def __is_terminated(self):
-        with self.__reply_msg_cdt:
-            return self.__terminated
-
-    def get_system_bytes(self):
-        return self.__msg.system_bytes
-
-    def put_reply_msg(self, reply_msg):
-        with self.__reply_msg_cdt:
-            self.__reply_msg = reply_msg
-            self.__reply_msg_cdt.notify_all()
-
-    def wait_reply_msg(self, timeout):
-
-        with self.__reply_msg_cdt:
-
-            if self.__is_terminated():
-                return None
-
-            if self.__reply_msg is not None:
-                return self.__reply_msg
+    Timeouts are expired by shared SecsTimer, no thread waits per message.
+    Reply, timeout and shutdown take the entry out of the table under lock,
+    only the taker completes the future.
+    """
 
-            self.__reply_msg_cdt.wait(timeout)
-        
-            return self.__reply_msg
-
-
-class SendReplyHsmsSsMessagePackPool:
-
-    def __init__(self):
+    def __init__(self, timer):
         self.__pool = dict()
         self.__lock = threading.Lock()
+        self.__timer = timer
+        self.__terminated = False
     
     def __enter__(self):
         return self
@@ -99,28 +71,182 @@ class SendReplyHsmsSsMessagePackPool:
     
     def shutdown(self):
         with self.__lock:
-            for pack in self.__pool.values():
-                pack.shutdown()
+            self.__terminated = True
+            ff = [v[0] for v in self.__pool.values()]
+            self.__pool.clear()
+        for f in ff:
+            self._set_exception(f, HsmsSsCommunicatorError("HsmsSsConnection terminated"))
 
-    def entry(self, pack):
-        with self.__lock:
-            self.__pool[pack.get_system_bytes()] = pack
+    def entry(self, msg, timeout, timeout_error):
+        """Entry reply-waiting message.
+
+        Args:
+            msg (secs.HsmsSsMessage): message waits reply.
+            timeout (float): seconds.
+            timeout_error (function): return Exception set to future,
+                called on timeout only if reply not received.
+
+        Returns:
+            concurrent.futures.Future: reply message future.
+                Exception is HsmsSsSendMessageError if System-Bytes is already waiting reply.
+        """
+        f = concurrent.futures.Future()
+        key = msg.system_bytes
 
-    def remove(self, pack):
         with self.__lock:
-            del self.__pool[pack.get_system_bytes()]
+            if self.__terminated:
+                f.set_exception(HsmsSsCommunicatorError("HsmsSsConnection terminated"))
+                return f
+            if key in self.__pool:
+                # pending entry is kept, its future completes by reply or timeout
+                f.set_exception(HsmsSsSendMessageError("System-Bytes already waiting reply", msg))
+                return f
+            self.__pool[key] = (f, msg)
+
+        def _expired():
+            if self.__take(key, f) is not None:
+                self._set_exception(f, timeout_error())
+
+        entry = self.__timer.schedule(timeout, _expired)
+
+        def _done(x):
+            self.__timer.cancel(entry)
+            self.__take(key, x)
+
+        f.add_done_callback(_done)
+        return f
 
     def put_reply_msg(self, reply_msg):
         with self.__lock:
-            key = reply_msg.system_bytes
-            if key in self.__pool:
-                self.__pool[key].put_reply_msg(reply_msg)
-                return True
-            else:
-                return False
+            v = self.__pool.pop(reply_msg.system_bytes, None)
+
+        if v is None:
+            return False
+
+        f, msg = v
+        if reply_msg.get_control_type() == secs.HsmsSsControlType.REJECT_REQ:
+            self._set_exception(f, HsmsSsRejectMessageError("HsmsSs-Reject-Message", msg))
+        else:
+            self._set_result(f, reply_msg)
+        return True
+
+    def __take(self, key, f):    # return entry if f is still pending in pool
+        with self.__lock:
+            v = self.__pool.get(key)
+            if v is not None and v[0] is f:
+                del self.__pool[key]
+                return v
+            return None
+
+    @staticmethod
+    def _set_result(f, v):
+        try:
+            f.set_result(v)
+        except Exception:
+            # already done or cancelled
+            pass
+
+    @staticmethod
+    def _set_exception(f, e):
+        try:
+            f.set_exception(e)
+        except Exception:
+            # already done or cancelled
+            pass
+
+
+class HsmsSsFrameBuffer:
+    """Receive buffer, extracts length-prefixed HSMS-SS frames.
+
+    Received bytes are written by recv_into(get_buffer()) and buffer_updated(n).
+    Frames larger than the buffer are received into a frame-sized
+    bytearray, and returned without copy.
+    """
+
+    def __init__(self, size=65536):
+        self.__size = size
+        self.__buf = bytearray(size)
+        self.__r = 0
+        self.__w = 0
+
+    def get_buffer(self):
+        """Writable buffer getter.
+
+        Returns:
+            memoryview: free space of buffer.
+        """
+        n = self.__frame_size()
+        if n is not None and n > len(self.__buf):
+            # large frame, receive into frame-sized buffer
+            buf = bytearray(n)
+            m = self.__w - self.__r
+            buf[0:m] = self.__buf[self.__r:self.__w]
+            self.__buf = buf
+            self.__r = 0
+            self.__w = m
+
+        elif self.__w == len(self.__buf):
+            m = self.__w - self.__r
+            self.__buf[0:m] = self.__buf[self.__r:self.__w]
+            self.__r = 0
+            self.__w = m
+
+        return memoryview(self.__buf)[self.__w:]
+
+    def buffer_updated(self, nbytes):
+        """Notify received bytes length.
+
+        Args:
+            nbytes (int): bytes written into get_buffer().
+        """
+        self.__w += nbytes
+
+    def has_partial(self):
+        """Incomplete frame getter.
+
+        Returns:
+            bool: True if buffer has bytes of incomplete frame.
+        """
+        return self.__w > self.__r
+
+    def next_frame(self):
+        """Extract next frame.
+
+        Raises:
+            HsmsSsCommunicatorError: if message length < 10.
+
+        Returns:
+            bytes or bytearray: 4-bytes length + 10-bytes header + body, None if not completed.
+        """
+        n = self.__frame_size()
+        if n is None or (self.__w - self.__r) < n:
+            return None
+
+        if self.__r == 0 and n == len(self.__buf) and n > self.__size:
+            v = self.__buf
+            self.__buf = bytearray(self.__size)
+            self.__w = 0
+            return v
+
+        v = bytes(self.__buf[self.__r:(self.__r + n)])
+        self.__r += n
+        if self.__r == self.__w:
+            self.__r = 0
+            self.__w = 0
+        return v
+
+    def __frame_size(self):
+        if (self.__w - self.__r) < 4:
+            return None
+        n = int.from_bytes(self.__buf[self.__r:(self.__r + 4)], 'big')
+        if n < 10:
+            raise HsmsSsCommunicatorError("Receive message size < 10")
+        return n + 4
 
 
 class HsmsSsConnection:
+
+    __SEND_BATCH = 64
     
     def __init__(
             self, sock, comm,
@@ -139,14 +265,32 @@ class HsmsSsConnection:
         self.__terminated_cdt = threading.Condition()
         self.__terminated = False
 
-        self.__bbqq = secs.WaitingQueuing()
+        self.__frame_buffer = HsmsSsFrameBuffer()
 
-        self.__send_reply_pool = SendReplyHsmsSsMessagePackPool()
+        self.__send_reply_pool = HsmsSsReplyFuturePool(secs.SecsTimer.get_shared())
 
         self.__send_lock = threading.Lock()
 
-        threading.Thread(target=self.__receiving_socket_bytes, daemon=True).start()
-        threading.Thread(target=self.__reading_msg, daemon=True).start()
+        self.__send_coalescing = comm.send_coalescing
+        self.__send_queue = collections.deque()
+        self.__send_queue_cdt = threading.Condition()
+        self.__send_queue_closed = False
+
+        if self.__send_coalescing:
+            try:
+                self.__sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, AttributeError):
+                pass
+
+            threading.Thread(target=self.__writing_msg, daemon=True).start()
+
+        self.__reactor = comm.reactor
+        self.__t8_entry = None
+
+        if self.__reactor is None:
+            threading.Thread(target=self.__reading_msg, daemon=True).start()
+        else:
+            self.__reactor.register(self.__sock, self.__readable, self.__readable_error)
     
     def __enter__(self):
         return self
@@ -161,11 +305,19 @@ class HsmsSsConnection:
 
                 self.__terminated = True
 
-                self.__bbqq.shutdown()
                 self.__send_reply_pool.shutdown()
 
                 self.__terminated_cdt.notify_all()
 
+        with self.__send_queue_cdt:
+            self.__send_queue_closed = True
+            self.__send_queue_cdt.notify_all()
+
+        if self.__reactor is not None:
+            # every caller waits until unregistered, socket may be closed after return
+            self.__reactor.unregister(self.__sock)
+            self.__cancel_t8()
+
     def __is_terminated(self):
         with self.__terminated_cdt:
             return self.__terminated
@@ -174,85 +326,120 @@ class HsmsSsConnection:
         with self.__terminated_cdt:
             self.__terminated_cdt.wait_for(self.__is_terminated, timeout)
 
-    def __receiving_socket_bytes(self):
+    def __reading_msg(self):
         try:
+            fb = self.__frame_buffer
+
             while not self.__is_terminated():
-                bs = self.__sock.recv(4096)
-                if bs:
-                    self.__bbqq.puts(bs)
-                else:
-                    raise HsmsSsCommunicatorError("Terminate detect")
 
-        except HsmsSsCommunicatorError as e:
-            if not self.__is_terminated():
-                self.__put_error(e)
+                if fb.has_partial():
+                    r, w, x = select.select([self.__sock], [], [], self.__comm.timeout_t8)
+                    if not r:
+                        raise HsmsSsCommunicatorError("T8-Timeout")
+
+                self.__recv_once()
+
         except Exception as e:
-            if not self.__is_terminated():
-                self.__put_error(HsmsSsCommunicatorError(e))
+            self.__put_recv_error(e)
 
         finally:
             self.shutdown()
 
-    def __reading_msg(self):
+    def __readable(self):
+        # called on reactor thread, socket is readable
+        self.__cancel_t8()
         try:
-            while not self.__is_terminated():
+            self.__recv_once()
+        except Exception as e:
+            self.__put_recv_error(e)
+            self.shutdown()
+            return
 
-                heads = list()
-                pos = 0
-                size = 14
+        if self.__frame_buffer.has_partial():
+            self.__t8_entry = secs.SecsTimer.get_shared().schedule(
+                self.__comm.timeout_t8,
+                self.__timeout_t8)
 
-                r = self.__bbqq.put_to_list(heads, pos, size)
-                if r < 0:
-                    return
+    def __readable_error(self, e):
+        # called on reactor thread, if __readable raised
+        self.__put_recv_error(e)
+        self.shutdown()
 
-                pos += r
+    def __timeout_t8(self):
+        self.__put_recv_error(HsmsSsCommunicatorError("T8-Timeout"))
+        self.shutdown()
 
-                while pos < size:
-                    r = self.__bbqq.put_to_list(
-                        heads, pos, size,
-                        self.__comm.timeout_t8)
-                    
-                    if r < 0:
-                        raise HsmsSsCommunicatorError("T8-Timeout")
-                    else:
-                        pos += r
-
-                bodys = list()
-                pos = 0
-                size = (heads[0] << 24
-                        | heads[1] << 16
-                        | heads[2] << 8
-                        | heads[3]) - 10
-
-                if size < 0:
-                    raise HsmsSsCommunicatorError("Receive message size < 10")
-
-                while pos < size:
-                    r = self.__bbqq.put_to_list(
-                        bodys, pos, size,
-                        self.__comm.timeout_t8)
-                    
-                    if r < 0:
-                        raise HsmsSsCommunicatorError("T8-Timeout")
-                    else:
-                        pos += r
+    def __cancel_t8(self):
+        entry = self.__t8_entry
+        if entry is not None:
+            self.__t8_entry = None
+            secs.SecsTimer.get_shared().cancel(entry)
 
-                msg = secs.HsmsSsMessage.from_bytes(bytes(heads) + bytes(bodys))
+    def __recv_once(self):
+        fb = self.__frame_buffer
 
-                self.__put_recv_all_msg(msg)
+        n = self.__sock.recv_into(fb.get_buffer())
+        if n == 0:
+            raise HsmsSsCommunicatorError("Terminate detect")
 
-                if not self.__send_reply_pool.put_reply_msg(msg):
-                    self.__put_recv_primary_msg(msg, self)
+        fb.buffer_updated(n)
 
-        except Exception as e:
-            if not self.__is_terminated():
-                self.__put_error(e)
+        while True:
+            bs = fb.next_frame()
+            if bs is None:
+                break
 
-        finally:
-            self.shutdown()
+            msg = secs.HsmsSsMessage.from_bytes(
+                bs,
+                self.__comm.lazy_secs2body,
+                self.__comm.compact_secs2body)
+
+            self.__put_recv_all_msg(msg)
+
+            if not self.__send_reply_pool.put_reply_msg(msg):
+                self.__put_recv_primary_msg(msg, self)
+
+    def __put_recv_error(self, e):
+        if self.__is_terminated():
+            return
+        if isinstance(e, HsmsSsCommunicatorError):
+            self.__put_error(e)
+        elif isinstance(e, OSError):
+            self.__put_error(HsmsSsCommunicatorError(e))
+        else:
+            self.__put_error(e)
+
+    def __send_buffers(self, buffers):
+        if not hasattr(self.__sock, 'sendmsg'):
+            self.__sock.sendall(b''.join(buffers))
+            return
+
+        vv = [memoryview(x).cast('B') for x in buffers if len(x) > 0]
+        while vv:
+            n = self.__sock.sendmsg(vv)
+            while n > 0:
+                m = len(vv[0])
+                if n >= m:
+                    del vv[0]
+                    n -= m
+                else:
+                    vv[0] = vv[0][n:]
+                    n = 0
 
     def send(self, msg):
+        return self.send_async(msg).result()
+
+    def send_async(self, msg):
+        """Send message, without waiting reply.
+
+        Args:
+            msg (secs.HsmsSsMessage): message.
 
+        Returns:
+            concurrent.futures.Future: Reply-Message if reply is required, otherwise None.
+                Exception is HsmsSsSendMessageError, HsmsSsTimeoutT3Error, HsmsSsTimeoutT6Error,
+                HsmsSsRejectMessageError or HsmsSsCommunicatorError.
+        """
         timeout_tx = -1.0
 
         ctrl_type = msg.get_control_type()
@@ -266,56 +453,92 @@ class HsmsSsConnection:
 
             timeout_tx = self.__comm.timeout_t6
 
-        def _send():
-            with self.__send_lock:
-                try:
-                    self.__sock.sendall(msg.to_bytes())
-                    self.__put_sended_msg(msg)
-                except Exception as e:
-                    raise HsmsSsSendMessageError(e, msg)
-        
+        def _timeout_error():
+            if ctrl_type == secs.HsmsSsControlType.DATA:
+                return HsmsSsTimeoutT3Error("HsmsSs-Timeout-T3", msg)
+            else:
+                threading.Thread(target=self.shutdown, daemon=True).start()
+                return HsmsSsTimeoutT6Error("HsmsSs-Timeout-T6", msg)
+
         if timeout_tx >= 0.0:
 
-            pack = SendReplyHsmsSsMessagePack(msg)
+            f = self.__send_reply_pool.entry(msg, timeout_tx, _timeout_error)
 
-            try:
-                self.__send_reply_pool.entry(pack)
+            if not f.done():
+                self.__write(msg, f, False)
 
-                _send()
+        else:
+            f = concurrent.futures.Future()
+            self.__write(msg, f, True)
 
-                rsp = pack.wait_reply_msg(timeout_tx)
+        return f
 
-                if rsp is None:
+    def __write(self, msg, f, complete):
+        # complete: set result None to f after sended
 
-                    if self.__is_terminated():
+        if self.__send_coalescing:
+            with self.__send_queue_cdt:
+                if not self.__send_queue_closed:
+                    self.__send_queue.append((msg, f, complete))
+                    self.__send_queue_cdt.notify()
+                    return
 
-                        raise HsmsSsCommunicatorError("HsmsSsConnection terminated")
-                    
-                    else:
+            HsmsSsReplyFuturePool._set_exception(
+                f, HsmsSsSendMessageError("Connection closed", msg))
+            return
 
-                        if ctrl_type == secs.HsmsSsControlType.DATA:
+        try:
+            with self.__send_lock:
+                self.__send_buffers(msg.to_buffers())
+            self.__put_sended_msg(msg)
+        except Exception as e:
+            HsmsSsReplyFuturePool._set_exception(f, HsmsSsSendMessageError(e, msg))
+            return
 
-                            raise HsmsSsTimeoutT3Error("HsmsSs-Timeout-T3", msg)
+        if complete:
+            HsmsSsReplyFuturePool._set_result(f, None)
 
-                        else:
-                            self.shutdown()
-                            raise HsmsSsTimeoutT6Error("HsmsSs-Timeout-T6", msg)
+    def __writing_msg(self):
+        # writer thread, pending messages are sent together, one sendmsg per batch
+        q = self.__send_queue
 
-                else:
+        while True:
+            with self.__send_queue_cdt:
+                while not q and not self.__send_queue_closed:
+                    self.__send_queue_cdt.wait()
 
-                    if rsp.get_control_type() == secs.HsmsSsControlType.REJECT_REQ:
+                if self.__send_queue_closed:
+                    closed = list(q)
+                    q.clear()
+                    break
 
-                        raise HsmsSsRejectMessageError("HsmsSs-Reject-Message", msg)
+                batch = [q.popleft() for _ in range(min(len(q), self.__SEND_BATCH))]
 
-                    else:
-                        return rsp
+            buffers = list()
+            sending = list()
+            for x in batch:
+                try:
+                    buffers.extend(x[0].to_buffers())
+                    sending.append(x)
+                except Exception as e:
+                    HsmsSsReplyFuturePool._set_exception(x[1], HsmsSsSendMessageError(e, x[0]))
 
-            finally:
-                self.__send_reply_pool.remove(pack)
-            
-        else:
-            _send()
-            return None
+            try:
+                with self.__send_lock:
+                    self.__send_buffers(buffers)
+            except Exception as e:
+                for msg, f, complete in sending:
+                    HsmsSsReplyFuturePool._set_exception(f, HsmsSsSendMessageError(e, msg))
+                continue
+
+            for msg, f, complete in sending:
+                self.__put_sended_msg(msg)
+                if complete:
+                    HsmsSsReplyFuturePool._set_result(f, None)
+
+        for msg, f, complete in closed:
+            HsmsSsReplyFuturePool._set_exception(
+                f, HsmsSsSendMessageError("Connection closed", msg))
 
 
 class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
@@ -328,11 +551,13 @@ class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
 
         self._hsmsss_comm = HsmsSsCommunicateState.NOT_CONNECT
         self._hsmsss_comm_lock = threading.Lock()
-        self._hsmsss_comm_lstnrs = list()
+        self._hsmsss_comm_lstnrs = tuple()
+
+        self.__recv_all_msg_putter = self._build_callback_queuing(self._put_recv_all_msg)
+        self.__sended_msg_putter = self._build_callback_queuing(self._put_sended_msg)
+        self.__error_putter = self._build_callback_queuing(super()._put_error)
 
-        self.__recv_all_msg_putter = secs.CallbackQueuing(self._put_recv_all_msg)
-        self.__sended_msg_putter = secs.CallbackQueuing(self._put_sended_msg)
-        self.__error_putter = secs.CallbackQueuing(super()._put_error)
+        self.send_coalescing = kwargs.get('send_coalescing', False)
 
         hsmsss_comm_lstnr = kwargs.get('hsmsss_communicate', None)
         if hsmsss_comm_lstnr is not None:
@@ -389,6 +614,33 @@ class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
         """
         return self.device_id
 
+    @property
+    def send_coalescing(self):
+        pass
+
+    @send_coalescing.setter
+    def send_coalescing(self, val):
+        """Send-Coalescing setter.
+
+        If True, TCP_NODELAY is set, and callers put messages to a queue.
+        Writer thread of each connection writes pending messages in one system call,
+        at most 64 messages per call.
+        Applied to next connection.
+
+        Args:
+            val (bool): Send-Coalescing
+        """
+        self.__send_coalescing = bool(val)
+
+    @send_coalescing.getter
+    def send_coalescing(self):
+        """Send-Coalescing getter.
+
+        Returns:
+            bool: True if send-coalescing.
+        """
+        return self.__send_coalescing
+
     def _put_error(self, e):
         self.__error_putter.put(e)
 
@@ -421,6 +673,15 @@ class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
             self.__sended_msg_putter.put,
             self.__error_putter.put)
 
+    def _build_hsmsss_asyncio_connection(self, loop, recv_primary_msg_callback):
+        return secs.HsmsSsAsyncioConnection(
+            loop,
+            self,
+            recv_primary_msg_callback,
+            self.__recv_all_msg_putter.put,
+            self.__sended_msg_putter.put,
+            self.__error_putter.put)
+
     def _set_hsmsss_connection(self, conn, callback=None):
         with self._hsmsss_connection_lock:
             if self._hsmsss_connection is None:
@@ -442,15 +703,23 @@ class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
         return self.send_hsmsss_msg(
             secs.HsmsSsDataMessage(strm, func, wbit, secs2body, system_bytes, device_id))
 
+    def _send_async(self, strm, func, wbit, secs2body, system_bytes, device_id):
+        return self.send_hsmsss_msg_async(
+            secs.HsmsSsDataMessage(strm, func, wbit, secs2body, system_bytes, device_id))
+
     def send_hsmsss_msg(self, msg):
-        def _f():
-            with self._hsmsss_connection_lock:
-                if self._hsmsss_connection is None:
-                    raise HsmsSsSendMessageError("HsmsSsCommunicator not connected", msg)
-                else:
-                    return self._hsmsss_connection
-        
-        return _f().send(msg)
+        return self.send_hsmsss_msg_async(msg).result()
+
+    def send_hsmsss_msg_async(self, msg):
+        with self._hsmsss_connection_lock:
+            conn = self._hsmsss_connection
+
+        if conn is None:
+            f = concurrent.futures.Future()
+            f.set_exception(HsmsSsSendMessageError("HsmsSsCommunicator not connected", msg))
+            return f
+
+        return conn.send_async(msg)
 
     def build_select_req(self):
         return secs.HsmsSsControlMessage.build_select_request(
@@ -521,8 +790,9 @@ class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
             None
         """
         with self._hsmsss_comm_lock:
-            self._hsmsss_comm_lstnrs.append(listener)
-            listener(self._hsmsss_comm, self)
+            with self._lstnrs_lock:
+                self._hsmsss_comm_lstnrs = self._added_listeners(self._hsmsss_comm_lstnrs, listener)
+            self._hsmsss_comm_lstnrs[-1][1](self._hsmsss_comm)
 
     def remove_hsmsss_communicate_listener(self, listener):
         """Remove HSMS-SS-Communicate-state-change-listener.
@@ -534,17 +804,15 @@ class AbstractHsmsSsCommunicator(secs.AbstractSecsCommunicator):
             None
         """
         with self._hsmsss_comm_lock:
-            self._hsmsss_comm_lstnrs.remove(listener)
+            with self._lstnrs_lock:
+                self._hsmsss_comm_lstnrs = self._removed_listeners(self._hsmsss_comm_lstnrs, listener)
 
     def _put_hsmsss_comm_state(self, state, callback=None):
         with self._hsmsss_comm_lock:
             if state != self._hsmsss_comm:
                 self._hsmsss_comm = state
                 for ls in self._hsmsss_comm_lstnrs:
-                    if self._is_single_args_listener(ls):
-                        ls(self._hsmsss_comm)
-                    else:
-                        ls(self._hsmsss_comm, self)
+                    ls[1](self._hsmsss_comm)
                 self._put_communicated(state == HsmsSsCommunicateState.SELECTED)
                 if callback is not None:
                     callback()
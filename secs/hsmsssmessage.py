@@ -95,6 +95,12 @@ class HsmsSsRejectReason:
 
 class HsmsSsMessage(secs.SecsMessage):
 
+    __slots__ = (
+        '_system_bytes', '_control_type',
+        '_cache_msg_length', '_cache_str', '_cache_repr', '_cache_bytes',
+        '_cache_header10bytes'
+    )
+
     def __init__(self, strm, func, wbit, secs2body, system_bytes, control_type):
         super(HsmsSsMessage, self).__init__(strm, func, wbit, secs2body)
         self._system_bytes = system_bytes
@@ -103,6 +109,7 @@ class HsmsSsMessage(secs.SecsMessage):
         self._cache_str = None
         self._cache_repr = None
         self._cache_bytes = None
+        self._cache_header10bytes = None
 
     def __str__(self):
         if self._cache_str is None:
@@ -143,7 +150,7 @@ class HsmsSsMessage(secs.SecsMessage):
         if self._cache_msg_length is None:
             i = len(self._header10bytes())
             if self.secs2body is not None:
-                i += len(self.secs2body.to_bytes())
+                i += self.secs2body.byte_size()
             self._cache_msg_length = i
 
         return self._cache_msg_length
@@ -174,24 +181,66 @@ class HsmsSsMessage(secs.SecsMessage):
 
     def to_bytes(self):
         if self._cache_bytes is None:
-            msg_len = self._msg_length()
-            vv = [
-                bytes([
-                    (msg_len >> 24) & 0xFF,
-                    (msg_len >> 16) & 0xFF,
-                    (msg_len >> 8) & 0xFF,
-                    msg_len & 0xFF
-                ]),
-                self._header10bytes(),
-                b'' if self.secs2body is None else self.secs2body.to_bytes()
-            ]
-            self._cache_bytes = b''.join(vv)
+            self._cache_bytes = b''.join(self.to_buffers())
         return self._cache_bytes
+
+    def to_buffers(self):
+        """Message buffers getter, for scatter/gather sending.
+
+        Returns:
+            tuple: (4-bytes length + 10-bytes header, body bytes),
+                concatenation is to_bytes().
+        """
+        if self._cache_bytes is not None:
+            return (self._cache_bytes, )
+        msg_len = self._msg_length()
+        return (
+            bytes([
+                (msg_len >> 24) & 0xFF,
+                (msg_len >> 16) & 0xFF,
+                (msg_len >> 8) & 0xFF,
+                msg_len & 0xFF
+            ]) + self._header10bytes(),
+            b'' if self.secs2body is None else self.secs2body.to_bytes()
+        )
+
+    def write_into(self, buffer, offset=0):
+        """Write message bytes into buffer.
+
+        Args:
+            buffer (bytearray or memoryview): writable buffer, require (4 + 10 + body) bytes from offset.
+            offset (int): write position. Defaults to 0.
+
+        Returns:
+            int: position next to written bytes.
+        """
+        msg_len = self._msg_length()
+        buffer[offset:(offset + 4)] = msg_len.to_bytes(4, 'big')
+        buffer[(offset + 4):(offset + 14)] = self._header10bytes()
+        if self.secs2body is None:
+            return offset + 14
+        else:
+            return self.secs2body.write_into(buffer, (offset + 14))
         
     @classmethod
-    def from_bytes(cls, bs):
-
-        h10bs = bs[4:14]
+    def from_bytes(cls, bs, lazy=False, compact=False):
+        """Parse HSMS-SS message from received frame.
+
+        SECS-II body is parsed over a memoryview of bs,
+        'A' and 'B' item payloads are not copied until accessed.
+        bs is cached as to_bytes() only if bytes. A bytearray is owned by
+        the message, and must not be modified after.
+
+        Args:
+            bs (bytes or bytearray): message frame, 4-bytes length + 10-bytes header + body.
+            lazy (bool): decode SECS-II body on access. Defaults to False.
+            compact (bool): decode numbers to array.array. Defaults to False.
+
+        Returns:
+            HsmsSsMessage: message
+        """
+        mv = memoryview(bs)
+        h10bs = bytes(mv[4:14])
         sys_bs = h10bs[6:10]
 
         ctrl_type = HsmsSsControlType.get(h10bs[4:6])
@@ -204,7 +253,7 @@ class HsmsSsMessage(secs.SecsMessage):
             wbit = (h10bs[2] & 0x80) == 0x80
 
             if len(bs) > 14:
-                s2b = secs.Secs2BodyBuilder.from_body_bytes(bs[14:])
+                s2b = secs.Secs2BodyBuilder.from_body_bytes(mv[14:], lazy, compact)
                 v = HsmsSsDataMessage(strm, func, wbit, s2b, sys_bs, dev_id)
             else:
                 v = HsmsSsDataMessage(strm, func, wbit, None, sys_bs, dev_id)
@@ -212,10 +261,9 @@ class HsmsSsMessage(secs.SecsMessage):
         else:
 
             v = HsmsSsControlMessage(sys_bs, ctrl_type)
-            v._p_type = h10bs[2]
-            v._s_type = h10bs[3]
 
-        v._cache_bytes = bs
+        if type(bs) is bytes:
+            v._cache_bytes = bs
         v._cache_header10bytes = h10bs
         
         return v
@@ -223,18 +271,19 @@ class HsmsSsMessage(secs.SecsMessage):
 
 class HsmsSsDataMessage(HsmsSsMessage):
 
+    __slots__ = ('__session_id', )
+
     def __init__(self, strm, func, wbit, secs2body, system_bytes, session_id):
         super(HsmsSsDataMessage, self).__init__(strm, func, wbit, secs2body, system_bytes, HsmsSsControlType.DATA)
         self.__session_id = session_id
-        self.__cache_header10bytes = None
 
     def _header10bytes(self):
-        if self.__cache_header10bytes is None:
+        if self._cache_header10bytes is None:
             b2 = self.strm
             if self.wbit:
                 b2 |= 0x80
 
-            self.__cache_header10bytes = bytes([
+            self._cache_header10bytes = bytes([
                 (self.session_id >> 8) & 0x7F,
                 self.session_id & 0xFF,
                 b2, self.func,
@@ -243,7 +292,7 @@ class HsmsSsDataMessage(HsmsSsMessage):
                 self._system_bytes[2], self._system_bytes[3]
                 ])
         
-        return self.__cache_header10bytes
+        return self._cache_header10bytes
 
     @property
     def session_id(self):
@@ -259,9 +308,10 @@ class HsmsSsDataMessage(HsmsSsMessage):
 
 class HsmsSsControlMessage(HsmsSsMessage):
 
+    __slots__ = ()
+
     def __init__(self, system_bytes, control_type):
         super(HsmsSsControlMessage, self).__init__(0, 0, False, None, system_bytes, control_type)
-        self.__cache_header10bytes = None
 
     CONTROL_DEVICE_ID = -1
 
@@ -269,8 +319,8 @@ class HsmsSsControlMessage(HsmsSsMessage):
         return self.CONTROL_DEVICE_ID
 
     def _header10bytes(self):
-        if self.__cache_header10bytes is None:
-            self.__cache_header10bytes = bytes([
+        if self._cache_header10bytes is None:
+            self._cache_header10bytes = bytes([
                 0xFF, 0xFF,
                 0x00, 0x00,
                 self._control_type[0], self._control_type[1],
@@ -278,7 +328,7 @@ class HsmsSsControlMessage(HsmsSsMessage):
                 self._system_bytes[2], self._system_bytes[3]
                 ])
         
-        return self.__cache_header10bytes
+        return self._cache_header10bytes
 
     @classmethod
     def build_select_request(cls, system_bytes):
@@ -16,15 +16,69 @@ class HsmsSsPassiveCommunicator(secs.AbstractHsmsSsCommunicator):
         self.__cdts = list()
         self.__ths = list()
 
-        self.__recv_primary_msg_putter = secs.CallbackQueuing(self._put_recv_primary_msg)
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
         
         self.timeout_rebind = kwargs.get('timeout_rebind', self.__TIMEOUT_REBIND)
 
+        self.__server = kwargs.get('server', None)
+        self.peer_address = kwargs.get('peer_address', None)
+
     def _get_protocol(self):
         return self.__PROTOCOL
 
     def _get_ipaddress(self):
         return self.__ipaddr
+
+    @property
+    def server(self):
+        pass
+
+    @server.getter
+    def server(self):
+        """Shared server getter.
+
+        Set by 'server' keyword argument.
+        If None, communicator binds own port.
+
+        Returns:
+            HsmsSsPassiveServer: server, or None.
+        """
+        return self.__server
+
+    @property
+    def peer_address(self):
+        pass
+
+    @peer_address.setter
+    def peer_address(self, val):
+        """Peer-Address setter.
+
+        Used to route connections if shared server.
+
+        Args:
+            val (str or tuple): IP-Address, or (IP-Address, port). None accepts any peer.
+        """
+        if val is None or isinstance(val, str):
+            self.__peer_address = val
+        else:
+            self.__peer_address = tuple(val)
+
+    @peer_address.getter
+    def peer_address(self):
+        """Peer-Address getter.
+
+        Returns:
+            str or tuple: IP-Address, or (IP-Address, port). None if accepts any peer.
+        """
+        return self.__peer_address
+
+    def _is_peer(self, peer):
+        pa = self.__peer_address
+        if pa is None:
+            return False
+        if isinstance(pa, str):
+            return peer[0] == pa
+        return tuple(peer[0:2]) == pa
     
     @property
     def timeout_rebind(self):
@@ -46,9 +100,12 @@ class HsmsSsPassiveCommunicator(secs.AbstractHsmsSsCommunicator):
             if self.is_open:
                 raise RuntimeError("Already opened")
 
-            th = threading.Thread(target=self.__loop, daemon=True)
-            self.__ths.append(th)
-            th.start()
+            if self.__server is None:
+                th = threading.Thread(target=self.__loop, daemon=True)
+                self.__ths.append(th)
+                th.start()
+            else:
+                self.__server._add_session(self)
 
             super()._open()
 
@@ -136,6 +193,10 @@ class HsmsSsPassiveCommunicator(secs.AbstractHsmsSsCommunicator):
         finally:
             self.__cdts.remove(cdt)
     
+    def _accept_socket(self, sock):
+        # called by HsmsSsPassiveServer, blocking until connection closed
+        self.__accept_socket(sock)
+
     def __accept_socket(self, sock):
         
         qq = secs.WaitingQueuing()
@@ -349,6 +410,9 @@ class HsmsSsPassiveCommunicator(secs.AbstractHsmsSsCommunicator):
 
         self._set_closed()
 
+        if self.__server is not None:
+            self.__server._remove_session(self)
+
         for cdt in self.__cdts:
             with cdt:
                 cdt.notify_all()
@@ -356,3 +420,322 @@ class HsmsSsPassiveCommunicator(secs.AbstractHsmsSsCommunicator):
         for th in self.__ths:
             if th.is_alive():
                 th.join(0.1)
+
+
+class HsmsSsPassiveServer:
+    """Listening port shared by many HsmsSsPassiveCommunicator sessions.
+
+    Accepted connection is routed to session,
+    by SESSION-ID of Select.req if not 0xFFFF, only to that session.
+    Otherwise by peer_address, next to any session without peer_address.
+    Session with peer_address never accepts connection from other peer.
+    Connection is closed if no session is free, after Select.rsp
+    NOT_READY (or ALREADY_USED if that session is connected) for Select.req.
+
+    Only listening port is shared. Each connection still has own threads,
+    same as HsmsSsPassiveCommunicator binding own port.
+
+    Examples:
+        server = secs.HsmsSsPassiveServer('0.0.0.0', 5000)
+        host1 = server.create_session(session_id=1, is_equip=True, peer_address='10.0.0.5')
+        host2 = server.create_session(session_id=2, is_equip=True)
+        server.open()
+        host1.open()
+        host2.open()
+    """
+
+    __TIMEOUT_REBIND = 5.0
+    __TIMEOUT_T7 = 10.0
+    __HEADER_SIZE = 14
+
+    def __init__(self, ip_address, port, **kwargs):
+
+        self.__ipaddr = (ip_address, port)
+
+        self.timeout_rebind = kwargs.get('timeout_rebind', self.__TIMEOUT_REBIND)
+        self.timeout_t7 = kwargs.get('timeout_t7', self.__TIMEOUT_T7)
+        self.name = kwargs.get('name', None)
+
+        self.__sessions = tuple()
+        self.__claimed = set()
+        self.__sessions_lock = threading.Lock()
+
+        self.__server_sock = None
+        self.__cdt = threading.Condition()
+        self.__th = None
+        self.__opened = False
+        self.__closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def timeout_rebind(self):
+        pass
+
+    @timeout_rebind.setter
+    def timeout_rebind(self, val):
+        self.__timeout_rebind = secs.AbstractSecsCommunicator._try_gt_zero(val)
+
+    @timeout_rebind.getter
+    def timeout_rebind(self):
+        return self.__timeout_rebind
+
+    @property
+    def timeout_t7(self):
+        pass
+
+    @timeout_t7.setter
+    def timeout_t7(self, val):
+        """Timeout-T7 setter, until Select.req is received for routing.
+
+        Args:
+            val (int or float): Timeout-T7 value.
+        """
+        self.__timeout_t7 = secs.AbstractSecsCommunicator._try_gt_zero(val)
+
+    @timeout_t7.getter
+    def timeout_t7(self):
+        return self.__timeout_t7
+
+    @property
+    def is_closed(self):
+        pass
+
+    @is_closed.getter
+    def is_closed(self):
+        with self.__cdt:
+            return self.__closed
+
+    def create_session(self, session_id, is_equip, **kwargs):
+        """Create session on this server.
+
+        Args:
+            session_id (int): SESSION-ID.
+            is_equip (bool): True if Equipment.
+            **kwargs: same as HsmsSsPassiveCommunicator, and 'peer_address'.
+
+        Returns:
+            HsmsSsPassiveCommunicator: session, open to accept connection.
+        """
+        return HsmsSsPassiveCommunicator(
+            self.__ipaddr[0], self.__ipaddr[1],
+            session_id, is_equip,
+            server=self,
+            **kwargs)
+
+    def get_sessions(self):
+        """Opened sessions getter.
+
+        Returns:
+            tuple: HsmsSsPassiveCommunicator sessions.
+        """
+        return self.__sessions
+
+    def _add_session(self, comm):
+        with self.__sessions_lock:
+            self.__sessions = self.__sessions + (comm,)
+
+    def _remove_session(self, comm):
+        with self.__sessions_lock:
+            self.__sessions = tuple([x for x in self.__sessions if x is not comm])
+
+    def open(self):
+        """Open server
+        """
+        with self.__cdt:
+            if self.__closed:
+                raise RuntimeError("Already closed")
+            if self.__opened:
+                raise RuntimeError("Already opened")
+            self.__opened = True
+
+        self.__th = threading.Thread(target=self.__loop, daemon=True)
+        self.__th.start()
+
+    def close(self):
+        """Close server
+
+        Sessions are not closed.
+        """
+        with self.__cdt:
+            if self.__closed:
+                return
+            self.__closed = True
+            self.__cdt.notify_all()
+
+            sock = self.__server_sock
+
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except Exception:
+                pass
+
+        if self.__th is not None and self.__th.is_alive():
+            self.__th.join(0.1)
+
+    def __put_error(self, e):
+        for comm in self.__sessions:
+            comm._put_error(e)
+
+    def __loop(self):
+        while not self.is_closed:
+            self.__open_server()
+            with self.__cdt:
+                if self.__closed:
+                    return
+                self.__cdt.wait(self.timeout_rebind)
+
+    def __open_server(self):
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
+
+                # server closes unrouted connections, rebind while those are in TIME_WAIT
+                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                server.bind(self.__ipaddr)
+                server.listen()
+
+                with self.__cdt:
+                    if self.__closed:
+                        return
+                    self.__server_sock = server
+
+                try:
+                    while not self.is_closed:
+                        sock = (server.accept())[0]
+
+                        threading.Thread(
+                            target=self.__accept,
+                            args=(sock, ),
+                            daemon=True
+                            ).start()
+
+                finally:
+                    with self.__cdt:
+                        self.__server_sock = None
+
+        except Exception as e:
+            if not self.is_closed:
+                self.__put_error(secs.HsmsSsCommunicatorError(e))
+
+    def __accept(self, sock):
+        with sock:
+            comm = None
+            try:
+                header = self.__peek_header(sock)
+                if header is None:
+                    return
+
+                comm = self.__claim_session(sock.getpeername(), header)
+                if comm is None:
+                    if (header[8], header[9]) == secs.HsmsSsControlType.SELECT_REQ:
+                        self.__reject_select(sock, header)
+                    self.__put_error(secs.HsmsSsCommunicatorError(
+                        "No free session for " + str(sock.getpeername())))
+                    return
+
+                comm._accept_socket(sock)
+
+            except Exception as e:
+                if not self.is_closed:
+                    if comm is None:
+                        self.__put_error(e)
+                    else:
+                        comm._put_error(e)
+
+            finally:
+                if comm is not None:
+                    with self.__sessions_lock:
+                        self.__claimed.discard(comm)
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except Exception:
+                    pass
+
+    def __peek_header(self, sock):
+        # blocking peek of length and header-10-bytes, without consuming.
+        # socket is shut down if not received until Timeout-T7.
+        lock = threading.Lock()
+        peeking = [True]
+
+        def _t7():
+            with lock:
+                if peeking[0]:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except Exception:
+                        pass
+
+        timer = secs.SecsTimer.get_shared()
+        entry = timer.schedule(self.timeout_t7, _t7)
+
+        try:
+            bs = sock.recv(self.__HEADER_SIZE, socket.MSG_PEEK | socket.MSG_WAITALL)
+
+        except OSError:
+            return None
+
+        finally:
+            timer.cancel(entry)
+            with lock:
+                peeking[0] = False
+
+        if len(bs) < self.__HEADER_SIZE:
+            return None
+
+        return bs
+
+    def __claim_session(self, peer, header):
+
+        session_id = None
+        if (header[8], header[9]) == secs.HsmsSsControlType.SELECT_REQ:
+            v = (header[4] << 8) | header[5]
+            if v != 0xFFFF:
+                session_id = v
+
+        with self.__sessions_lock:
+
+            # peer_address is checked on every routing path
+            free = [
+                x for x in self.__sessions
+                if x not in self.__claimed and (x.peer_address is None or x._is_peer(peer))]
+
+            comm = None
+
+            if session_id is not None:
+
+                # SESSION-ID of Select.req never falls back to other session
+                comm = next((x for x in free if x.session_id == session_id), None)
+
+            else:
+
+                comm = next((x for x in free if x._is_peer(peer)), None)
+
+                if comm is None:
+                    comm = next((x for x in free if x.peer_address is None), None)
+
+            if comm is not None:
+                self.__claimed.add(comm)
+
+            return comm
+
+    def __is_claimed(self, session_id):
+        with self.__sessions_lock:
+            return any(x.session_id == session_id for x in self.__claimed)
+
+    def __reject_select(self, sock, header):
+        session_id = (header[4] << 8) | header[5]
+        if self.__is_claimed(session_id):
+            status = secs.HsmsSsSelectStatus.ALREADY_USED
+        else:
+            status = secs.HsmsSsSelectStatus.NOT_READY
+
+        rsp = secs.HsmsSsControlMessage.build_select_response(
+            secs.HsmsSsMessage.from_bytes(header),
+            status)
+
+        sock.sendall(rsp.to_bytes())
@@ -1,5 +1,7 @@
 import secs
 import threading
+import collections
+import concurrent.futures
 
 
 class Secs1CommunicatorError(secs.SecsCommunicatorError):
@@ -36,10 +38,61 @@ class MsgAndRecvBytesWaitingQueuing(secs.WaitingQueuing):
 
     def __init__(self):
         super(MsgAndRecvBytesWaitingQueuing, self).__init__()
-        self.__msg_queue = list()
+        self.__msg_queue = collections.deque()
+        self.__recv_bytes = bytearray()
 
     def put_recv_bytes(self, bs):
-        self.puts(bs)
+        with self._v_cdt:
+            if bs and not self._is_terminated():
+                self.__recv_bytes.extend(bs)
+                self._v_cdt.notify_all()
+
+    def _poll_vv(self):
+        with self._v_cdt:
+            if self.__recv_bytes:
+                v = self.__recv_bytes[0]
+                del self.__recv_bytes[0]
+                return v
+            else:
+                return None
+
+    def read_into(self, buf, pos, size, timeout=None):
+        """Read received bytes into buffer.
+
+        Args:
+            buf (bytearray): buffer.
+            pos (int): start position of buf.
+            size (int): end position of buf.
+            timeout (float): seconds to wait, if no bytes.
+
+        Returns:
+            int: read bytes count, -1 if timeout or terminated.
+        """
+
+        def _f():
+            n = min(len(self.__recv_bytes), size - pos)
+            if n > 0:
+                buf[pos:(pos + n)] = self.__recv_bytes[0:n]
+                del self.__recv_bytes[0:n]
+                return n
+            else:
+                return -1
+
+        with self._v_cdt:
+
+            if self._is_terminated():
+                return -1
+
+            r = _f()
+            if r > 0:
+                return r
+
+            self._v_cdt.wait(timeout)
+
+            if self._is_terminated():
+                return -1
+
+            return _f()
 
     def entry_msg(self, msg):
         with self._v_cdt:
@@ -55,7 +108,7 @@ class MsgAndRecvBytesWaitingQueuing(secs.WaitingQueuing):
                 return None, None
 
             if self.__msg_queue:
-                return self.__msg_queue.pop(0), None
+                return self.__msg_queue.popleft(), None
 
             v = self._poll_vv()
             if v is not None:
@@ -67,133 +120,177 @@ class MsgAndRecvBytesWaitingQueuing(secs.WaitingQueuing):
                 return None, None
 
             if self.__msg_queue:
-                return self.__msg_queue.pop(0), None
+                return self.__msg_queue.popleft(), None
 
             return None, self._poll_vv()
 
     def recv_bytes_garbage(self, timeout):
 
         with self._v_cdt:
-            del self._vv[:]
+            while True:
+                del self.__recv_bytes[:]
 
-            if self._is_terminated():
-                return
+                if self._is_terminated():
+                    return
 
-            while True:
-                v = self.poll(timeout)
-                if v is None:
+                self._v_cdt.wait(timeout)
+
+                if not self.__recv_bytes:
                     return
 
 
 class SendSecs1MessagePack:
+    """Sending message and its reply, completed by future.
 
-    def __init__(self, msg):
+    Timeout-T3 is started after sended, restarted by each received block of reply.
+    Blocks are built on demand, only present block is held.
+    """
+
+    def __init__(self, msg, timeout_t3, sended_callback, timer):
         self.__msg = msg
         self.__present = 0
+        self.__block = None
+        self.__timeout_t3 = timeout_t3
+        self.__sended_callback = sended_callback
+        self.__timer = timer
+        self.__timer_entry = None
         self.__lock = threading.Lock()
-        self.__cdt = threading.Condition()
-        self.__sended = False
-        self.__except = None
-        self.__timer_resetted = True
-        self.__reply_msg = None
+        self.__future = concurrent.futures.Future()
+        self.__future.add_done_callback(self.__cancel_t3)
 
     def secs1msg(self):
         return self.__msg
 
+    def future(self):
+        """Future getter.
+
+        Returns:
+            concurrent.futures.Future: Reply-Message if W-Bit, otherwise None.
+        """
+        return self.__future
+
     def present_block(self):
-        return (self.__msg.to_blocks())[self.__present]
+        if self.__block is None:
+            self.__block = self.__msg.get_block(self.__present)
+        return self.__block
 
     def next_block(self):
         self.__present += 1
+        self.__block = None
 
     def reset_block(self):
         self.__present = 0
+        self.__block = None
 
     def ebit_block(self):
         return self.present_block().ebit
 
-    def wait_until_sended(self, timeout=None):
-        while True:
-            with self.__lock:
-                if self.__sended:
-                    return
-                elif self.__except is not None:
-                    raise self.__except
-
-            with self.__cdt:
-                self.__cdt.wait(timeout)
-
     def notify_sended(self):
-        with self.__lock:
-            self.__sended = True
-            with self.__cdt:
-                self.__cdt.notify_all()
+        self.__sended_callback(self.__msg)
+        if self.__msg.wbit and self.__timeout_t3 > 0.0:
+            self.__start_t3()
+        else:
+            self.__set_result(None)
 
     def notify_except(self, e):
+        try:
+            self.__future.set_exception(e)
+        except Exception:
+            # already done
+            pass
+
+    def notify_reply_msg(self, msg):
+        self.__set_result(msg)
+
+    def notify_timer_reset(self):
         with self.__lock:
-            self.__except = e
-            with self.__cdt:
-                self.__cdt.notify_all()
+            if self.__timer_entry is None:
+                return
+        self.__start_t3()
 
-    def wait_until_reply(self, timeout):
+    def is_waiting_reply(self):
+        """Reply-waiting getter.
 
+        Returns:
+            bool: True if sended with W-Bit, and reply not received yet.
+        """
         with self.__lock:
-            self.__timer_resetted = True
-
-        while True:
-            with self.__lock:
-                if self.__reply_msg is not None:
-                    return self.__reply_msg
-                elif self.__timer_resetted:
-                    self.__timer_resetted = False
-                else:
-                    return None
+            return self.__timer_entry is not None and not self.__future.done()
 
-            with self.__cdt:
-                self.__cdt.wait(timeout)
+    def __set_result(self, v):
+        try:
+            self.__future.set_result(v)
+        except Exception:
+            # already done
+            pass
 
-    def notify_reply_msg(self, msg):
+    def __start_t3(self):
         with self.__lock:
-            self.__reply_msg = msg
-            with self.__cdt:
-                self.__cdt.notify_all()
+            if self.__future.done():
+                return
+            if self.__timer_entry is not None:
+                self.__timer.cancel(self.__timer_entry)
+            self.__timer_entry = self.__timer.schedule(self.__timeout_t3, self.__timeout_t3_expired)
 
-    def notify_timer_reset(self):
+    def __timeout_t3_expired(self):
+        self.notify_except(Secs1TimeoutT3Error('Timeout-T3', self.__msg))
+
+    def __cancel_t3(self, f):
         with self.__lock:
-            self.__timer_resetted = True
-            with self.__cdt:
-                self.__cdt.notify_all()
+            if self.__timer_entry is not None:
+                self.__timer.cancel(self.__timer_entry)
 
 
 class Secs1SendReplyPackPool:
+    """Sending packs indexed by System-Bytes, removed when completed.
+    """
 
     def __init__(self):
-        self.__packs = list()
+        self.__packs = dict()
         self.__lock = threading.Lock()
+        self.__terminated = False
 
     def append(self, pack):
+        key = pack.secs1msg().system_bytes
+        with self.__lock:
+            if self.__terminated:
+                pack.notify_except(Secs1CommunicatorError("Communicator closed"))
+                return
+            self.__packs[key] = self.__packs.get(key, tuple()) + (pack,)
+
+        pack.future().add_done_callback(lambda f: self.__remove(key, pack))
+
+    def shutdown(self):
         with self.__lock:
-            self.__packs.append(pack)
+            self.__terminated = True
+            pp = [p for v in self.__packs.values() for p in v]
+        for p in pp:
+            p.notify_except(Secs1CommunicatorError("Communicator closed"))
 
-    def remove(self, pack):
+    def __remove(self, key, pack):
         with self.__lock:
-            self.__packs.remove(pack)
+            pp = tuple([p for p in self.__packs.get(key, tuple()) if p is not pack])
+            if pp:
+                self.__packs[key] = pp
+            else:
+                self.__packs.pop(key, None)
 
     def __get_packs(self, system_bytes):
         with self.__lock:
-            return [p for p in self.__packs
-                    if p.secs1msg().system_bytes == system_bytes]
+            return self.__packs.get(system_bytes, tuple())
 
-    def sended(self, msg):
-        for p in self.__get_packs(msg.system_bytes):
-            p.notify_sended()
+    def receive(self, msg):
+        """Complete packs waiting reply by received message.
 
-    def raise_except(self, msg, e):
-        for p in self.__get_packs(msg.system_bytes):
-            p.notify_except(e)
+        Packs not sended yet, or sended without W-Bit, are not completed.
 
-    def receive(self, msg):
-        pp = self.__get_packs(msg.system_bytes)
+        Args:
+            msg (secs.Secs1Message): received message.
+
+        Returns:
+            bool: True if reply of sended pack, otherwise message is primary.
+        """
+        pp = [p for p in self.__get_packs(msg.system_bytes) if p.is_waiting_reply()]
         if pp:
             for p in pp:
                 p.notify_reply_msg(msg)
@@ -228,23 +325,23 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         self.__send_reply_pack_pool = Secs1SendReplyPackPool()
         self.__recv_blocks = list()
 
-        self.__recv_primary_msg_putter = secs.CallbackQueuing(self._put_recv_primary_msg)
-        self.__recv_all_msg_putter = secs.CallbackQueuing(self._put_recv_all_msg)
-        self.__sended_msg_putter = secs.CallbackQueuing(self._put_sended_msg)
+        self.__recv_primary_msg_putter = self._build_callback_queuing(self._put_recv_primary_msg)
+        self.__recv_all_msg_putter = self._build_callback_queuing(self._put_recv_all_msg)
+        self.__sended_msg_putter = self._build_callback_queuing(self._put_sended_msg)
 
-        self.__error_putter = secs.CallbackQueuing(super()._put_error)
+        self.__error_putter = self._build_callback_queuing(super()._put_error)
 
-        self.__recv_block_lstnrs = list()
-        self.__recv_block_putter = secs.CallbackQueuing(self._put_recv_block)
+        self.__recv_block_lstnrs = tuple()
+        self.__recv_block_putter = self._build_callback_queuing(self._put_recv_block)
 
-        self.__try_send_block_lstnrs = list()
-        self.__try_send_block_putter = secs.CallbackQueuing(self._put_try_send_block)
+        self.__try_send_block_lstnrs = tuple()
+        self.__try_send_block_putter = self._build_callback_queuing(self._put_try_send_block)
 
-        self.__sended_block_lstnrs = list()
-        self.__sended_block_putter = secs.CallbackQueuing(self._put_sended_block)
+        self.__sended_block_lstnrs = tuple()
+        self.__sended_block_putter = self._build_callback_queuing(self._put_sended_block)
 
-        self.__secs1_circuit_error_msg_lstnrs = list()
-        self.__secs1_circuit_error_msg_putter = secs.CallbackQueuing(self._put_secs1_circuit_error_msg)
+        self.__secs1_circuit_error_msg_lstnrs = tuple()
+        self.__secs1_circuit_error_msg_putter = self._build_callback_queuing(self._put_secs1_circuit_error_msg)
 
         self.__circuit_th = None
 
@@ -322,6 +419,7 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
 
         self._set_closed()
 
+        self.__send_reply_pack_pool.shutdown()
         self.__recv_primary_msg_putter.shutdown()
         self.__recv_all_msg_putter.shutdown()
         self.__sended_msg_putter.shutdown()
@@ -340,33 +438,34 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         return self.send_secs1_msg(
             secs.Secs1Message(strm, func, wbit, secs2body, system_bytes, device_id, self.is_equip))
 
-    def send_secs1_msg(self, msg):
-
-        pack = SendSecs1MessagePack(msg)
+    def _send_async(self, strm, func, wbit, secs2body, system_bytes, device_id):
+        return self.send_secs1_msg_async(
+            secs.Secs1Message(strm, func, wbit, secs2body, system_bytes, device_id, self.is_equip))
 
+    def send_secs1_msg(self, msg):
         try:
-            self.__send_reply_pack_pool.append(pack)
-
-            self.__msg_and_bytes_queue.entry_msg(pack)
+            return self.send_secs1_msg_async(msg).result()
+        except Secs1CommunicatorError:
+            # message without W-Bit is discarded at close,
+            # listener replying while closing is not failed
+            if msg.wbit or not self.is_closed:
+                raise
+            return None
 
-            timeout_tx = self.timeout_t3 if msg.wbit else -1.0
+    def send_secs1_msg_async(self, msg):
 
-            pack.wait_until_sended()
+        pack = SendSecs1MessagePack(
+            msg,
+            self.timeout_t3,
+            self.__sended_msg_putter.put,
+            secs.SecsTimer.get_shared())
 
-            self.__sended_msg_putter.put(pack.secs1msg())
+        self.__send_reply_pack_pool.append(pack)
 
-            if timeout_tx > 0.0:
-
-                r = pack.wait_until_reply(timeout_tx)
-                if r is None:
-                    raise Secs1TimeoutT3Error('Timeout-T3', pack.secs1msg())
-                else:
-                    return r
-            else:
-                return None
+        if not pack.future().done():
+            self.__msg_and_bytes_queue.entry_msg(pack)
 
-        finally:
-            self.__send_reply_pack_pool.remove(pack)
+        return pack.future()
 
     def _put_recv_bytes(self, bs):
         self.__msg_and_bytes_queue.put_recv_bytes(bs)
@@ -392,7 +491,8 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__recv_block_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__recv_block_lstnrs = self._added_listeners(self.__recv_block_lstnrs, listener)
     
     def remove_recv_block_listener(self, listener):
         """Remove receive-secs1-message-block-listener.
@@ -403,15 +503,13 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__recv_block_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__recv_block_lstnrs = self._removed_listeners(self.__recv_block_lstnrs, listener)
     
     def _put_recv_block(self, block):
         if block is not None:
             for ls in self.__recv_block_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(block)
-                else:
-                    ls(block, self)
+                ls[1](block)
     
     def add_try_send_block_listener(self, listener):
         """Add try-send-secs1-message-block-listener.
@@ -427,7 +525,8 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__try_send_block_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__try_send_block_lstnrs = self._added_listeners(self.__try_send_block_lstnrs, listener)
     
     def remove_try_send_block_listener(self, listener):
         """Remove try-send-secs1-message-block-listener.
@@ -438,15 +537,13 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__try_send_block_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__try_send_block_lstnrs = self._removed_listeners(self.__try_send_block_lstnrs, listener)
     
     def _put_try_send_block(self, block):
         if block is not None:
             for ls in self.__try_send_block_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(block)
-                else:
-                    ls(block, self)
+                ls[1](block)
     
     def add_sended_block_listener(self, listener):
         """Add sended-secs1-message-block-listener.
@@ -462,7 +559,8 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__sended_block_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__sended_block_lstnrs = self._added_listeners(self.__sended_block_lstnrs, listener)
     
     def remove_sended_block_listener(self, listener):
         """Remove sended-secs1-message-block-listener.
@@ -473,15 +571,13 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__sended_block_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__sended_block_lstnrs = self._removed_listeners(self.__sended_block_lstnrs, listener)
     
     def _put_sended_block(self, block):
         if block is not None:
             for ls in self.__sended_block_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(block)
-                else:
-                    ls(block, self)
+                ls[1](block)
 
     def add_secs1_circuit_error_msg_listener(self, listener):
         """Add SECS1-Circuit-error-msg-listener.
@@ -497,7 +593,8 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__secs1_circuit_error_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__secs1_circuit_error_msg_lstnrs = self._added_listeners(self.__secs1_circuit_error_msg_lstnrs, listener)
 
     def remove_secs1_circuit_error_msg_listener(self, listener):
         """Remove SECS1-Circuit-error-msg-listener.
@@ -508,15 +605,13 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         Returns:
             None
         """
-        self.__secs1_circuit_error_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__secs1_circuit_error_msg_lstnrs = self._removed_listeners(self.__secs1_circuit_error_msg_lstnrs, listener)
 
     def _put_secs1_circuit_error_msg(self, msg_obj):
         if msg_obj is not None:
             for ls in self.__secs1_circuit_error_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(msg_obj)
-                else:
-                    ls(msg_obj, self)
+                ls[1](msg_obj)
 
     def __circuit(self):
 
@@ -658,9 +753,9 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
         try:
             self._send_bytes(self.__BYTES_EOT)
 
-            bb = list()
+            bb = bytearray(257)
 
-            r = self.__msg_and_bytes_queue.put_to_list(
+            r = self.__msg_and_bytes_queue.read_into(
                 bb, 0, 1,
                 self.timeout_t2)
 
@@ -689,7 +784,7 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
             m = bb_len + 3
 
             while pos < m:
-                r = self.__msg_and_bytes_queue.put_to_list(
+                r = self.__msg_and_bytes_queue.read_into(
                     bb, pos, m,
                     self.timeout_t1)
 
@@ -705,7 +800,7 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
 
                 pos += r
 
-            if self.__sum_check(bb):
+            if secs.Secs1Framer.check_block(bb, m):
 
                 self._send_bytes(self.__BYTES_ACK)
 
@@ -716,12 +811,12 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
 
                 self.__secs1_circuit_error_msg_putter.put({
                     'msg': 'Sum-Check-Error',
-                    'bytes': bytes(bb)
+                    'bytes': bytes(bb[0:m])
                 })
 
                 return
 
-            block = secs.Secs1MessageBlock(bytes(bb))
+            block = secs.Secs1MessageBlock(bytes(bb[0:m]))
 
             self.__recv_block_putter.put(block)
 
@@ -755,7 +850,10 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
             if block.ebit:
 
                 try:
-                    msg = secs.Secs1Message.from_blocks(self.__recv_blocks)
+                    msg = secs.Secs1Message.from_blocks(
+                        self.__recv_blocks,
+                        self.lazy_secs2body,
+                        self.compact_secs2body)
 
                     if not self.__send_reply_pack_pool.receive(msg):
 
@@ -795,9 +893,3 @@ class AbstractSecs1Communicator(secs.AbstractSecsCommunicator):
 
         except Secs1CommunicatorError as e:
             self._put_error(e)
-
-    @staticmethod
-    def __sum_check(bb):
-        a = sum(bb[1:-2]) & 0xFFFF
-        b = (bb[-2] << 8) | bb[-1]
-        return a == b
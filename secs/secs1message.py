@@ -7,8 +7,151 @@ class Secs1MessageParseError(secs.SecsMessageParseError):
         super(Secs1MessageParseError, self).__init__(msg)
 
 
+class Secs1Framer:
+    """SECS-I block framing on bytes-like objects.
+
+    Sums and splits are computed on memoryview slices, without per-byte lists.
+    Block is length-byte + header-10-bytes + body (max 244 bytes) + checksum-2-bytes.
+    """
+
+    BLOCK_BODY_SIZE = 244
+    MAX_BLOCKS = 0x7FFF
+
+    @staticmethod
+    def checksum(data):
+        """Checksum of bytes.
+
+        Args:
+            data (bytes-like): header and body bytes.
+
+        Returns:
+            int: 16-bit sum
+        """
+        return sum(memoryview(data).cast('B')) & 0xFFFF
+
+    @classmethod
+    def check_block(cls, buf, size):
+        """Test block checksum.
+
+        Args:
+            buf (bytes-like): block bytes, from length-byte.
+            size (int): block size, length-byte value + 3.
+
+        Returns:
+            bool: True if checksum is valid.
+        """
+        mv = memoryview(buf).cast('B')
+        return cls.checksum(mv[1:(size - 2)]) == ((mv[size - 2] << 8) | mv[size - 1])
+
+    @classmethod
+    def count(cls, body_size):
+        """Count of blocks.
+
+        Args:
+            body_size (int): SECS-II body bytes length.
+
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+
+        Returns:
+            int: count of blocks, at least 1.
+        """
+        bs = cls.BLOCK_BODY_SIZE
+        count = max(1, (body_size + bs - 1) // bs)
+
+        if count > cls.MAX_BLOCKS:
+            raise Secs1MessageParseError("blocks overflow")
+
+        return count
+
+    @classmethod
+    def block(cls, header10bytes, body, index, count=None):
+        """Build one block.
+
+        Only the slice of the block is copied from body.
+
+        Args:
+            header10bytes (bytes): header-10-bytes, block-number bytes are replaced.
+            body (bytes-like): SECS-II body bytes.
+            index (int): block index, from 0.
+            count (int): count of blocks. Defaults to None, counted from body.
+
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+            IndexError: if index out of range.
+
+        Returns:
+            bytes: block bytes.
+        """
+        mv = memoryview(body).cast('B')
+        n = len(mv)
+        if count is None:
+            count = cls.count(n)
+
+        if index < 0 or index >= count:
+            raise IndexError("block index out of range")
+
+        bs = cls.BLOCK_BODY_SIZE
+        pos = index * bs
+        x = min(bs, n - pos)
+        num = index + 1
+
+        b4 = (num >> 8) & 0x7F
+        if num == count:
+            b4 |= 0x80
+        b5 = num & 0xFF
+
+        a = (sum(mv[pos:(pos + x)]) + sum(header10bytes)
+             - header10bytes[4] - header10bytes[5] + b4 + b5)
+
+        v = bytearray(x + 13)
+        v[0] = x + 10
+        v[1:11] = header10bytes
+        v[5] = b4
+        v[6] = b5
+        v[11:(11 + x)] = mv[pos:(pos + x)]
+        v[-2] = (a >> 8) & 0xFF
+        v[-1] = a & 0xFF
+        return bytes(v)
+
+    @classmethod
+    def split(cls, header10bytes, body):
+        """Split message to blocks.
+
+        Args:
+            header10bytes (bytes): header-10-bytes, block-number bytes are replaced.
+            body (bytes-like): SECS-II body bytes.
+
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+
+        Returns:
+            list: block bytes.
+        """
+        mv = memoryview(body).cast('B')
+        count = cls.count(len(mv))
+        return [cls.block(header10bytes, mv, i, count) for i in range(count)]
+
+    @staticmethod
+    def join(blocks):
+        """Join body bytes of blocks.
+
+        Args:
+            blocks (list or tuple): Secs1MessageBlock.
+
+        Returns:
+            bytes: SECS-II body bytes.
+        """
+        return b''.join([memoryview(x.to_bytes())[11:-2] for x in blocks])
+
+
 class Secs1Message(secs.SecsMessage):
 
+    __slots__ = (
+        '_system_bytes', '__device_id', '__rbit',
+        '__cache_header10bytes', '__cache_str', '__cache_repr', '__cache_blocks'
+    )
+
     def __init__(self, strm, func, wbit, secs2body, system_bytes, device_id, rbit):
         super(Secs1Message, self).__init__(strm, func, wbit, secs2body)
         self._system_bytes = system_bytes
@@ -83,77 +226,67 @@ class Secs1Message(secs.SecsMessage):
 
     def to_blocks(self):
 
-        def _bb(bs, from_pos):
-            m = len(bs)
-            x = m - from_pos
-            if x > 244:
-                return bs[from_pos:(from_pos + 244)], 244, False
-            else:
-                return bs[from_pos:m], x, True
-
-        def _hh(l_hh, num, l_ebit):
-            b4 = (num >> 8) & 0x7F
-            if l_ebit:
-                b4 |= 0x80
-            b5 = num & 0xFF
-            return bytes([
-                l_hh[0], l_hh[1], l_hh[2], l_hh[3],
-                b4, b5,
-                l_hh[6], l_hh[7], l_hh[8], l_hh[9]
-            ])
-
-        def _sum(l_hh, l_bb):
-            x = sum([i for i in l_hh]) + sum([i for i in l_bb])
-            return bytes([((x >> 8) & 0xFF), (x & 0xFF)])
-        
         if self.__cache_blocks is None:
 
-            h10bs = self._header10bytes()
-            if self.secs2body is None:
-                body_bs = bytes()
-            else:
-                body_bs = self.secs2body.to_bytes()
+            self.__cache_blocks = tuple([
+                Secs1MessageBlock(x)
+                for x in Secs1Framer.split(self._header10bytes(), self.__body_view())])
 
-            blocks = []
-            pos = 0
-            block_num = 0
+        return self.__cache_blocks
 
-            while True:
-                block_num += 1
+    def __body_view(self):
+        if self.secs2body is None:
+            return memoryview(bytes())
+        else:
+            return memoryview(self.secs2body.to_bytes())
 
-                if block_num > 0x7FFF:
-                    raise Secs1MessageParseError("blocks overflow")
-                
-                bb, shift, ebit = _bb(body_bs, pos)
-                hh = _hh(h10bs, block_num, ebit)
-                ss = _sum(hh, bb)
+    def block_count(self):
+        """Count of blocks.
+
+        Returns:
+            int: count of blocks, without building blocks.
+        """
+        if self.__cache_blocks is None:
+            return Secs1Framer.count(len(self.__body_view()))
+        else:
+            return len(self.__cache_blocks)
 
-                v = Secs1MessageBlock(bytes([shift + 10]) + hh + bb + ss)
-                blocks.append(v)
+    def get_block(self, index):
+        """Block getter.
 
-                if ebit:
-                    break
+        If blocks are not cached by to_blocks, block is built on demand
+        from memoryview of body, and not cached.
 
-                pos += shift
+        Args:
+            index (int): block index, from 0.
 
-            self.__cache_blocks = tuple(blocks)
+        Raises:
+            Secs1MessageParseError: if blocks > 0x7FFF.
+            IndexError: if index out of range.
 
-        return self.__cache_blocks
+        Returns:
+            Secs1MessageBlock: block.
+        """
+        if self.__cache_blocks is None:
+            return Secs1MessageBlock(
+                Secs1Framer.block(self._header10bytes(), self.__body_view(), index))
+        else:
+            return self.__cache_blocks[index]
 
     @classmethod
-    def from_blocks(cls, blocks):
+    def from_blocks(cls, blocks, lazy=False, compact=False):
 
         if blocks is None or len(blocks) == 0:
             raise Secs1MessageParseError("No blocks")
 
-        bs = b''.join([(x.to_bytes())[11:-2] for x in blocks])
+        bs = Secs1Framer.join(blocks)
 
         try:
             v = Secs1Message(
                 blocks[0].strm,
                 blocks[0].func,
                 blocks[0].wbit,
-                secs.Secs2BodyBuilder.from_body_bytes(bs) if bs else None,
+                secs.Secs2BodyBuilder.from_body_bytes(memoryview(bs), lazy, compact) if bs else None,
                 blocks[0].get_system_bytes(),
                 blocks[0].device_id,
                 blocks[0].rbit
@@ -167,6 +300,8 @@ class Secs1Message(secs.SecsMessage):
 
 class Secs1MessageBlock:
 
+    __slots__ = ('__bytes', '__cache_str', '__cache_repr')
+
     def __init__(self, block_bytes):
         self.__bytes = block_bytes
         self.__cache_str = None
@@ -174,7 +309,7 @@ class Secs1MessageBlock:
 
     def __str__(self):
         if self.__cache_str is None:
-            self._cache_str = (
+            self.__cache_str = (
                 '[' + '{:02X}'.format(self.__bytes[1])
                 + ' ' + '{:02X}'.format(self.__bytes[2])
                 + '|' + '{:02X}'.format(self.__bytes[3])
@@ -187,7 +322,7 @@ class Secs1MessageBlock:
                 + ' ' + '{:02X}'.format(self.__bytes[10])
                 + '] length: ' + str(self.__bytes[0])
                 )
-        return self._cache_str
+        return self.__cache_str
 
     def __repr__(self):
         if self.__cache_repr is None:
@@ -87,6 +87,44 @@ class Secs1OnPySerialCommunicator(secs.AbstractSecs1Communicator):
         except Exception as e:
             self._put_error(e)
 
+    def __start_reading(self, ser, cdt):
+        # return reading thread, or None if read on reactor
+        if self.reactor is None or not hasattr(ser, 'fileno'):
+
+            def _f():
+                self._reading(ser)
+                with cdt:
+                    cdt.notify_all()
+
+            th = threading.Thread(target=_f, daemon=True)
+            th.start()
+            self.__ths.append(th)
+            return th
+
+        def _readable():
+            try:
+                bs = ser.read(ser.in_waiting or 1)
+            except Exception as e:
+                if not self.is_closed:
+                    self._put_error(e)
+                bs = None
+
+            if bs:
+                self._put_recv_bytes(bs)
+            else:
+                self.reactor.unregister(ser)
+                with cdt:
+                    cdt.notify_all()
+
+        def _error(e):
+            if not self.is_closed:
+                self._put_error(e)
+            with cdt:
+                cdt.notify_all()
+
+        self.reactor.register(ser, _readable, _error)
+        return None
+
     def _open(self):
         with self._open_close_rlock:
             if self.is_closed:
@@ -116,16 +154,9 @@ class Secs1OnPySerialCommunicator(secs.AbstractSecs1Communicator):
                                 ser.port = self.__port
                                 ser.open()
 
-                                def _ff():
-                                    self._reading(ser)
-                                    with cdt:
-                                        cdt.notify_all()
-
-                                th_r = threading.Thread(target=_ff, daemon=True)
-                                th_r.start()
+                                th_r = self.__start_reading(ser, cdt)
 
                                 try:
-                                    self.__ths.append(th_r)
                                     self.__set_serial(ser)
 
                                     with cdt:
@@ -133,7 +164,10 @@ class Secs1OnPySerialCommunicator(secs.AbstractSecs1Communicator):
 
                                 finally:
                                     self.__unset_serial()
-                                    self.__ths.remove(th_r)
+                                    if th_r is None:
+                                        self.reactor.unregister(ser)
+                                    else:
+                                        self.__ths.remove(th_r)
 
                             finally:
                                 try:
@@ -48,6 +48,50 @@ class AbstractSecs1OnTcpIpCommunicator(secs.AbstractSecs1Communicator):
             if not self.is_closed:
                 self._put_error(e)
 
+    def _start_reading(self, sock, cdt, ths):
+        # return reading thread, or None if read on reactor
+        if self.reactor is None:
+
+            def _f():
+                self._reading(sock)
+                with cdt:
+                    cdt.notify_all()
+
+            th = threading.Thread(target=_f, daemon=True)
+            th.start()
+            ths.append(th)
+            return th
+
+        def _readable():
+            try:
+                bs = sock.recv(4096)
+            except Exception as e:
+                if not self.is_closed:
+                    self._put_error(e)
+                bs = None
+
+            if bs:
+                self._put_recv_bytes(bs)
+            else:
+                self.reactor.unregister(sock)
+                with cdt:
+                    cdt.notify_all()
+
+        def _error(e):
+            if not self.is_closed:
+                self._put_error(e)
+            with cdt:
+                cdt.notify_all()
+
+        self.reactor.register(sock, _readable, _error)
+        return None
+
+    def _stop_reading(self, sock, th, ths):
+        if th is None:
+            self.reactor.unregister(sock)
+        else:
+            ths.remove(th)
+
 
 class Secs1OnTcpIpCommunicator(AbstractSecs1OnTcpIpCommunicator):
 
@@ -118,22 +162,15 @@ class Secs1OnTcpIpCommunicator(AbstractSecs1OnTcpIpCommunicator):
                                 try:
                                     sock.connect(self.__ipaddr)
 
-                                    def _f():
-                                        self._reading(sock)
-                                        with cdt:
-                                            cdt.notify_all()
-
-                                    th_r = threading.Thread(target=_f, daemon=True)
-                                    th_r.start()
+                                    th_r = self._start_reading(sock, cdt, self.__ths)
 
                                     try:
-                                        self.__ths.append(th_r)
                                         self._add_socket(sock)
 
                                         with cdt:
                                             cdt.wait()
                                     finally:
-                                        self.__ths.remove(th_r)
+                                        self._stop_reading(sock, th_r, self.__ths)
                                         self._remove_socket(sock)
 
                                 finally:
@@ -296,16 +333,9 @@ class Secs1OnTcpIpReceiverCommunicator(AbstractSecs1OnTcpIpCommunicator):
             try:
                 self.__cdts.append(cdt)
 
-                def _f():
-                    self._reading(sock)
-                    with cdt:
-                        cdt.notify_all()
-
-                th_r = threading.Thread(target=_f, daemon=True)
-                th_r.start()
+                th_r = self._start_reading(sock, cdt, self.__ths)
 
                 try:
-                    self.__ths.append(th_r)
                     self._add_socket(sock)
                     
                     with cdt:
@@ -313,7 +343,7 @@ class Secs1OnTcpIpReceiverCommunicator(AbstractSecs1OnTcpIpCommunicator):
 
                 finally:
                     self._remove_socket(sock)
-                    self.__ths.remove(th_r)
+                    self._stop_reading(sock, th_r, self.__ths)
 
             finally:
                 self.__cdts.remove(cdt)
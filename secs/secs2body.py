@@ -1,5 +1,9 @@
+import io
 import os
+import sys
 import struct
+import array
+import importlib
 
 
 class Secs2BodyParseError(Exception):
@@ -16,11 +20,17 @@ class Secs2BodyBytesParseError(Secs2BodyParseError):
 
 class AbstractSecs2Body:
 
+    __slots__ = (
+        '_type',
+        '__cache_sml', '__cache_repr', '__cache_bytes', '__cache_byte_size'
+    )
+
     _BYTES_LEN_3 = 2**16
     _BYTES_LEN_2 = 2**8
     _SML_TAB = '  '
     _SML_VALUESEPARATOR = ' '
     _SML_LINESEPARATOR = os.linesep
+    _SML_WRITE_CHUNK = 1024
 
     def __init__(self, item_type, value):
         self._type = item_type
@@ -28,6 +38,7 @@ class AbstractSecs2Body:
         self.__cache_sml = None
         self.__cache_repr = None
         self.__cache_bytes = None
+        self.__cache_byte_size = None
 
     def __str__(self):
         return self.to_sml()
@@ -135,6 +146,27 @@ class AbstractSecs2Body:
             self.__cache_sml = self._create_to_sml()
         return self.__cache_sml
 
+    def write_sml(self, stream, max_depth=None, max_items=None):
+        """Write SML to stream.
+
+        Written piece by piece, without building whole SML string.
+
+        Args:
+            stream (io.TextIOBase): text stream, or object has write(str).
+            max_depth (int): 'L' nested deeper than max_depth are written as '<L [n] ... >'.
+                Defaults to None, no limit.
+            max_items (int): write first max_items of values and 'L' items, and '...'.
+                Defaults to None, no limit.
+
+        Returns:
+            None: None
+
+        Examples:
+            write_sml(sys.stdout, max_items=100)
+            <U4 [50000] 0 1 2 ... 99 ... >
+        """
+        self._write_sml(stream, '', max_depth, max_items)
+
     def to_bytes(self):
         """bytes getter.
 
@@ -145,6 +177,66 @@ class AbstractSecs2Body:
             self.__cache_bytes = self._create_to_bytes()
         return self.__cache_bytes
 
+    def byte_size(self):
+        """bytes length getter.
+
+        Computed from item lengths, without encoding values.
+
+        Returns:
+            int: length of to_bytes()
+        """
+        if self.__cache_byte_size is None:
+            if self.__cache_bytes is None:
+                self.__cache_byte_size = self._create_byte_size()
+            else:
+                self.__cache_byte_size = len(self.__cache_bytes)
+        return self.__cache_byte_size
+
+    def write_into(self, buffer, offset=0):
+        """Write bytes into buffer.
+
+        Args:
+            buffer (bytearray or memoryview): writable buffer, require byte_size() bytes from offset.
+            offset (int): write position. Defaults to 0.
+
+        Returns:
+            int: position next to written bytes.
+        """
+        if self.__cache_bytes is None:
+            return self._write_into(buffer, offset)
+        else:
+            end = offset + len(self.__cache_bytes)
+            buffer[offset:end] = self.__cache_bytes
+            return end
+
+    def to_numpy(self):
+        """numpy.ndarray getter.
+
+        Supports 'B', 'BOOLEAN', 'I1'-'I8', 'U1'-'U8', 'F4', 'F8'.
+        Require NumPy.
+
+        Raises:
+            TypeError: if 'L' or 'A'.
+
+        Returns:
+            numpy.ndarray: values, native byte order.
+        """
+        np = importlib.import_module('numpy')
+
+        tt = self._type
+        if tt[0] == 'BOOLEAN':
+            return np.frombuffer(self._create_to_bytes_value(), dtype='u1') != 0
+        elif tt[2] > 0:
+            if tt[4] is None:
+                dt = np.dtype('>f' + str(tt[2]))
+            elif tt[4]:
+                dt = np.dtype('>i' + str(tt[2]))
+            else:
+                dt = np.dtype('>u' + str(tt[2]))
+            return np.frombuffer(self._create_to_bytes_value(), dtype=dt).astype(dt.newbyteorder('='))
+        else:
+            raise TypeError(tt[0] + " not support to_numpy")
+
     def _create_to_sml(self):
         l, v = self._create_to_sml_value()
         return '<' + self._type[0] + ' [' + str(l) + '] ' + str(v) + ' >'
@@ -152,6 +244,41 @@ class AbstractSecs2Body:
     def _create_to_sml_value(self):
         return 0, ''
 
+    def _write_sml(self, stream, level, max_depth, max_items):
+        stream.write(level + '<' + self._type[0] + ' [' + str(len(self)) + '] ')
+        self._write_sml_value(stream, max_items)
+        stream.write(' >')
+
+    def _write_sml_value(self, stream, max_items):
+        n = len(self)
+        m = n if max_items is None else min(n, max_items)
+        sep = self._SML_VALUESEPARATOR
+        for i in range(0, m, self._SML_WRITE_CHUNK):
+            if i > 0:
+                stream.write(sep)
+            stream.write(sep.join(self._sml_values(i, min(m, (i + self._SML_WRITE_CHUNK)))))
+        if m < n:
+            stream.write((sep + '...') if m > 0 else '...')
+
+    def _sml_values(self, start, stop):
+        return [str(x) for x in self._value[start:stop]]
+
+    def _write_sml_list(self, stream, level, max_depth, max_items):
+        n = len(self)
+        stream.write(level + '<L [' + str(n) + ']')
+        if n > 0 and max_depth is not None and max_depth < 1:
+            stream.write(' ... >')
+            return
+        deep_level = level + self._SML_TAB
+        deep_depth = None if max_depth is None else (max_depth - 1)
+        m = n if max_items is None else min(n, max_items)
+        for i in range(m):
+            stream.write(self._SML_LINESEPARATOR)
+            self[i]._write_sml(stream, deep_level, deep_depth, max_items)
+        if m < n:
+            stream.write(self._SML_LINESEPARATOR + deep_level + '...')
+        stream.write(self._SML_LINESEPARATOR + level + '>')
+
     def _create_to_bytes(self):
         bs_vv = self._create_to_bytes_value()
         v_len = len(bs_vv)
@@ -166,6 +293,39 @@ class AbstractSecs2Body:
     def _create_to_bytes_value(self):
         return self._value
 
+    def _create_byte_size(self):
+        v_len = self._value_byte_size()
+        return self._header_size(v_len) + v_len
+
+    def _value_byte_size(self):
+        return len(self._create_to_bytes_value())
+
+    def _header_size(self, v_len):
+        if v_len >= self._BYTES_LEN_3:
+            return 4
+        elif v_len >= self._BYTES_LEN_2:
+            return 3
+        else:
+            return 2
+
+    def _write_header_into(self, buffer, offset, v_len):
+        if v_len >= self._BYTES_LEN_3:
+            struct.pack_into('>BBH', buffer, offset, (self._type[1] | 0x03), (v_len >> 16) & 0xFF, v_len & 0xFFFF)
+            return offset + 4
+        elif v_len >= self._BYTES_LEN_2:
+            struct.pack_into('>BH', buffer, offset, (self._type[1] | 0x02), v_len)
+            return offset + 3
+        else:
+            struct.pack_into('>BB', buffer, offset, (self._type[1] | 0x01), v_len)
+            return offset + 2
+
+    def _write_into(self, buffer, offset):
+        bs = self._create_to_bytes_value()
+        pos = self._write_header_into(buffer, offset, len(bs))
+        end = pos + len(bs)
+        buffer[pos:end] = bs
+        return end
+
     @staticmethod
     def _tiof(value, item_size, is_signed):    # test_int_overflow return int_value
 
@@ -188,22 +348,72 @@ class AbstractSecs2Body:
             v_min = 0
         
         if v > v_max or v < v_min:
-            raise ValueError("value is from " + str(min) + " to " + str(max) + ", value is " + str(v))
+            raise ValueError("value is from " + str(v_min) + " to " + str(v_max) + ", value is " + str(v))
 
         return v
 
+    @staticmethod
+    def _tiofs(values, item_type):    # test_int_overflow of all values at once, return int_values tuple
+
+        try:
+            vv = tuple(map(int, values))
+        except ValueError:
+            vv = tuple([
+                (int(x[2:], 16) if (type(x) is str and x.upper().startswith("0X")) else int(x))
+                for x in values])
+
+        if vv:
+            v_min, v_max = Secs2BodyBuilder._INT_RANGES[item_type[0]]
+            x_min = min(vv)
+            x_max = max(vv)
+            if x_max > v_max or x_min < v_min:
+                v = x_max if x_max > v_max else x_min
+                raise ValueError("value is from " + str(v_min) + " to " + str(v_max) + ", value is " + str(v))
+
+        return vv
+
+    @staticmethod
+    def _int_range(item_type):  # return (min, max)
+        n = item_type[2] * 8
+        if item_type[4]:
+            x = 2**(n - 1)
+            return -x, (x - 1)
+        else:
+            return 0, (2**n - 1)
+
     
 class Secs2AsciiBody(AbstractSecs2Body):
 
+    __slots__ = ('_extended', '__value')
+
     def __init__(self, item_type, value):
         self._extended = os.getenv('SECS_EXTENDED')
 
-        if self._extended:
+        if self._extended or type(value) is memoryview:
             super(Secs2AsciiBody, self).__init__(item_type, value)  # Keep it as is
             return
 
         super(Secs2AsciiBody, self).__init__(item_type, str(value))
 
+    @property
+    def _value(self):
+        v = self.__value
+        if type(v) is memoryview:
+            # decode received view on first touch
+            try:
+                if self._extended and not all([c <= 128 for c in v]):
+                    v = bytes(v)
+                else:
+                    v = str(v, 'ascii')
+            except UnicodeDecodeError as e:
+                raise Secs2BodyBytesParseError(e)
+            self.__value = v
+        return v
+
+    @_value.setter
+    def _value(self, val):
+        self.__value = val
+
     def _create_to_sml_value(self):
         # ret = len(self._value), ('"' + self._value + '"')
         s = self._value
@@ -211,7 +421,20 @@ class Secs2AsciiBody(AbstractSecs2Body):
             s = ''.join(['%c' % c for c in s])
         return len(s), (f'"{s}"')
 
+    def _write_sml_value(self, stream, max_items):
+        s = self._value
+        suffix = ''
+        if max_items is not None and len(s) > max_items:
+            s = s[:max_items]
+            suffix = self._SML_VALUESEPARATOR + '...'
+        if self._extended:
+            s = ''.join(['%c' % c for c in s])
+        stream.write('"' + s + '"' + suffix)
+
     def _create_to_bytes_value(self):
+        if type(self.__value) is memoryview:
+            return self.__value
+
         if self._extended:
             s = self._value
             if type(s) is str:
@@ -223,12 +446,14 @@ class Secs2AsciiBody(AbstractSecs2Body):
         return self._value.encode(encoding='ascii')
 
     @staticmethod
-    def build(item_type, value):
+    def build(item_type, value, trusted=False):
         return Secs2AsciiBody(item_type, value)
 
 
 class Secs2BooleanBody(AbstractSecs2Body):
 
+    __slots__ = ('_value', )
+
     def __init__(self, item_type, value):
         tv = type(value)
         if tv is tuple or tv is list:
@@ -246,92 +471,240 @@ class Secs2BooleanBody(AbstractSecs2Body):
         vv = [("TRUE" if x else "FALSE") for x in self._value]
         return len(vv), self._SML_VALUESEPARATOR.join(vv)
 
+    def _sml_values(self, start, stop):
+        return [("TRUE" if x else "FALSE") for x in self._value[start:stop]]
+
     def _create_to_bytes_value(self):
         return bytes([(0xFF if v else 0x00) for v in self._value])
 
+    def _value_byte_size(self):
+        return len(self._value)
+
     @staticmethod
-    def build(item_type, value):
+    def build(item_type, value, trusted=False):
         return Secs2BooleanBody(item_type, value)
 
 
 class Secs2BinaryBody(AbstractSecs2Body):
 
-    def __init__(self, item_type, value):
+    __slots__ = ('__value', )
+
+    def __init__(self, item_type, value, trusted=False):
         tv = type(value)
-        if tv is bytes:
+        if tv is bytes or tv is memoryview:
             super(Secs2BinaryBody, self).__init__(item_type, value)
         elif tv is bytearray:
             super(Secs2BinaryBody, self).__init__(item_type, bytes(value))
         elif tv is tuple or tv is list:
             super(Secs2BinaryBody, self).__init__(
                 item_type,
-                bytes([self._tiof(x, item_type[2], item_type[4]) for x in value])
+                bytes(value if trusted else self._tiofs(value, item_type))
                 )
         else:
             super(Secs2BinaryBody, self).__init__(
                 item_type,
-                bytes([self._tiof(value, item_type[2], item_type[4])])
+                bytes(self._tiofs((value, ), item_type))
                 )
 
+    @property
+    def _value(self):
+        v = self.__value
+        if type(v) is memoryview:
+            # copy received view on first touch
+            v = self.__value = v.tobytes()
+        return v
+
+    @_value.setter
+    def _value(self, val):
+        self.__value = val
+
+    def __len__(self):
+        return len(self.__value)
+
     def _create_to_sml_value(self):
         vv = [('0x' + '{:02X}'.format(x)) for x in self._value]
         return len(vv), self._SML_VALUESEPARATOR.join(vv)
 
+    def _sml_values(self, start, stop):
+        return [('0x' + '{:02X}'.format(x)) for x in self._value[start:stop]]
+
+    def _create_to_bytes_value(self):
+        return self.__value
+
     @staticmethod
-    def build(item_type, value):
-        return Secs2BinaryBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2BinaryBody(item_type, value, trusted)
 
 
 class AbstractSecs2NumberBody(AbstractSecs2Body):
 
+    __slots__ = ('_value', )
+
+    _ARRAY_BYTESWAP = sys.byteorder == 'little'
+    _ARRAY_TYPECODES = dict()
+
     def __init__(self, item_type, value):
-        super(AbstractSecs2NumberBody, self).__init__(item_type, tuple(value))
+        if self._is_ndarray(value):
+            value = self._array_from_numpy(item_type, value)
+        if type(value) is array.array:
+            tc = self._array_typecode(item_type)
+            if value.typecode != tc:
+                try:
+                    value = array.array(tc, value)
+                except OverflowError as e:
+                    raise ValueError(e)
+            super(AbstractSecs2NumberBody, self).__init__(item_type, value)
+        else:
+            super(AbstractSecs2NumberBody, self).__init__(item_type, tuple(value))
+
+    @classmethod
+    def _array_typecode(cls, item_type):
+        """array.array typecode of same size and sign as item_type.
+
+        Returns:
+            str: typecode
+        """
+        tc = cls._ARRAY_TYPECODES.get(item_type[0])
+        if tc is None:
+            if item_type[4] is None:
+                cc = item_type[3]
+            elif item_type[4]:
+                cc = 'bhilq'
+            else:
+                cc = 'BHILQ'
+            tc = [c for c in cc if array.array(c).itemsize == item_type[2]][0]
+            cls._ARRAY_TYPECODES[item_type[0]] = tc
+        return tc
+
+    @classmethod
+    def _array_from_bytes(cls, item_type, bs):
+        """Decode big-endian bytes to array.array.
+
+        Args:
+            item_type (tuple): item type.
+            bs (bytes or memoryview): big-endian values.
+
+        Returns:
+            array.array: values
+        """
+        a = array.array(cls._array_typecode(item_type))
+        a.frombytes(bs)
+        if cls._ARRAY_BYTESWAP:
+            a.byteswap()
+        return a
+
+    @staticmethod
+    def _is_ndarray(value):
+        np = sys.modules.get('numpy')
+        return np is not None and isinstance(value, np.ndarray)
+
+    @classmethod
+    def _array_from_numpy(cls, item_type, value):
+        """Convert numpy.ndarray to array.array without per-element objects.
+
+        Raises:
+            ValueError: if integer value out of range, or not finite.
+
+        Returns:
+            array.array: values
+        """
+        np = sys.modules['numpy']
+        tc = cls._array_typecode(item_type)
+        if item_type[4] is not None and value.size > 0:
+            if value.dtype.kind in 'fc' and not np.isfinite(value).all():
+                raise ValueError("value is not finite")
+            v_min, v_max = Secs2BodyBuilder._INT_RANGES[item_type[0]]
+            if value.min() < v_min or value.max() > v_max:
+                raise ValueError("value is from " + str(v_min) + " to " + str(v_max))
+        a = array.array(tc)
+        a.frombytes(memoryview(np.ascontiguousarray(value, dtype=np.dtype(tc)).reshape(-1)).cast('B'))
+        return a
+
+    def to_numpy(self):
+        v = self._value
+        if type(v) is array.array:
+            np = importlib.import_module('numpy')
+            return np.frombuffer(v, dtype=np.dtype(v.typecode)).copy()
+        else:
+            return super(AbstractSecs2NumberBody, self).to_numpy()
 
     def _create_to_sml_value(self):
         vv = [str(x) for x in self._value]
         return len(vv), self._SML_VALUESEPARATOR.join(vv)
 
     def _create_to_bytes_value(self):
-        return b''.join([struct.pack(('>' + self._type[3]), x) for x in self._value])
+        v = self._value
+        if type(v) is array.array:
+            if self._ARRAY_BYTESWAP:
+                v = v[:]
+                v.byteswap()
+            return v.tobytes()
+        else:
+            return struct.pack(('>' + str(len(v)) + self._type[3]), *v)
+
+    def _value_byte_size(self):
+        return len(self._value) * self._type[2]
+
+    def _write_into(self, buffer, offset):
+        v = self._value
+        if type(v) is array.array:
+            return super(AbstractSecs2NumberBody, self)._write_into(buffer, offset)
+        else:
+            pos = self._write_header_into(buffer, offset, len(v) * self._type[2])
+            struct.pack_into(('>' + str(len(v)) + self._type[3]), buffer, pos, *v)
+            return pos + len(v) * self._type[2]
 
 
 class Secs2IntegerBody(AbstractSecs2NumberBody):
 
-    def __init__(self, item_type, value):
+    __slots__ = ()
+
+    def __init__(self, item_type, value, trusted=False):
         tv = type(value)
-        if tv is tuple or tv is list:
+        if tv is array.array or self._is_ndarray(value):
+            super(Secs2IntegerBody, self).__init__(item_type, value)
+        elif tv is tuple or tv is list:
             super(Secs2IntegerBody, self).__init__(
                 item_type,
-                [self._tiof(x, item_type[2], item_type[4]) for x in value]
+                value if trusted else self._tiofs(value, item_type)
                 )
         else:
             super(Secs2IntegerBody, self).__init__(
                 item_type,
-                [self._tiof(value, item_type[2], item_type[4])]
+                self._tiofs((value, ), item_type)
                 )
 
     @staticmethod
-    def build(item_type, value):
-        return Secs2IntegerBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2IntegerBody(item_type, value, trusted)
 
 
 class Secs2FloatBody(AbstractSecs2NumberBody):
 
-    def __init__(self, item_type, value):
+    __slots__ = ()
+
+    def __init__(self, item_type, value, trusted=False):
         tv = type(value)
-        if tv is tuple or tv is list:
-            super(Secs2FloatBody, self).__init__(item_type, [float(x) for x in value])
+        if tv is array.array or self._is_ndarray(value):
+            super(Secs2FloatBody, self).__init__(item_type, value)
+        elif tv is tuple or tv is list:
+            super(Secs2FloatBody, self).__init__(
+                item_type,
+                value if trusted else tuple(map(float, value))
+                )
         else:
-            super(Secs2FloatBody, self).__init__(item_type, [float(value)])
+            super(Secs2FloatBody, self).__init__(item_type, (float(value), ))
 
     @staticmethod
-    def build(item_type, value):
-        return Secs2FloatBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2FloatBody(item_type, value, trusted)
 
 
 class Secs2ListBody(AbstractSecs2Body):
 
-    def __init__(self, item_type, value):
+    __slots__ = ('_value', )
+
+    def __init__(self, item_type, value, trusted=False):
 
         tv = type(value)
         if tv is tuple or tv is list:
@@ -343,7 +716,7 @@ class Secs2ListBody(AbstractSecs2Body):
                 else:
                     tx = type(x)
                     if (tx is tuple or tx is list) and (len(x) == 2):
-                        vv.append(Secs2BodyBuilder.build(x[0], x[1]))
+                        vv.append(Secs2BodyBuilder.build(x[0], x[1], trusted))
                     else:
                         raise TypeError("L value require tuple or list, and length == 2")
 
@@ -353,35 +726,167 @@ class Secs2ListBody(AbstractSecs2Body):
             raise TypeError("L values require tuple or list")
             
     def _create_to_sml(self):
+        stream = io.StringIO()
+        self._write_sml_list(stream, '', None, None)
+        return stream.getvalue()
 
-        def _lsf(value, level=''):  # create_list_sml_string
-            deep_level = level + self._SML_TAB
-            vv = list()
-            vv.append(level + '<L [' + str(len(value)) + ']')
-            for x in value:
-                if x.type == 'L':
-                    vv.append(_lsf(x.value, deep_level))
-                else:
-                    vv.append(deep_level + x.to_sml())
-            vv.append(level + '>')
-            return self._SML_LINESEPARATOR.join(vv)
-
-        return _lsf(self._value)
+    def _write_sml(self, stream, level, max_depth, max_items):
+        self._write_sml_list(stream, level, max_depth, max_items)
 
     def _create_to_bytes(self):
+        buffer = bytearray(self.byte_size())
+        self._write_into(buffer, 0)
+        return bytes(buffer)
+
+    def _create_byte_size(self):
         v_len = len(self._value)
-        bs_len = struct.pack('>L', v_len)
-        bs_vv = b''.join([x.to_bytes() for x in self._value])
-        if v_len >= self._BYTES_LEN_3:
-            return struct.pack('>B', (self._type[1] | 0x03)) + bs_len[1:4] + bs_vv
-        elif v_len >= self._BYTES_LEN_2:
-            return struct.pack('>B', (self._type[1] | 0x02)) + bs_len[2:4] + bs_vv
-        else:
-            return struct.pack('>B', (self._type[1] | 0x01)) + bs_len[3:4] + bs_vv
+        return self._header_size(v_len) + sum([x.byte_size() for x in self._value])
+
+    def _write_into(self, buffer, offset):
+        pos = self._write_header_into(buffer, offset, len(self._value))
+        for x in self._value:
+            pos = x.write_into(buffer, pos)
+        return pos
 
     @staticmethod
-    def build(item_type, value):
-        return Secs2ListBody(item_type, value)
+    def build(item_type, value, trusted=False):
+        return Secs2ListBody(item_type, value, trusted)
+
+
+
+class Secs2LazyBody(AbstractSecs2Body):
+    """SECS-II body decoded on demand.
+
+    Backed by the received body bytes. Only item headers are read
+    until a value is accessed, and only the accessed subtree is decoded.
+    Parse errors are raised on access as Secs2BodyBytesParseError.
+    Trailing bytes after a non-empty list are detected when the list end is reached,
+    by to_bytes or decoding the list.
+    """
+
+    __slots__ = (
+        '__bs', '__pos', '__compact', '__start', '__v_len', '__end', '__bytes_end',
+        '__offsets', '__children', '__decoded'
+    )
+
+    def __init__(self, body_bytes, pos=0, compact=False, end=None):
+        # end: bytes end of root item, item must end at it
+        tt, start_index, v_len = Secs2BodyBuilder._item_header(body_bytes, pos)
+        super(Secs2LazyBody, self).__init__(tt, None)
+        self.__bs = body_bytes
+        self.__pos = pos
+        self.__compact = compact
+        self.__start = start_index
+        self.__v_len = v_len
+        self.__bytes_end = end
+        if tt[0] == 'L' and v_len > 0:
+            # checked when end is reached
+            self.__end = None
+        else:
+            self.__end = start_index + v_len
+            self.__check_bytes_end(self.__end)
+        self.__offsets = None
+        self.__children = None
+        self.__decoded = None
+
+    @property
+    def _value(self):
+        if self._type[0] == 'L':
+            return tuple([self.__child(i) for i in range(self.__v_len)])
+        else:
+            return self.__decode()._value
+
+    @_value.setter
+    def _value(self, val):
+        # value is always decoded from body bytes
+        pass
+
+    def __len__(self):
+        if self._type[0] == 'L':
+            return self.__v_len
+        else:
+            return len(self.__decode())
+
+    def __getitem__(self, item):
+        if self._type[0] == 'L' and type(item) is int:
+            i = item + self.__v_len if item < 0 else item
+            if i < 0 or i >= self.__v_len:
+                raise Secs2BodyParseError("list index out of range")
+            return self.__child(i)
+        else:
+            return super(Secs2LazyBody, self).__getitem__(item)
+
+    def __offset(self, index):  # offset index, extended up to index on demand
+        if self.__offsets is None:
+            self.__offsets = [self.__start]
+        while len(self.__offsets) <= index:
+            self.__offsets.append(Secs2BodyBuilder._skip_item(self.__bs, self.__offsets[-1]))
+        return self.__offsets[index]
+
+    def __child(self, index):
+        if self.__children is None:
+            self.__children = [None] * self.__v_len
+
+        v = self.__children[index]
+        if v is None:
+            v = Secs2LazyBody(self.__bs, self.__offset(index), self.__compact)
+            self.__children[index] = v
+        return v
+
+    def __end_index(self):
+        if self.__end is None:
+            end = Secs2BodyBuilder._skip_item(self.__bs, self.__offset(self.__v_len - 1))
+            self.__check_bytes_end(end)
+            self.__end = end
+        return self.__end
+
+    def __check_bytes_end(self, end):
+        if self.__bytes_end is not None and end != self.__bytes_end:
+            raise Secs2BodyBytesParseError(
+                "not reach bytes end, reach=" + str(end) + ", length=" + str(self.__bytes_end))
+
+    def __decode(self):
+        if self.__decoded is None:
+            bs = self.__bs
+            if type(bs) is not memoryview:
+                bs = memoryview(bs)
+            self.__decoded = Secs2BodyBuilder.from_body_bytes(
+                bs[self.__pos:self.__end_index()],
+                compact=self.__compact)
+        return self.__decoded
+
+    def _create_to_sml(self):
+        return self.__decode().to_sml()
+
+    def _write_sml(self, stream, level, max_depth, max_items):
+        if self._type[0] == 'L':
+            self._write_sml_list(stream, level, max_depth, max_items)
+        else:
+            self.__decode()._write_sml(stream, level, max_depth, max_items)
+
+    def _create_to_bytes_value(self):
+        bs = self.__bs
+        if type(bs) is not memoryview:
+            bs = memoryview(bs)
+        return bs[self.__start:self.__end_index()]
+
+    def _create_to_bytes(self):
+        bs = self.__bs
+        end = self.__end_index()
+        if type(bs) is bytes and self.__pos == 0 and end == len(bs):
+            return bs
+        return bytes(bs[self.__pos:end])
+
+    def _create_byte_size(self):
+        return self.__end_index() - self.__pos
+
+    def _write_into(self, buffer, offset):
+        bs = self.__bs
+        if type(bs) is not memoryview:
+            bs = memoryview(bs)
+        end = offset + self.byte_size()
+        buffer[offset:end] = bs[self.__pos:self.__end_index()]
+        return end
 
     
 class Secs2BodyBuilder:
@@ -403,9 +908,26 @@ class Secs2BodyBuilder:
         ('U4',      0xB0,  4, 'L',  False,  Secs2IntegerBody.build)
     )
 
+    _INT_RANGES = {i[0]: AbstractSecs2Body._int_range(i) for i in _ITEMS if i[4] is not None}
+
     @classmethod
-    def build(cls, item_type, value):
+    def build(cls, item_type, value, trusted=False):
+        """Build Secs2Body.
+
+        Args:
+            item_type (str or tuple): item type, 'L', 'B', 'U4', ...
+            value (Any): value.
+            trusted (bool): skip conversion and range check of
+                'B', 'I1'-'I8', 'U1'-'U8', 'F4', 'F8' list values. Defaults to False.
+                Require values already int (or float), and in range.
+
+        Raises:
+            TypeError: if item_type is not str or tuple.
+            ValueError: if value is out of range.
 
+        Returns:
+            AbstractSecs2Body: Secs2Body
+        """
         if item_type is None:
             raise TypeError("Not accept None")
 
@@ -418,92 +940,245 @@ class Secs2BodyBuilder:
         else:
             raise TypeError("Require str or tuple")
 
-        return ref_type[5](ref_type, value)
+        k = cls._intern_key(ref_type, value)
+        if k is not None:
+            return cls._interned(ref_type, k)
+
+        return ref_type[5](ref_type, value, trusted)
+
+    _INTERN_SCALARS = {
+        'B': (0, 0xFF),
+        'U1': (0, 0xFF),
+        'I1': (-0x80, 0x7F)
+    }
+    _INTERNED = dict()
 
     @classmethod
-    def get_item_type_from_sml(cls, sml_item_type):
-        str_upper = sml_item_type.upper()
-        for i in cls._ITEMS:
-            if i[0] == str_upper:
-                return i
-        raise ValueError("'" + sml_item_type + "' not found")
+    def _intern_key(cls, item_type, value):
+        """Key of interned item, if value is empty or small scalar.
+
+        Small scalars are single 'B', 'U1', 'I1' and 'BOOLEAN' values.
+
+        Returns:
+            tuple: (item-type-name, None if empty, otherwise value), None if not interned.
+        """
+        name = item_type[0]
+        tv = type(value)
+
+        if tv is tuple or tv is list:
+            if not value:
+                return None if name == 'A' else (name, None)
+            if len(value) != 1:
+                return None
+            value = value[0]
+            tv = type(value)
+
+        elif tv is bytes:
+            if name != 'B':
+                return None
+            if not value:
+                return (name, None)
+            if len(value) != 1:
+                return None
+            value = value[0]
+            tv = int
+
+        elif tv is str:
+            return (name, None) if (name == 'A' and not value) else None
+
+        if name == 'BOOLEAN':
+            return (name, value) if tv is bool else None
+
+        r = cls._INTERN_SCALARS.get(name)
+        if r is not None and tv is int and r[0] <= value <= r[1]:
+            return (name, value)
+
+        return None
 
     @classmethod
-    def from_body_bytes(cls, body_bytes):
+    def _interned(cls, item_type, key):
+        """Canonical shared instance of empty or small scalar item.
+
+        Items are immutable, bytes and SML are built once on first use.
 
-        def _itr(b):    # get_item_type
-            x = b & 0xFC
-            for i in cls._ITEMS:
-                if i[1] == x:
-                    return i
-            raise ValueError('0x' + '{:02X}'.format(b) + " not found")
+        Returns:
+            AbstractSecs2Body: Secs2Body
+        """
+        v = cls._INTERNED.get(key)
+        if v is None:
+            if key[1] is None:
+                v = item_type[5](item_type, ('' if key[0] == 'A' else tuple()))
+            else:
+                v = item_type[5](item_type, (key[1], ))
+            v.to_bytes()
+            v.to_sml()
+            v = cls._INTERNED.setdefault(key, v)
+        return v
+
+    _SML_ITEMS = {i[0]: i for i in _ITEMS}
+
+    @classmethod
+    def get_item_type_from_sml(cls, sml_item_type):
+        try:
+            return cls._SML_ITEMS[sml_item_type.upper()]
+        except KeyError:
+            raise ValueError("'" + sml_item_type + "' not found")
 
-        def _xr(bs, pos):   # get (item_type, value_length, shift_position)
+    _FORMAT_TABLE = tuple(map(
+        {(i[1] | n): (i, n) for i in _ITEMS for n in (1, 2, 3)}.get,
+        range(256)))
 
+    @classmethod
+    def _item_header(cls, bs, pos):  # return (item_type, value_start_position, value_length)
+        try:
             b = bs[pos]
-            t = _itr(b)
-            len_bit = b & 0x3
+            x = cls._FORMAT_TABLE[b]
+            if x is None:
+                raise Secs2BodyBytesParseError('0x' + '{:02X}'.format(b) + " not found")
 
-            if len_bit == 3:
-                len_bs = (bs[pos+1] << 16) | (bs[pos+2] << 8) | bs[pos+3]
+            tt, len_bit = x
+
+            if len_bit == 1:
+                v_len = bs[pos+1]
             elif len_bit == 2:
-                len_bs = (bs[pos+1] << 8) | bs[pos+2]
+                v_len = (bs[pos+1] << 8) | bs[pos+2]
             else:
-                len_bs = bs[pos+1]
+                v_len = (bs[pos+1] << 16) | (bs[pos+2] << 8) | bs[pos+3]
+
+            return tt, (pos + len_bit + 1), v_len
 
-            return t, len_bs, (len_bit + 1)
+        except IndexError as e:
+            raise Secs2BodyBytesParseError(e)
 
-        def _f(bs, pos):
+    @classmethod
+    def _skip_item(cls, bs, pos):  # return item end position
+        tt, p, v_len = cls._item_header(bs, pos)
+        if tt[0] == 'L':
+            for _ in range(v_len):
+                p = cls._skip_item(bs, p)
+            return p
+        else:
+            p += v_len
+            if p > len(bs):
+                raise Secs2BodyBytesParseError("not reach item end, end=" + str(p) + ", length=" + str(len(bs)))
+            return p
 
-            r = _xr(bs, pos)
-            tt, v_len, b_len = _xr(bs, pos)
-            start_index = pos + b_len
-            end_index = pos + b_len + v_len
+    @classmethod
+    def from_body_bytes(cls, body_bytes, lazy=False, compact=False):
+        """Parse SECS-II body bytes.
+
+        If body_bytes is a memoryview, 'A' and 'B' items keep their payload
+        as a view of it and copy on first access to the value.
+
+        If lazy is True, return Secs2LazyBody, decoded on access.
+
+        If compact is True, I1-I8, U1-U8, F4 and F8 values are array.array
+        instead of tuple.
+
+        Args:
+            body_bytes (bytes or memoryview): SECS-II body bytes.
+            lazy (bool): decode on access. Defaults to False.
+            compact (bool): decode numbers to array.array. Defaults to False.
+
+        Raises:
+            Secs2BodyBytesParseError: if parse failed.
+
+        Returns:
+            AbstractSecs2Body: Secs2Body, None if body_bytes is empty.
+        """
+        if lazy:
+            return Secs2LazyBody(body_bytes, 0, compact, len(body_bytes)) if len(body_bytes) > 0 else None
+
+        table = cls._FORMAT_TABLE
+        interned = cls._INTERNED
+        scalars = cls._INTERN_SCALARS
+        extended = os.getenv('SECS_EXTENDED')
+        is_view = type(body_bytes) is memoryview
+
+        def _f(bs, pos, m):
+
+            b = bs[pos]
+            x = table[b]
+            if x is None:
+                raise ValueError('0x' + '{:02X}'.format(b) + " not found")
+
+            tt, len_bit = x
+
+            if len_bit == 1:
+                v_len = bs[pos+1]
+            elif len_bit == 2:
+                v_len = (bs[pos+1] << 8) | bs[pos+2]
+            else:
+                v_len = (bs[pos+1] << 16) | (bs[pos+2] << 8) | bs[pos+3]
+
+            start_index = pos + len_bit + 1
+            end_index = start_index + v_len
+
+            if v_len <= 1 and end_index <= m and not (compact and tt[4] is not None):
+                if v_len == 0:
+                    k = (tt[0], None)
+                elif tt[0] == 'BOOLEAN':
+                    k = (tt[0], bs[start_index] != 0x00)
+                elif tt[0] in scalars:
+                    k = bs[start_index]
+                    k = (tt[0], (k - 0x100 if (tt[0] == 'I1' and k > 0x7F) else k))
+                else:
+                    k = None
+                if k is not None:
+                    v = interned.get(k)
+                    if v is None:
+                        v = cls._interned(tt, k)
+                    return v, end_index
 
             if tt[0] == 'L':
                 vv = list()
                 p = start_index
-                for _ in range(r[1]):
-                    v, p = _f(bs, p)
+                for _ in range(v_len):
+                    v, p = _f(bs, p, m)
                     vv.append(v)
                 return tt[5](tt, vv), p
 
-            elif tt[0] == 'BOOLEAN':
+            if end_index > m:
+                raise Secs2BodyBytesParseError("not reach item end, end=" + str(end_index) + ", length=" + str(m))
+
+            if tt[0] == 'BOOLEAN':
                 vv = [(b != 0x00) for b in bs[start_index:end_index]]
                 return tt[5](tt, vv), end_index
 
             elif tt[0] == 'A':
-                if os.getenv('SECS_EXTENDED'):
-                    v = bs[start_index:end_index]
-                    v = v.decode(encoding='ascii') if all([c <= 128 for c in v]) else bytes([c for c in v])
+                v = bs[start_index:end_index]
+                if is_view:
+                    # validate now, decode on first access
+                    if not extended and max(v, default=0) > 0x7F:
+                        raise Secs2BodyBytesParseError("'A' has not ASCII bytes")
                     return tt[5](tt, v), end_index
-
-                v = bs[start_index:end_index].decode(encoding='ascii')
+                if extended:
+                    v = v.decode(encoding='ascii') if all([c <= 128 for c in v]) else bytes([c for c in v])
+                else:
+                    v = v.decode(encoding='ascii')
                 return tt[5](tt, v), end_index
 
             elif tt[0] == 'B':
-                vv = bs[start_index:end_index]
-                return tt[5](tt, vv), end_index
+                return tt[5](tt, bs[start_index:end_index]), end_index
 
-            elif tt[0] in ('I1', 'I2', 'I4', 'I8', 'F8', 'F4', 'U1', 'U2', 'U4', 'U8'):
-                vv = list()
-                p = start_index
-                for _ in range(0, v_len, tt[2]):
-                    prev = p
-                    p += tt[2]
-                    v = struct.unpack(('>' + tt[3]), bs[prev:p])
-                    vv.append(v[0])
-                return tt[5](tt, vv), end_index
+            else:
+                if v_len % tt[2] != 0:
+                    raise Secs2BodyBytesParseError(tt[0] + " length is not multiple of " + str(tt[2]))
+                if compact:
+                    vv = AbstractSecs2NumberBody._array_from_bytes(tt, memoryview(bs)[start_index:end_index])
+                else:
+                    vv = struct.unpack_from(('>' + str(v_len // tt[2]) + tt[3]), bs, start_index)
+                return tt[5](tt, vv, True), end_index
 
         try:
-            if len(body_bytes) == 0:
-                return None
-            
-            lr, lp = _f(body_bytes, 0)
             len_body = len(body_bytes)
 
+            if len_body == 0:
+                return None
+
+            lr, lp = _f(body_bytes, 0, len_body)
+
             if lp == len_body:
-                lr._cache_bytes = bytes(body_bytes)
                 return lr
             else:
                 raise Secs2BodyBytesParseError("not reach bytes end, reach=" + str(lp) + ", length=" + str(len_body))
@@ -514,3 +1189,5 @@ class Secs2BodyBuilder:
             raise Secs2BodyBytesParseError(e)
         except IndexError as e:
             raise Secs2BodyBytesParseError(e)
+        except struct.error as e:
+            raise Secs2BodyBytesParseError(e)
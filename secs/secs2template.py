@@ -0,0 +1,297 @@
+import re
+import secs
+
+
+class Secs2TemplateError(Exception):
+
+    def __init__(self, msg):
+        super(Secs2TemplateError, self).__init__(msg)
+
+
+class Secs2Placeholder:
+
+    def __init__(self, name):
+        self.__name = str(name)
+
+    def __repr__(self):
+        return '$' + self.__name
+
+    @property
+    def name(self):
+        pass
+
+    @name.getter
+    def name(self):
+        """Placeholder name getter.
+
+        Returns:
+            str: name
+        """
+        return self.__name
+
+
+class Secs2Template:
+    """Precompiled SECS-II body, constant items are encoded once.
+
+    Compile once, and render many times with placeholder values.
+
+    Examples:
+        tmpl = secs.Secs2Template.compile('S6F11 W <L <U4 $dataid> <U4 1001> <L <A $text> > >.')
+        comm.send_template(tmpl, dataid=1, text="ON FIRE")
+
+        tmpl = secs.Secs2Template.compile(
+            ('L', [
+                ('U4', secs.Secs2Template.placeholder('dataid')),
+                ('U4', [1001])
+            ]))
+        comm.send(6, 11, True, tmpl.render(dataid=1))
+    """
+
+    _SML_PLACEHOLDER_PATTERN = (
+        '("[^"]*")'                                 # 1: ascii string, not replaced
+        '|<\\s*([A-Za-z0-9]+)\\s*(\\[[^\\]]*\\])?'  # 2: item type, 3: size bracket
+        '\\s*\\$([A-Za-z_][A-Za-z0-9_]*)\\s*>'      # 4: placeholder name
+    )
+    _SML_PLACEHOLDER_PROG = re.compile(_SML_PLACEHOLDER_PATTERN)
+    _SML_MESSAGE_PROG = re.compile(secs.SmlParser._SML_PATTERN, re.DOTALL)
+    _SML_MARKER = '\x00'
+
+    def __init__(self, chunks, strm=None, func=None, wbit=False):
+        self.__chunks = tuple(chunks)
+        self.__names = frozenset([x[0] for x in self.__chunks if type(x) is not bytes])
+        self.__strm = strm
+        self.__func = func
+        self.__wbit = bool(wbit)
+
+    @property
+    def strm(self):
+        pass
+
+    @strm.getter
+    def strm(self):
+        """Stream-Number getter.
+
+        Returns:
+            int: Stream-Number, None if compiled from SECS-II body.
+        """
+        return self.__strm
+
+    @property
+    def func(self):
+        pass
+
+    @func.getter
+    def func(self):
+        """Function-Number getter.
+
+        Returns:
+            int: Function-Number, None if compiled from SECS-II body.
+        """
+        return self.__func
+
+    @property
+    def wbit(self):
+        pass
+
+    @wbit.getter
+    def wbit(self):
+        """W-Bit getter.
+
+        Returns:
+            bool: W-Bit
+        """
+        return self.__wbit
+
+    @property
+    def names(self):
+        pass
+
+    @names.getter
+    def names(self):
+        """Placeholder names getter.
+
+        Returns:
+            frozenset: names
+        """
+        return self.__names
+
+    def render(self, **values):
+        """Render SECS-II body.
+
+        Args:
+            **values: placeholder values, same as build value, or secs.AbstractSecs2Body.
+
+        A placeholder used under several item types is built once per item type.
+
+        Raises:
+            Secs2TemplateError: if placeholder value missing or unknown.
+            TypeError: if value type not accepted, or secs.AbstractSecs2Body of other item type.
+            ValueError: if value is out of range.
+
+        Returns:
+            secs.AbstractSecs2Body: Secs2Body
+        """
+        for k in values:
+            if k not in self.__names:
+                raise Secs2TemplateError("'" + k + "' is not placeholder")
+
+        encoded = dict()
+        vv = list()
+        for x in self.__chunks:
+            if type(x) is bytes:
+                vv.append(x)
+            else:
+                name, tt = x
+                bs = encoded.get(x)
+                if bs is None:
+                    try:
+                        v = values[name]
+                    except KeyError:
+                        raise Secs2TemplateError("'" + name + "' value missing")
+                    if isinstance(v, secs.AbstractSecs2Body):
+                        if v.type != tt[0]:
+                            raise TypeError("'" + name + "' require " + tt[0] + ", value is " + v.type)
+                    else:
+                        v = secs.Secs2BodyBuilder.build(tt, v)
+                    bs = v.to_bytes()
+                    encoded[x] = bs
+                vv.append(bs)
+
+        bs = b''.join(vv)
+        if len(bs) == 0:
+            return None
+        return secs.Secs2LazyBody(bs, end=len(bs))
+
+    @staticmethod
+    def placeholder(name):
+        """Placeholder for tuple-style compile.
+
+        Args:
+            name (str): name, render keyword.
+
+        Returns:
+            Secs2Placeholder: placeholder
+        """
+        return Secs2Placeholder(name)
+
+    @classmethod
+    def compile(cls, v):
+        """Compile template.
+
+        Args:
+            v (str or tuple or list): SML or SECS-II body SML, placeholder is '$name'
+                like '<U4 $name>' or '<L $name>'.
+                Or tuple-style SECS-II body, placeholder is Secs2Template.placeholder('name').
+
+        Raises:
+            Secs2TemplateError: if SML ascii string has NUL.
+            secs.SmlParseError: if SML parse failed.
+            secs.Secs2BodySmlParseError: if Secs2body parse failed.
+            TypeError: if tuple-style body is not accepted.
+            ValueError: if value is out of range or item-type not found.
+
+        Returns:
+            Secs2Template: template
+        """
+        if isinstance(v, str):
+            return cls._compile_sml(v)
+        else:
+            chunks = list()
+            cls._compile_value(v, None, chunks)
+            return Secs2Template(cls._join_chunks(chunks))
+
+    @classmethod
+    def _compile_sml(cls, sml_str):
+
+        markers = list()
+
+        def _mark(m):
+            if m.group(1) is not None:
+                if cls._SML_MARKER in m.group(1):
+                    raise Secs2TemplateError("ascii string not accept NUL")
+                return m.group(1)
+            markers.append((
+                m.group(4),
+                secs.Secs2BodyBuilder.get_item_type_from_sml(m.group(2))
+            ))
+            return '<A "' + cls._SML_MARKER + str(len(markers) - 1) + '">'
+
+        # newlines are whitespace for the tokenizer, kept inside ascii strings
+        s = cls._SML_PLACEHOLDER_PROG.sub(_mark, sml_str.strip())
+
+        if s.startswith('<'):
+            strm, func, wbit = None, None, False
+            body = secs.SmlParser._parse_body(s)
+        else:
+            x = cls._SML_MESSAGE_PROG.match(s)
+            if x is None:
+                raise secs.SmlParseError("SML not match")
+            strm, func, wbit = int(x.group(1)), int(x.group(2)), len(x.group(3)) > 0
+            body = secs.SmlParser._parse_body(x.group(4)) if len(x.group(4)) > 0 else None
+
+        chunks = list()
+        if body is not None:
+            cls._compile_value(body, markers, chunks)
+
+        return Secs2Template(cls._join_chunks(chunks), strm, func, wbit)
+
+    @classmethod
+    def _compile_value(cls, v, markers, chunks):
+
+        if isinstance(v, secs.AbstractSecs2Body):
+
+            if v.type == 'L':
+                chunks.append(cls._header_bytes(v._type[1], len(v)))
+                for x in v:
+                    cls._compile_value(x, markers, chunks)
+
+            elif (markers is not None
+                  and v.type == 'A'
+                  and type(v.value) is str
+                  and v.value.startswith(cls._SML_MARKER)):
+                chunks.append(markers[int(v.value[1:])])
+
+            else:
+                chunks.append(v.to_bytes())
+
+        else:
+            tv = type(v)
+            if not ((tv is tuple or tv is list) and len(v) == 2):
+                raise TypeError("Secs2Template value require tuple or list, and length == 2")
+
+            tt = v[0]
+            if type(tt) is str:
+                tt = secs.Secs2BodyBuilder.get_item_type_from_sml(tt)
+
+            if isinstance(v[1], Secs2Placeholder):
+                chunks.append((v[1].name, tt))
+
+            elif tt[0] == 'L':
+                tx = type(v[1])
+                if not (tx is tuple or tx is list):
+                    raise TypeError("L values require tuple or list")
+                chunks.append(cls._header_bytes(tt[1], len(v[1])))
+                for x in v[1]:
+                    cls._compile_value(x, markers, chunks)
+
+            else:
+                chunks.append(secs.Secs2BodyBuilder.build(tt, v[1]).to_bytes())
+
+    @staticmethod
+    def _header_bytes(fmt_byte, v_len):
+        if v_len >= 2**16:
+            return bytes([(fmt_byte | 0x03), ((v_len >> 16) & 0xFF), ((v_len >> 8) & 0xFF), (v_len & 0xFF)])
+        elif v_len >= 2**8:
+            return bytes([(fmt_byte | 0x02), ((v_len >> 8) & 0xFF), (v_len & 0xFF)])
+        else:
+            return bytes([(fmt_byte | 0x01), v_len])
+
+    @staticmethod
+    def _join_chunks(chunks):   # join adjacent constant bytes
+        vv = list()
+        for x in chunks:
+            if type(x) is bytes and len(vv) > 0 and type(vv[-1]) is bytes:
+                vv[-1] = vv[-1] + x
+            else:
+                vv.append(x)
+        return vv
@@ -1,5 +1,12 @@
 import threading
 import inspect
+import collections
+import heapq
+import time
+import asyncio
+import concurrent.futures
+import selectors
+import socket
 import secs
 
 
@@ -47,11 +54,258 @@ class SecsWaitReplyMessageError(SecsWithReferenceMessageError):
         super(SecsWaitReplyMessageError, self).__init__(msg, ref_msg)
 
 
-class AbstractQueuing:
+class SecsTimer:
+    """Deadline timer, one thread for many timeouts.
+
+    Callbacks are called on timer thread, keep them short.
+    Cancelled entries are removed lazily, and the heap is rebuilt
+    when they exceed half of it.
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+    __COMPACT_MIN = 64
 
     def __init__(self):
+        self.__heap = list()
+        self.__seq = 0
+        self.__cancelled = 0
+        self.__cdt = threading.Condition()
+        self.__th = None
+
+    @classmethod
+    def get_shared(cls):
+        """Shared timer getter.
+
+        Returns:
+            SecsTimer: timer shared by communicators.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = SecsTimer()
+            return cls.__shared
+
+    def schedule(self, timeout, callback):
+        """Schedule callback.
+
+        Args:
+            timeout (float): seconds.
+            callback (function): no arguments, called after timeout.
+
+        Returns:
+            list: entry, to cancel.
+        """
+        with self.__cdt:
+            self.__seq += 1
+            entry = [(time.monotonic() + timeout), self.__seq, callback]
+            heapq.heappush(self.__heap, entry)
+            if self.__th is None:
+                self.__th = threading.Thread(target=self.__run, daemon=True)
+                self.__th.start()
+            self.__cdt.notify()
+            return entry
+
+    def cancel(self, entry):
+        """Cancel scheduled callback.
+
+        Args:
+            entry (list): entry returned by schedule.
+        """
+        with self.__cdt:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self.__cancelled += 1
+            if self.__cancelled > self.__COMPACT_MIN and self.__cancelled * 2 > len(self.__heap):
+                self.__heap = [x for x in self.__heap if x[2] is not None]
+                heapq.heapify(self.__heap)
+                self.__cancelled = 0
+
+    def __len__(self):
+        """Scheduled entries count, includes cancelled entries not removed yet.
+
+        Returns:
+            int: count
+        """
+        with self.__cdt:
+            return len(self.__heap)
+
+    def __run(self):
+        while True:
+            with self.__cdt:
+                while True:
+                    while self.__heap and self.__heap[0][2] is None:
+                        heapq.heappop(self.__heap)
+                        self.__cancelled -= 1
+
+                    if not self.__heap:
+                        self.__cdt.wait()
+                        continue
+
+                    d = self.__heap[0][0] - time.monotonic()
+                    if d <= 0.0:
+                        entry = heapq.heappop(self.__heap)
+                        cb = entry[2]
+                        entry[2] = None
+                        break
+
+                    self.__cdt.wait(d)
+
+            try:
+                cb()
+            except Exception:
+                pass
+
+
+class SecsReactor:
+    """Readiness loop, reads sockets and serial ports of many communicators on one thread.
+
+    Callbacks are called on reactor thread when readable, must read once and not block.
+    """
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self):
+        self.__sel = selectors.DefaultSelector()
+        self.__ops = collections.deque()
+        self.__ops_lock = threading.Lock()
+        self.__wakeup_r, self.__wakeup_w = socket.socketpair()
+        self.__wakeup_r.setblocking(False)
+        self.__wakeup_w.setblocking(False)
+        self.__sel.register(self.__wakeup_r, selectors.EVENT_READ, None)
+        self.__th = threading.Thread(target=self.__run, name='secs-reactor', daemon=True)
+        self.__th.start()
+
+    @classmethod
+    def get_shared(cls):
+        """Shared reactor getter.
+
+        Returns:
+            SecsReactor: reactor shared by communicators.
+        """
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = SecsReactor()
+            return cls.__shared
+
+    def register(self, fileobj, callback, error_callback=None):
+        """Register readable callback.
+
+        If callback raises, file object is unregistered and
+        error_callback is called with the exception on reactor thread.
+
+        Args:
+            fileobj (socket.socket or object has fileno()): file object.
+            callback (function): no arguments, called when readable.
+            error_callback (function): 1 argument (exception), or None.
+        """
+        self.__call(self.__sel.register, fileobj, selectors.EVENT_READ, (callback, error_callback))
+
+    def unregister(self, fileobj):
+        """Unregister file object, returns after removed from reactor.
+
+        Args:
+            fileobj (socket.socket or object has fileno()): file object.
+        """
+        self.__call(self.__unregister, fileobj)
+
+    def __unregister(self, fileobj):
+        try:
+            self.__sel.unregister(fileobj)
+        except (KeyError, ValueError):
+            pass
+
+    def __call(self, func, *args):
+
+        if threading.current_thread() is self.__th:
+            func(*args)
+            return
+
+        ev = threading.Event()
+        errs = list()
+
+        def _f():
+            try:
+                func(*args)
+            except Exception as e:
+                errs.append(e)
+            finally:
+                ev.set()
+
+        with self.__ops_lock:
+            self.__ops.append(_f)
+
+        try:
+            self.__wakeup_w.send(b'\x00')
+        except (BlockingIOError, InterruptedError):
+            pass
+
+        ev.wait()
+
+        if errs:
+            raise errs[0]
+
+    def __run(self):
+        while True:
+            for key, mask in self.__sel.select():
+
+                if key.data is None:
+                    try:
+                        while self.__wakeup_r.recv(4096):
+                            pass
+                    except (BlockingIOError, InterruptedError):
+                        pass
+
+                    while True:
+                        with self.__ops_lock:
+                            if not self.__ops:
+                                break
+                            f = self.__ops.popleft()
+                        f()
+
+                elif self.__sel.get_map().get(key.fd) is key:
+                    callback, error_callback = key.data
+                    try:
+                        callback()
+                    except Exception as e:
+                        self.__unregister(key.fileobj)
+                        if error_callback is not None:
+                            try:
+                                error_callback(e)
+                            except Exception:
+                                pass
+
+
+class QueuingFullError(SecsCommunicatorError):
+
+    def __init__(self, msg):
+        super(QueuingFullError, self).__init__(msg)
+
+
+class QueuingFullPolicy:
+
+    BLOCK = 'block'
+    DROP_OLDEST = 'drop_oldest'
+    RAISE = 'raise'
+
+    @classmethod
+    def get(cls, v):
+        for x in (cls.BLOCK, cls.DROP_OLDEST, cls.RAISE):
+            if x == v:
+                return x
+        raise ValueError("'" + str(v) + "' is not QueuingFullPolicy")
+
+
+class AbstractQueuing:
+
+    def __init__(self, maxsize=None, full_policy=QueuingFullPolicy.BLOCK, full_callback=None):
+        # full_callback: if not None, called with QueuingFullError instead of raising, value is dropped
         self.__terminated = False
-        self._vv = list()
+        self.__maxsize = maxsize if maxsize is None else int(maxsize)
+        self.__full_policy = QueuingFullPolicy.get(full_policy)
+        self.__full_callback = full_callback
+        self._vv = collections.deque()
         self._v_cdt = threading.Condition()
 
     def __enter__(self):
@@ -73,53 +327,227 @@ class AbstractQueuing:
         with self._v_cdt:
             return self._v_cdt.wait_for(self._is_terminated, timeout)
 
-    def put(self, value):
+    @property
+    def maxsize(self):
+        pass
+
+    @maxsize.getter
+    def maxsize(self):
+        """Queue max size getter.
+
+        Returns:
+            int: max size, None if unbounded.
+        """
+        return self.__maxsize
+
+    @maxsize.setter
+    def maxsize(self, val):
+        """Queue max size setter.
+
+        Queued values over new max size are kept.
+
+        Args:
+            val (int or None): max size, None if unbounded.
+        """
         with self._v_cdt:
-            if value is not None and not self._is_terminated():
-                self._vv.append(value)
-                self._v_cdt.notify_all()
+            self.__maxsize = val if val is None else int(val)
+            self._v_cdt.notify_all()
 
-    def puts(self, values):
+    @property
+    def full_policy(self):
+        pass
+
+    @full_policy.getter
+    def full_policy(self):
+        """Full policy getter.
+
+        Returns:
+            str: QueuingFullPolicy
+        """
+        return self.__full_policy
+
+    @full_policy.setter
+    def full_policy(self, val):
+        """Full policy setter.
+
+        Args:
+            val (str): QueuingFullPolicy
+        """
         with self._v_cdt:
-            if values and not self._is_terminated():
-                self._vv.extend([v for v in values])
-                self._v_cdt.notify_all()
+            self.__full_policy = QueuingFullPolicy.get(val)
+            self._v_cdt.notify_all()
+
+    def qsize(self):
+        """Queued values count getter.
+
+        Returns:
+            int: count
+        """
+        with self._v_cdt:
+            return len(self._vv)
+
+    def put(self, value):
+        try:
+            with self._v_cdt:
+                if value is not None and not self._is_terminated():
+                    if self.__maxsize is not None and not self.__reserve(1):
+                        return
+                    self._vv.append(value)
+                    self._v_cdt.notify_all()
+
+        except QueuingFullError as e:
+            self.__put_full(e)
+
+    def puts(self, values):
+        try:
+            with self._v_cdt:
+                if values and not self._is_terminated():
+                    try:
+                        if self.__maxsize is None:
+                            self._vv.extend(values)
+                        else:
+                            for v in values:
+                                if not self.__reserve(1):
+                                    return
+                                self._vv.append(v)
+                    finally:
+                        self._v_cdt.notify_all()
+
+        except QueuingFullError as e:
+            self.__put_full(e)
+
+    def __put_full(self, e):
+        if self.__full_callback is None:
+            raise e
+        self.__full_callback(e)
+
+    def __reserve(self, n):   # apply full-policy, return False if terminated while blocking
+        if self.__maxsize is None or len(self._vv) + n <= self.__maxsize:
+            return True
+
+        if self.__full_policy == QueuingFullPolicy.DROP_OLDEST:
+            while self._vv and len(self._vv) + n > self.__maxsize:
+                self._vv.popleft()
+            return True
+
+        elif self.__full_policy == QueuingFullPolicy.RAISE:
+            raise QueuingFullError("Queue is full, maxsize=" + str(self.__maxsize))
+
+        else:
+            self._v_cdt.wait_for(
+                lambda: (self._is_terminated()
+                         or self.__full_policy != QueuingFullPolicy.BLOCK
+                         or self.__maxsize is None
+                         or len(self._vv) + n <= self.__maxsize))
+            if self._is_terminated():
+                return False
+            return self.__reserve(n)
 
     def _poll_vv(self):
         with self._v_cdt:
             if self._vv:
-                return self._vv.pop(0)
+                v = self._vv.popleft()
+                if self.__maxsize is not None:
+                    self._v_cdt.notify_all()
+                return v
             else:
                 return None
 
 
 class CallbackQueuing(AbstractQueuing):
 
-    def __init__(self, callback):
-        super(CallbackQueuing, self).__init__()
+    def __init__(self, callback, maxsize=None, full_policy=QueuingFullPolicy.BLOCK, full_callback=None):
+        super(CallbackQueuing, self).__init__(maxsize, full_policy, full_callback)
         self._cb = callback
 
         def _f():
-            with self._v_cdt:
-                while True:
+            while True:
+                with self._v_cdt:
                     v = self._poll_vv()
-                    if v is None:
+                    while v is None:
+                        if self._is_terminated():
+                            break
                         self._v_cdt.wait()
+                        v = self._poll_vv()
 
-                        if self._is_terminated():
-                            self._cb(None)
+                # callback outside of lock, put is not blocked while callback
+                if v is None:
+                    self._cb(None)
+                    return
+                else:
+                    self._cb(v)
+
+        threading.Thread(target=_f, daemon=True).start()
+
+
+class ExecutorQueuing(AbstractQueuing):
+    """Callback-Queuing dispatched on shared executor.
+
+    No thread per queuing. Callbacks of one queuing are called
+    in put order, one at a time, on executor threads.
+    """
+
+    __DRAIN_BATCH = 64
+
+    def __init__(self, callback, executor, maxsize=None, full_policy=QueuingFullPolicy.BLOCK, full_callback=None):
+        super(ExecutorQueuing, self).__init__(maxsize, full_policy, full_callback)
+        self._cb = callback
+        self.__executor = executor
+        self.__scheduled = False
+        self.__finished = False
+
+    def shutdown(self):
+        super(ExecutorQueuing, self).shutdown()
+        self.__schedule()
+
+    def put(self, value):
+        super(ExecutorQueuing, self).put(value)
+        self.__schedule()
+
+    def puts(self, values):
+        super(ExecutorQueuing, self).puts(values)
+        self.__schedule()
+
+    def __schedule(self):
+        with self._v_cdt:
+            if self.__scheduled or self.__finished:
+                return
+            if not self._vv and not self._is_terminated():
+                return
+            self.__scheduled = True
+
+        try:
+            self.__executor.submit(self.__drain)
+        except RuntimeError:
+            # executor already shutdown
+            with self._v_cdt:
+                self.__scheduled = False
+
+    def __drain(self):
+        try:
+            # drain a batch, and resubmit to share executor with other queuings
+            for _ in range(self.__DRAIN_BATCH):
+                with self._v_cdt:
+                    v = self._poll_vv()
+                    if v is None:
+                        if self.__finished or not self._is_terminated():
                             return
+                        self.__finished = True
 
-                    else:
-                        self._cb(v)
+                self._cb(v)
 
-        threading.Thread(target=_f, daemon=True).start()
+                if v is None:
+                    return
+        finally:
+            with self._v_cdt:
+                self.__scheduled = False
+            self.__schedule()
 
 
 class WaitingQueuing(AbstractQueuing):
 
-    def __init__(self):
-        super(WaitingQueuing, self).__init__()
+    def __init__(self, maxsize=None, full_policy=QueuingFullPolicy.BLOCK):
+        super(WaitingQueuing, self).__init__(maxsize, full_policy)
 
     def poll(self, timeout=None):
 
@@ -146,12 +574,13 @@ class WaitingQueuing(AbstractQueuing):
             if vv_size > 0:
                 r = m - p
                 if vv_size > r:
-                    vv.extend(self._vv[0:r])
-                    del self._vv[0:r]
+                    vv.extend([self._vv.popleft() for _ in range(r)])
+                    self._v_cdt.notify_all()
                     return r
                 else:
                     vv.extend(self._vv)
                     self._vv.clear()
+                    self._v_cdt.notify_all()
                     return vv_size
             else:
                 return -1
@@ -201,6 +630,18 @@ class AbstractSecsCommunicator:
         self.timeout_t7 = kwargs.get('timeout_t7', self.__DEFAULT_TIMEOUT_T7)
         self.timeout_t8 = kwargs.get('timeout_t8', self.__DEFAULT_TIMEOUT_T8)
 
+        self.lazy_secs2body = kwargs.get('lazy_secs2body', False)
+        self.compact_secs2body = kwargs.get('compact_secs2body', False)
+
+        self.__dispatcher = kwargs.get('dispatcher', None)
+        self.__reactor = kwargs.get('reactor', None)
+        self.__callback_queuings = dict()
+        self.__set_queue_full_policy(
+            kwargs.get('queue_maxsize', None),
+            kwargs.get('queue_full_policy', QueuingFullPolicy.BLOCK))
+        self.__send_executor = None
+        self.__send_executor_lock = threading.Lock()
+
         gem_mdln = kwargs.get('gem_mdln', None)
         if gem_mdln is not None:
             self.gem.mdln = gem_mdln
@@ -218,11 +659,12 @@ class AbstractSecsCommunicator:
         self.__communicating = False
         self.__comm_cdt = threading.Condition()
 
-        self.__recv_primary_msg_lstnrs = list()
-        self.__communicate_lstnrs = list()
-        self.__error_lstnrs = list()
-        self.__recv_all_msg_lstnrs = list()
-        self.__sended_msg_lstnrs = list()
+        self._lstnrs_lock = threading.Lock()
+        self.__recv_primary_msg_lstnrs = tuple()
+        self.__communicate_lstnrs = tuple()
+        self.__error_lstnrs = tuple()
+        self.__recv_all_msg_lstnrs = tuple()
+        self.__sended_msg_lstnrs = tuple()
 
         recv_pri_msg_lstnr = kwargs.get('recv_primary_msg', None)
         if recv_pri_msg_lstnr is not None:
@@ -548,6 +990,198 @@ class AbstractSecsCommunicator:
         """
         self.__timeout_t8 = self._try_gt_zero(val)
 
+    @property
+    def lazy_secs2body(self):
+        pass
+
+    @lazy_secs2body.getter
+    def lazy_secs2body(self):
+        """Lazy-SECS-II-body-decode getter.
+
+        Returns:
+            bool: True if received SECS-II body is decoded on access.
+        """
+        return self.__lazy_secs2body
+
+    @lazy_secs2body.setter
+    def lazy_secs2body(self, val):
+        """Lazy-SECS-II-body-decode setter.
+
+        Args:
+            val (bool): True if received SECS-II body is decoded on access.
+        """
+        self.__lazy_secs2body = bool(val)
+
+    @property
+    def compact_secs2body(self):
+        pass
+
+    @compact_secs2body.getter
+    def compact_secs2body(self):
+        """Compact-SECS-II-body-decode getter.
+
+        Returns:
+            bool: True if received I1-I8, U1-U8, F4, F8 values are array.array.
+        """
+        return self.__compact_secs2body
+
+    @compact_secs2body.setter
+    def compact_secs2body(self, val):
+        """Compact-SECS-II-body-decode setter.
+
+        Args:
+            val (bool): True if received I1-I8, U1-U8, F4, F8 values are array.array.
+        """
+        self.__compact_secs2body = bool(val)
+
+    @property
+    def queue_maxsize(self):
+        pass
+
+    @queue_maxsize.getter
+    def queue_maxsize(self):
+        """Listener-Queue max size getter.
+
+        Returns:
+            int: max size, None if unbounded.
+        """
+        return self.__queue_maxsize
+
+    @queue_maxsize.setter
+    def queue_maxsize(self, val):
+        """Listener-Queue max size setter.
+
+        Applied to all listener queues.
+
+        Args:
+            val (int or None): max size, None if unbounded.
+
+        Raises:
+            ValueError: if value is not greater than 0,
+                or QueuingFullPolicy.BLOCK is not accepted.
+        """
+        self.__set_queue_full_policy(val, self.__queue_full_policy)
+
+    @property
+    def queue_full_policy(self):
+        pass
+
+    @queue_full_policy.getter
+    def queue_full_policy(self):
+        """Listener-Queue full policy getter.
+
+        Returns:
+            str: QueuingFullPolicy
+        """
+        return self.__queue_full_policy
+
+    @queue_full_policy.setter
+    def queue_full_policy(self, val):
+        """Listener-Queue full policy setter.
+
+        Applied to all listener queues.
+        If QueuingFullPolicy.RAISE, message not fit in queue is dropped,
+        and QueuingFullError is put to error listeners.
+
+        Args:
+            val (str): QueuingFullPolicy.BLOCK, QueuingFullPolicy.DROP_OLDEST or QueuingFullPolicy.RAISE
+
+        Raises:
+            ValueError: if value is not QueuingFullPolicy,
+                or QueuingFullPolicy.BLOCK is not accepted.
+        """
+        self.__set_queue_full_policy(self.__queue_maxsize, val)
+
+    def __set_queue_full_policy(self, maxsize, full_policy):
+        if maxsize is not None:
+            maxsize = int(maxsize)
+            if maxsize <= 0:
+                raise ValueError("queue_maxsize is greater than 0")
+        full_policy = QueuingFullPolicy.get(full_policy)
+
+        if (maxsize is not None
+                and full_policy == QueuingFullPolicy.BLOCK
+                and self._is_put_on_shared_thread()):
+            # blocking put stalls all connections on shared thread
+            raise ValueError("queue_full_policy BLOCK with queue_maxsize can not be used "
+                             "if messages are put on shared thread (reactor or asyncio loop)")
+
+        self.__queue_maxsize = maxsize
+        self.__queue_full_policy = full_policy
+
+        for q in self.__callback_queuings.values():
+            q.full_policy = full_policy
+            q.maxsize = maxsize
+
+    def _is_put_on_shared_thread(self):
+        # True if received messages are put to listener queues on thread shared with other connections
+        return self.__reactor is not None
+
+    @property
+    def dispatcher(self):
+        pass
+
+    @dispatcher.getter
+    def dispatcher(self):
+        """Listener-Dispatcher getter.
+
+        Set by 'dispatcher' keyword argument.
+        If None, each listener-queue has own thread.
+        If concurrent.futures.Executor, listeners are called on executor threads,
+        executor can be shared by many communicators.
+
+        Returns:
+            concurrent.futures.Executor: Dispatcher, or None.
+        """
+        return self.__dispatcher
+
+    @property
+    def reactor(self):
+        pass
+
+    @reactor.getter
+    def reactor(self):
+        """Reactor getter.
+
+        Set by 'reactor' keyword argument.
+        If None, each connection has own receiving thread.
+        If SecsReactor, connections are read on reactor thread,
+        reactor can be shared by many communicators.
+        With reactor, bounded queues (queue_maxsize) must not use
+        QueuingFullPolicy.BLOCK, ValueError is raised.
+
+        Returns:
+            SecsReactor: Reactor, or None.
+        """
+        return self.__reactor
+
+    def get_queue_sizes(self):
+        """Listener-Queue depths getter.
+
+        Returns:
+            dict: {name: queued count}, like {'recv_all_msg': 0, 'error': 0}
+        """
+        return {k: v.qsize() for k, v in self.__callback_queuings.items()}
+
+    def _build_callback_queuing(self, callback):
+        name = callback.__name__
+        if name.startswith('_put_'):
+            name = name[5:]
+        if name == 'error':
+            # error not fit in queue is dropped
+            full_callback = self.__drop_error
+        else:
+            full_callback = self._put_error
+        if self.__dispatcher is None:
+            q = CallbackQueuing(callback, self.queue_maxsize, self.queue_full_policy, full_callback)
+        else:
+            q = ExecutorQueuing(callback, self.__dispatcher, self.queue_maxsize, self.queue_full_policy, full_callback)
+        self.__callback_queuings[name] = q
+        return q
+
+    def __drop_error(self, e):
+        pass
+
     def open(self):
         """Open communicator
         """
@@ -609,6 +1243,9 @@ class AbstractSecsCommunicator:
             self.__closed = True
             with self.__comm_cdt:
                 self.__comm_cdt.notify_all()
+        with self.__send_executor_lock:
+            if self.__send_executor is not None:
+                self.__send_executor.shutdown(wait=False)
 
     def __enter__(self):
         return self
@@ -617,7 +1254,8 @@ class AbstractSecsCommunicator:
         self._close()
     
     def __del__(self):
-        self._close()
+        if hasattr(self, '_open_close_rlock'):
+            self._close()
 
     def send(self, strm, func, wbit, secs2body=None):
         """Send primary message
@@ -681,6 +1319,30 @@ class AbstractSecsCommunicator:
         strm, func, wbit, s2b = secs.SmlParser.parse(sml_str)
         return self.send(strm, func, wbit, s2b)
 
+    def send_template(self, template, **values):
+        """Send primary message by template
+
+        Args:
+            template (secs.Secs2Template): template compiled from SML.
+            **values: placeholder values.
+
+        Raises:
+            SecsCommunicatorError: if communicator not opened.
+            SecsSendMessageError: if send failed.
+            SecsWaitReplyError: if reply not received.
+            secs.Secs2TemplateError: if template has no Stream-Number, or value missing.
+
+        Returns:
+            secs.SecsMessage: Reply-Message if exist, otherwise None.
+
+        Examples:
+            tmpl = secs.Secs2Template.compile('S6F11 W <L <U4 $dataid> <U4 1001> >.')
+            send_template(tmpl, dataid=1)
+        """
+        if template.strm is None:
+            raise secs.Secs2TemplateError("Template has no Stream-Number and Function-Number")
+        return self.send(template.strm, template.func, template.wbit, template.render(**values))
+
     def reply(self, primary, strm, func, wbit, secs2body=None):
         """Send reply message
 
@@ -730,6 +1392,141 @@ class AbstractSecsCommunicator:
             strm, func, wbit,
             self._create_secs2body(s2b))
 
+    def reply_template(self, primary, template, **values):
+        """Send reply message by template
+
+        Args:
+            primary (secs.SecsMessage): Primary-Message
+            template (secs.Secs2Template): template compiled from SML.
+            **values: placeholder values.
+
+        Raises:
+            SecsCommunicatorError: if communicator not opened.
+            SecsSendMessageError: if send failed.
+            secs.Secs2TemplateError: if template has no Stream-Number, or value missing.
+
+        Returns:
+            None: None
+        """
+        if template.strm is None:
+            raise secs.Secs2TemplateError("Template has no Stream-Number and Function-Number")
+        return self.reply(primary, template.strm, template.func, template.wbit, template.render(**values))
+
+    def send_async(self, strm, func, wbit, secs2body=None):
+        """Send primary message, without blocking.
+
+        Args:
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool): W-Bit.
+            secs2body (tuple or list or secs.AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            concurrent.futures.Future: result is Reply-Message if exist, otherwise None.
+                exception is same as send.
+
+        Examples:
+            ff = [comm.send_async(1, 3, True, ('L', [])) for comm in comms]
+            replies = [f.result() for f in ff]
+        """
+        try:
+            s2b = self._create_secs2body(secs2body)
+        except Exception as e:
+            f = concurrent.futures.Future()
+            f.set_exception(e)
+            return f
+
+        return self._send_async(
+            strm, func, wbit,
+            s2b,
+            self._create_system_bytes(),
+            self.device_id)
+
+    def send_sml_async(self, sml_str):
+        """Send primary message by SML, without blocking.
+
+        Args:
+            sml_str (str): SML-string.
+
+        Raises:
+            secs.Secs2BodySmlParseError: if Secs2body parse failed.
+            secs.SmlParseError: if SML parse failed.
+
+        Returns:
+            concurrent.futures.Future: result is Reply-Message if exist, otherwise None.
+        """
+        strm, func, wbit, s2b = secs.SmlParser.parse(sml_str)
+        return self.send_async(strm, func, wbit, s2b)
+
+    def reply_async(self, primary, strm, func, wbit, secs2body=None):
+        """Send reply message, without blocking.
+
+        Args:
+            primary (secs.SecsMessage): Primary-Message.
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool: W-Bit.
+            secs2body (tuple or list or secs.AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            concurrent.futures.Future: result is None.
+        """
+        try:
+            s2b = self._create_secs2body(secs2body)
+        except Exception as e:
+            f = concurrent.futures.Future()
+            f.set_exception(e)
+            return f
+
+        return self._send_async(
+            strm, func, wbit,
+            s2b,
+            primary.system_bytes,
+            self.device_id)
+
+    async def asend(self, strm, func, wbit, secs2body=None):
+        """Send primary message, awaitable.
+
+        Args:
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool): W-Bit.
+            secs2body (tuple or list or secs.AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            secs.SecsMessage: Reply-Message if exist, otherwise None.
+
+        Examples:
+            replies = await asyncio.gather(*[comm.asend(1, 3, True, ('L', [])) for comm in comms])
+        """
+        return await asyncio.wrap_future(self.send_async(strm, func, wbit, secs2body))
+
+    async def asend_sml(self, sml_str):
+        """Send primary message by SML, awaitable.
+
+        Args:
+            sml_str (str): SML-string.
+
+        Returns:
+            secs.SecsMessage: Reply-Message if exist, otherwise None.
+        """
+        return await asyncio.wrap_future(self.send_sml_async(sml_str))
+
+    async def areply(self, primary, strm, func, wbit, secs2body=None):
+        """Send reply message, awaitable.
+
+        Args:
+            primary (secs.SecsMessage): Primary-Message.
+            strm (int): Stream-Number.
+            func (int): Function-Number.
+            wbit (bool: W-Bit.
+            secs2body (tuple or list or secs.AbstractSecs2Body): SECS-II-body. Defaults to None.
+
+        Returns:
+            None: None
+        """
+        return await asyncio.wrap_future(self.reply_async(primary, strm, func, wbit, secs2body))
+
     def _create_system_bytes(self):
         self._sys_num = (self._sys_num + 1) & 0xFFFF
         n = self._sys_num
@@ -747,6 +1544,8 @@ class AbstractSecsCommunicator:
             return None
         elif isinstance(v, secs.AbstractSecs2Body):
             return v
+        elif isinstance(v, secs.Secs2Template):
+            return v.render()
         else:
             tt = type(v)
             if (tt is list or tt is tuple) and len(v) == 2:
@@ -775,11 +1574,45 @@ class AbstractSecsCommunicator:
         """
         raise NotImplementedError()
 
+    def _send_async(self, strm, func, wbit, secs2body, system_bytes, device_id):
+        # Blocking _send on sender-thread, override if protocol can wait reply without thread.
+        with self.__send_executor_lock:
+            if self.__send_executor is None:
+                if self.is_closed:
+                    f = concurrent.futures.Future()
+                    f.set_exception(SecsCommunicatorError("Communicator closed"))
+                    return f
+                self.__send_executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix=(self.name or 'secs') + '-sender')
+            try:
+                return self.__send_executor.submit(
+                    self._send, strm, func, wbit, secs2body, system_bytes, device_id)
+            except RuntimeError:
+                f = concurrent.futures.Future()
+                f.set_exception(SecsCommunicatorError("Communicator closed"))
+                return f
+
     @staticmethod
     def _is_single_args_listener(listener):
         n = len(inspect.signature(listener).parameters)
         return n == 1
 
+    def _bind_listener(self, listener):   # return (listener, invoker), arity resolved once
+        if self._is_single_args_listener(listener):
+            return listener, listener
+        else:
+            return listener, (lambda v: listener(v, self))
+
+    def _added_listeners(self, lstnrs, listener):     # return copied tuple
+        return lstnrs + (self._bind_listener(listener), )
+
+    @staticmethod
+    def _removed_listeners(lstnrs, listener):   # return copied tuple
+        for i, x in enumerate(lstnrs):
+            if x[0] == listener:
+                return lstnrs[:i] + lstnrs[(i + 1):]
+        raise ValueError("listener not found")
+
     def add_recv_primary_msg_listener(self, listener):
         """Add receive-primary-message listener
 
@@ -794,7 +1627,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_primary_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__recv_primary_msg_lstnrs = self._added_listeners(self.__recv_primary_msg_lstnrs, listener)
 
     def remove_recv_primary_msg_listener(self, listener):
         """Remove receive-primary-message-listener.
@@ -805,15 +1639,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_primary_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__recv_primary_msg_lstnrs = self._removed_listeners(self.__recv_primary_msg_lstnrs, listener)
 
     def _put_recv_primary_msg(self, recv_msg):
         if recv_msg is not None:
             for ls in self.__recv_primary_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(recv_msg)
-                else:
-                    ls(recv_msg, self)
+                ls[1](recv_msg)
 
     def add_recv_all_msg_listener(self, listener):
         """Add receive-all-message listener
@@ -831,7 +1663,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_all_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__recv_all_msg_lstnrs = self._added_listeners(self.__recv_all_msg_lstnrs, listener)
 
     def remove_recv_all_msg_listener(self, listener):
         """Remove receive-all-message-listener.
@@ -842,15 +1675,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__recv_all_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__recv_all_msg_lstnrs = self._removed_listeners(self.__recv_all_msg_lstnrs, listener)
     
     def _put_recv_all_msg(self, recv_msg):
         if recv_msg is not None:
             for ls in self.__recv_all_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(recv_msg)
-                else:
-                    ls(recv_msg, self)
+                ls[1](recv_msg)
     
     def add_sended_msg_listener(self, listener):
         """Add sended-message-listener.
@@ -866,7 +1697,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__sended_msg_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__sended_msg_lstnrs = self._added_listeners(self.__sended_msg_lstnrs, listener)
 
     def remove_sended_msg_listener(self, listener):
         """Remove sended-message-listener.
@@ -877,15 +1709,13 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__sended_msg_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__sended_msg_lstnrs = self._removed_listeners(self.__sended_msg_lstnrs, listener)
 
     def _put_sended_msg(self, sended_msg):
         if sended_msg is not None:
             for ls in self.__sended_msg_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(sended_msg)
-                else:
-                    ls(sended_msg, self)
+                ls[1](sended_msg)
     
     def add_communicate_listener(self, listener):
         """Add communicate-state-change-listener.
@@ -902,11 +1732,9 @@ class AbstractSecsCommunicator:
             None
         """
         with self.__comm_cdt:
-            self.__communicate_lstnrs.append(listener)
-            if self._is_single_args_listener(listener):
-                listener(self.__communicating)
-            else:
-                listener(self.__communicating, self)
+            with self._lstnrs_lock:
+                self.__communicate_lstnrs = self._added_listeners(self.__communicate_lstnrs, listener)
+            self.__communicate_lstnrs[-1][1](self.__communicating)
 
     def remove_communicate_listener(self, listener):
         """Remove communicate-state-change-listener.
@@ -918,17 +1746,15 @@ class AbstractSecsCommunicator:
             None
         """
         with self.__comm_cdt:
-            self.__communicate_lstnrs.remove(listener)
+            with self._lstnrs_lock:
+                self.__communicate_lstnrs = self._removed_listeners(self.__communicate_lstnrs, listener)
 
     def _put_communicated(self, communicating):
         with self.__comm_cdt:
             if communicating != self.__communicating:
                 self.__communicating = communicating
                 for ls in self.__communicate_lstnrs:
-                    if self._is_single_args_listener(ls):
-                        ls(self.__communicating)
-                    else:
-                        ls(self.__communicating, self)
+                    ls[1](self.__communicating)
                 self.__comm_cdt.notify_all()
 
     @property
@@ -958,7 +1784,8 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__error_lstnrs.append(listener)
+        with self._lstnrs_lock:
+            self.__error_lstnrs = self._added_listeners(self.__error_lstnrs, listener)
 
     def remove_error_listener(self, listener):
         """Remove error-listener.
@@ -969,12 +1796,10 @@ class AbstractSecsCommunicator:
         Returns:
             None
         """
-        self.__error_lstnrs.remove(listener)
+        with self._lstnrs_lock:
+            self.__error_lstnrs = self._removed_listeners(self.__error_lstnrs, listener)
 
     def _put_error(self, e):
         if e is not None:
             for ls in self.__error_lstnrs:
-                if self._is_single_args_listener(ls):
-                    ls(e)
-                else:
-                    ls(e, self)
+                ls[1](e)
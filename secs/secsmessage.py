@@ -10,7 +10,12 @@ class SecsMessageParseError(Exception):
 class SecsMessage:
 
     _STR_LINESEPARATOR = os.linesep
-    
+
+    __slots__ = (
+        '__strm', '__func', '__wbit', '__secs2body',
+        '__cache_header10bytes_str'
+    )
+
     def __init__(self, strm, func, wbit, secs2body):
 
         if strm < 0 or strm > 127:
@@ -184,3 +189,26 @@ class SecsMessage:
                 + ']')
 
         return self.__cache_header10bytes_str
+
+    def write_sml(self, stream, max_depth=None, max_items=None):
+        """Write SML to stream.
+
+        Written piece by piece, without building whole SML string.
+
+        Args:
+            stream (io.TextIOBase): text stream, or object has write(str).
+            max_depth (int): 'L' nested deeper than max_depth are written as '<L [n] ... >'.
+                Defaults to None, no limit.
+            max_items (int): write first max_items of values and 'L' items, and '...'.
+                Defaults to None, no limit.
+
+        Returns:
+            None: None
+        """
+        stream.write('S' + str(self.strm) + 'F' + str(self.func))
+        if self.wbit:
+            stream.write(' W')
+        if self.secs2body is not None:
+            stream.write(self._STR_LINESEPARATOR)
+            self.secs2body.write_sml(stream, max_depth, max_items)
+        stream.write('.')
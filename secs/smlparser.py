@@ -1,4 +1,5 @@
 import re
+import functools
 import secs
 
 
@@ -19,10 +20,16 @@ class SmlParser:
     _SML_PATTERN = '[Ss]([0-9]{1,3})[Ff]([0-9]{1,3})\\s*([Ww]?)\\s*((<.*>)?)\\s*\\.$'
     _SML_PROG = re.compile(_SML_PATTERN)
 
+    _PARSE_CACHE_MAX_LENGTH = 1024
+
     @classmethod
     def parse(cls, sml_str):
         """parse from SML to Tuple
 
+        Results of SML up to 1024 characters are cached by SML string,
+        same SML returns same secs2body instance.
+        Secs2body is immutable, shared between callers.
+
         Args:
             sml_str (str): SML string.
 
@@ -38,6 +45,18 @@ class SmlParser:
                 secs.AbstractSecs2Body: secs2body or None
             )
         """
+        if len(sml_str) <= cls._PARSE_CACHE_MAX_LENGTH:
+            return cls._parse_cached(sml_str)
+        else:
+            return cls._parse(sml_str)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_cached(cls, sml_str):
+        return cls._parse(sml_str)
+
+    @classmethod
+    def _parse(cls, sml_str):
         s = sml_str.replace('\n', ' ').strip()
         if not s.endswith("."):
             raise SmlParseError("SML not endswith '.'")
@@ -55,125 +74,111 @@ class SmlParser:
             cls._parse_body(body) if len(body) > 0 else None
         )
 
+    _SML_TOKEN_PATTERN = (
+        '[\\x00-\\x20]*(?:'
+        '(<)'                           # 1: item start bracket
+        '|(>)'                          # 2: item end bracket
+        '|(\\[[^\\]]*\\])'              # 3: size bracket
+        '|"([^"]*)"'                    # 4: ascii string
+        '|([^\\x00-\\x20\\[\\]"<>]+)'     # 5: word
+        '|(.)'                          # 6: not accept
+        ')'
+    )
+    _SML_TOKEN_PROG = re.compile(_SML_TOKEN_PATTERN, re.DOTALL)
+
     @classmethod
     def _parse_body(cls, sml_str):
 
-        def _is_ws(v):  # is_white_space
-            return (v.encode(encoding='ascii'))[0] <= 0x20
-
-        def _seek_next(s, from_pos, *args):
-            p = from_pos
-            if len(args) > 0:
-                while True:
-                    v = s[p]
-                    for a in args:
-                        if type(a) is str:
-                            if v == a:
-                                return v, p
-                        else:
-                            if a(v):
-                                return v, p
-                    p += 1
-            else:
-                while True:
-                    v = s[p]
-                    if _is_ws(v):
-                        p += 1
-                    else:
-                        return v, p
-
-        def _ssbkt(s, from_pos):    # seek size_start_bracket'[' position, return position, -1 if not exist
-            v, p = _seek_next(s, from_pos)
-            return p if v == '[' else -1
-
-        def _sebkt(s, from_pos):    # seek size_end_bracket']' position, return position
-            return (_seek_next(s, from_pos, ']'))[1]
-
-        def _isbkt(s, from_pos):    # seek item_start_bracket'<' position, return position, -1 if not exist
-            v, p = _seek_next(s, from_pos)
-            return p if v == '<' else -1
-
-        def _iebkt(s, from_pos):    # seek item_end_bracket'>' position, return position
-            return (_seek_next(s, from_pos, '>'))[1]
+        def _f(tokens, i):
 
-        def _seek_item(s, from_pos):  # seek item_type, return (item_type, shifted_position)
-            p_start = (_seek_next(s, from_pos))[1]
-            p_end = (_seek_next(s, (p_start + 1), '[', '"', '<', '>', _is_ws))[1]
-            return secs.Secs2BodyBuilder.get_item_type_from_sml(s[p_start:p_end]), p_end
-
-        def _f(s, from_pos):
+            if tokens[i][0] is None:
+                raise Secs2BodySmlParseError("Not start < bracket")
 
-            p = _isbkt(s, from_pos)
+            x = tokens[i + 1][4]
+            if x is None:
+                raise Secs2BodySmlParseError("Not found item type")
 
-            if p < 0:
-                raise Secs2BodySmlParseError("Not start < bracket")
+            tt = secs.Secs2BodyBuilder.get_item_type_from_sml(x)
 
-            tt, p = _seek_item(s, (p + 1))
+            i += 2
+            if tokens[i][2] is not None:
+                i += 1
 
-            r = _ssbkt(s, p)
-            if r >= 0:
-                p = _sebkt(s, (r + 1)) + 1
-            
             if tt[0] == 'L':
                 vv = list()
                 while True:
-                    v, p = _seek_next(s, p)
-                    if v == '>':
-                        return tt[5](tt, vv), (p + 1)
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, vv), (i + 1)
 
-                    elif v == '<':
-                        r, p = _f(s, p)
+                    elif t[0] is not None:
+                        r, i = _f(tokens, i)
                         vv.append(r)
 
                     else:
                         raise Secs2BodySmlParseError("Not reach LIST end")
 
             elif tt[0] == 'BOOLEAN':
-                r = _iebkt(s, p)
                 vv = list()
-                for x in s[p:r].strip().split():
-                    ux = x.upper()
+                while True:
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, vv), (i + 1)
+
+                    if t[4] is None:
+                        raise Secs2BodySmlParseError("Not reach BOOLEAN end")
+
+                    ux = t[4].upper()
                     if ux == 'TRUE' or ux == 'T':
                         vv.append(True)
                     elif ux == 'FALSE' or ux == 'F':
                         vv.append(False)
                     else:
                         raise Secs2BodySmlParseError("Not accept, BOOLEAN require TRUE or FALSE")
-                return tt[5](tt, vv), (r + 1)
+                    i += 1
 
             elif tt[0] == 'A':
                 vv = list()
                 while True:
-                    v, p_start = _seek_next(s, p)
-                    if v == '>':
-                        return tt[5](tt, ''.join(vv)), (p_start + 1)
- 
-                    elif v == '"':
-                        v, p_end = _seek_next(s, (p_start + 1), '"')
-                        vv.append(s[(p_start+1):p_end])
-                        p = p_end + 1
-
-                    elif v == '0':
-                        if s[p_start + 1] not in ('X', 'x'):
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, ''.join(vv)), (i + 1)
+
+                    elif t[3] is not None:
+                        vv.append(t[3])
+
+                    elif t[4] is not None:
+                        if not (t[4].startswith('0x') or t[4].startswith('0X')):
                             raise Secs2BodySmlParseError("Ascii not accept 0xNN")
-                        v, p = _seek_next(s, (p_start+2), '"', '>', _is_ws)
-                        vv.append(bytes([int(s[(p_start+2):p], 16)]).decode(encoding='ascii'))
+                        vv.append(bytes([int(t[4][2:], 16)]).decode(encoding='ascii'))
 
                     else:
                         raise Secs2BodySmlParseError("Ascii not reach end")
+                    i += 1
 
-            elif tt[0] in ('B', 'I1', 'I2', 'I4', 'I8', 'F4', 'F8', 'U1', 'U2', 'U4', 'U8'):
-                r = _iebkt(s, p)
-                return tt[5](tt, s[p:r].strip().split()), (r + 1)
+            else:
+                vv = list()
+                while True:
+                    t = tokens[i]
+                    if t[1] is not None:
+                        return tt[5](tt, vv), (i + 1)
+
+                    elif t[4] is not None:
+                        vv.append(t[4])
+
+                    else:
+                        raise Secs2BodySmlParseError("Not reach " + tt[0] + " end")
+                    i += 1
 
         try:
             if sml_str is None:
                 raise Secs2BodySmlParseError("Not accept None")
-            
+
             ss = str(sml_str).strip()
-            lr, lp = _f(ss, 0)
-            if len(ss[lp:]) > 0:
-                raise Secs2BodySmlParseError("Not reach end, end=" + str(lp) + ", length=" + str(len(ss)))
+            tokens = [m.groups() for m in cls._SML_TOKEN_PROG.finditer(ss)]
+            lr, lp = _f(tokens, 0)
+            if lp < len(tokens):
+                raise Secs2BodySmlParseError("Not reach end, end=" + str(lp) + ", tokens=" + str(len(tokens)))
             return lr
 
         except TypeError as e:
@@ -12,6 +12,7 @@ if __name__ == '__main__':
     files = [
         'secs2body.py',
         'smlparser.py',
+        'secs2template.py',
         'secsmessage.py',
         'hsmsssmessage.py',
         'secs1message.py',
@@ -19,6 +20,7 @@ if __name__ == '__main__':
         'hsmssscommunicator.py',
         'hsmsssactivecommunicator.py',
         'hsmssspassivecommunicator.py',
+        'hsmsssasynciocommunicator.py',
         'secs1communicator.py',
         'secs1ontcpipcommunicator.py',
         'secs1onpyserialcommunicator.py',